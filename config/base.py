@@ -38,6 +38,29 @@ def _parse_adapter_list(value):
     return tuple(adapters)
 
 
+def _parse_stage_ints(value, *, minimum=0):
+    """
+    Parse ``stage=number`` pairs (e.g. ``fuzzy=1800,core=900``) into a dict.
+
+    Malformed pairs and numbers below ``minimum`` are ignored.
+    """
+
+    if not value:
+        return {}
+
+    parsed: dict[str, int] = {}
+    for raw_item in value.split(","):
+        stage, _, raw_number = raw_item.partition("=")
+        stage = stage.strip().lower()
+        try:
+            number = int(raw_number.strip())
+        except ValueError:
+            continue
+        if stage and number >= minimum:
+            parsed[stage] = number
+    return parsed
+
+
 def _parse_int_list(value, *, minimum=1, maximum=100):
     """
     Parse a comma-separated list of integers with optional bounds.
@@ -161,6 +184,39 @@ class Config:
         IMPORTER_SALESFORCE_BATCH_SIZE = max(1000, int(os.environ.get("IMPORTER_SALESFORCE_BATCH_SIZE", "5000")))
     except ValueError:
         IMPORTER_SALESFORCE_BATCH_SIZE = 5000
+    # Staging write path: auto (COPY on PostgreSQL/psycopg2, bulk INSERT elsewhere), core, copy, or orm
+    IMPORTER_STAGING_WRITER = os.environ.get("IMPORTER_STAGING_WRITER", "auto").strip().lower() or "auto"
+    # CSV uploads at least this large are parsed by worker processes (0 disables); workers 0 = CPU count
+    try:
+        IMPORTER_CSV_PARALLEL_THRESHOLD_MB = max(0, int(os.environ.get("IMPORTER_CSV_PARALLEL_THRESHOLD_MB", "64")))
+    except ValueError:
+        IMPORTER_CSV_PARALLEL_THRESHOLD_MB = 64
+    try:
+        IMPORTER_CSV_PARALLEL_WORKERS = max(0, int(os.environ.get("IMPORTER_CSV_PARALLEL_WORKERS", "0")))
+    except ValueError:
+        IMPORTER_CSV_PARALLEL_WORKERS = 0
+    # CSV ingest stages each batch with its DQ status, violations, and clean rows in one pass
+    IMPORTER_CSV_FUSED_INGEST = _coerce_bool(os.environ.get("IMPORTER_CSV_FUSED_INGEST"), default=True)
+    # Run CSV ingest as a chain of per-stage tasks on the imports.io / imports.cpu queues
+    IMPORTER_STAGE_CHAIN_ENABLED = _coerce_bool(os.environ.get("IMPORTER_STAGE_CHAIN_ENABLED"), default=False)
+    # Per-stage overrides (stage=value, comma-separated) for the chained stage tasks
+    IMPORTER_STAGE_TIME_LIMITS = _parse_stage_ints(os.environ.get("IMPORTER_STAGE_TIME_LIMITS"), minimum=1)
+    IMPORTER_STAGE_MAX_RETRIES = _parse_stage_ints(os.environ.get("IMPORTER_STAGE_MAX_RETRIES"))
+    try:
+        IMPORTER_STAGE_RETRY_DELAY_SECONDS = max(0, int(os.environ.get("IMPORTER_STAGE_RETRY_DELAY_SECONDS", "30")))
+    except ValueError:
+        IMPORTER_STAGE_RETRY_DELAY_SECONDS = 30
+    # CSV dry runs stream rows and keep only counters plus this many example violations
+    try:
+        IMPORTER_DRY_RUN_VIOLATION_SAMPLE_SIZE = max(
+            0, int(os.environ.get("IMPORTER_DRY_RUN_VIOLATION_SAMPLE_SIZE", "100"))
+        )
+    except ValueError:
+        IMPORTER_DRY_RUN_VIOLATION_SAMPLE_SIZE = 100
+    # Clean promotion: set (one INSERT ... SELECT per entity on SQLite/PostgreSQL) or python (per-row ORM)
+    IMPORTER_CLEAN_PROMOTION = os.environ.get("IMPORTER_CLEAN_PROMOTION", "set").strip().lower() or "set"
+    # Skip staged rows whose checksum matches the payload last loaded for the same external ID
+    IMPORTER_SKIP_UNCHANGED = _coerce_bool(os.environ.get("IMPORTER_SKIP_UNCHANGED"), default=True)
     IMPORTER_WARN_ON_MISSING_CONTACT = _coerce_bool(os.environ.get("IMPORTER_WARN_ON_MISSING_CONTACT"), default=False)
     # Salesforce volunteer filtering - set to false if Contact_Type__c field doesn't exist
     IMPORTER_SALESFORCE_FILTER_VOLUNTEERS = _coerce_bool(
@@ -192,6 +248,11 @@ class Config:
     FUZZY_AUTO_MERGE_THRESHOLD = float(os.environ.get("FUZZY_AUTO_MERGE_THRESHOLD", "0.95"))
     FUZZY_AUTO_MERGE_ENABLED = os.environ.get("FUZZY_AUTO_MERGE_ENABLED", "true").lower() == "true"
     FUZZY_AUTO_MERGE_BATCH_SIZE = int(os.environ.get("FUZZY_AUTO_MERGE_BATCH_SIZE", "50"))
+    # Claim-based auto-merge workers (see flask_app/importer/pipeline/auto_merge.py)
+    FUZZY_AUTO_MERGE_GROUP_SIZE = int(os.environ.get("FUZZY_AUTO_MERGE_GROUP_SIZE", "10"))
+    FUZZY_AUTO_MERGE_WORKERS = max(1, int(os.environ.get("FUZZY_AUTO_MERGE_WORKERS", "1")))
+    FUZZY_AUTO_MERGE_CLAIM_TTL_SECONDS = int(os.environ.get("FUZZY_AUTO_MERGE_CLAIM_TTL_SECONDS", "900"))
+    FUZZY_AUTO_MERGE_WORKER_SECONDS = int(os.environ.get("FUZZY_AUTO_MERGE_WORKER_SECONDS", "600"))
 
 
 class DevelopmentConfig(Config):
@@ -3,13 +3,29 @@
 Responsible for validating CSV headers against the canonical volunteer
 contract, streaming rows, and applying lightweight normalization so downstream
 pipeline steps can persist data into staging tables.
+
+Large files on disk can be parsed in parallel: the body is split into
+newline-aligned byte ranges (newlines inside quoted fields are never used as
+split points), worker processes parse and normalize each range, and the
+parent yields rows in file order with the same ``sequence_number`` and
+``source_line`` the serial reader would produce. The workers come from
+billiard (Celery's fork of ``multiprocessing``), whose pools also start
+inside the daemonic children of a prefork Celery worker.
 """
 
 from __future__ import annotations
 
+import codecs
 import csv
+import io
+import logging
+import mmap
+import os
+from collections import deque
 from dataclasses import dataclass
-from typing import IO, Iterator, Sequence
+from typing import IO, Iterator, Mapping, Sequence
+
+from billiard.pool import Pool
 
 from flask_app.importer.contracts import (
     FieldSpec,
@@ -19,6 +35,13 @@ from flask_app.importer.contracts import (
     normalize_header,
 )
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARALLEL_CHUNK_BYTES = 4 * 1024 * 1024
+# Appended after each non-final range; it parses as its own record only when the
+# range ended outside a quoted field, which verifies the split point.
+_RANGE_END_SENTINEL = "\x1epolaris-range-end\x1e"
+
 
 class CSVAdapterError(Exception):
     """Base exception for CSV adapter failures."""
@@ -126,16 +149,159 @@ def _row_is_blank(row: dict[str, object | None]) -> bool:
     return all((value is None or (isinstance(value, str) and value.strip() == "")) for value in row.values())
 
 
+def _normalize_row(row: Mapping[str, object | None], field_specs: Mapping[str, FieldSpec]) -> dict[str, object | None]:
+    normalized: dict[str, object | None] = {}
+    for key, value in row.items():
+        spec: FieldSpec | None = field_specs.get(key)
+        if spec is None or spec.normalizer is None:
+            normalized[key] = value
+        else:
+            normalized[key] = spec.normalizer(value)
+    return normalized
+
+
+@dataclass(frozen=True)
+class _CSVByteRange:
+    start: int
+    end: int
+    is_last: bool
+
+
+@dataclass
+class _CSVRangeResult:
+    """Rows parsed from one byte range, numbered relative to the range start."""
+
+    # (record_index, line_num, raw values, normalized values)
+    rows: list[tuple[int, int, tuple, tuple]]
+    records: int
+    lines: int
+    rows_skipped_blank: int
+    terminated: bool
+
+
+def _ascii_compatible(encoding: str) -> bool:
+    try:
+        return '\n"'.encode(encoding) == b'\n"'
+    except LookupError:
+        return False
+
+
+def _next_record_end(view: mmap.mmap, position: int, quotes: int) -> tuple[int, int]:
+    """
+    Return the offset just past the next newline outside a quoted field.
+
+    ``quotes`` is the number of quote characters before ``position``; a newline
+    terminates a record only when that count is even.
+    """
+
+    size = len(view)
+    while position < size:
+        newline = view.find(b"\n", position)
+        if newline == -1:
+            return size, quotes
+        quotes += view[position:newline].count(b'"')
+        position = newline + 1
+        if quotes % 2 == 0:
+            return position, quotes
+    return size, quotes
+
+
+def _plan_byte_ranges(path: str, chunk_bytes: int) -> list[_CSVByteRange] | None:
+    """Split the file body after the header into newline-aligned ranges of roughly ``chunk_bytes``."""
+
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        size = len(view)
+        header_end, quotes = _next_record_end(view, 0, 0)
+        if quotes:
+            # Quoted headers are rare; leave them to the serial reader.
+            return None
+        ranges: list[_CSVByteRange] = []
+        start = header_end
+        while start < size:
+            target = min(start + chunk_bytes, size)
+            end = size
+            if target < size:
+                end, _ = _next_record_end(view, target, view[start:target].count(b'"'))
+            ranges.append(_CSVByteRange(start=start, end=end, is_last=end >= size))
+            start = end
+        return ranges
+
+
+def _is_range_sentinel(row: Mapping[str | None, object | None], fieldnames: Sequence[str]) -> bool:
+    values = list(row.values())
+    return (
+        len(values) == len(fieldnames)
+        and values[0] == _RANGE_END_SENTINEL
+        and all(value is None for value in values[1:])
+    )
+
+
+def _parse_byte_range(
+    path: str,
+    encoding: str,
+    errors: str,
+    byte_range: _CSVByteRange,
+    fieldnames: Sequence[str],
+    skip_blank_rows: bool,
+) -> _CSVRangeResult:
+    """Worker entry point: parse and normalize one byte range of the CSV body."""
+
+    with open(path, "rb") as handle:
+        handle.seek(byte_range.start)
+        text = handle.read(byte_range.end - byte_range.start).decode(encoding, errors)
+    if not byte_range.is_last:
+        text += _RANGE_END_SENTINEL + "\n"
+
+    reader = csv.DictReader(io.StringIO(text, newline=""), fieldnames=list(fieldnames))
+    parsed = [(record_index, reader.line_num, raw_row) for record_index, raw_row in enumerate(reader, start=1)]
+    lines = reader.line_num
+    terminated = True
+    if not byte_range.is_last:
+        terminated = bool(parsed) and _is_range_sentinel(parsed.pop()[2], fieldnames)
+        lines -= 1
+
+    field_specs = {spec.name: spec for spec in get_volunteer_field_specs()}
+    rows: list[tuple[int, int, tuple, tuple]] = []
+    rows_skipped_blank = 0
+    for record_index, line_num, raw_row in parsed:
+        if skip_blank_rows and _row_is_blank(raw_row):
+            rows_skipped_blank += 1
+            continue
+        normalized = _normalize_row(raw_row, field_specs)
+        rows.append((record_index, line_num, tuple(raw_row.values()), tuple(normalized.values())))
+
+    return _CSVRangeResult(
+        rows=rows,
+        records=len(parsed),
+        lines=lines,
+        rows_skipped_blank=rows_skipped_blank,
+        terminated=terminated,
+    )
+
+
 class VolunteerCSVAdapter:
     """CSV reader that enforces the volunteer ingest contract."""
 
-    def __init__(self, file_obj: IO[str], *, source_system: str = "csv", skip_blank_rows: bool = True) -> None:
+    def __init__(
+        self,
+        file_obj: IO[str],
+        *,
+        source_system: str = "csv",
+        skip_blank_rows: bool = True,
+        parallel_threshold_bytes: int | None = None,
+        parallel_workers: int | None = None,
+        parallel_chunk_bytes: int = DEFAULT_PARALLEL_CHUNK_BYTES,
+    ) -> None:
         self._file_obj = file_obj
         self.source_system = source_system
         self.skip_blank_rows = skip_blank_rows
+        self.parallel_threshold_bytes = parallel_threshold_bytes
+        self.parallel_workers = parallel_workers
+        self.parallel_chunk_bytes = max(1, parallel_chunk_bytes)
         self._header_result: HeaderValidationResult | None = None
         self.statistics = VolunteerCSVStatistics()
         self._field_specs = {spec.name: spec for spec in get_volunteer_field_specs()}
+        self.parallel_used = False
 
     @property
     def header(self) -> HeaderValidationResult | None:
@@ -154,6 +320,12 @@ class VolunteerCSVAdapter:
 
     def iter_rows(self) -> Iterator[VolunteerCSVRow]:
         reader = self._prepare_reader()
+        source_path = self._parallel_source_path()
+        ranges = _plan_byte_ranges(source_path, self.parallel_chunk_bytes) if source_path else None
+        if ranges:
+            yield from self._iter_rows_parallel(source_path, ranges, header_lines=reader.line_num)
+            return
+
         for sequence_number, raw_row in enumerate(reader, start=1):
             row_copy = {key: value for key, value in raw_row.items()}
 
@@ -172,11 +344,105 @@ class VolunteerCSVAdapter:
             )
 
     def _apply_normalizers(self, row: dict[str, object | None]) -> dict[str, object | None]:
-        normalized: dict[str, object | None] = {}
-        for key, value in row.items():
-            spec: FieldSpec | None = self._field_specs.get(key)
-            if spec is None or spec.normalizer is None:
-                normalized[key] = value
-            else:
-                normalized[key] = spec.normalizer(value)
-        return normalized
+        return _normalize_row(row, self._field_specs)
+
+    def _resolve_parallel_workers(self) -> int:
+        if self.parallel_workers and self.parallel_workers > 0:
+            return self.parallel_workers
+        return os.cpu_count() or 1
+
+    def _parallel_source_path(self) -> str | None:
+        """Return the on-disk path when this file qualifies for parallel parsing."""
+
+        if not self.parallel_threshold_bytes or self.parallel_threshold_bytes <= 0:
+            return None
+        path = getattr(self._file_obj, "name", None)
+        if not isinstance(path, str) or not os.path.isfile(path):
+            return None
+        if os.path.getsize(path) < self.parallel_threshold_bytes:
+            return None
+        if not _ascii_compatible(getattr(self._file_obj, "encoding", None) or "utf-8"):
+            return None
+        if self._resolve_parallel_workers() < 2:
+            return None
+        return path
+
+    def _iter_rows_parallel(
+        self, path: str, ranges: Sequence[_CSVByteRange], *, header_lines: int
+    ) -> Iterator[VolunteerCSVRow]:
+        encoding = codecs.lookup(getattr(self._file_obj, "encoding", None) or "utf-8").name
+        if encoding == "utf-8-sig":
+            # Only the header can carry a BOM, and no range starts inside it.
+            encoding = "utf-8"
+        errors = getattr(self._file_obj, "errors", None) or "strict"
+        fieldnames = tuple(self._header_result.canonical_headers) if self._header_result else ()
+        keys_with_rest = (*fieldnames, None)
+        workers = self._resolve_parallel_workers()
+        self.parallel_used = True
+
+        sequence_offset = 0
+        line_offset = header_lines
+        fallback_start: int | None = None
+        pool = Pool(processes=workers)
+        try:
+            pending: deque = deque()
+            remaining = iter(ranges)
+
+            def submit_next() -> None:
+                byte_range = next(remaining, None)
+                if byte_range is not None:
+                    future = pool.apply_async(
+                        _parse_byte_range, (path, encoding, errors, byte_range, fieldnames, self.skip_blank_rows)
+                    )
+                    pending.append((byte_range, future))
+
+            # Bound the number of parsed ranges held in memory while the caller stages rows.
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                byte_range, future = pending.popleft()
+                result = future.get()
+                if not result.terminated:
+                    # A quote inside an unquoted field skewed this split point. The range
+                    # start is still record-aligned, so continue serially from there.
+                    pending.clear()
+                    fallback_start = byte_range.start
+                    break
+                submit_next()
+
+                self.statistics.rows_skipped_blank += result.rows_skipped_blank
+                for record_index, line_num, raw_values, normalized_values in result.rows:
+                    row_keys = fieldnames if len(raw_values) == len(fieldnames) else keys_with_rest
+                    self.statistics.rows_processed += 1
+                    yield VolunteerCSVRow(
+                        sequence_number=sequence_offset + record_index,
+                        source_line=line_offset + line_num,
+                        raw=dict(zip(row_keys, raw_values)),
+                        normalized=dict(zip(row_keys, normalized_values)),
+                    )
+                sequence_offset += result.records
+                line_offset += result.lines
+        finally:
+            # Let in-flight ranges (at most two per worker) finish rather than terminating
+            # workers mid-task; joining terminated billiard workers can block.
+            pool.close()
+            pool.join()
+
+        if fallback_start is not None:
+            logger.info("CSV byte range at offset %s was not record-aligned; continuing serially.", fallback_start)
+            with open(path, "rb") as handle:
+                handle.seek(fallback_start)
+                stream = io.TextIOWrapper(handle, encoding=encoding, errors=errors, newline="")
+                reader = csv.DictReader(stream, fieldnames=list(fieldnames))
+                for record_index, raw_row in enumerate(reader, start=1):
+                    if self.skip_blank_rows and _row_is_blank(raw_row):
+                        self.statistics.rows_skipped_blank += 1
+                        continue
+                    self.statistics.rows_processed += 1
+                    yield VolunteerCSVRow(
+                        sequence_number=sequence_offset + record_index,
+                        source_line=line_offset + reader.line_num,
+                        raw=raw_row,
+                        normalized=self._apply_normalizers(raw_row),
+                    )
@@ -18,8 +18,40 @@ from flask import Flask
 from kombu import Queue
 
 DEFAULT_QUEUE_NAME = "imports"
+IO_QUEUE_NAME = "imports.io"
+CPU_QUEUE_NAME = "imports.cpu"
+WORKER_QUEUE_NAMES = ",".join((DEFAULT_QUEUE_NAME, IO_QUEUE_NAME, CPU_QUEUE_NAME))
 DEFAULT_SQLITE_FILENAME = "celery.sqlite"
 
+# Chained CSV ingest (IMPORTER_STAGE_CHAIN_ENABLED): each pipeline stage is its own task.
+# Fuzzy matching and DQ rule evaluation are CPU-bound; the other stages mostly wait on the database.
+STAGE_QUEUES: dict[str, str] = {
+    "staging": IO_QUEUE_NAME,
+    "dq": CPU_QUEUE_NAME,
+    "clean": IO_QUEUE_NAME,
+    "fuzzy": CPU_QUEUE_NAME,
+    "core": IO_QUEUE_NAME,
+}
+DEFAULT_STAGE_TIME_LIMITS: dict[str, int] = {
+    "staging": 15 * 60,
+    "dq": 10 * 60,
+    "clean": 10 * 60,
+    "fuzzy": 30 * 60,
+    "core": 15 * 60,
+}
+DEFAULT_STAGE_MAX_RETRIES: dict[str, int] = {
+    "staging": 2,
+    "dq": 2,
+    "clean": 2,
+    "fuzzy": 1,
+    "core": 2,
+}
+
+
+def stage_task_name(stage: str) -> str:
+    """Return the registered name of the chained CSV ingest task for ``stage``."""
+    return f"importer.pipeline.csv_stage.{stage}"
+
 
 def _configure_quiet_loggers(app: Flask) -> None:
     """
@@ -88,6 +120,32 @@ def _determine_connection_urls(app: Flask) -> tuple[str, str]:
     return broker_url or default_broker, result_backend or default_backend
 
 
+def _stage_task_options(app: Flask) -> tuple[dict[str, dict[str, str]], dict[str, dict[str, Any]]]:
+    """
+    Build ``task_routes`` and ``task_annotations`` for the chained stage tasks.
+
+    ``IMPORTER_STAGE_TIME_LIMITS`` and ``IMPORTER_STAGE_MAX_RETRIES`` override
+    the per-stage defaults; the soft limit keeps the 80% ratio of the
+    importer-wide limits so a stage can fail its run cleanly before it is killed.
+    """
+    time_limits = {**DEFAULT_STAGE_TIME_LIMITS, **(app.config.get("IMPORTER_STAGE_TIME_LIMITS") or {})}
+    max_retries = {**DEFAULT_STAGE_MAX_RETRIES, **(app.config.get("IMPORTER_STAGE_MAX_RETRIES") or {})}
+    retry_delay = app.config.get("IMPORTER_STAGE_RETRY_DELAY_SECONDS", 30)
+
+    routes: dict[str, dict[str, str]] = {}
+    annotations: dict[str, dict[str, Any]] = {}
+    for stage, queue in STAGE_QUEUES.items():
+        task_name = stage_task_name(stage)
+        routes[task_name] = {"queue": queue}
+        annotations[task_name] = {
+            "time_limit": time_limits[stage],
+            "soft_time_limit": int(time_limits[stage] * 0.8),
+            "max_retries": max_retries[stage],
+            "default_retry_delay": retry_delay,
+        }
+    return routes, annotations
+
+
 def create_celery_app(app: Flask) -> Celery:
     """
     Create and configure a Celery instance bound to the given Flask app.
@@ -103,9 +161,12 @@ def create_celery_app(app: Flask) -> Celery:
         include=("flask_app.importer.tasks",),
     )
 
+    stage_routes, stage_annotations = _stage_task_options(app)
     celery_app.conf.update(
         task_default_queue=DEFAULT_QUEUE_NAME,
-        task_queues=[Queue(DEFAULT_QUEUE_NAME)],
+        task_queues=[Queue(DEFAULT_QUEUE_NAME), Queue(IO_QUEUE_NAME), Queue(CPU_QUEUE_NAME)],
+        task_routes=stage_routes,
+        task_annotations=stage_annotations,
         task_default_exchange=DEFAULT_QUEUE_NAME,
         task_default_routing_key=DEFAULT_QUEUE_NAME,
         task_acks_late=True,
@@ -17,14 +17,17 @@ from celery import Celery
 from celery.exceptions import TimeoutError as CeleryTimeoutError
 from flask.cli import ScriptInfo
 
-from flask_app.importer.celery_app import DEFAULT_QUEUE_NAME, ensure_celery_app, get_celery_app
+from flask_app.importer.celery_app import WORKER_QUEUE_NAMES, ensure_celery_app, get_celery_app
 from flask_app.importer.idempotency_summary import persist_idempotency_summary
 from flask_app.importer.pipeline import (
+    PIPELINE_STAGES,
     CleanPromotionSummary,
     CoreLoadSummary,
     DQProcessingSummary,
     StagingSummary,
+    csv_fused_ingest_enabled,
     load_core_volunteers,
+    prepare_run_retry,
     promote_clean_volunteers,
     run_minimal_dq,
     stage_volunteers_from_csv,
@@ -148,9 +151,10 @@ def _execute_csv_inline(
                 handle,
                 source_system=source_system,
                 dry_run=dry_run,
+                fused=csv_fused_ingest_enabled(),
             )
-        dq_summary = run_minimal_dq(run, dry_run=dry_run, csv_rows=staging_summary.dry_run_rows)
-        clean_summary = promote_clean_volunteers(run, dry_run=dry_run)
+        dq_summary = run_minimal_dq(run, dry_run=dry_run, streamed_summary=staging_summary.streamed_dq)
+        clean_summary = promote_clean_volunteers(run, dry_run=dry_run, streamed_summary=staging_summary.streamed_clean)
         fuzzy_summary = generate_fuzzy_candidates(run, dry_run=dry_run)
 
         # Auto-merge high-confidence candidates if enabled and not dry_run
@@ -327,9 +331,9 @@ def worker_group(ctx):
 )
 @click.option(
     "--queues",
-    default=DEFAULT_QUEUE_NAME,
+    default=WORKER_QUEUE_NAMES,
     show_default=True,
-    help="Comma-separated queue list to consume.",
+    help="Comma-separated queue list to consume (e.g. imports.cpu for a fuzzy-matching worker).",
 )
 @click.pass_context
 def worker_run(ctx, loglevel: str, concurrency: Optional[int], pool: Optional[str], queues: str):
@@ -752,10 +756,13 @@ def importer_cleanup_uploads(ctx, max_age_hours: int):
     click.echo(f"Removed {removed} upload file(s) older than {max_age_hours} hours from {uploads_dir}.")
 
 
-def _retry_import_run(app, run: ImportRun) -> tuple[str, str]:
+def _retry_import_run(app, run: ImportRun, *, from_stage: str | None = None) -> tuple[str, str]:
     """
     Retry an import run by re-enqueueing it with stored parameters.
 
+    The run resumes from its first incomplete pipeline stage, or from
+    ``from_stage`` when given (see ``flask_app.importer.pipeline.checkpoints``).
+
     Returns:
         tuple[str, str]: (task_id, status_message)
     """
@@ -766,44 +773,50 @@ def _retry_import_run(app, run: ImportRun) -> tuple[str, str]:
             "This run was created before retry support was added."
         )
 
-    file_path = params.get("file_path")
-    if not file_path:
-        raise click.ClickException(f"Import run {run.id} cannot be retried: file_path missing from stored parameters.")
-
-    path = Path(file_path)
-    if not path.exists():
-        raise click.ClickException(
-            f"Import run {run.id} cannot be retried: file not found at {file_path}. "
-            "The upload may have been cleaned up."
-        )
-
     source_system = params.get("source_system", "csv")
     dry_run = params.get("dry_run", False)
-    keep_file = params.get("keep_file", True)
-
-    # Reset run state for retry
-    run.status = ImportRunStatus.PENDING
-    run.started_at = None
-    run.finished_at = None
-    run.error_summary = None
-    run.counts_json = {}
-    run.metrics_json = {}
+    if source_system == "salesforce":
+        entity_type = params.get("entity_type", "contacts")
+        if entity_type != "contacts":
+            raise click.ClickException(
+                f"Import run {run.id} cannot be retried: Salesforce {entity_type} runs must be re-queued as new runs."
+            )
+        task_name = "importer.pipeline.ingest_salesforce_contacts"
+        task_kwargs = {"run_id": run.id, "dry_run": dry_run, "record_limit": params.get("record_limit")}
+    else:
+        file_path = params.get("file_path")
+        if not file_path:
+            raise click.ClickException(
+                f"Import run {run.id} cannot be retried: file_path missing from stored parameters."
+            )
+
+        path = Path(file_path)
+        if not path.exists():
+            raise click.ClickException(
+                f"Import run {run.id} cannot be retried: file not found at {file_path}. "
+                "The upload may have been cleaned up."
+            )
+        task_name = "importer.pipeline.ingest_csv"
+        task_kwargs = {
+            "run_id": run.id,
+            "file_path": str(path),
+            "dry_run": dry_run,
+            "source_system": source_system,
+            "keep_file": params.get("keep_file", True),
+        }
+
+    # Reset run state for retry; checkpointed stages before the resume stage are kept
+    try:
+        start_stage = prepare_run_retry(run, from_stage)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
     db.session.commit()
 
     celery_app = get_celery_app(app)
     if celery_app is None:
         raise click.ClickException("Importer worker is not configured; cannot enqueue retry.")
 
-    async_result = celery_app.send_task(
-        "importer.pipeline.ingest_csv",
-        kwargs={
-            "run_id": run.id,
-            "file_path": str(path),
-            "dry_run": dry_run,
-            "source_system": source_system,
-            "keep_file": keep_file,
-        },
-    )
+    async_result = celery_app.send_task(task_name, kwargs={**task_kwargs, "from_stage": from_stage})
 
     app.logger.info(
         "Import run retried via CLI",
@@ -811,6 +824,7 @@ def _retry_import_run(app, run: ImportRun) -> tuple[str, str]:
             "importer_run_id": run.id,
             "importer_task_id": async_result.id,
             "importer_source": source_system,
+            "importer_resume_stage": start_stage,
         },
     )
 
@@ -939,6 +953,36 @@ def undo_merge(ctx, merge_log_id: int, force: bool):
             raise click.Abort()
 
 
+@importer_cli.command("repair-dedupe-counters")
+@click.option("--dry-run", is_flag=True, help="Report drift without rewriting the counters.")
+@click.pass_context
+def repair_dedupe_counters(ctx, dry_run: bool):
+    """Recompute the dedupe queue counters from the suggestions and report any drift."""
+    from flask_app.models.importer.dedupe_counters import rebuild_dedupe_queue_counters
+
+    info = ctx.ensure_object(ScriptInfo)
+    app = info.load_app()
+
+    with app.app_context():
+        summary = rebuild_dedupe_queue_counters(db.session, dry_run=dry_run)
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+
+        if not summary.drifted:
+            click.echo(f"Dedupe queue counters are consistent ({summary.rows_after} buckets).")
+            return
+        for (decision, match_type, hour), (stored, expected) in sorted(
+            summary.drift.items(), key=lambda item: (item[0][2], item[0][0].value, item[0][1])
+        ):
+            click.echo(
+                f"  {hour.isoformat()} {decision.value} {match_type or '-'}: stored={stored} expected={expected}"
+            )
+        action = "Would repair" if dry_run else "Repaired"
+        click.echo(f"{action} {len(summary.drift)} drifted buckets ({summary.rows_after} buckets total).")
+
+
 @importer_cli.command("load-clean")
 @click.option("--run-id", required=True, type=int, help="ID of the import run to load clean volunteers from.")
 @click.pass_context
@@ -1035,9 +1079,15 @@ def importer_stats(ctx, run_id: Optional[int]):
 
 @importer_cli.command("retry")
 @click.option("--run-id", required=True, type=int, help="ID of the import run to retry.")
+@click.option(
+    "--from-stage",
+    type=click.Choice(PIPELINE_STAGES),
+    default=None,
+    help="Re-run this stage and every later one instead of resuming at the first incomplete stage.",
+)
 @click.pass_context
-def importer_retry(ctx, run_id: int):
-    """Retry a failed or pending import run using stored parameters."""
+def importer_retry(ctx, run_id: int, from_stage: str | None):
+    """Retry a failed or pending import run using stored parameters, resuming from checkpointed stages."""
     info = ctx.ensure_object(ScriptInfo)
     app = info.load_app()
     if not is_importer_enabled(app):
@@ -1048,7 +1098,7 @@ def importer_retry(ctx, run_id: int):
         raise click.ClickException(f"Import run {run_id} not found.")
 
     try:
-        task_id, status = _retry_import_run(app, run)
+        task_id, status = _retry_import_run(app, run, from_stage=from_stage)
         payload = {
             "run_id": run_id,
             "task_id": task_id,
@@ -6,7 +6,7 @@ import hashlib
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, Mapping, Sequence
 
 import yaml
 from flask import current_app
@@ -85,16 +85,16 @@ def load_mapping(path: str | Path) -> MappingSpec:
         required = bool(entry.get("required", False))
         transform = entry.get("transform")
         default = entry.get("default")
-        field = MappingField(
+        mapping_field = MappingField(
             source=str(source).strip() if source else None,
             target=target,
             required=required,
             default=default,
             transform=str(transform).strip() if transform else None,
         )
-        if field.source is None and field.default is None:
+        if mapping_field.source is None and mapping_field.default is None:
             raise MappingLoadError(f"Field '{target}' requires either source or default.")
-        fields.append(field)
+        fields.append(mapping_field)
 
     transforms_payload = raw.get("transforms", {})
     transforms: dict[str, MappingTransform] = {}
@@ -322,113 +322,353 @@ class TransformResult:
     canonical: dict[str, Any]
     unmapped_fields: dict[str, Any]
     errors: list[str]
-    field_stats: dict[str, FieldImportStats] = field(default_factory=dict)
+
+
+@dataclass
+class BatchTransformResult:
+    """
+    Outcome of ``transform_batch``.
+
+    ``results`` yields one ``TransformResult`` per input record, in order, and is
+    consumed once; ``cardinality`` holds distinct-value counts per encoded source field.
+    """
+
+    results: Iterator[TransformResult]
+    cardinality: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _TransformFailure:
+    """Dictionary entry standing in for a transform that raised for a value."""
+
+    exc: Exception
+
+
+# Positions of the per-source counters held by the transformer. Each counter is a
+# flat list indexed by the stats slot assigned to a source field at compile time.
+_STAT_WITH_VALUE = 0
+_STAT_MAPPED = 1
+_STAT_TRANSFORMED = 2
+_STAT_FAILED_TRANSFORM = 3
+_STAT_USED_DEFAULT = 4
+_STAT_COUNT = 5
+
+_TRUTHY_STRINGS = frozenset(("true", "1", "yes", "y", "on"))
+
+# Transforms over low-cardinality picklist values whose results are cached per
+# distinct value by ``transform_batch``. Cheap or high-cardinality transforms
+# (dates, phones) are cheaper to run directly than to dictionary-encode.
+DICTIONARY_ENCODED_TRANSFORMS = frozenset(
+    (
+        "normalize_race_ethnicity",
+        "normalize_education_level",
+        "normalize_age_group",
+        "normalize_organization_type",
+        "normalize_session_type",
+        "normalize_session_status",
+        "normalize_event_format",
+        "normalize_cancellation_reason",
+        "split_semicolon",
+    )
+)
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    """A mapping field with everything resolvable ahead of time already resolved."""
+
+    target: str
+    source: str | None
+    parents: tuple[str, ...]
+    leaf: str
+    required: bool
+    default: Any
+    has_default: bool
+    coerce_bool: bool
+    transform_name: str | None
+    transform_fn: Callable[[Any], Any] | None
+    dictionary_encoded: bool
+    stats_slot: int
+    required_error: str
+    unknown_transform_error: str | None
+
+
+@dataclass(frozen=True)
+class CompiledMappingPlan:
+    """Flat, per-record-ready form of a ``MappingSpec``."""
+
+    fields: tuple[CompiledField, ...]
+    source_fields: frozenset[str]
+    stats_sources: tuple[str, ...]
+    stats_targets: tuple[str, ...]
+    stats_multiplicity: tuple[int, ...]
+
+
+def compile_mapping(spec: MappingSpec, transform_registry: Mapping[str, Any] | None = None) -> CompiledMappingPlan:
+    """
+    Compile a mapping spec into a flat plan.
+
+    Transform callables are resolved, dotted targets split, and default/boolean
+    handling decided once, so per-record work is reduced to the value lookups.
+    Each distinct source field gets a stats slot; fields sharing a source share
+    the slot (and the target of the first such field), matching how
+    ``FieldImportStats`` were keyed per source.
+    """
+
+    registry = transform_registry if transform_registry is not None else _build_transform_registry()
+    slots: dict[str, int] = {}
+    stats_targets: list[str] = []
+    multiplicity: list[int] = []
+    compiled: list[CompiledField] = []
+    for field_spec in spec.fields:
+        slot = -1
+        if field_spec.source:
+            slot = slots.get(field_spec.source, -1)
+            if slot < 0:
+                slot = len(slots)
+                slots[field_spec.source] = slot
+                stats_targets.append(field_spec.target)
+                multiplicity.append(0)
+            multiplicity[slot] += 1
+        *parents, leaf = field_spec.target.split(".")
+        transform_fn = registry.get(field_spec.transform) if field_spec.transform else None
+        compiled.append(
+            CompiledField(
+                target=field_spec.target,
+                source=field_spec.source or None,
+                parents=tuple(parents),
+                leaf=leaf,
+                required=field_spec.required,
+                default=field_spec.default,
+                has_default=field_spec.default is not None,
+                coerce_bool=isinstance(field_spec.default, bool),
+                transform_name=field_spec.transform,
+                transform_fn=transform_fn,
+                dictionary_encoded=transform_fn is not None and field_spec.transform in DICTIONARY_ENCODED_TRANSFORMS,
+                stats_slot=slot,
+                required_error=f"Required field '{field_spec.target}' missing (source: {field_spec.source})",
+                unknown_transform_error=(
+                    f"Unknown transform '{field_spec.transform}' for field '{field_spec.target}'"
+                    if field_spec.transform and transform_fn is None
+                    else None
+                ),
+            )
+        )
+    return CompiledMappingPlan(
+        fields=tuple(compiled),
+        source_fields=frozenset(slots),
+        stats_sources=tuple(slots),
+        stats_targets=tuple(stats_targets),
+        stats_multiplicity=tuple(multiplicity),
+    )
 
 
 class SalesforceMappingTransformer:
-    """Apply a mapping spec to Salesforce Contact payloads."""
+    """
+    Apply a mapping spec to Salesforce payloads.
+
+    The spec is compiled once into a ``CompiledMappingPlan``; field statistics are
+    accumulated across every ``transform`` call in fixed-position integer arrays
+    and materialized on demand via ``field_stats()``.
+    """
 
     def __init__(self, spec: MappingSpec):
         self.spec = spec
         self.transform_registry = _build_transform_registry()
+        self.plan = compile_mapping(spec, self.transform_registry)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Clear the accumulated field statistics and batch cardinality."""
+        slot_count = len(self.plan.stats_sources)
+        self.records_processed = 0
+        self.peak_cardinality: dict[str, int] = {}
+        self._stats: list[list[int]] = [[0] * slot_count for _ in range(_STAT_COUNT)]
+
+    def field_stats(self) -> dict[str, FieldImportStats]:
+        """Return per-source statistics for every record transformed so far."""
+        if not self.records_processed:
+            return {}
+        stats = self._stats
+        return {
+            source: FieldImportStats(
+                source_field=source,
+                target_field=self.plan.stats_targets[slot],
+                records_with_value=stats[_STAT_WITH_VALUE][slot],
+                records_mapped=stats[_STAT_MAPPED][slot],
+                records_transformed=stats[_STAT_TRANSFORMED][slot],
+                records_failed_transform=stats[_STAT_FAILED_TRANSFORM][slot],
+                records_used_default=stats[_STAT_USED_DEFAULT][slot],
+                total_records_processed=self.records_processed * self.plan.stats_multiplicity[slot],
+            )
+            for slot, source in enumerate(self.plan.stats_sources)
+        }
 
     def transform(self, payload: Mapping[str, Any]) -> TransformResult:
+        return self._transform_record(payload, None, 0)
+
+    def transform_batch(self, records: Sequence[Mapping[str, Any]]) -> BatchTransformResult:
+        """
+        Transform a batch of payloads, running each transform once per distinct input value.
+
+        Columns feeding a ``DICTIONARY_ENCODED_TRANSFORMS`` transform are
+        dictionary-encoded across the batch: the transform runs once per distinct
+        (post-default) value and the outcome is scattered back to each row, so
+        picklist normalizers cost O(distinct values) instead of O(rows). Results,
+        errors and statistics are identical to calling ``transform`` on each
+        record in order. Encoding happens eagerly; the per-record results are
+        produced as they are iterated so a large batch is never held twice.
+        """
+
+        columns: list[list[Any] | None] = [None] * len(self.plan.fields)
+        cardinality: dict[str, int] = {}
+        for index, field_spec in enumerate(self.plan.fields):
+            if not field_spec.dictionary_encoded:
+                continue
+            columns[index], distinct = _encode_transform_column(field_spec, records)
+            if field_spec.source is not None:
+                cardinality[field_spec.source] = max(distinct, cardinality.get(field_spec.source, 0))
+
+        results = (self._transform_record(payload, columns, row) for row, payload in enumerate(records))
+        for source, distinct in cardinality.items():
+            if distinct > self.peak_cardinality.get(source, 0):
+                self.peak_cardinality[source] = distinct
+        return BatchTransformResult(results=results, cardinality=cardinality)
+
+    def _transform_record(
+        self,
+        payload: Mapping[str, Any],
+        columns: Sequence[list[Any] | None] | None,
+        row: int,
+    ) -> TransformResult:
         canonical: dict[str, Any] = {}
-        unmapped = dict(payload)
         errors: list[str] = []
-        field_stats: dict[str, FieldImportStats] = {}
-
-        for field_spec in self.spec.fields:
-            # Only track stats for fields with a source (not default-only fields)
-            source_field_name = field_spec.source
-            if source_field_name:
-                if source_field_name not in field_stats:
-                    field_stats[source_field_name] = FieldImportStats(
-                        source_field=source_field_name,
-                        target_field=field_spec.target,
-                    )
-                stats = field_stats[source_field_name]
-                stats.total_records_processed += 1
+        with_value, mapped, transformed, failed_transform, used_default = self._stats
+        self.records_processed += 1
 
+        for index, field_spec in enumerate(self.plan.fields):
+            slot = field_spec.stats_slot
             value = None
             had_value = False
-            used_default = False
+            defaulted = False
 
-            if field_spec.source:
+            if field_spec.source is not None:
                 value = payload.get(field_spec.source)
-                unmapped.pop(field_spec.source, None)
                 if value is not None and value != "":
                     had_value = True
-                    if source_field_name and source_field_name in field_stats:
-                        field_stats[source_field_name].records_with_value += 1
+                    with_value[slot] += 1
 
-            if (value is None or value == "") and field_spec.default is not None:
+            if not had_value and field_spec.has_default:
                 value = field_spec.default
-                used_default = True
-                if source_field_name and source_field_name in field_stats:
-                    field_stats[source_field_name].records_used_default += 1
+                defaulted = True
+                if slot >= 0:
+                    used_default[slot] += 1
 
             if field_spec.required and (value is None or value == ""):
-                errors.append(f"Required field '{field_spec.target}' missing (source: {field_spec.source})")
+                errors.append(field_spec.required_error)
                 continue
 
-            if field_spec.transform:
-                transform_fn = self.transform_registry.get(field_spec.transform)
+            if field_spec.transform_name is not None:
+                transform_fn = field_spec.transform_fn
                 if transform_fn is None:
-                    errors.append(f"Unknown transform '{field_spec.transform}' for field '{field_spec.target}'")
-                    if source_field_name and source_field_name in field_stats:
-                        field_stats[source_field_name].records_failed_transform += 1
+                    errors.append(field_spec.unknown_transform_error)
+                    if slot >= 0:
+                        failed_transform[slot] += 1
                 else:
                     try:
-                        original_value = value
-                        transformed_value = transform_fn(value)
-                        if source_field_name and source_field_name in field_stats:
-                            field_stats[source_field_name].records_transformed += 1
+                        column = columns[index] if columns is not None else None
+                        if column is None:
+                            transformed_value = transform_fn(value)
+                        else:
+                            transformed_value = column[row]
+                            if transformed_value.__class__ is _TransformFailure:
+                                raise transformed_value.exc
+                            if isinstance(transformed_value, (list, dict)):
+                                # Encoded outcomes are shared across rows; hand each record its own copy
+                                transformed_value = transformed_value.copy()
+                        if slot >= 0:
+                            transformed[slot] += 1
                         # For phone/email transforms, if the original value exists but transform returns None,
-                        # keep the original value (might be already normalized or in unexpected format)
-                        if transformed_value is None and original_value is not None and original_value != "":
-                            # Transform returned None but we had a value - keep original for manual review
-                            # The loader will handle normalization/validation
-                            value = str(original_value).strip() if original_value else None
+                        # keep the original value for manual review; the loader handles normalization/validation
+                        if transformed_value is None and value is not None and value != "":
+                            value = str(value).strip() if value else None
                         else:
                             value = transformed_value
                     except Exception as exc:  # pragma: no cover - defensive path
-                        errors.append(f"Transform '{field_spec.transform}' failed for {field_spec.target}: {exc}")
-                        if source_field_name and source_field_name in field_stats:
-                            field_stats[source_field_name].records_failed_transform += 1
-
-            # Update mapped count if field was successfully processed
-            if source_field_name and source_field_name in field_stats:
-                if had_value or used_default:
-                    field_stats[source_field_name].records_mapped += 1
-
-            # Skip only None and empty strings, but include False (boolean) values
-            # Note: False is not None and False != "", so it will pass through
-            # However, if we have a boolean default and the value is None/empty, we should use the default
+                        errors.append(f"Transform '{field_spec.transform_name}' failed for {field_spec.target}: {exc}")
+                        if slot >= 0:
+                            failed_transform[slot] += 1
+
+            if slot >= 0 and (had_value or defaulted):
+                mapped[slot] += 1
+
+            # Skip only None and empty strings, but keep False; boolean defaults fill empty values
             if value is None or value == "":
-                # If we have a boolean default, use it (don't skip)
-                if isinstance(field_spec.default, bool):
-                    value = field_spec.default
-                else:
+                if not field_spec.coerce_bool:
                     continue
+                value = field_spec.default
             # Normalize boolean values from Salesforce (handles both bool and string "true"/"false")
-            if isinstance(field_spec.default, bool) or isinstance(value, bool):
+            if field_spec.coerce_bool and not isinstance(value, bool):
                 if isinstance(value, str):
-                    # Convert string representations to bool
-                    value = value.lower() in ("true", "1", "yes", "y", "on")
-                elif not isinstance(value, bool) and value is not None:
-                    # Convert other types to bool if default is bool
+                    value = value.lower() in _TRUTHY_STRINGS
+                else:
                     value = bool(value)
-            _set_nested_value(canonical, field_spec.target, value)
 
+            node = canonical
+            for part in field_spec.parents:
+                node = node.setdefault(part, {})
+            node[field_spec.leaf] = value
+
+        source_fields = self.plan.source_fields
         return TransformResult(
             canonical=canonical,
-            unmapped_fields={key: val for key, val in unmapped.items() if val not in (None, "", [])},
+            unmapped_fields={
+                key: val for key, val in payload.items() if key not in source_fields and val not in (None, "", [])
+            },
             errors=errors,
-            field_stats=field_stats,
         )
 
 
+def _encode_transform_column(
+    field_spec: CompiledField, records: Sequence[Mapping[str, Any]]
+) -> tuple[list[Any], int]:
+    """
+    Dictionary-encode one transformed column and return (per-row outcomes, distinct count).
+
+    The input value mirrors ``_transform_record``: the source value, or the
+    default when the source is empty. Non-string keys carry their type so that
+    equal-hashing values such as ``1`` and ``True`` stay distinct; unhashable
+    values bypass the dictionary.
+    """
+
+    transform_fn = field_spec.transform_fn
+    source = field_spec.source
+    has_default = field_spec.has_default
+    default = field_spec.default
+    dictionary: dict[Any, Any] = {}
+    outcomes: list[Any] = []
+    for payload in records:
+        value = payload.get(source) if source is not None else None
+        if has_default and (value is None or value == ""):
+            value = default
+        key = value if value.__class__ is str else (value.__class__, value)
+        try:
+            outcome = dictionary[key]
+        except KeyError:
+            outcome = dictionary[key] = _apply_transform(transform_fn, value)
+        except TypeError:
+            outcome = _apply_transform(transform_fn, value)
+        outcomes.append(outcome)
+    return outcomes, len(dictionary)
+
+
+def _apply_transform(transform_fn: Callable[[Any], Any], value: Any) -> Any:
+    try:
+        return transform_fn(value)
+    except Exception as exc:  # pragma: no cover - defensive path
+        return _TransformFailure(exc)
+
+
 def _build_transform_registry() -> Dict[str, Any]:
     from flask_app.importer.pipeline.deterministic import normalize_phone
 
@@ -987,11 +1227,3 @@ def _build_transform_registry() -> Dict[str, Any]:
         "normalize_event_format": normalize_event_format,
         "normalize_cancellation_reason": normalize_cancellation_reason,
     }
-
-
-def _set_nested_value(target: dict[str, Any], dotted_path: str, value: Any) -> None:
-    parts = dotted_path.split(".")
-    current = target
-    for part in parts[:-1]:
-        current = current.setdefault(part, {})
-    current[parts[-1]] = value
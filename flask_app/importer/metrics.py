@@ -48,6 +48,31 @@ if _PROMETHEUS_AVAILABLE:
         "importer_salesforce_watermark_seconds",
         "Unix timestamp of the last successful Salesforce watermark.",
     )
+    _dq_rule_duration = Histogram(
+        "importer_dq_rule_duration_seconds",
+        "Duration of one DQ rule evaluation call (a batch of rows) in seconds.",
+        ["rule_code"],
+        buckets=(0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+    )
+    _dq_rule_rows = Counter(
+        "importer_dq_rule_rows_total",
+        "Rows evaluated by each DQ rule.",
+        ["rule_code"],
+    )
+    _dq_rule_violations = Counter(
+        "importer_dq_rule_violations_total",
+        "Violations emitted by each DQ rule.",
+        ["rule_code"],
+    )
+    _auto_merge_counter = Counter(
+        "importer_auto_merge_suggestions_total",
+        "Claimed fuzzy_high suggestions by auto-merge outcome (merged/error/conflict).",
+        ["outcome"],
+    )
+    _auto_merge_rate_gauge = Gauge(
+        "importer_auto_merge_merges_per_second",
+        "Merges per second of the most recent auto-merge batch.",
+    )
 else:  # pragma: no cover - fallbacks when prometheus_client missing
     _salesforce_enabled_gauge = None
     _salesforce_auth_attempts = None
@@ -56,6 +81,11 @@ else:  # pragma: no cover - fallbacks when prometheus_client missing
     _salesforce_unmapped_counter = None
     _salesforce_row_counter = None
     _salesforce_watermark_gauge = None
+    _dq_rule_duration = None
+    _dq_rule_rows = None
+    _dq_rule_violations = None
+    _auto_merge_counter = None
+    _auto_merge_rate_gauge = None
 
 
 def record_salesforce_adapter_status(enabled: bool) -> None:
@@ -112,3 +142,28 @@ def record_salesforce_watermark(dt: datetime) -> None:
         return
     _salesforce_watermark_gauge.set(dt.timestamp())
 
+
+def record_dq_rule_evaluation(
+    *,
+    rule_code: str,
+    duration_seconds: float | None,
+    rows: int,
+    violations: int,
+) -> None:
+    """Record DQ rule work covering ``rows`` rows; ``duration_seconds`` is one evaluation call, if timed."""
+
+    if duration_seconds is not None and _dq_rule_duration is not None:
+        _dq_rule_duration.labels(rule_code=rule_code).observe(duration_seconds)
+    if _dq_rule_rows is not None:
+        _dq_rule_rows.labels(rule_code=rule_code).inc(rows)
+    if violations and _dq_rule_violations is not None:
+        _dq_rule_violations.labels(rule_code=rule_code).inc(violations)
+
+
+def record_auto_merge_batch(*, merged: int, errors: int, conflicts: int, merges_per_second: float) -> None:
+    if _auto_merge_counter is not None:
+        for outcome, count in (("merged", merged), ("error", errors), ("conflict", conflicts)):
+            if count:
+                _auto_merge_counter.labels(outcome=outcome).inc(count)
+    if _auto_merge_rate_gauge is not None:
+        _auto_merge_rate_gauge.set(merges_per_second)
@@ -13,17 +13,24 @@ from .clean import (
     promote_clean_organizations,
     promote_clean_volunteers,
 )
+from .checkpoints import PIPELINE_STAGES, StageCheckpoints, prepare_run_retry, resolve_start_stage
+from .clean_set_based import resolve_clean_promotion_mode
 from .deterministic import DeterministicMatchResult, match_volunteer_by_contact, normalize_email, normalize_phone
-from .dq import DQProcessingSummary, DQResult, evaluate_rules, run_minimal_dq
+from .dq import DQProcessingSummary, DQResult, evaluate_rules, evaluate_rules_batch, run_minimal_dq
+from .fused_ingest import FusedVolunteerWriter, csv_fused_ingest_enabled
 from .load_core import CoreLoadSummary, load_core_volunteers
 from .staging import (
     StagingSummary,
     compute_checksum,
+    count_unchanged_staging_rows,
+    mark_unchanged_staging_rows,
+    max_staging_source_timestamps,
     resolve_external_system,
     resolve_source_record_id,
     stage_volunteers_from_csv,
     update_staging_counts,
 )
+from .staging_writer import StagingWriter, build_staging_row, resolve_staging_writer_mode
 
 __all__ = [
     "CleanAffiliationPayload",
@@ -35,10 +42,14 @@ __all__ = [
     "DQProcessingSummary",
     "DQResult",
     "DeterministicMatchResult",
+    "FusedVolunteerWriter",
+    "PIPELINE_STAGES",
+    "StageCheckpoints",
     "match_volunteer_by_contact",
     "normalize_email",
     "normalize_phone",
     "evaluate_rules",
+    "evaluate_rules_batch",
     "load_core_volunteers",
     "promote_clean_affiliations",
     "promote_clean_events",
@@ -46,9 +57,19 @@ __all__ = [
     "promote_clean_volunteers",
     "run_minimal_dq",
     "StagingSummary",
+    "StagingWriter",
+    "build_staging_row",
     "compute_checksum",
+    "csv_fused_ingest_enabled",
+    "count_unchanged_staging_rows",
+    "mark_unchanged_staging_rows",
+    "max_staging_source_timestamps",
+    "prepare_run_retry",
+    "resolve_clean_promotion_mode",
     "resolve_external_system",
+    "resolve_start_stage",
     "resolve_source_record_id",
+    "resolve_staging_writer_mode",
     "stage_volunteers_from_csv",
     "update_staging_counts",
 ]
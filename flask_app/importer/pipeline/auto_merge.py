@@ -0,0 +1,268 @@
+"""
+Claim-based auto-merge of high-confidence fuzzy dedupe suggestions.
+
+Several workers can drain the ``fuzzy_high`` backlog at once. Each worker
+stamps a batch of pending suggestions with its own ``claim_token`` in one
+``UPDATE``, then merges the batch in groups, one transaction per group:
+
+* On PostgreSQL the candidate rows are picked with ``FOR UPDATE SKIP LOCKED``,
+  so concurrent claims never wait on each other. SQLite serializes writers, and
+  the claim ``UPDATE`` re-checks the claim columns, so two workers can never
+  stamp the same row there either.
+* A suggestion is not claimed while another worker's live claim touches one of
+  its contacts. Each group also locks its contacts (``SKIP LOCKED`` on
+  PostgreSQL); a suggestion whose contacts are locked by another transaction is
+  counted as a conflict and released so a later batch retries it.
+* Each merge runs in a savepoint, so one failure does not roll back the group.
+  Failed suggestions keep their claim until it expires (``claim_ttl``), so a
+  draining worker does not retry them in a tight loop.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from flask import current_app
+from sqlalchemy import exists, or_, select, update
+from sqlalchemy.orm import Session, aliased
+
+from flask_app.importer.metrics import record_auto_merge_batch
+from flask_app.models.contact.base import Contact
+from flask_app.models.importer.schema import DedupeDecision, DedupeSuggestion
+
+if TYPE_CHECKING:
+    from flask_app.importer.pipeline.merge_service import MergeService
+
+AUTO_MERGE_MATCH_TYPE = "fuzzy_high"
+AUTO_MERGE_NOTES = "Auto-merged due to high confidence score"
+
+
+@dataclass
+class AutoMergeStats:
+    """Counts for one or more claimed auto-merge batches."""
+
+    processed: int = 0
+    merged: int = 0
+    skipped: int = 0
+    errors: int = 0
+    conflicts: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def merges_per_second(self) -> float:
+        return round(self.merged / self.elapsed_seconds, 2) if self.elapsed_seconds else 0.0
+
+    def add(self, other: AutoMergeStats) -> None:
+        self.processed += other.processed
+        self.merged += other.merged
+        self.skipped += other.skipped
+        self.errors += other.errors
+        self.conflicts += other.conflicts
+        self.batches += other.batches
+        self.elapsed_seconds += other.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "merged": self.merged,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "conflicts": self.conflicts,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "merges_per_second": self.merges_per_second,
+        }
+
+
+def claim_auto_merge_candidates(
+    session: Session,
+    *,
+    token: str,
+    limit: int,
+    claim_ttl: timedelta,
+    run_id: int | None = None,
+    created_before: datetime | None = None,
+) -> list[int]:
+    """Stamp up to ``limit`` claimable ``fuzzy_high`` suggestions with ``token`` and return their IDs."""
+
+    now = datetime.now(timezone.utc)
+    expired = now - claim_ttl
+    unclaimed = or_(DedupeSuggestion.claim_token.is_(None), DedupeSuggestion.claimed_at < expired)
+    other = aliased(DedupeSuggestion)
+    touches_same_contact = or_(
+        other.primary_contact_id == DedupeSuggestion.primary_contact_id,
+        other.candidate_contact_id == DedupeSuggestion.primary_contact_id,
+        other.primary_contact_id == DedupeSuggestion.candidate_contact_id,
+        other.candidate_contact_id == DedupeSuggestion.candidate_contact_id,
+    )
+    claimed_elsewhere = exists().where(
+        other.id != DedupeSuggestion.id,
+        other.claim_token.isnot(None),
+        other.claim_token != token,
+        other.claimed_at >= expired,
+        touches_same_contact,
+    )
+    conditions = [
+        DedupeSuggestion.decision == DedupeDecision.PENDING,
+        DedupeSuggestion.match_type == AUTO_MERGE_MATCH_TYPE,
+        DedupeSuggestion.primary_contact_id.isnot(None),
+        unclaimed,
+        ~claimed_elsewhere,
+    ]
+    if run_id:
+        conditions.append(DedupeSuggestion.run_id == run_id)
+    if created_before is not None:
+        conditions.append(DedupeSuggestion.created_at < created_before)
+    candidates = (
+        select(DedupeSuggestion.id)
+        .where(*conditions)
+        .order_by(DedupeSuggestion.score.desc().nulls_last(), DedupeSuggestion.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=DedupeSuggestion)
+        .correlate(None)
+    )
+
+    session.execute(
+        update(DedupeSuggestion)
+        .where(DedupeSuggestion.id.in_(candidates.scalar_subquery()), unclaimed)
+        .values(claim_token=token, claimed_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return list(
+        session.scalars(
+            select(DedupeSuggestion.id)
+            .where(DedupeSuggestion.claim_token == token, DedupeSuggestion.claimed_at == now)
+            .order_by(DedupeSuggestion.score.desc().nulls_last(), DedupeSuggestion.id.asc())
+        )
+    )
+
+
+def release_claims(session: Session, suggestion_ids: list[int]) -> None:
+    if suggestion_ids:
+        session.execute(
+            update(DedupeSuggestion)
+            .where(DedupeSuggestion.id.in_(suggestion_ids))
+            .values(claim_token=None, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+
+
+class AutoMergeWorker:
+    """Claim batches of ``fuzzy_high`` suggestions and merge them in grouped transactions."""
+
+    def __init__(
+        self,
+        merge_service: MergeService,
+        *,
+        run_id: int | None = None,
+        claim_size: int | None = None,
+        group_size: int | None = None,
+        claim_ttl: timedelta | None = None,
+        created_before: datetime | None = None,
+    ) -> None:
+        config = current_app.config
+        self.merge_service = merge_service
+        self.session = merge_service.session
+        self.run_id = run_id
+        self.claim_size = max(1, claim_size or config.get("FUZZY_AUTO_MERGE_BATCH_SIZE", 50))
+        self.group_size = max(1, group_size or config.get("FUZZY_AUTO_MERGE_GROUP_SIZE", 10))
+        self.claim_ttl = claim_ttl or timedelta(seconds=config.get("FUZZY_AUTO_MERGE_CLAIM_TTL_SECONDS", 900))
+        self.created_before = created_before
+        self.token = uuid.uuid4().hex
+
+    def run_batch(self) -> AutoMergeStats:
+        """Claim one batch and merge it; ``processed`` is 0 when nothing was claimable."""
+
+        started = time.perf_counter()
+        stats = AutoMergeStats()
+        suggestion_ids = claim_auto_merge_candidates(
+            self.session,
+            token=self.token,
+            limit=self.claim_size,
+            claim_ttl=self.claim_ttl,
+            run_id=self.run_id,
+            created_before=self.created_before,
+        )
+        self.session.commit()
+        if suggestion_ids:
+            stats.batches = 1
+            stats.processed = len(suggestion_ids)
+            for start in range(0, len(suggestion_ids), self.group_size):
+                self._merge_group(suggestion_ids[start : start + self.group_size], stats)
+        stats.elapsed_seconds = time.perf_counter() - started
+        if stats.processed:
+            record_auto_merge_batch(
+                merged=stats.merged,
+                errors=stats.errors,
+                conflicts=stats.conflicts,
+                merges_per_second=stats.merges_per_second,
+            )
+        return stats
+
+    def drain(self, *, max_seconds: float | None = None, max_batches: int | None = None) -> AutoMergeStats:
+        """Run batches until nothing is claimable or a budget is spent."""
+
+        total = AutoMergeStats()
+        started = time.perf_counter()
+        while max_batches is None or total.batches < max_batches:
+            stats = self.run_batch()
+            if not stats.processed:
+                break
+            total.add(stats)
+            if max_seconds is not None and time.perf_counter() - started >= max_seconds:
+                break
+        total.elapsed_seconds = time.perf_counter() - started
+        return total
+
+    def _merge_group(self, suggestion_ids: list[int], stats: AutoMergeStats) -> None:
+        contacts = {
+            suggestion_id: {contact_id for contact_id in pair if contact_id is not None}
+            for suggestion_id, *pair in self.session.execute(
+                select(
+                    DedupeSuggestion.id, DedupeSuggestion.primary_contact_id, DedupeSuggestion.candidate_contact_id
+                ).where(DedupeSuggestion.id.in_(suggestion_ids))
+            )
+        }
+        contact_ids = set().union(*contacts.values()) if contacts else set()
+        locked = set(
+            self.session.scalars(
+                select(Contact.id).where(Contact.id.in_(contact_ids)).with_for_update(skip_locked=True, of=Contact)
+            )
+        )
+
+        conflicts: list[int] = []
+        for suggestion_id in suggestion_ids:
+            if not contacts.get(suggestion_id, set()) <= locked:
+                conflicts.append(suggestion_id)
+                continue
+            try:
+                with self.session.begin_nested():
+                    self.merge_service.execute_merge(
+                        suggestion_id,
+                        user_id=None,
+                        decision_type="auto",
+                        notes=AUTO_MERGE_NOTES,
+                    )
+                stats.merged += 1
+            except Exception as exc:
+                stats.errors += 1
+                current_app.logger.warning(f"Failed to auto-merge suggestion {suggestion_id}: {exc}", exc_info=True)
+
+        stats.conflicts += len(conflicts)
+        # Merged suggestions are decided, so clearing their claim only tidies the row.
+        release_claims(self.session, conflicts)
+        self.session.execute(
+            update(DedupeSuggestion)
+            .where(
+                DedupeSuggestion.id.in_(suggestion_ids),
+                DedupeSuggestion.decision != DedupeDecision.PENDING,
+            )
+            .values(claim_token=None, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
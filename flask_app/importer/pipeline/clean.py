@@ -1,14 +1,19 @@
 """
 Promotion helpers for moving validated staging rows into the clean layer.
+
+Outside dry runs, eligible rows are first promoted in one ``INSERT ... SELECT``
+per entity type (see ``clean_set_based``); the per-row builders below promote
+or skip whatever remains and are the only path for dry runs.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import MutableMapping
+from typing import Mapping, MutableMapping
 
 from flask import current_app, has_app_context
+from sqlalchemy import func, select
 
 from flask_app.models.base import db
 from flask_app.models.importer.schema import (
@@ -23,6 +28,16 @@ from flask_app.models.importer.schema import (
     StagingVolunteer,
 )
 
+from .clean_set_based import (
+    AFFILIATION_PROMOTION,
+    EVENT_PROMOTION,
+    ORGANIZATION_PROMOTION,
+    VOLUNTEER_PROMOTION,
+    CleanPromotionSpec,
+    promote_set_based,
+    resolve_clean_promotion_mode,
+)
+
 
 @dataclass(frozen=True)
 class CleanVolunteerPayload:
@@ -87,11 +102,69 @@ class CleanPromotionSummary:
     candidates: tuple[CleanVolunteerPayload, ...] = ()
 
 
-def promote_clean_volunteers(import_run, *, dry_run: bool = False) -> CleanPromotionSummary:
+class DryRunCleanEvaluator:
+    """
+    Streaming clean-promotion check for CSV dry runs.
+
+    Each DQ-passing row is checked for promotability and counted; payloads are
+    not retained, so memory stays flat regardless of file size.
+    """
+
+    def __init__(self) -> None:
+        self.rows_considered = 0
+        self.rows_skipped = 0
+
+    def check(
+        self,
+        raw: Mapping[str, object | None],
+        normalized: Mapping[str, object | None],
+        *,
+        external_system: str,
+        checksum: str | None = None,
+    ) -> bool:
+        """Return whether the row would be promoted to the clean layer."""
+
+        self.rows_considered += 1
+        payload = _build_payload_from_values(
+            raw,
+            normalized,
+            staging_volunteer_id=None,
+            external_system=external_system,
+            external_id=normalized.get("external_id"),
+            checksum=checksum,
+        )
+        if payload is None:
+            self.rows_skipped += 1
+            return False
+        return True
+
+    def summary(self) -> CleanPromotionSummary:
+        return CleanPromotionSummary(
+            rows_considered=self.rows_considered,
+            rows_promoted=0,
+            rows_skipped=self.rows_skipped,
+            dry_run=True,
+        )
+
+
+def promote_clean_volunteers(
+    import_run,
+    *,
+    dry_run: bool = False,
+    streamed_summary: CleanPromotionSummary | None = None,
+) -> CleanPromotionSummary:
     """
     Promote validated staging volunteers into the clean layer for further processing.
+
+    When ``streamed_summary`` is given (a streaming CSV dry run or fused ingest
+    already checked or promoted each row during staging), only its counts are
+    recorded.
     """
 
+    if streamed_summary is not None:
+        _update_clean_counts(import_run, streamed_summary)
+        return streamed_summary
+
     session = db.session
     rows = (
         session.query(StagingVolunteer)
@@ -107,6 +180,11 @@ def promote_clean_volunteers(import_run, *, dry_run: bool = False) -> CleanPromo
     rows_skipped = 0
     candidates: list[CleanVolunteerPayload] = []
 
+    set_based = _use_set_based_promotion(dry_run)
+    if set_based:
+        rows_promoted = promote_set_based(import_run, VOLUNTEER_PROMOTION)
+        rows = rows.filter(~StagingVolunteer.clean_record.has())
+
     for row in rows:
         rows_considered += 1
         payload = _build_payload(row)
@@ -140,6 +218,9 @@ def promote_clean_volunteers(import_run, *, dry_run: bool = False) -> CleanPromo
         session.add(clean_row)
         rows_promoted += 1
 
+    if set_based:
+        rows_considered, rows_skipped = _set_based_totals(import_run, VOLUNTEER_PROMOTION, rows_promoted)
+
     summary = CleanPromotionSummary(
         rows_considered=rows_considered,
         rows_promoted=rows_promoted,
@@ -159,9 +240,44 @@ def promote_clean_volunteers(import_run, *, dry_run: bool = False) -> CleanPromo
     return summary
 
 
+def _use_set_based_promotion(dry_run: bool) -> bool:
+    return not dry_run and resolve_clean_promotion_mode() == "set"
+
+
+def _set_based_totals(import_run, spec: CleanPromotionSpec, rows_promoted: int) -> tuple[int, int]:
+    """Return ``(rows_considered, rows_skipped)`` over every validated row once set-based promotion ran."""
+
+    staging_model = spec.staging_model
+    rows_considered = db.session.execute(
+        select(func.count())
+        .select_from(staging_model)
+        .where(staging_model.run_id == import_run.id, staging_model.status == StagingRecordStatus.VALIDATED)
+    ).scalar_one()
+    return rows_considered, rows_considered - rows_promoted
+
+
 def _build_payload(row: StagingVolunteer) -> CleanVolunteerPayload | None:
-    normalized = dict(row.normalized_json or {})
-    raw = dict(row.payload_json or {})
+    return _build_payload_from_values(
+        row.payload_json or {},
+        row.normalized_json or {},
+        staging_volunteer_id=row.id,
+        external_system=row.external_system,
+        external_id=row.external_id,
+        checksum=row.checksum,
+    )
+
+
+def _build_payload_from_values(
+    raw: Mapping[str, object | None],
+    normalized: Mapping[str, object | None],
+    *,
+    staging_volunteer_id: int | None,
+    external_system: str,
+    external_id: object | None,
+    checksum: str | None,
+) -> CleanVolunteerPayload | None:
+    normalized = dict(normalized)
+    raw = dict(raw)
 
     first_name = _coerce_string(normalized.get("first_name") or raw.get("first_name"))
     last_name = _coerce_string(normalized.get("last_name") or raw.get("last_name"))
@@ -169,9 +285,9 @@ def _build_payload(row: StagingVolunteer) -> CleanVolunteerPayload | None:
         return None
 
     external_system = (
-        _coerce_string(normalized.get("external_system") or raw.get("external_system")) or row.external_system
+        _coerce_string(normalized.get("external_system") or raw.get("external_system")) or external_system
     )
-    external_id = _coerce_string(normalized.get("external_id") or raw.get("external_id") or row.external_id)
+    external_id = _coerce_string(normalized.get("external_id") or raw.get("external_id") or external_id)
 
     email = _normalize_email(normalized.get("email") or normalized.get("email_normalized") or raw.get("email"))
     phone = _normalize_phone(normalized.get("phone_e164") or normalized.get("phone") or raw.get("phone"))
@@ -186,14 +302,14 @@ def _build_payload(row: StagingVolunteer) -> CleanVolunteerPayload | None:
     )
 
     return CleanVolunteerPayload(
-        staging_volunteer_id=row.id,
+        staging_volunteer_id=staging_volunteer_id,
         external_system=external_system,
         external_id=external_id,
         first_name=first_name,
         last_name=last_name,
         email=email,
         phone_e164=phone,
-        checksum=row.checksum,
+        checksum=checksum,
         normalized_payload=normalized,
     )
 
@@ -273,6 +389,11 @@ def promote_clean_organizations(import_run, *, dry_run: bool = False) -> CleanPr
     rows_skipped = 0
     candidates: list[CleanOrganizationPayload] = []
 
+    set_based = _use_set_based_promotion(dry_run)
+    if set_based:
+        rows_promoted = promote_set_based(import_run, ORGANIZATION_PROMOTION)
+        rows = rows.filter(~StagingOrganization.clean_record.has())
+
     for row in rows:
         rows_considered += 1
         payload = _build_organization_payload(row)
@@ -303,6 +424,9 @@ def promote_clean_organizations(import_run, *, dry_run: bool = False) -> CleanPr
         session.add(clean_row)
         rows_promoted += 1
 
+    if set_based:
+        rows_considered, rows_skipped = _set_based_totals(import_run, ORGANIZATION_PROMOTION, rows_promoted)
+
     summary = CleanPromotionSummary(
         rows_considered=rows_considered,
         rows_promoted=rows_promoted,
@@ -397,6 +521,11 @@ def promote_clean_affiliations(import_run, *, dry_run: bool = False) -> CleanPro
     rows_skipped = 0
     candidates: list[CleanAffiliationPayload] = []
 
+    set_based = _use_set_based_promotion(dry_run)
+    if set_based:
+        rows_promoted = promote_set_based(import_run, AFFILIATION_PROMOTION)
+        rows = rows.filter(~StagingAffiliation.clean_record.has())
+
     for row in rows:
         rows_considered += 1
         payload = _build_affiliation_payload(row)
@@ -428,6 +557,9 @@ def promote_clean_affiliations(import_run, *, dry_run: bool = False) -> CleanPro
         session.add(clean_row)
         rows_promoted += 1
 
+    if set_based:
+        rows_considered, rows_skipped = _set_based_totals(import_run, AFFILIATION_PROMOTION, rows_promoted)
+
     summary = CleanPromotionSummary(
         rows_considered=rows_considered,
         rows_promoted=rows_promoted,
@@ -528,6 +660,11 @@ def promote_clean_events(import_run, *, dry_run: bool = False) -> CleanPromotion
     rows_skipped = 0
     candidates: list[CleanEventPayload] = []
 
+    set_based = _use_set_based_promotion(dry_run)
+    if set_based:
+        rows_promoted = promote_set_based(import_run, EVENT_PROMOTION)
+        rows = rows.filter(~StagingEvent.clean_record.has())
+
     for row in rows:
         rows_considered += 1
         payload = _build_event_payload(row)
@@ -558,6 +695,9 @@ def promote_clean_events(import_run, *, dry_run: bool = False) -> CleanPromotion
         session.add(clean_row)
         rows_promoted += 1
 
+    if set_based:
+        rows_considered, rows_skipped = _set_based_totals(import_run, EVENT_PROMOTION, rows_promoted)
+
     summary = CleanPromotionSummary(
         rows_considered=rows_considered,
         rows_promoted=rows_promoted,
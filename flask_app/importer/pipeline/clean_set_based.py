@@ -0,0 +1,372 @@
+"""
+Set-based promotion of validated staging rows into the clean tables.
+
+Each entity type is promoted with a single ``INSERT ... SELECT``: canonical
+fields are extracted from ``normalized_json`` (falling back to the raw
+``payload_json`` keys the Python builders in ``clean.py`` use) with the
+database's JSON functions, SQLite ``json_extract``/``json_type`` and PostgreSQL
+``json_extract_path_text``/``json_typeof``. ``IMPORTER_CLEAN_PROMOTION``
+selects the mode:
+
+* ``set`` (the default) – set-based promotion on SQLite and PostgreSQL.
+* ``python`` – legacy path, one clean ORM object per staging row.
+
+The statement only takes rows whose referenced JSON values are strings (or
+objects of strings for nested Salesforce email/phone values), so every row it
+promotes matches what the Python builder would produce. Anything else, along
+with rows missing a required field, is left for the Python path to promote or
+skip. Staging rows keep their ``validated`` status; the clean row's staging
+foreign key records the promotion, as on the Python path.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from flask import current_app, has_app_context
+from sqlalchemy import JSON, Text, and_, case, cast, exists, func, insert, literal, null, or_, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.elements import ColumnElement
+
+from flask_app.models.base import db
+from flask_app.models.importer.schema import (
+    CleanAffiliation,
+    CleanEvent,
+    CleanOrganization,
+    CleanVolunteer,
+    StagingAffiliation,
+    StagingEvent,
+    StagingOrganization,
+    StagingRecordStatus,
+    StagingVolunteer,
+)
+
+logger = logging.getLogger(__name__)
+
+CLEAN_PROMOTION_MODES = ("set", "python")
+SET_BASED_DIALECTS = frozenset({"sqlite", "postgresql"})
+# Every character str.strip() removes (the highest is U+3000)
+_WHITESPACE = "".join(character for character in map(chr, range(0x3001)) if character.isspace())
+
+_EMAIL_KEYS = ("primary", "home", "work", "alternate")
+_PHONE_KEYS = ("primary", "mobile", "home", "work")
+
+
+@dataclass(frozen=True)
+class JsonSource:
+    """A key read from ``normalized_json`` or ``payload_json``; ``nested`` keys are tried when it is an object."""
+
+    column: str
+    key: str
+    nested: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class CleanField:
+    """
+    One clean column, derived like the matching ``clean.py`` builder.
+
+    ``sources`` are tried in order with ``or`` semantics (first non-empty
+    value wins) before stripping; ``staging_column`` is the staging column
+    appended as the last source. ``fallback_column`` is used when the stripped
+    value is empty. ``blank`` is the value stored when nothing is found:
+    ``None`` for optional columns, ``""`` for strings.
+    """
+
+    name: str
+    sources: tuple[JsonSource, ...]
+    staging_column: str | None = None
+    fallback_column: str | None = None
+    lower: bool = False
+    required: bool = False
+    blank: str | None = ""
+    in_payload: bool = True
+
+
+@dataclass(frozen=True)
+class CleanPromotionSpec:
+    staging_model: type
+    clean_model: type
+    staging_fk: str
+    fields: tuple[CleanField, ...]
+
+
+def _normalized(key: str, nested: tuple[str, ...] = ()) -> JsonSource:
+    return JsonSource("normalized_json", key, nested)
+
+
+def _raw(key: str, nested: tuple[str, ...] = ()) -> JsonSource:
+    return JsonSource("payload_json", key, nested)
+
+
+def _identity_fields() -> tuple[CleanField, ...]:
+    return (
+        CleanField(
+            "external_system",
+            (_normalized("external_system"), _raw("external_system")),
+            fallback_column="external_system",
+            in_payload=False,
+        ),
+        CleanField(
+            "external_id",
+            (_normalized("external_id"), _raw("external_id")),
+            staging_column="external_id",
+            in_payload=False,
+        ),
+    )
+
+
+VOLUNTEER_PROMOTION = CleanPromotionSpec(
+    staging_model=StagingVolunteer,
+    clean_model=CleanVolunteer,
+    staging_fk="staging_volunteer_id",
+    fields=(
+        CleanField("first_name", (_normalized("first_name"), _raw("first_name")), required=True),
+        CleanField("last_name", (_normalized("last_name"), _raw("last_name")), required=True),
+        *_identity_fields(),
+        CleanField(
+            "email",
+            (
+                _normalized("email", _EMAIL_KEYS),
+                _normalized("email_normalized", _EMAIL_KEYS),
+                _raw("email", _EMAIL_KEYS),
+            ),
+            lower=True,
+            blank=None,
+        ),
+        CleanField(
+            "phone_e164",
+            (
+                _normalized("phone_e164", _PHONE_KEYS),
+                _normalized("phone", _PHONE_KEYS),
+                _raw("phone", _PHONE_KEYS),
+            ),
+            blank=None,
+        ),
+    ),
+)
+
+ORGANIZATION_PROMOTION = CleanPromotionSpec(
+    staging_model=StagingOrganization,
+    clean_model=CleanOrganization,
+    staging_fk="staging_organization_id",
+    fields=(
+        CleanField("name", (_normalized("name"), _raw("Name")), required=True),
+        *_identity_fields(),
+    ),
+)
+
+AFFILIATION_PROMOTION = CleanPromotionSpec(
+    staging_model=StagingAffiliation,
+    clean_model=CleanAffiliation,
+    staging_fk="staging_affiliation_id",
+    fields=(
+        CleanField(
+            "contact_external_id",
+            (_normalized("contact_external_id"), _raw("npe5__Contact__c")),
+            required=True,
+        ),
+        CleanField(
+            "organization_external_id",
+            (_normalized("organization_external_id"), _raw("npe5__Organization__c")),
+            required=True,
+        ),
+        *_identity_fields(),
+    ),
+)
+
+EVENT_PROMOTION = CleanPromotionSpec(
+    staging_model=StagingEvent,
+    clean_model=CleanEvent,
+    staging_fk="staging_event_id",
+    fields=(
+        CleanField("title", (_normalized("title"), _raw("Name")), required=True),
+        *_identity_fields(),
+    ),
+)
+
+
+def resolve_clean_promotion_mode(requested: str | None = None) -> str:
+    """Resolve the configured promotion mode to the one usable on the bound database."""
+
+    mode = (requested or "").strip().lower()
+    if not mode and has_app_context():
+        mode = str(current_app.config.get("IMPORTER_CLEAN_PROMOTION", "set")).strip().lower()
+    if mode not in CLEAN_PROMOTION_MODES:
+        logger.warning("Unknown IMPORTER_CLEAN_PROMOTION %r; using 'set'.", mode)
+        mode = "set"
+    if mode == "set" and db.engine.dialect.name not in SET_BASED_DIALECTS:
+        logger.info("Set-based clean promotion is not supported on %s; using python.", db.engine.dialect.name)
+        return "python"
+    return mode
+
+
+def promote_set_based(import_run, spec: CleanPromotionSpec) -> int:
+    """
+    Promote eligible validated rows of ``spec.staging_model`` with one ``INSERT ... SELECT``.
+
+    Returns the number of clean rows inserted. Rows already promoted, rows the
+    statement cannot derive exactly, and rows missing a required field are left
+    untouched for the Python path.
+    """
+
+    session = db.session
+    json_sql = _JsonSql(session.get_bind().dialect.name)
+    staging = spec.staging_model.__table__
+    clean = spec.clean_model.__table__
+
+    values: dict[str, ColumnElement] = {}
+    eligible: list[ColumnElement] = [
+        json_sql.type_of(staging.c.normalized_json) == "object",
+        json_sql.type_of(staging.c.payload_json) == "object",
+    ]
+    for clean_field in spec.fields:
+        value = _field_value(json_sql, staging, clean_field)
+        values[clean_field.name] = value
+        for source in clean_field.sources:
+            eligible.append(json_sql.is_plain(staging.c[source.column], source))
+        if clean_field.lower:
+            # Python lower-cases all of Unicode; SQLite's lower() only ASCII
+            eligible.append(or_(value.is_(None), json_sql.is_ascii(value)))
+
+    promoted_at = datetime.now(timezone.utc)
+    payload_overrides = {field.name: values[field.name] for field in spec.fields if field.in_payload}
+    derived = (
+        select(
+            staging.c.id.label("staging_id"),
+            staging.c.sequence_number,
+            staging.c.checksum,
+            json_sql.with_keys(staging.c.normalized_json, payload_overrides).label("payload_json"),
+            *(value.label(name) for name, value in values.items()),
+        )
+        .where(
+            staging.c.run_id == import_run.id,
+            staging.c.status == StagingRecordStatus.VALIDATED,
+            ~exists(select(clean.c.id).where(clean.c[spec.staging_fk] == staging.c.id)),
+            *eligible,
+        )
+        .subquery("derived")
+    )
+
+    column_names = [spec.staging_fk, "run_id", "checksum", "payload_json", "promoted_at", "created_at", "updated_at"]
+    column_names.extend(values)
+    rows = (
+        select(
+            derived.c.staging_id,
+            literal(import_run.id, clean.c.run_id.type),
+            derived.c.checksum,
+            derived.c.payload_json,
+            literal(promoted_at, clean.c.promoted_at.type),
+            literal(promoted_at, clean.c.created_at.type),
+            literal(promoted_at, clean.c.updated_at.type),
+            *(derived.c[name] for name in values),
+        )
+        .where(*(derived.c[field.name] != "" for field in spec.fields if field.required))
+        .order_by(derived.c.sequence_number)
+    )
+    result = session.execute(insert(clean).from_select(column_names, rows))
+    promoted = max(result.rowcount or 0, 0)
+    if promoted:
+        # Staging rows already in the session still cache ``clean_record`` as unset
+        for instance in list(session.identity_map.values()):
+            if isinstance(instance, spec.staging_model):
+                session.expire(instance, ["clean_record"])
+    return promoted
+
+
+def _field_value(json_sql: "_JsonSql", staging, clean_field: CleanField) -> ColumnElement:
+    whens = []
+    for source in clean_field.sources:
+        column = staging.c[source.column]
+        text_value = json_sql.text(column, source.key)
+        whens.append((and_(json_sql.is_text(column, source.key), text_value != ""), text_value))
+        if source.nested:
+            whens.append((json_sql.is_nonempty_object(column, source.key), _first_non_empty(json_sql, column, source)))
+    if clean_field.staging_column is not None:
+        staging_column = staging.c[clean_field.staging_column]
+        whens.append((staging_column != "", staging_column))
+    value = json_sql.strip(case(*whens, else_=null()))
+    if clean_field.lower:
+        value = func.lower(value)
+    if clean_field.fallback_column is not None:
+        return func.coalesce(func.nullif(value, ""), staging.c[clean_field.fallback_column])
+    if clean_field.blank is None:
+        return func.nullif(value, "")
+    return func.coalesce(value, literal(clean_field.blank))
+
+
+def _first_non_empty(json_sql: "_JsonSql", column, source: JsonSource) -> ColumnElement:
+    values = [json_sql.text(column, source.key, nested_key) for nested_key in source.nested]
+    return func.coalesce(*(func.nullif(value, "") for value in values))
+
+
+class _JsonSql:
+    """Dialect-specific JSON expressions over the staging ``JSON`` columns."""
+
+    def __init__(self, dialect: str) -> None:
+        if dialect not in SET_BASED_DIALECTS:
+            raise ValueError(f"Set-based clean promotion is not supported on {dialect!r}.")
+        self.dialect = dialect
+        self.text_type = "text" if dialect == "sqlite" else "string"
+
+    def _path(self, keys: tuple[str, ...]) -> str:
+        return "$" + "".join(f'."{key}"' for key in keys)
+
+    def type_of(self, column, *keys: str) -> ColumnElement:
+        if self.dialect == "sqlite":
+            return func.json_type(column, self._path(keys))
+        target = func.json_extract_path(column, *keys) if keys else column
+        return func.json_typeof(target)
+
+    def text(self, column, *keys: str) -> ColumnElement:
+        if self.dialect == "sqlite":
+            return func.json_extract(column, self._path(keys))
+        return func.json_extract_path_text(column, *keys)
+
+    def is_text(self, column, *keys: str) -> ColumnElement:
+        return self.type_of(column, *keys) == self.text_type
+
+    def is_nonempty_object(self, column, *keys: str) -> ColumnElement:
+        if self.dialect == "sqlite":
+            object_text = func.json_extract(column, self._path(keys))
+            return and_(self.type_of(column, *keys) == "object", object_text != "{}")
+        target = cast(func.json_extract_path(column, *keys), JSONB)
+        return and_(self.type_of(column, *keys) == "object", target != cast(literal("{}"), JSONB))
+
+    def is_plain(self, column, source: JsonSource) -> ColumnElement:
+        """True when the source is missing, null, or a string (or, when nested, an object of those)."""
+
+        def scalar_ok(*keys: str) -> ColumnElement:
+            value_type = self.type_of(column, *keys)
+            return or_(value_type.is_(None), value_type.in_(("null", self.text_type)))
+
+        if not source.nested:
+            return scalar_ok(source.key)
+        nested_ok = and_(*(scalar_ok(source.key, nested_key) for nested_key in source.nested))
+        return or_(scalar_ok(source.key), and_(self.type_of(column, source.key) == "object", nested_ok))
+
+    def is_ascii(self, value: ColumnElement) -> ColumnElement:
+        if self.dialect == "sqlite":
+            return value.op("NOT GLOB")("*[^\x01-\x7f]*")
+        return ~value.op("~")("[^\x01-\x7f]")
+
+    def strip(self, value: ColumnElement) -> ColumnElement:
+        if self.dialect == "sqlite":
+            return func.trim(value, _WHITESPACE)
+        return func.btrim(value, _WHITESPACE)
+
+    def with_keys(self, column, overrides: dict[str, ColumnElement]) -> ColumnElement:
+        """``column`` (a JSON object) with ``overrides`` set, as a JSON value."""
+
+        if self.dialect == "sqlite":
+            arguments: list[object] = []
+            for key, value in overrides.items():
+                arguments.extend((self._path((key,)), value))
+            return func.json_set(column, *arguments, type_=JSON) if arguments else column
+        pairs: list[object] = []
+        for key, value in overrides.items():
+            pairs.extend((cast(literal(key), Text), value))
+        merged = cast(column, JSONB).op("||")(func.jsonb_build_object(*pairs))
+        return cast(merged, JSON)
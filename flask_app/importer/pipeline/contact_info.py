@@ -0,0 +1,172 @@
+"""
+Chunk-level email and phone reconciliation for core contact loads.
+
+Applying a contact's emails and phones one address at a time costs a lookup
+per address plus an ``UPDATE`` each time the primary flag moves, so a contact
+with several of each needs twenty or more statements. ``ContactInfoReconciler``
+collects the wanted addresses for every contact in a chunk, loads the chunk's
+existing ``ContactEmail`` and ``ContactPhone`` rows with one query each, works
+out inserts, type changes, and primary flags in memory, and writes them in a
+single flush (batched ``INSERT``/``UPDATE`` statements).
+
+Per contact, the result matches applying the wanted addresses in order: an
+existing address keeps its row and takes the wanted type, and whenever the
+wanted primary address is not already primary, every other address of that
+contact is unmarked first, so each contact ends with at most one primary.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+from flask import current_app
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session
+
+from flask_app.models import ContactEmail, ContactPhone, EmailType, PhoneType, Volunteer
+
+
+class WantedEmail(NamedTuple):
+    email: str
+    email_type: EmailType
+    is_primary: bool
+
+
+class WantedPhone(NamedTuple):
+    phone_number: str
+    phone_type: PhoneType
+    is_primary: bool
+
+
+class ContactInfoReconciler:
+    """Queue wanted emails and phones per contact and apply a chunk of them together."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self._volunteers: dict[int, Volunteer] = {}
+        self._emails: dict[int, list[WantedEmail]] = defaultdict(list)
+        self._phones: dict[int, list[WantedPhone]] = defaultdict(list)
+        self._pending_addresses: set[str] = set()
+
+    def queue(self, volunteer: Volunteer, *, emails: Sequence[WantedEmail], phones: Sequence[WantedPhone]) -> None:
+        """Record the addresses ``volunteer`` should have; nothing is written until ``flush``."""
+
+        self._volunteers[volunteer.id] = volunteer
+        self._emails[volunteer.id].extend(emails)
+        self._phones[volunteer.id].extend(phones)
+        self._pending_addresses.update(wanted.email.lower() for wanted in emails)
+
+    def has_pending(self, contact_id: int) -> bool:
+        return contact_id in self._volunteers
+
+    def has_pending_email(self, email: str | None) -> bool:
+        """Whether ``email`` is queued for any contact and not written yet."""
+
+        return bool(email) and email.lower() in self._pending_addresses
+
+    def flush(self) -> None:
+        """Apply every queued contact's emails and phones and flush the session."""
+
+        if not self._volunteers:
+            return
+        contact_ids = list(self._volunteers)
+        emails = _rows_by_contact(
+            self.session.scalars(select(ContactEmail).where(ContactEmail.contact_id.in_(contact_ids)))
+        )
+        phones = _rows_by_contact(
+            self.session.scalars(select(ContactPhone).where(ContactPhone.contact_id.in_(contact_ids)))
+        )
+        for contact_id, volunteer in self._volunteers.items():
+            self._reconcile(
+                volunteer,
+                "emails",
+                emails[contact_id],
+                self._emails[contact_id],
+                value_key="email",
+                type_key="email_type",
+                build=lambda wanted, contact_id=contact_id: ContactEmail(
+                    contact_id=contact_id,
+                    email=wanted.email,
+                    email_type=wanted.email_type,
+                    is_primary=wanted.is_primary,
+                    is_verified=False,
+                ),
+            )
+            self._reconcile(
+                volunteer,
+                "phones",
+                phones[contact_id],
+                self._phones[contact_id],
+                value_key="phone_number",
+                type_key="phone_type",
+                build=lambda wanted, contact_id=contact_id: ContactPhone(
+                    contact_id=contact_id,
+                    phone_number=wanted.phone_number,
+                    phone_type=wanted.phone_type,
+                    is_primary=wanted.is_primary,
+                    can_text=(wanted.phone_type == PhoneType.MOBILE),
+                ),
+            )
+        self.session.flush()
+        self._volunteers.clear()
+        self._emails.clear()
+        self._phones.clear()
+        self._pending_addresses.clear()
+
+    def _reconcile(
+        self,
+        volunteer: Volunteer,
+        collection: str,
+        rows: list[ContactEmail] | list[ContactPhone],
+        wanted_rows: Iterable[WantedEmail] | Iterable[WantedPhone],
+        *,
+        value_key: str,
+        type_key: str,
+        build: Callable,
+    ) -> None:
+        by_value = {getattr(row, value_key): row for row in rows}
+        # Only append to collections that are already loaded; appending would otherwise lazy-load them.
+        loaded_collection = collection not in inspect(volunteer).unloaded
+        for wanted in wanted_rows:
+            value, kind, is_primary = wanted
+            row = by_value.get(value)
+            if row is not None:
+                if getattr(row, type_key) != kind:
+                    setattr(row, type_key, kind)
+                if is_primary and not row.is_primary:
+                    _clear_primary(rows)
+                    row.is_primary = True
+                continue
+
+            if is_primary:
+                _clear_primary(rows)
+            try:
+                row = build(wanted)
+            except ValueError as exc:
+                current_app.logger.warning(
+                    f"Model validator rejected {value_key} for volunteer {volunteer.id}: {value} - {exc}"
+                )
+                continue
+            rows.append(row)
+            by_value[value] = row
+            if loaded_collection:
+                getattr(volunteer, collection).append(row)
+            self.session.add(row)
+            if collection == "emails":
+                current_app.logger.info(
+                    f"Added email {value} ({kind.value}) to volunteer {volunteer.id}, primary={is_primary}"
+                )
+
+
+def _rows_by_contact(rows: Iterable) -> dict[int, list]:
+    grouped: dict[int, list] = defaultdict(list)
+    for row in rows:
+        grouped[row.contact_id].append(row)
+    return grouped
+
+
+def _clear_primary(rows: Iterable[ContactEmail] | Iterable[ContactPhone]) -> None:
+    for row in rows:
+        if row.is_primary:
+            row.is_primary = False
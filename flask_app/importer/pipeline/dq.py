@@ -8,12 +8,19 @@ callers can persist to `dq_violations` or tally for metrics.
 
 from __future__ import annotations
 
+import random
 import re
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Sequence
+
+from flask import current_app, has_app_context
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm.util import identity_key
 
 from flask_app.importer.adapters import VolunteerCSVRow
+from flask_app.importer.metrics import record_dq_rule_evaluation
 from flask_app.models.base import db
 from flask_app.models.importer.schema import (
     DataQualitySeverity,
@@ -27,6 +34,10 @@ from flask_app.models.importer.schema import (
     StagingVolunteer,
 )
 
+DEFAULT_DRY_RUN_VIOLATION_SAMPLE_SIZE = 100
+DQ_BATCH_SIZE = 1000
+DQ_PROFILE_SAMPLE_SIZE = 1024
+
 
 @dataclass(frozen=True)
 class DQResult:
@@ -59,6 +70,24 @@ class DQRule:
         """Return violations for the provided payload."""
         raise NotImplementedError
 
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
+        """
+        Return ``(index, violation)`` pairs for a batch of payloads.
+
+        The default adapts :meth:`evaluate` row by row so existing rules keep
+        working; built-in rules override it to run over column arrays.
+        """
+        return [(index, result) for index, payload in enumerate(payloads) for result in self.evaluate(payload)]
+
+
+def _column(payloads: Sequence[Mapping[str, object | None]], key: str, fallback: str) -> list[object | None]:
+    """Extract one column from a batch of payloads, preferring ``key`` over ``fallback``."""
+    return [payload.get(key) or payload.get(fallback) for payload in payloads]
+
+
+def _str_column(payloads: Sequence[Mapping[str, object | None]], key: str, fallback: str) -> list[str]:
+    return [_coerce_str(value) for value in _column(payloads, key, fallback)]
+
 
 _EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 _E164_REGEX = re.compile(r"^\+[1-9]\d{7,14}$")
@@ -81,17 +110,23 @@ class EmailOrPhoneRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        email = _coerce_str(payload.get("email") or payload.get("email_normalized"))
-        phone = _coerce_str(payload.get("phone") or payload.get("phone_e164"))
-        if email or phone:
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
+        emails = _str_column(payloads, "email", "email_normalized")
+        phones = _str_column(payloads, "phone", "phone_e164")
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Row missing both email and phone; at least one contact method is required.",
-                details={"fields": ["email", "phone"]},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Row missing both email and phone; at least one contact method is required.",
+                    details={"fields": ["email", "phone"]},
+                ),
             )
+            for index, (email, phone) in enumerate(zip(emails, phones))
+            if not email and not phone
         ]
 
 
@@ -106,18 +141,22 @@ class EmailFormatRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        email = _coerce_str(payload.get("email") or payload.get("email_normalized"))
-        if not email:
-            return []
-        if _EMAIL_REGEX.match(email):
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
+        match = _EMAIL_REGEX.match
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Email is not in a valid format.",
-                details={"fields": ["email"], "value": email},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Email is not in a valid format.",
+                    details={"fields": ["email"], "value": email},
+                ),
             )
+            for index, email in enumerate(_str_column(payloads, "email", "email_normalized"))
+            if email and match(email) is None
         ]
 
 
@@ -132,18 +171,22 @@ class PhoneFormatRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        phone = _coerce_str(payload.get("phone") or payload.get("phone_e164"))
-        if not phone:
-            return []
-        if _E164_REGEX.match(phone):
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
+        match = _E164_REGEX.match
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Phone is not E.164 formatted (+<country><number>).",
-                details={"fields": ["phone"], "value": phone},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Phone is not E.164 formatted (+<country><number>).",
+                    details={"fields": ["phone"], "value": phone},
+                ),
             )
+            for index, phone in enumerate(_str_column(payloads, "phone", "phone_e164"))
+            if phone and match(phone) is None
         ]
 
 
@@ -177,6 +220,15 @@ MINIMAL_VOLUNTEER_RULES: Sequence[DQRule] = (
 )
 
 
+def _resolve_volunteer_rules() -> Sequence[DQRule]:
+    # Use configurable rules function instead of static tuple
+    try:
+        return get_minimal_volunteer_rules()
+    except Exception:
+        # Fallback to static rules if config access fails
+        return MINIMAL_VOLUNTEER_RULES
+
+
 def evaluate_rules(payload: Mapping[str, object | None], rules: Sequence[DQRule] | None = None) -> list[DQResult]:
     """
     Evaluate the provided payload against the configured rules.
@@ -189,21 +241,130 @@ def evaluate_rules(payload: Mapping[str, object | None], rules: Sequence[DQRule]
         List of violations (empty when the payload satisfies all rules).
     """
 
-    if rules is None:
-        # Use configurable rules function instead of static tuple
-        try:
-            applicable_rules = get_minimal_volunteer_rules()
-        except Exception:
-            # Fallback to static rules if config access fails
-            applicable_rules = MINIMAL_VOLUNTEER_RULES
-    else:
-        applicable_rules = rules
+    applicable_rules = _resolve_volunteer_rules() if rules is None else rules
     violations: list[DQResult] = []
     for rule in applicable_rules:
         violations.extend(rule.evaluate(payload))
     return violations
 
 
+@dataclass
+class DQRuleStats:
+    """Timing and invocation counters for one DQ rule across a run."""
+
+    invocations: int = 0
+    rows_evaluated: int = 0
+    violations: int = 0
+    total_seconds: float = 0.0
+    # (seconds per row, rows) for a sample of calls; batches weigh in by their row count.
+    samples: list[tuple[float, int]] = field(default_factory=list)
+
+    def observe(self, duration_seconds: float, *, rows: int, violations: int) -> None:
+        self.invocations += 1
+        self.rows_evaluated += rows
+        self.violations += violations
+        self.total_seconds += duration_seconds
+        # Calls cover one row (dry runs) or a whole batch, so sample the per-row time.
+        sample = (duration_seconds / rows if rows else duration_seconds, max(rows, 1))
+        # Reservoir sample of calls keeps p95 estimates bounded in memory.
+        if len(self.samples) < DQ_PROFILE_SAMPLE_SIZE:
+            self.samples.append(sample)
+        else:
+            slot = random.randrange(self.invocations)
+            if slot < DQ_PROFILE_SAMPLE_SIZE:
+                self.samples[slot] = sample
+
+    @property
+    def p95_seconds(self) -> float:
+        """The 95th percentile of the sampled per-row times, weighted by the rows each call covered."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        threshold = sum(rows for _, rows in ordered) * 0.95
+        covered = 0
+        for seconds, rows in ordered:
+            covered += rows
+            if covered >= threshold:
+                return seconds
+        return ordered[-1][0]
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "invocations": self.invocations,
+            "rows_evaluated": self.rows_evaluated,
+            "violations": self.violations,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "p95_ms": round(self.p95_seconds * 1000, 4),
+        }
+
+
+class DQRuleProfile:
+    """
+    Per-rule profile collected while evaluating DQ rules.
+
+    Each ``evaluate_batch`` call is timed and counted under its rule code; the
+    p95 is taken over per-row times so batched and per-row callers compare. Calls
+    are exported to the ``importer_dq_rule_*`` Prometheus metrics. With
+    ``export_calls=False`` (per-row streaming callers) nothing is exported per
+    call; :meth:`export_totals` adds the row and violation counters once.
+    """
+
+    def __init__(self, *, export_calls: bool = True) -> None:
+        self.rules: dict[str, DQRuleStats] = {}
+        self.export_calls = export_calls
+        self._totals_exported = False
+
+    def observe(self, rule_code: str, duration_seconds: float, *, rows: int, violations: int) -> None:
+        stats = self.rules.get(rule_code)
+        if stats is None:
+            stats = self.rules[rule_code] = DQRuleStats()
+        stats.observe(duration_seconds, rows=rows, violations=violations)
+        if self.export_calls:
+            record_dq_rule_evaluation(
+                rule_code=rule_code, duration_seconds=duration_seconds, rows=rows, violations=violations
+            )
+
+    def export_totals(self) -> None:
+        if self.export_calls or self._totals_exported:
+            return
+        self._totals_exported = True
+        for rule_code, stats in self.rules.items():
+            record_dq_rule_evaluation(
+                rule_code=rule_code, duration_seconds=None, rows=stats.rows_evaluated, violations=stats.violations
+            )
+
+    def to_dict(self) -> dict[str, dict[str, int | float]]:
+        return {code: self.rules[code].to_dict() for code in sorted(self.rules)}
+
+
+def evaluate_rules_batch(
+    payloads: Sequence[Mapping[str, object | None]],
+    rules: Sequence[DQRule] | None = None,
+    *,
+    profile: DQRuleProfile | None = None,
+) -> list[list[DQResult]]:
+    """
+    Evaluate a batch of payloads rule-by-rule and return violations per payload.
+
+    Each rule sees the whole batch through ``DQRule.evaluate_batch``; results
+    keep the same per-row order as calling :func:`evaluate_rules` row by row.
+    When ``profile`` is given, every rule call is timed and counted.
+    """
+
+    applicable_rules = _resolve_volunteer_rules() if rules is None else rules
+    results: list[list[DQResult]] = [[] for _ in payloads]
+    for rule in applicable_rules:
+        if profile is None:
+            pairs = rule.evaluate_batch(payloads)
+        else:
+            started = time.perf_counter()
+            pairs = rule.evaluate_batch(payloads)
+            profile.observe(rule.code, time.perf_counter() - started, rows=len(payloads), violations=len(pairs))
+        for index, violation in pairs:
+            results[index].append(violation)
+    return results
+
+
 def summarize_violations(results: Iterable[DQResult]) -> MutableMapping[str, int]:
     """
     Aggregate violation counts keyed by rule code.
@@ -227,17 +388,134 @@ class DQProcessingSummary:
     rows_quarantined: int
     violations: list[DQResult]
     dry_run: bool
+    violation_counts: MutableMapping[str, int] | None = None
+    rule_profile: Mapping[str, Mapping[str, int | float]] | None = None
 
     @property
     def rule_counts(self) -> MutableMapping[str, int]:
+        if self.violation_counts is not None:
+            return dict(self.violation_counts)
         return summarize_violations(self.violations)
 
 
+class DryRunDQEvaluator:
+    """
+    Streaming DQ evaluation for CSV dry runs.
+
+    Rows are evaluated one at a time and then discarded; only counters and the
+    first ``sample_size`` violations are kept, so memory stays flat regardless
+    of file size. ``rule_counts`` still reflects every violation seen.
+    """
+
+    def __init__(self, *, sample_size: int | None = None) -> None:
+        self.sample_size = max(_dry_run_violation_sample_size() if sample_size is None else sample_size, 0)
+        self.rules = _resolve_volunteer_rules()
+        self.rows_evaluated = 0
+        self.rows_validated = 0
+        self.rows_quarantined = 0
+        self.violation_counts: MutableMapping[str, int] = {}
+        self.violation_sample: list[DQResult] = []
+        self.profile = DQRuleProfile(export_calls=False)
+
+    def evaluate(self, row: VolunteerCSVRow) -> list[DQResult]:
+        """
+        Evaluate a single CSV row and return its violations (empty when it would validate).
+
+        As in the dry-run DQ pass this replaced, any violation quarantines the
+        row, including WARNING-severity ones such as the optional contact rule.
+        """
+
+        self.rows_evaluated += 1
+        (violations,) = evaluate_rules_batch((_compose_payload_from_csv_row(row),), self.rules, profile=self.profile)
+        if not violations:
+            self.rows_validated += 1
+            return violations
+        self.rows_quarantined += 1
+        for violation in violations:
+            self.violation_counts[violation.rule_code] = self.violation_counts.get(violation.rule_code, 0) + 1
+            if len(self.violation_sample) < self.sample_size:
+                self.violation_sample.append(violation)
+        return violations
+
+    def summary(self) -> DQProcessingSummary:
+        self.profile.export_totals()
+        return DQProcessingSummary(
+            rows_evaluated=self.rows_evaluated,
+            rows_validated=self.rows_validated,
+            rows_quarantined=self.rows_quarantined,
+            violations=list(self.violation_sample),
+            dry_run=True,
+            violation_counts=dict(self.violation_counts),
+            rule_profile=self.profile.to_dict(),
+        )
+
+
+class StreamingDQEvaluator:
+    """
+    DQ evaluation for volunteer rows evaluated in the same pass that stages them.
+
+    Used by the fused CSV ingest. Rows are the staging column values (``id``,
+    ``external_id``, ``source_record_id``, ``sequence_number``,
+    ``payload_json``, ``normalized_json``), and payloads, statuses, and
+    violation rows are derived exactly as ``run_minimal_dq`` derives them from
+    ``staging_volunteers``, so the recorded audit trail is the same.
+    """
+
+    def __init__(self, import_run) -> None:
+        self.run_id = import_run.id
+        self.entity = _dq_entities()[0]
+        self.rules = self.entity.rules()
+        self.rows_evaluated = 0
+        self.rows_validated = 0
+        self.rows_quarantined = 0
+        self.error_violations: list[DQResult] = []
+        self.profile = DQRuleProfile()
+
+    def evaluate(self, rows: Sequence[Any]) -> list[list[DQResult]]:
+        """Evaluate a batch of rows and return all violations (errors and warnings) per row."""
+
+        payloads = [self.entity.compose_payload(row) for row in rows]
+        results = evaluate_rules_batch(payloads, self.rules, profile=self.profile)
+        for violations in results:
+            self.rows_evaluated += 1
+            errors = [violation for violation in violations if violation.severity == DataQualitySeverity.ERROR]
+            if errors:
+                self.rows_quarantined += 1
+                self.error_violations.extend(errors)
+            else:
+                self.rows_validated += 1
+        return results
+
+    def violation_params(self, row: Any, violations: Sequence[DQResult]) -> list[dict[str, object]]:
+        return _violation_params(self.run_id, self.entity, row, violations)
+
+    def summary(self) -> DQProcessingSummary:
+        return DQProcessingSummary(
+            rows_evaluated=self.rows_evaluated,
+            rows_validated=self.rows_validated,
+            rows_quarantined=self.rows_quarantined,
+            violations=list(self.error_violations),
+            dry_run=False,
+            rule_profile=self.profile.to_dict(),
+        )
+
+
+def _dry_run_violation_sample_size() -> int:
+    if not has_app_context():
+        return DEFAULT_DRY_RUN_VIOLATION_SAMPLE_SIZE
+    value = current_app.config.get("IMPORTER_DRY_RUN_VIOLATION_SAMPLE_SIZE", DEFAULT_DRY_RUN_VIOLATION_SAMPLE_SIZE)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_DRY_RUN_VIOLATION_SAMPLE_SIZE
+
+
 def run_minimal_dq(
     import_run,
     *,
     dry_run: bool = False,
-    csv_rows: Sequence[VolunteerCSVRow] | None = None,
+    csv_rows: Iterable[VolunteerCSVRow] | None = None,
+    streamed_summary: DQProcessingSummary | None = None,
 ) -> DQProcessingSummary:
     """
     Evaluate staged volunteer/organization rows for a given import run and persist violations.
@@ -246,212 +524,202 @@ def run_minimal_dq(
         import_run: `ImportRun` instance whose staged rows should be evaluated.
         dry_run: If true, no database state is mutated; a summary is still
             returned for diagnostics.
+        csv_rows: Optional CSV rows to evaluate in a dry run; consumed as a stream.
+        streamed_summary: Result of DQ already evaluated while staging
+            (``StagingSummary.streamed_dq``, from a streaming dry run or a
+            fused ingest); only its counts are recorded.
     """
+    if streamed_summary is not None:
+        _update_dq_counts(import_run, streamed_summary)
+        return streamed_summary
     if dry_run:
-        if csv_rows:
+        if csv_rows is not None:
             return _run_minimal_dq_dry_run(import_run, csv_rows)
         return _run_minimal_dq_from_staging(import_run)
 
+    summary = _evaluate_staged_entities(import_run, persist=True)
+    _update_dq_counts(import_run, summary)
+    return summary
+
+
+@dataclass(frozen=True)
+class _DQEntity:
+    """How one staging table is read, evaluated, and recorded by the batch DQ pass."""
+
+    model: type
+    entity_type: str
+    violation_fk: str
+    compose_payload: Callable[[Any], MutableMapping[str, object | None]]
+    record_key: Callable[[Any], str]
+    rules: Callable[[], Sequence[DQRule]]
+
+
+def _dq_entities() -> tuple[_DQEntity, ...]:
+    return (
+        _DQEntity(
+            StagingVolunteer,
+            "volunteer",
+            "staging_volunteer_id",
+            _compose_payload,
+            _compose_record_key,
+            _resolve_volunteer_rules,
+        ),
+        _DQEntity(
+            StagingOrganization,
+            "organization",
+            "staging_organization_id",
+            _compose_organization_payload,
+            _compose_organization_record_key,
+            _organization_rules,
+        ),
+        _DQEntity(
+            StagingAffiliation,
+            "affiliation",
+            "staging_affiliation_id",
+            _compose_affiliation_payload,
+            _compose_affiliation_record_key,
+            _affiliation_rules_for_run,
+        ),
+        _DQEntity(
+            StagingEvent,
+            "event",
+            "staging_event_id",
+            evaluate_event_payload,
+            _compose_event_record_key,
+            _event_rules,
+        ),
+    )
+
+
+def _evaluate_staged_entities(import_run, *, persist: bool, batch_size: int = DQ_BATCH_SIZE) -> DQProcessingSummary:
+    """
+    Evaluate every landed staging row for a run in batches of ``batch_size``.
+
+    Rows are read as plain column tuples, evaluated rule-by-rule with
+    ``evaluate_batch``, and, when ``persist`` is true, recorded with one bulk
+    status UPDATE and one bulk violation INSERT per batch. Only ERROR
+    violations quarantine a row; warnings are logged alongside them.
+    """
+
     session = db.session
     now = datetime.now(timezone.utc)
     rows_evaluated = 0
     rows_validated = 0
     rows_quarantined = 0
-    all_violations: list[DQResult] = []
-
-    # Process volunteers
-    volunteer_rows = (
-        session.query(StagingVolunteer)
-        .filter(
-            StagingVolunteer.run_id == import_run.id,
-            StagingVolunteer.status == StagingRecordStatus.LANDED,
-        )
-        .order_by(StagingVolunteer.sequence_number)
-    )
-
-    for row in volunteer_rows:
-        rows_evaluated += 1
-        payload = _compose_payload(row)
-        violations = list(evaluate_rules(payload))
-        # Separate errors (blocking) from warnings (non-blocking)
-        error_violations = [v for v in violations if v.severity == DataQualitySeverity.ERROR]
-
-        # Only quarantine on ERROR severity violations
-        if not error_violations:
-            rows_validated += 1
-            row.status = StagingRecordStatus.VALIDATED
-            row.processed_at = now
-            row.last_error = None
-        else:
-            rows_quarantined += 1
-            all_violations.extend(error_violations)
-            row.status = StagingRecordStatus.QUARANTINED
-            row.last_error = error_violations[0].message
-            row.processed_at = now
-
-        # Log all violations (both errors and warnings) for tracking
-        for violation in violations:
-            session.add(
-                DataQualityViolation(
-                    run_id=import_run.id,
-                    staging_volunteer_id=row.id,
-                    entity_type="volunteer",
-                    record_key=_compose_record_key(row),
-                    rule_code=violation.rule_code,
-                    severity=violation.severity,
-                    status=DataQualityStatus.OPEN,
-                    message=violation.message,
-                    details_json=dict(violation.details),
-                )
+    error_violations: list[DQResult] = []
+    profile = DQRuleProfile()
+
+    for entity in _dq_entities():
+        table = entity.model.__table__
+        row_ids = (
+            session.execute(
+                select(table.c.id)
+                .where(table.c.run_id == import_run.id, table.c.status == StagingRecordStatus.LANDED)
+                .order_by(table.c.sequence_number)
             )
-
-    # Process organizations
-    org_rows = (
-        session.query(StagingOrganization)
-        .filter(
-            StagingOrganization.run_id == import_run.id,
-            StagingOrganization.status == StagingRecordStatus.LANDED,
+            .scalars()
+            .all()
         )
-        .order_by(StagingOrganization.sequence_number)
-    )
-
-    for row in org_rows:
-        rows_evaluated += 1
-        payload = _compose_organization_payload(row)
-        violations = list(evaluate_organization_rules(payload))
-        # Separate errors (blocking) from warnings (non-blocking)
-        error_violations = [v for v in violations if v.severity == DataQualitySeverity.ERROR]
-
-        # Only quarantine on ERROR severity violations
-        if not error_violations:
-            rows_validated += 1
-            row.status = StagingRecordStatus.VALIDATED
-            row.processed_at = now
-            row.last_error = None
-        else:
-            rows_quarantined += 1
-            all_violations.extend(error_violations)
-            row.status = StagingRecordStatus.QUARANTINED
-            row.last_error = error_violations[0].message
-            row.processed_at = now
-
-        # Log all violations (both errors and warnings) for tracking
-        for violation in violations:
-            session.add(
-                DataQualityViolation(
-                    run_id=import_run.id,
-                    staging_organization_id=row.id,
-                    entity_type="organization",
-                    record_key=_compose_organization_record_key(row),
-                    rule_code=violation.rule_code,
-                    severity=violation.severity,
-                    status=DataQualityStatus.OPEN,
-                    message=violation.message,
-                    details_json=dict(violation.details),
+        if not row_ids:
+            continue
+        rules = entity.rules()
+        for start in range(0, len(row_ids), batch_size):
+            rows = session.execute(
+                select(
+                    table.c.id,
+                    table.c.external_id,
+                    table.c.source_record_id,
+                    table.c.sequence_number,
+                    table.c.payload_json,
+                    table.c.normalized_json,
                 )
-            )
+                .where(table.c.id.in_(row_ids[start : start + batch_size]))
+                .order_by(table.c.sequence_number)
+            ).all()
+            results = evaluate_rules_batch([entity.compose_payload(row) for row in rows], rules, profile=profile)
+
+            status_params: list[dict[str, object]] = []
+            violation_params: list[dict[str, object]] = []
+            for row, violations in zip(rows, results):
+                rows_evaluated += 1
+                errors = [violation for violation in violations if violation.severity == DataQualitySeverity.ERROR]
+                if errors:
+                    rows_quarantined += 1
+                    error_violations.extend(errors)
+                else:
+                    rows_validated += 1
+                if not persist:
+                    continue
+                status_params.append(
+                    {
+                        "row_id": row.id,
+                        "new_status": StagingRecordStatus.QUARANTINED if errors else StagingRecordStatus.VALIDATED,
+                        "new_error": errors[0].message if errors else None,
+                    }
+                )
+                # Log all violations (both errors and warnings) for tracking
+                violation_params.extend(_violation_params(import_run.id, entity, row, violations))
+            if persist:
+                _persist_dq_batch(entity, status_params, violation_params, now)
 
-    # Process affiliations
-    affiliation_rows = (
-        session.query(StagingAffiliation)
-        .filter(
-            StagingAffiliation.run_id == import_run.id,
-            StagingAffiliation.status == StagingRecordStatus.LANDED,
-        )
-        .order_by(StagingAffiliation.sequence_number)
+    return DQProcessingSummary(
+        rows_evaluated=rows_evaluated,
+        rows_validated=rows_validated,
+        rows_quarantined=rows_quarantined,
+        violations=error_violations,
+        dry_run=not persist,
+        rule_profile=profile.to_dict(),
     )
 
-    for row in affiliation_rows:
-        rows_evaluated += 1
-        payload = _compose_affiliation_payload(row)
-        violations = list(evaluate_affiliation_rules(payload))
-        # Separate errors (blocking) from warnings (non-blocking)
-        error_violations = [v for v in violations if v.severity == DataQualitySeverity.ERROR]
-
-        # Only quarantine on ERROR severity violations
-        if not error_violations:
-            rows_validated += 1
-            row.status = StagingRecordStatus.VALIDATED
-            row.processed_at = now
-            row.last_error = None
-        else:
-            rows_quarantined += 1
-            all_violations.extend(error_violations)
-            row.status = StagingRecordStatus.QUARANTINED
-            row.last_error = error_violations[0].message
-            row.processed_at = now
-
-        # Log all violations (both errors and warnings) for tracking
-        for violation in violations:
-            session.add(
-                DataQualityViolation(
-                    run_id=import_run.id,
-                    staging_affiliation_id=row.id,
-                    entity_type="affiliation",
-                    record_key=_compose_affiliation_record_key(row),
-                    rule_code=violation.rule_code,
-                    severity=violation.severity,
-                    status=DataQualityStatus.OPEN,
-                    message=violation.message,
-                    details_json=dict(violation.details),
-                )
-            )
 
-    # Process events
-    event_rows = (
-        session.query(StagingEvent)
-        .filter(
-            StagingEvent.run_id == import_run.id,
-            StagingEvent.status == StagingRecordStatus.LANDED,
-        )
-        .order_by(StagingEvent.sequence_number)
-    )
+def _violation_params(
+    run_id: int, entity: _DQEntity, row: Any, violations: Sequence[DQResult]
+) -> list[dict[str, object]]:
+    """Rows for a bulk ``dq_violations`` insert, one per violation of a staged ``row``."""
 
-    for row in event_rows:
-        rows_evaluated += 1
-        payload = evaluate_event_payload(row)
-        violations = list(evaluate_event_rules(payload))
-        # Separate errors (blocking) from warnings (non-blocking)
-        error_violations = [v for v in violations if v.severity == DataQualitySeverity.ERROR]
-
-        # Only quarantine on ERROR severity violations
-        if not error_violations:
-            rows_validated += 1
-            row.status = StagingRecordStatus.VALIDATED
-            row.processed_at = now
-            row.last_error = None
-        else:
-            rows_quarantined += 1
-            all_violations.extend(error_violations)
-            row.status = StagingRecordStatus.QUARANTINED
-            row.last_error = error_violations[0].message
-            row.processed_at = now
+    if not violations:
+        return []
+    record_key = entity.record_key(row)
+    return [
+        {
+            "run_id": run_id,
+            entity.violation_fk: row.id,
+            "entity_type": entity.entity_type,
+            "record_key": record_key,
+            "rule_code": violation.rule_code,
+            "severity": violation.severity,
+            "status": DataQualityStatus.OPEN,
+            "message": violation.message,
+            "details_json": dict(violation.details),
+        }
+        for violation in violations
+    ]
 
-        # Log all violations (both errors and warnings) for tracking
-        for violation in violations:
-            session.add(
-                DataQualityViolation(
-                    run_id=import_run.id,
-                    staging_event_id=row.id,
-                    entity_type="event",
-                    record_key=_compose_event_record_key(row),
-                    rule_code=violation.rule_code,
-                    severity=violation.severity,
-                    status=DataQualityStatus.OPEN,
-                    message=violation.message,
-                    details_json=dict(violation.details),
-                )
-            )
 
-    summary = DQProcessingSummary(
-        rows_evaluated=rows_evaluated,
-        rows_validated=rows_validated,
-        rows_quarantined=rows_quarantined,
-        violations=all_violations,
-        dry_run=dry_run,
+def _persist_dq_batch(
+    entity: _DQEntity,
+    status_params: list[dict[str, object]],
+    violation_params: list[dict[str, object]],
+    now: datetime,
+) -> None:
+    if not status_params:
+        return
+    session = db.session
+    table = entity.model.__table__
+    session.execute(
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(status=bindparam("new_status"), last_error=bindparam("new_error"), processed_at=now),
+        status_params,
     )
-    _update_dq_counts(import_run, summary)
-    return summary
+    if violation_params:
+        session.execute(insert(DataQualityViolation.__table__), violation_params)
+
+    # Bulk statements bypass the unit of work; drop stale copies of any rows already loaded in this session.
+    for params in status_params:
+        instance = session.identity_map.get(identity_key(entity.model, params["row_id"]))
+        if instance is not None:
+            session.expire(instance)
 
 
 def _compose_payload(row: StagingVolunteer) -> MutableMapping[str, object | None]:
@@ -592,32 +860,35 @@ class OrganizationNameRequiredRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        name = _coerce_str(payload.get("name") or payload.get("Name"))
-        if name:
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Organization missing required name field.",
-                details={"fields": ["name"]},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Organization missing required name field.",
+                    details={"fields": ["name"]},
+                ),
             )
+            for index, name in enumerate(_str_column(payloads, "name", "Name"))
+            if not name
         ]
 
 
+def _organization_rules() -> Sequence[DQRule]:
+    return (OrganizationNameRequiredRule(),)
+
+
 def evaluate_organization_rules(payload: Mapping[str, object | None]) -> Iterable[DQResult]:
     """
     Evaluate all applicable organization DQ rules against a payload.
 
     Returns violations found (empty if payload passes all rules).
     """
-    applicable_rules: list[DQRule] = [
-        OrganizationNameRequiredRule(),
-    ]
-    violations: list[DQResult] = []
-    for rule in applicable_rules:
-        violations.extend(rule.evaluate(payload))
-    return violations
+    return evaluate_rules(payload, _organization_rules())
 
 
 class EventTitleRequiredRule(DQRule):
@@ -631,16 +902,21 @@ class EventTitleRequiredRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        title = _coerce_str(payload.get("title") or payload.get("Name"))
-        if title:
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Event missing required title field.",
-                details={"fields": ["title"]},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Event missing required title field.",
+                    details={"fields": ["title"]},
+                ),
             )
+            for index, title in enumerate(_str_column(payloads, "title", "Name"))
+            if not title
         ]
 
 
@@ -655,16 +931,21 @@ class EventStartDateRequiredRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        start_date = payload.get("start_date") or payload.get("Start_Date_and_Time__c")
-        if start_date:
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Event missing required start_date field.",
-                details={"fields": ["start_date"]},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Event missing required start_date field.",
+                    details={"fields": ["start_date"]},
+                ),
             )
+            for index, start_date in enumerate(_column(payloads, "start_date", "Start_Date_and_Time__c"))
+            if not start_date
         ]
 
 
@@ -679,32 +960,39 @@ class EventDateValidationRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        start_date_str = payload.get("start_date") or payload.get("Start_Date_and_Time__c")
-        end_date_str = payload.get("end_date") or payload.get("End_Date_and_Time__c")
-
-        if not start_date_str or not end_date_str:
-            return []  # Skip validation if either date is missing
-
-        try:
-            start_dt = datetime.fromisoformat(str(start_date_str).replace("Z", "+00:00"))
-            end_dt = datetime.fromisoformat(str(end_date_str).replace("Z", "+00:00"))
-            if end_dt > start_dt:
-                return []
-            return [
-                DQResult(
-                    rule_code=self.code,
-                    severity=self.severity,
-                    message="Event end date must be after start date.",
-                    details={
-                        "fields": ["start_date", "end_date"],
-                        "start_date": str(start_date_str),
-                        "end_date": str(end_date_str),
-                    },
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
+        starts = _column(payloads, "start_date", "Start_Date_and_Time__c")
+        ends = _column(payloads, "end_date", "End_Date_and_Time__c")
+        results: list[tuple[int, DQResult]] = []
+        for index, (start_date_str, end_date_str) in enumerate(zip(starts, ends)):
+            if not start_date_str or not end_date_str:
+                continue  # Skip validation if either date is missing
+            try:
+                start_dt = datetime.fromisoformat(str(start_date_str).replace("Z", "+00:00"))
+                end_dt = datetime.fromisoformat(str(end_date_str).replace("Z", "+00:00"))
+                if end_dt > start_dt:
+                    continue
+            except Exception:
+                # If date parsing fails, skip validation (format errors handled elsewhere)
+                continue
+            results.append(
+                (
+                    index,
+                    DQResult(
+                        rule_code=self.code,
+                        severity=self.severity,
+                        message="Event end date must be after start date.",
+                        details={
+                            "fields": ["start_date", "end_date"],
+                            "start_date": str(start_date_str),
+                            "end_date": str(end_date_str),
+                        },
+                    ),
                 )
-            ]
-        except Exception:
-            # If date parsing fails, skip validation (format errors handled elsewhere)
-            return []
+            )
+        return results
 
 
 def evaluate_event_payload(row: StagingEvent) -> MutableMapping[str, object | None]:
@@ -732,21 +1020,21 @@ def _compose_event_record_key(row: StagingEvent) -> str:
     return f"row-{row.id}"
 
 
+def _event_rules() -> Sequence[DQRule]:
+    return (
+        EventTitleRequiredRule(),
+        EventStartDateRequiredRule(),
+        EventDateValidationRule(),
+    )
+
+
 def evaluate_event_rules(payload: Mapping[str, object | None]) -> Iterable[DQResult]:
     """
     Evaluate all applicable event DQ rules against a payload.
 
     Returns violations found (empty if payload passes all rules).
     """
-    applicable_rules: list[DQRule] = [
-        EventTitleRequiredRule(),
-        EventStartDateRequiredRule(),
-        EventDateValidationRule(),
-    ]
-    violations: list[DQResult] = []
-    for rule in applicable_rules:
-        violations.extend(rule.evaluate(payload))
-    return violations
+    return evaluate_rules(payload, _event_rules())
 
 
 def _compose_affiliation_payload(row: StagingAffiliation) -> MutableMapping[str, object | None]:
@@ -803,16 +1091,23 @@ class AffiliationContactRequiredRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        contact_external_id = _coerce_str(payload.get("contact_external_id") or payload.get("npe5__Contact__c"))
-        if contact_external_id:
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Affiliation missing required contact external ID (npe5__Contact__c).",
-                details={"fields": ["contact_external_id", "npe5__Contact__c"]},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Affiliation missing required contact external ID (npe5__Contact__c).",
+                    details={"fields": ["contact_external_id", "npe5__Contact__c"]},
+                ),
+            )
+            for index, contact_external_id in enumerate(
+                _str_column(payloads, "contact_external_id", "npe5__Contact__c")
             )
+            if not contact_external_id
         ]
 
 
@@ -827,30 +1122,74 @@ class AffiliationOrganizationRequiredRule(DQRule):
         )
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
-        organization_external_id = _coerce_str(
-            payload.get("organization_external_id") or payload.get("npe5__Organization__c")
-        )
-        if organization_external_id:
-            return []
+        return [result for _, result in self.evaluate_batch((payload,))]
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
         return [
-            DQResult(
-                rule_code=self.code,
-                severity=self.severity,
-                message="Affiliation missing required organization external ID (npe5__Organization__c).",
-                details={"fields": ["organization_external_id", "npe5__Organization__c"]},
+            (
+                index,
+                DQResult(
+                    rule_code=self.code,
+                    severity=self.severity,
+                    message="Affiliation missing required organization external ID (npe5__Organization__c).",
+                    details={"fields": ["organization_external_id", "npe5__Organization__c"]},
+                ),
+            )
+            for index, organization_external_id in enumerate(
+                _str_column(payloads, "organization_external_id", "npe5__Organization__c")
             )
+            if not organization_external_id
         ]
 
 
+@dataclass(frozen=True)
+class AffiliationReferenceSet:
+    """Active Salesforce contact and organization external IDs known to ``ExternalIdMap``."""
+
+    contact_ids: frozenset[str]
+    organization_ids: frozenset[str]
+
+    @classmethod
+    def load(cls, *, chunk_size: int = 10000) -> AffiliationReferenceSet:
+        """Load both sets with one streamed query each."""
+        return cls(
+            contact_ids=_load_active_salesforce_ids("salesforce_contact", chunk_size),
+            organization_ids=_load_active_salesforce_ids("salesforce_organization", chunk_size),
+        )
+
+
+def _load_active_salesforce_ids(entity_type: str, chunk_size: int) -> frozenset[str]:
+    statement = (
+        select(ExternalIdMap.external_id)
+        .where(
+            ExternalIdMap.external_system == "salesforce",
+            ExternalIdMap.entity_type == entity_type,
+            ExternalIdMap.is_active.is_(True),
+        )
+        .execution_options(yield_per=chunk_size)
+    )
+    return frozenset(db.session.execute(statement).scalars())
+
+
 class AffiliationReferenceValidationRule(DQRule):
-    """Ensure both contact and organization exist in ExternalIdMap."""
+    """
+    Ensure both contact and organization exist in ExternalIdMap.
 
-    def __init__(self, severity: DataQualitySeverity = DataQualitySeverity.ERROR) -> None:
+    With ``references`` (a run-scoped :class:`AffiliationReferenceSet`) lookups
+    are set membership checks; without it each payload issues its own queries.
+    """
+
+    def __init__(
+        self,
+        severity: DataQualitySeverity = DataQualitySeverity.ERROR,
+        references: AffiliationReferenceSet | None = None,
+    ) -> None:
         super().__init__(
             code="AFF_REFERENCE_VALIDATION",
             description="Affiliation contact and organization must exist in ExternalIdMap.",
             severity=severity,
         )
+        object.__setattr__(self, "references", references)
 
     def evaluate(self, payload: Mapping[str, object | None]) -> Iterable[DQResult]:
         contact_external_id = _coerce_str(payload.get("contact_external_id") or payload.get("npe5__Contact__c"))
@@ -862,32 +1201,42 @@ class AffiliationReferenceValidationRule(DQRule):
             # Skip validation if required fields are missing (handled by other rules)
             return []
 
-        # Check if contact exists in ExternalIdMap
-        contact_exists = (
-            db.session.query(ExternalIdMap)
-            .filter_by(
-                external_system="salesforce",
-                external_id=contact_external_id,
-                entity_type="salesforce_contact",
-                is_active=True,
-            )
-            .first()
-            is not None
-        )
-
-        # Check if organization exists in ExternalIdMap
-        organization_exists = (
-            db.session.query(ExternalIdMap)
-            .filter_by(
-                external_system="salesforce",
-                external_id=organization_external_id,
-                entity_type="salesforce_organization",
-                is_active=True,
-            )
-            .first()
-            is not None
-        )
-
+        if self.references is not None:
+            contact_exists = contact_external_id in self.references.contact_ids
+            organization_exists = organization_external_id in self.references.organization_ids
+        else:
+            contact_exists = _salesforce_id_exists(contact_external_id, "salesforce_contact")
+            organization_exists = _salesforce_id_exists(organization_external_id, "salesforce_organization")
+        return self._violations(contact_external_id, organization_external_id, contact_exists, organization_exists)
+
+    def evaluate_batch(self, payloads: Sequence[Mapping[str, object | None]]) -> list[tuple[int, DQResult]]:
+        if self.references is None:
+            return super().evaluate_batch(payloads)
+        contact_ids = self.references.contact_ids
+        organization_ids = self.references.organization_ids
+        contacts = _str_column(payloads, "contact_external_id", "npe5__Contact__c")
+        organizations = _str_column(payloads, "organization_external_id", "npe5__Organization__c")
+        results: list[tuple[int, DQResult]] = []
+        for index, (contact_external_id, organization_external_id) in enumerate(zip(contacts, organizations)):
+            if not contact_external_id or not organization_external_id:
+                continue
+            contact_exists = contact_external_id in contact_ids
+            organization_exists = organization_external_id in organization_ids
+            if contact_exists and organization_exists:
+                continue
+            for violation in self._violations(
+                contact_external_id, organization_external_id, contact_exists, organization_exists
+            ):
+                results.append((index, violation))
+        return results
+
+    def _violations(
+        self,
+        contact_external_id: str,
+        organization_external_id: str,
+        contact_exists: bool,
+        organization_exists: bool,
+    ) -> list[DQResult]:
         violations = []
         if not contact_exists:
             violations.append(
@@ -918,154 +1267,57 @@ class AffiliationReferenceValidationRule(DQRule):
         return violations
 
 
+def _salesforce_id_exists(external_id: str, entity_type: str) -> bool:
+    return (
+        db.session.query(ExternalIdMap)
+        .filter_by(
+            external_system="salesforce",
+            external_id=external_id,
+            entity_type=entity_type,
+            is_active=True,
+        )
+        .first()
+        is not None
+    )
+
+
+def _affiliation_rules(references: AffiliationReferenceSet | None = None) -> Sequence[DQRule]:
+    return (
+        AffiliationContactRequiredRule(),
+        AffiliationOrganizationRequiredRule(),
+        AffiliationReferenceValidationRule(references=references),
+    )
+
+
+def _affiliation_rules_for_run() -> Sequence[DQRule]:
+    # Reference IDs are loaded once per run instead of two queries per staged affiliation.
+    return _affiliation_rules(AffiliationReferenceSet.load())
+
+
 def evaluate_affiliation_rules(payload: Mapping[str, object | None]) -> Iterable[DQResult]:
     """
     Evaluate all applicable affiliation DQ rules against a payload.
 
     Returns violations found (empty if payload passes all rules).
     """
-    applicable_rules: list[DQRule] = [
-        AffiliationContactRequiredRule(),
-        AffiliationOrganizationRequiredRule(),
-        AffiliationReferenceValidationRule(),
-    ]
-    violations: list[DQResult] = []
-    for rule in applicable_rules:
-        violations.extend(rule.evaluate(payload))
-    return violations
+    return evaluate_rules(payload, _affiliation_rules())
 
 
 def _run_minimal_dq_dry_run(
     import_run,
-    csv_rows: Sequence[VolunteerCSVRow],
+    csv_rows: Iterable[VolunteerCSVRow],
 ) -> DQProcessingSummary:
-    rows_evaluated = 0
-    rows_validated = 0
-    rows_quarantined = 0
-    all_violations: list[DQResult] = []
-
+    evaluator = DryRunDQEvaluator()
     for row in csv_rows:
-        rows_evaluated += 1
-        payload = _compose_payload_from_csv_row(row)
-        violations = list(evaluate_rules(payload))
-        if violations:
-            rows_quarantined += 1
-            all_violations.extend(violations)
-        else:
-            rows_validated += 1
+        evaluator.evaluate(row)
 
-    summary = DQProcessingSummary(
-        rows_evaluated=rows_evaluated,
-        rows_validated=rows_validated,
-        rows_quarantined=rows_quarantined,
-        violations=all_violations,
-        dry_run=True,
-    )
+    summary = evaluator.summary()
     _update_dq_counts(import_run, summary)
     return summary
 
 
 def _run_minimal_dq_from_staging(import_run) -> DQProcessingSummary:
-    session = db.session
-    now = datetime.now(timezone.utc)
-    rows_evaluated = 0
-    rows_validated = 0
-    rows_quarantined = 0
-    all_violations: list[DQResult] = []
-
-    # Process volunteers
-    volunteer_rows = (
-        session.query(StagingVolunteer)
-        .filter(
-            StagingVolunteer.run_id == import_run.id,
-            StagingVolunteer.status == StagingRecordStatus.LANDED,
-        )
-        .order_by(StagingVolunteer.sequence_number)
-    )
-
-    for row in volunteer_rows:
-        rows_evaluated += 1
-        payload = _compose_payload(row)
-        violations = list(evaluate_rules(payload))
-        if violations:
-            rows_quarantined += 1
-            all_violations.extend(violations)
-        else:
-            rows_validated += 1
-
-    # Process organizations
-    org_rows = (
-        session.query(StagingOrganization)
-        .filter(
-            StagingOrganization.run_id == import_run.id,
-            StagingOrganization.status == StagingRecordStatus.LANDED,
-        )
-        .order_by(StagingOrganization.sequence_number)
-    )
-
-    for row in org_rows:
-        rows_evaluated += 1
-        payload = _compose_organization_payload(row)
-        violations = list(evaluate_organization_rules(payload))
-        if violations:
-            rows_quarantined += 1
-            all_violations.extend(violations)
-        else:
-            rows_validated += 1
-
-    # Process events
-    event_rows = (
-        session.query(StagingEvent)
-        .filter(
-            StagingEvent.run_id == import_run.id,
-            StagingEvent.status == StagingRecordStatus.LANDED,
-        )
-        .order_by(StagingEvent.sequence_number)
-    )
-
-    for row in event_rows:
-        rows_evaluated += 1
-        payload = evaluate_event_payload(row)
-        violations = list(evaluate_event_rules(payload))
-        # Separate errors (blocking) from warnings (non-blocking)
-        error_violations = [v for v in violations if v.severity == DataQualitySeverity.ERROR]
-
-        # Only quarantine on ERROR severity violations
-        if not error_violations:
-            rows_validated += 1
-            row.status = StagingRecordStatus.VALIDATED
-            row.processed_at = now
-            row.last_error = None
-        else:
-            rows_quarantined += 1
-            all_violations.extend(error_violations)
-            row.status = StagingRecordStatus.QUARANTINED
-            row.last_error = error_violations[0].message
-            row.processed_at = now
-
-        # Log all violations (both errors and warnings) for tracking
-        for violation in violations:
-            session.add(
-                DataQualityViolation(
-                    run_id=import_run.id,
-                    staging_event_id=row.id,
-                    entity_type="event",
-                    record_key=_compose_event_record_key(row),
-                    rule_code=violation.rule_code,
-                    severity=violation.severity,
-                    status=DataQualityStatus.OPEN,
-                    message=violation.message,
-                    details_json=dict(violation.details),
-                )
-            )
-
-    summary = DQProcessingSummary(
-        rows_evaluated=rows_evaluated,
-        rows_validated=rows_validated,
-        rows_quarantined=rows_quarantined,
-        violations=all_violations,
-        dry_run=True,
-    )
+    summary = _evaluate_staged_entities(import_run, persist=False)
     _update_dq_counts(import_run, summary)
     return summary
 
@@ -1112,4 +1364,6 @@ def _update_dq_counts(import_run, summary: DQProcessingSummary) -> None:
             "dry_run": summary.dry_run,
         }
     )
+    if summary.rule_profile is not None:
+        metrics["dq"]["rule_profile"] = {code: dict(stats) for code, stats in summary.rule_profile.items()}
     import_run.metrics_json = metrics
@@ -0,0 +1,121 @@
+"""
+Chunked ``external_id_map`` access for the Salesforce loaders.
+
+The loaders used to look up each clean row's identifier map entry with its own
+``SELECT ... FOR UPDATE``. ``ExternalIdMapCache`` instead fetches (and locks,
+where the database supports it) every entry for a chunk of external IDs in one
+statement and serves lookups from a dict.
+
+Fetched entries are detached from the session while their chunk is processed,
+so the per-row flushes the loaders trigger do not write them one at a time.
+``flush`` then writes the chunk's changes with one executemany ``UPDATE`` per
+set of changed columns, inserts the chunk's new entries in one batch,
+re-attaches everything to the session, and forgets the chunk, so the cache
+holds one chunk of entries however large the run. The loaders keep working
+with ordinary ``ExternalIdMap`` instances throughout.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+from sqlalchemy import inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from flask_app.models.importer.schema import ExternalIdMap
+
+EXTERNAL_ID_CHUNK_SIZE = 2000
+
+_COLUMN_KEYS = tuple(column.key for column in ExternalIdMap.__table__.columns if column.key != "id")
+
+T = TypeVar("T")
+
+
+def iter_chunks(rows: Iterable[T], size: int = EXTERNAL_ID_CHUNK_SIZE) -> Iterator[list[T]]:
+    """Yield ``rows`` in lists of ``size``; ``rows`` may be a generator that is consumed lazily."""
+
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ExternalIdMapCache:
+    """Identifier map entries of one entity type, prefetched a chunk at a time."""
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        entity_type: str,
+        external_system: str = "salesforce",
+        chunk_size: int = EXTERNAL_ID_CHUNK_SIZE,
+    ) -> None:
+        self.session = session
+        self.entity_type = entity_type
+        self.external_system = external_system
+        self.chunk_size = chunk_size
+        self._entries: dict[str, ExternalIdMap] = {}
+        self._fetched: set[str] = set()
+        self._detached: list[ExternalIdMap] = []
+        self._pending: list[ExternalIdMap] = []
+
+    def prefetch(self, external_ids: Iterable[str | None]) -> None:
+        """Load and lock the entries for ``external_ids`` not fetched yet."""
+
+        missing = [external_id for external_id in dict.fromkeys(external_ids) if external_id]
+        missing = [external_id for external_id in missing if external_id not in self._fetched]
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start : start + self.chunk_size]
+            stmt = (
+                select(ExternalIdMap)
+                .where(
+                    ExternalIdMap.external_system == self.external_system,
+                    ExternalIdMap.entity_type == self.entity_type,
+                    ExternalIdMap.external_id.in_(chunk),
+                )
+                .with_for_update(of=ExternalIdMap)
+            )
+            entries = list(self.session.scalars(stmt))
+            for entry in entries:
+                self.session.expunge(entry)
+                self._entries[entry.external_id] = entry
+                self._detached.append(entry)
+            self._fetched.update(chunk)
+
+    def get(self, external_id: str) -> ExternalIdMap | None:
+        if external_id not in self._fetched and external_id not in self._entries:
+            self.prefetch([external_id])
+        return self._entries.get(external_id)
+
+    def add(self, entry: ExternalIdMap) -> None:
+        """Register a new entry; it is inserted with the rest of the chunk on ``flush``."""
+
+        self._entries[entry.external_id] = entry
+        self._pending.append(entry)
+
+    def flush(self) -> None:
+        """Write the chunk's updated and new entries, re-attach them to the session, and drop them from the cache."""
+
+        changes: list[dict[str, object]] = []
+        for entry in self._detached:
+            state = inspect(entry)
+            changed = {key: state.attrs[key].value for key in _COLUMN_KEYS if state.attrs[key].history.has_changes()}
+            if not changed:
+                continue
+            for key, value in changed.items():
+                set_committed_value(entry, key, value)
+            changes.append({"id": entry.id, **changed})
+        if changes:
+            self.session.execute(update(ExternalIdMap), changes)
+        for entry in self._detached:
+            self.session.add(entry)
+        self._detached.clear()
+
+        if self._pending:
+            self.session.add_all(self._pending)
+            self.session.flush()
+            self._pending.clear()
+        self._entries.clear()
+        self._fetched.clear()
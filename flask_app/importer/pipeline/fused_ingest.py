@@ -0,0 +1,233 @@
+"""
+Fused staging, DQ, and clean promotion for CSV volunteer ingest.
+
+The staged pipeline writes every parsed row to ``staging_volunteers``, then
+re-reads the table for DQ, again for clean promotion, and once more for the
+unchanged-row check. ``FusedVolunteerWriter`` does all of that per batch while
+the parsed rows are still in memory: unchanged rows are detected against
+``external_id_map``, DQ rules are evaluated, and the staging rows are written
+with their final status, followed by one bulk insert each for
+``dq_violations`` and ``clean_volunteers``.
+
+Statuses, violation rows, and clean rows match what ``stage_volunteers_from_csv``
+followed by ``run_minimal_dq`` and ``promote_clean_volunteers`` would record,
+so downstream stages (fuzzy matching, core load) read the same clean rows.
+Enabled with ``IMPORTER_CSV_FUSED_INGEST`` for ``tasks.ingest_csv`` and the CLI.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Mapping, NamedTuple, Sequence
+
+from flask import current_app, has_app_context
+from sqlalchemy import func, insert, select, update
+
+from flask_app.models.base import db
+from flask_app.models.importer.schema import (
+    CleanVolunteer,
+    DataQualitySeverity,
+    DataQualityViolation,
+    ExternalIdMap,
+    StagingRecordStatus,
+    StagingVolunteer,
+)
+
+from .clean import CleanPromotionSummary, _build_payload_from_values
+from .dq import DQProcessingSummary, StreamingDQEvaluator
+from .staging_writer import StagingWriter
+
+
+class _StagedRow(NamedTuple):
+    """The staging columns DQ payload and record-key helpers read."""
+
+    id: int | None
+    external_id: str | None
+    source_record_id: str | None
+    sequence_number: int
+    payload_json: Mapping[str, object | None]
+    normalized_json: Mapping[str, object | None]
+
+
+def csv_fused_ingest_enabled() -> bool:
+    """Whether CSV ingest should stage, evaluate, and promote rows in one pass."""
+
+    if not has_app_context():
+        return False
+    return bool(current_app.config.get("IMPORTER_CSV_FUSED_INGEST", True))
+
+
+class FusedVolunteerWriter:
+    """Write batches of parsed volunteer rows to staging, DQ, and clean tables together."""
+
+    def __init__(self, import_run, *, writer_mode: str | None = None) -> None:
+        self.import_run = import_run
+        self.staging_writer = StagingWriter(StagingVolunteer, mode=writer_mode)
+        self.dq = StreamingDQEvaluator(import_run)
+        self.skip_unchanged = not has_app_context() or bool(current_app.config.get("IMPORTER_SKIP_UNCHANGED", True))
+        self.rows_unchanged = 0
+        self.clean_rows_considered = 0
+        self.clean_rows_promoted = 0
+        self.clean_rows_skipped = 0
+
+    def write(self, rows: Sequence[tuple[dict[str, Any], Mapping[str, object | None]]]) -> int:
+        """
+        Write one batch of ``(staging_row, normalized)`` pairs.
+
+        ``staging_row`` is a ``build_staging_row`` dictionary and ``normalized``
+        the normalized payload it was built from. Returns the rows written.
+        """
+
+        if not rows:
+            return 0
+        now = datetime.now(timezone.utc)
+        unchanged = self._claim_unchanged([staging_row for staging_row, _ in rows], now)
+
+        evaluated: list[tuple[dict[str, Any], _StagedRow]] = []
+        for staging_row, normalized in rows:
+            if staging_row["sequence_number"] in unchanged:
+                staging_row.update(status=StagingRecordStatus.UNCHANGED, last_error=None, processed_at=None)
+                continue
+            evaluated.append((staging_row, _staged_row(staging_row, normalized)))
+        results = self.dq.evaluate([staged for _, staged in evaluated]) if evaluated else []
+        for (staging_row, _), violations in zip(evaluated, results):
+            errors = [violation for violation in violations if violation.severity == DataQualitySeverity.ERROR]
+            staging_row.update(
+                status=StagingRecordStatus.QUARANTINED if errors else StagingRecordStatus.VALIDATED,
+                last_error=errors[0].message if errors else None,
+                processed_at=now,
+            )
+
+        written_ids = self.staging_writer.write_returning_ids([staging_row for staging_row, _ in rows])
+        if not evaluated:
+            return len(rows)
+
+        if written_ids is not None:
+            row_ids = {staging_row["sequence_number"]: row_id for (staging_row, _), row_id in zip(rows, written_ids)}
+        else:
+            row_ids = self._staging_ids([staging_row["sequence_number"] for staging_row, _ in evaluated])
+        violation_params: list[dict[str, object]] = []
+        clean_params: list[dict[str, object]] = []
+        for (staging_row, staged), violations in zip(evaluated, results):
+            staged = staged._replace(id=row_ids[staged.sequence_number])
+            violation_params.extend(self.dq.violation_params(staged, violations))
+            if staging_row["status"] == StagingRecordStatus.VALIDATED:
+                clean_row = self._clean_row(staging_row, staged, now)
+                if clean_row is not None:
+                    clean_params.append(clean_row)
+
+        session = db.session
+        if violation_params:
+            session.execute(insert(DataQualityViolation.__table__), violation_params)
+        if clean_params:
+            session.execute(insert(CleanVolunteer.__table__), clean_params)
+        return len(rows)
+
+    def dq_summary(self) -> DQProcessingSummary:
+        return self.dq.summary()
+
+    def clean_summary(self) -> CleanPromotionSummary:
+        return CleanPromotionSummary(
+            rows_considered=self.clean_rows_considered,
+            rows_promoted=self.clean_rows_promoted,
+            rows_skipped=self.clean_rows_skipped,
+            dry_run=False,
+        )
+
+    def _claim_unchanged(self, staging_rows: Sequence[Mapping[str, Any]], now: datetime) -> set[int]:
+        """
+        Return sequence numbers of rows whose checksum matches the payload last loaded for their external ID.
+
+        Matching identifier map entries are touched (``last_seen_at``/``run_id``)
+        as ``mark_unchanged_staging_rows`` does for a staged run.
+        """
+
+        if not self.skip_unchanged:
+            return set()
+        external_ids = {staging_row["external_id"] for staging_row in staging_rows if staging_row["external_id"]}
+        if not external_ids:
+            return set()
+        id_map = ExternalIdMap.__table__
+        entries = db.session.execute(
+            select(id_map.c.id, id_map.c.external_system, id_map.c.external_id, id_map.c.last_loaded_checksum).where(
+                id_map.c.entity_type == "volunteer",
+                id_map.c.is_active.is_(True),
+                id_map.c.external_id.in_(external_ids),
+                id_map.c.last_loaded_checksum.is_not(None),
+            )
+        )
+        loaded = {
+            (entry.external_system, entry.external_id): (entry.id, entry.last_loaded_checksum) for entry in entries
+        }
+        unchanged: set[int] = set()
+        touched: set[int] = set()
+        for staging_row in staging_rows:
+            entry = loaded.get((staging_row["external_system"], staging_row["external_id"]))
+            if entry is not None and entry[1] == staging_row["checksum"]:
+                unchanged.add(staging_row["sequence_number"])
+                touched.add(entry[0])
+        if touched:
+            db.session.execute(
+                update(id_map).where(id_map.c.id.in_(touched)).values(last_seen_at=now, run_id=self.import_run.id)
+            )
+        self.rows_unchanged += len(unchanged)
+        return unchanged
+
+    def _staging_ids(self, sequence_numbers: Sequence[int]) -> dict[int, int]:
+        """
+        Look up the ids of rows just written by COPY, which cannot return them.
+
+        A run may already hold rows with the same sequence numbers (an earlier
+        staging attempt), so each maps to its newest row: the one this batch wrote.
+        """
+
+        staging = StagingVolunteer.__table__
+        return dict(
+            db.session.execute(
+                select(staging.c.sequence_number, func.max(staging.c.id))
+                .where(staging.c.run_id == self.import_run.id, staging.c.sequence_number.in_(sequence_numbers))
+                .group_by(staging.c.sequence_number)
+            ).all()
+        )
+
+    def _clean_row(
+        self, staging_row: Mapping[str, Any], staged: _StagedRow, now: datetime
+    ) -> dict[str, object] | None:
+        self.clean_rows_considered += 1
+        payload = _build_payload_from_values(
+            staged.payload_json,
+            staged.normalized_json,
+            staging_volunteer_id=staged.id,
+            external_system=staging_row["external_system"],
+            external_id=staged.external_id,
+            checksum=staging_row["checksum"],
+        )
+        if payload is None:
+            self.clean_rows_skipped += 1
+            return None
+        self.clean_rows_promoted += 1
+        return {
+            "run_id": self.import_run.id,
+            "staging_volunteer_id": staged.id,
+            "external_system": payload.external_system,
+            "external_id": payload.external_id,
+            "first_name": payload.first_name,
+            "last_name": payload.last_name,
+            "email": payload.email,
+            "phone_e164": payload.phone_e164,
+            "checksum": payload.checksum,
+            "payload_json": dict(payload.normalized_payload),
+            "promoted_at": now,
+            "load_action": None,
+        }
+
+
+def _staged_row(staging_row: Mapping[str, Any], normalized: Mapping[str, object | None]) -> _StagedRow:
+    return _StagedRow(
+        id=None,
+        external_id=staging_row["external_id"],
+        source_record_id=staging_row["source_record_id"],
+        sequence_number=staging_row["sequence_number"],
+        payload_json=staging_row["payload_json"],
+        normalized_json=normalized,
+    )
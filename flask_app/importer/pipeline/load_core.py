@@ -35,6 +35,7 @@ from .clean import CleanVolunteerPayload
 from .deterministic import match_volunteer_by_contact
 from .fuzzy_features import compute_name_similarity
 from .idempotency import MissingExternalIdentifier, resolve_import_target
+from .staging import count_unchanged_staging_rows
 from .survivorship import SurvivorshipResult, apply_survivorship, summarize_decisions
 
 
@@ -235,7 +236,8 @@ def load_core_volunteers(
     rows_deduped_auto = 0
     rows_skipped_duplicates = 0
     rows_skipped_duplicate_name = 0
-    rows_skipped_no_change = 0
+    # Rows whose checksum matched the last load were marked unchanged at staging
+    rows_skipped_no_change = count_unchanged_staging_rows(import_run.id, StagingVolunteer)
     rows_missing_external_id = 0
     rows_soft_deleted = 0
 
@@ -390,7 +392,7 @@ def load_core_volunteers(
                                 external_system=candidate.external_system,
                                 external_id=candidate.external_id,
                             )
-                            id_map.mark_seen(run_id=import_run.id)
+                            id_map.mark_seen(run_id=import_run.id, checksum=candidate.checksum)
                             session.add(id_map)
                     clean_row.core_contact_id = name_match_volunteer.id
                     clean_row.core_volunteer_id = name_match_volunteer.id
@@ -463,7 +465,7 @@ def load_core_volunteers(
                 external_system=candidate.external_system,
                 external_id=candidate.external_id,
             )
-            id_map.mark_seen(run_id=import_run.id)
+            id_map.mark_seen(run_id=import_run.id, checksum=candidate.checksum)
             session.add(id_map)
 
             clean_row.load_action = "inserted"
@@ -488,7 +490,7 @@ def load_core_volunteers(
                 raise RuntimeError("resolve_import_target returned update/reactivate without external_id_map")
 
             id_map.entity_id = volunteer.id
-            id_map.mark_seen(run_id=import_run.id)
+            id_map.mark_seen(run_id=import_run.id, checksum=candidate.checksum)
 
             profile = _get_active_survivorship_profile()
             changes, survivorship = _apply_survivorship_updates(
@@ -7,14 +7,19 @@ candidate rejection/deferral, and queue management.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from config.survivorship import load_profile
+from flask_app.importer.pipeline.auto_merge import AUTO_MERGE_MATCH_TYPE, AutoMergeStats, AutoMergeWorker
 from flask_app.importer.pipeline.clean import CleanVolunteerPayload
 from flask_app.importer.pipeline.load_core import (
     _apply_email_change,
@@ -28,8 +33,25 @@ from flask_app.importer.pipeline.load_core import (
     _serialize_change_value,
 )
 from flask_app.importer.pipeline.survivorship import apply_survivorship, summarize_decisions
-from flask_app.models import ChangeLogEntry, ExternalIdMap, MergeLog, Volunteer, db
-from flask_app.models.importer.schema import CleanVolunteer, DedupeDecision, DedupeSuggestion, ImportRun
+from flask_app.models import (
+    ChangeLogEntry,
+    Contact,
+    ContactEmail,
+    ContactPhone,
+    ExternalIdMap,
+    MergeLog,
+    Volunteer,
+    db,
+)
+from flask_app.models.importer.schema import (
+    CleanVolunteer,
+    DataQualityViolation,
+    DedupeDecision,
+    DedupeQueueCounter,
+    DedupeSuggestion,
+    ImportRun,
+    StagingVolunteer,
+)
 
 
 @dataclass
@@ -59,6 +81,98 @@ class QueueStats:
     aging_buckets: dict[str, int]
 
 
+@dataclass
+class ReviewQueueRow:
+    """The columns the review queue table displays for one suggestion."""
+
+    id: int
+    run_id: int
+    score: float | None
+    match_type: str | None
+    decision: str
+    primary_contact_id: int | None
+    candidate_contact_id: int | None
+    staging_volunteer_id: int | None
+    primary_name: str | None
+    candidate_name: str | None
+    created_at: datetime | None
+    decided_at: datetime | None
+    merge_log_id: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "run_id": self.run_id,
+            "score": self.score,
+            "match_type": self.match_type,
+            "decision": self.decision,
+            "primary_contact_id": self.primary_contact_id,
+            "candidate_contact_id": self.candidate_contact_id,
+            "staging_volunteer_id": self.staging_volunteer_id,
+            "primary_name": self.primary_name,
+            "candidate_name": self.candidate_name,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "decided_at": self.decided_at.isoformat() if self.decided_at else None,
+            "merge_log_id": self.merge_log_id,
+        }
+
+
+@dataclass
+class ReviewQueuePage:
+    """One keyset page of the review queue; ``next_cursor`` is None on the last page."""
+
+    rows: list[ReviewQueueRow]
+    total: int
+    next_cursor: str | None
+
+
+def encode_queue_cursor(score: Decimal | float | None, suggestion_id: int) -> str:
+    """Encode the (score, id) position of the last row on a page as an opaque cursor."""
+
+    payload = json.dumps([None if score is None else str(score), suggestion_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_queue_cursor(cursor: str) -> tuple[Decimal | None, int]:
+    """Decode a cursor from ``encode_queue_cursor``; raises ValueError when it is malformed."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, suggestion_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (None if score is None else Decimal(score)), int(suggestion_id)
+    except (binascii.Error, InvalidOperation, TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError(f"Invalid review queue cursor: {cursor!r}") from exc
+
+
+def _queue_filters(decision_column: Any, match_type_column: Any, status: str | None, match_type: str | None) -> list:
+    """Filter conditions for a review queue status/match type, shared by the queue and its counters."""
+
+    conditions = []
+    if status == "pending":
+        conditions.append(decision_column == DedupeDecision.PENDING)
+    elif status == "deferred":
+        conditions.append(decision_column == DedupeDecision.DEFERRED)
+    elif status == "auto_merged":
+        conditions.append(decision_column == DedupeDecision.AUTO_MERGED)
+    elif status == "review":
+        conditions.append(decision_column == DedupeDecision.PENDING)
+        conditions.append(match_type_column.in_(["fuzzy_review", "fuzzy_high"]))
+    if match_type:
+        conditions.append(match_type_column == match_type)
+    return conditions
+
+
+def _display_name(first_name: str | None, last_name: str | None) -> str | None:
+    return f"{first_name or ''} {last_name or ''}".strip() or None
+
+
+def _remediation_violation_id(import_run: ImportRun | None) -> int | None:
+    """The DQ violation a remediation run replays, whose edits act as manual overrides."""
+    ingest_params = getattr(import_run, "ingest_params_json", None) or {}
+    remediation = ingest_params.get("remediation") if isinstance(ingest_params, dict) else None
+    return remediation.get("violation_id") if isinstance(remediation, dict) else None
+
+
 class MergeService:
     """Service for handling merge operations and candidate management."""
 
@@ -94,21 +208,9 @@ class MergeService:
             joinedload(DedupeSuggestion.import_run),
         )
 
-        if status:
-            if status == "pending":
-                query = query.filter(DedupeSuggestion.decision == DedupeDecision.PENDING)
-            elif status == "deferred":
-                query = query.filter(DedupeSuggestion.decision == DedupeDecision.DEFERRED)
-            elif status == "auto_merged":
-                query = query.filter(DedupeSuggestion.decision == DedupeDecision.AUTO_MERGED)
-            elif status == "review":
-                query = query.filter(
-                    DedupeSuggestion.decision == DedupeDecision.PENDING,
-                    DedupeSuggestion.match_type.in_(["fuzzy_review", "fuzzy_high"]),
-                )
-
-        if match_type:
-            query = query.filter(DedupeSuggestion.match_type == match_type)
+        query = query.filter(
+            *_queue_filters(DedupeSuggestion.decision, DedupeSuggestion.match_type, status, match_type)
+        )
 
         if run_id:
             query = query.filter(DedupeSuggestion.run_id == run_id)
@@ -116,7 +218,7 @@ class MergeService:
         # Only return suggestions with valid primary contact
         query = query.filter(DedupeSuggestion.primary_contact_id.isnot(None))
 
-        total = query.count()
+        total = self.count_review_queue(status=status, match_type=match_type, run_id=run_id)
 
         # Order by score descending, then by created_at (oldest first for pending)
         query = query.order_by(
@@ -128,6 +230,172 @@ class MergeService:
 
         return candidates, total
 
+    def get_review_queue_page(
+        self,
+        *,
+        status: str | None = None,
+        match_type: str | None = None,
+        run_id: int | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> ReviewQueuePage:
+        """
+        Get one page of the review queue after ``cursor``, projecting only displayed columns.
+
+        Pages are keyed on (score DESC NULLS LAST, id), the queue's sort order, so a
+        deep page costs the same as the first. The total comes from the
+        ``dedupe_queue_counters`` rollup unless ``run_id`` narrows the queue.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed
+        """
+        primary = aliased(Contact)
+        candidate = aliased(Contact)
+        conditions = _queue_filters(DedupeSuggestion.decision, DedupeSuggestion.match_type, status, match_type)
+        conditions.append(DedupeSuggestion.primary_contact_id.isnot(None))
+        if run_id:
+            conditions.append(DedupeSuggestion.run_id == run_id)
+        if cursor:
+            after_score, after_id = decode_queue_cursor(cursor)
+            if after_score is None:
+                conditions.append(and_(DedupeSuggestion.score.is_(None), DedupeSuggestion.id > after_id))
+            else:
+                conditions.append(
+                    or_(
+                        DedupeSuggestion.score < after_score,
+                        and_(DedupeSuggestion.score == after_score, DedupeSuggestion.id > after_id),
+                        DedupeSuggestion.score.is_(None),
+                    )
+                )
+
+        results = self.session.execute(
+            select(
+                DedupeSuggestion.id,
+                DedupeSuggestion.run_id,
+                DedupeSuggestion.score,
+                DedupeSuggestion.match_type,
+                DedupeSuggestion.decision,
+                DedupeSuggestion.primary_contact_id,
+                DedupeSuggestion.candidate_contact_id,
+                DedupeSuggestion.staging_volunteer_id,
+                DedupeSuggestion.decided_at,
+                ImportRun.created_at.label("run_created_at"),
+                primary.first_name.label("primary_first_name"),
+                primary.last_name.label("primary_last_name"),
+                candidate.first_name.label("candidate_first_name"),
+                candidate.last_name.label("candidate_last_name"),
+            )
+            .outerjoin(ImportRun, ImportRun.id == DedupeSuggestion.run_id)
+            .outerjoin(primary, primary.id == DedupeSuggestion.primary_contact_id)
+            .outerjoin(candidate, candidate.id == DedupeSuggestion.candidate_contact_id)
+            .where(*conditions)
+            .order_by(DedupeSuggestion.score.desc().nulls_last(), DedupeSuggestion.id.asc())
+            .limit(limit + 1)
+        ).all()
+
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = encode_queue_cursor(results[-1].score, results[-1].id)
+
+        rows = [
+            ReviewQueueRow(
+                id=row.id,
+                run_id=row.run_id,
+                score=float(row.score) if row.score is not None else None,
+                match_type=row.match_type,
+                decision=row.decision.value if isinstance(row.decision, DedupeDecision) else str(row.decision),
+                primary_contact_id=row.primary_contact_id,
+                candidate_contact_id=row.candidate_contact_id,
+                staging_volunteer_id=row.staging_volunteer_id,
+                primary_name=_display_name(row.primary_first_name, row.primary_last_name),
+                candidate_name=(
+                    _display_name(row.candidate_first_name, row.candidate_last_name)
+                    if row.candidate_contact_id
+                    else None
+                ),
+                created_at=row.run_created_at,
+                decided_at=row.decided_at,
+            )
+            for row in results
+        ]
+        self._fill_staging_names(rows)
+        self._fill_auto_merge_log_ids(rows)
+        return ReviewQueuePage(
+            rows=rows,
+            total=self.count_review_queue(status=status, match_type=match_type, run_id=run_id),
+            next_cursor=next_cursor,
+        )
+
+    def count_review_queue(
+        self,
+        *,
+        status: str | None = None,
+        match_type: str | None = None,
+        run_id: int | None = None,
+    ) -> int:
+        """Count the review queue from the counters rollup; a ``run_id`` filter falls back to a COUNT."""
+        if run_id:
+            conditions = _queue_filters(DedupeSuggestion.decision, DedupeSuggestion.match_type, status, match_type)
+            return (
+                self.session.scalar(
+                    select(func.count(DedupeSuggestion.id)).where(
+                        *conditions,
+                        DedupeSuggestion.run_id == run_id,
+                        DedupeSuggestion.primary_contact_id.isnot(None),
+                    )
+                )
+                or 0
+            )
+        conditions = _queue_filters(DedupeQueueCounter.decision, DedupeQueueCounter.match_type, status, match_type)
+        total = self.session.scalar(
+            select(func.coalesce(func.sum(DedupeQueueCounter.suggestion_count), 0)).where(*conditions)
+        )
+        return int(total or 0)
+
+    def _fill_staging_names(self, rows: list[ReviewQueueRow]) -> None:
+        """Name candidates that only exist as staging rows, loading their staging payloads in one query."""
+        staging_ids = {
+            row.staging_volunteer_id for row in rows if not row.candidate_contact_id and row.staging_volunteer_id
+        }
+        if not staging_ids:
+            return
+        payloads = dict(
+            self.session.execute(
+                select(StagingVolunteer.id, StagingVolunteer.normalized_json).where(
+                    StagingVolunteer.id.in_(staging_ids)
+                )
+            ).all()
+        )
+        for row in rows:
+            if row.candidate_contact_id or row.staging_volunteer_id not in payloads:
+                continue
+            normalized = payloads[row.staging_volunteer_id]
+            if normalized:
+                row.candidate_name = _display_name(normalized.get("first_name"), normalized.get("last_name"))
+            else:
+                row.candidate_name = f"Staging Row {row.staging_volunteer_id}"
+
+    def _fill_auto_merge_log_ids(self, rows: list[ReviewQueueRow]) -> None:
+        """Attach the MergeLog id to auto-merged rows (for undo), loading the candidate logs in one query."""
+        auto_merged = {
+            row.id: row for row in rows if row.decision == DedupeDecision.AUTO_MERGED.value and row.primary_contact_id
+        }
+        if not auto_merged:
+            return
+        merge_logs = self.session.execute(
+            select(MergeLog.id, MergeLog.undo_payload)
+            .where(
+                MergeLog.decision_type == "auto",
+                MergeLog.primary_contact_id.in_({row.primary_contact_id for row in auto_merged.values()}),
+            )
+            .order_by(MergeLog.id.asc())
+        ).all()
+        for merge_log_id, undo_payload in merge_logs:
+            row = auto_merged.get((undo_payload or {}).get("suggestion_id"))
+            if row is not None and row.merge_log_id is None:
+                row.merge_log_id = merge_log_id
+
     def get_candidate_details(self, suggestion_id: int) -> CandidateDetails:
         """
         Get detailed information about a dedupe candidate.
@@ -143,12 +411,7 @@ class MergeService:
         """
         suggestion = (
             self.session.query(DedupeSuggestion)
-            .options(
-                joinedload(DedupeSuggestion.primary_contact),
-                joinedload(DedupeSuggestion.candidate_contact),
-                joinedload(DedupeSuggestion.staging_row),
-                joinedload(DedupeSuggestion.import_run),
-            )
+            .options(joinedload(DedupeSuggestion.import_run))
             .filter_by(id=suggestion_id)
             .first()
         )
@@ -159,6 +422,120 @@ class MergeService:
         if not suggestion.primary_contact_id:
             raise ValueError(f"Dedupe suggestion {suggestion_id} has no primary contact")
 
+        # The comparison is cached on the suggestion and rebuilt when any row it was built from changes.
+        stamps = self._comparison_stamps(suggestion)
+        comparison = suggestion.comparison_json
+        if not comparison or comparison.get("stamps") != stamps:
+            comparison = {"stamps": stamps, **self._build_candidate_comparison(suggestion)}
+            # Profile fields may hold dates and other values the JSON column cannot store as-is.
+            comparison = json.loads(json.dumps(comparison, default=str))
+            suggestion.comparison_json = comparison
+            self.session.flush()
+
+        return CandidateDetails(
+            suggestion_id=suggestion.id,
+            score=float(suggestion.score) if suggestion.score else None,
+            match_type=suggestion.match_type,
+            features_json=suggestion.features_json or {},
+            primary_contact=comparison["primary_contact"],
+            candidate_contact=comparison["candidate_contact"],
+            staging_data=comparison["staging_data"],
+            survivorship_preview=comparison["survivorship_preview"],
+            run_id=suggestion.run_id,
+            created_at=suggestion.import_run.created_at if suggestion.import_run else datetime.now(timezone.utc),
+        )
+
+    def prefetch_candidate_details(self, suggestion_ids: list[int]) -> int:
+        """
+        Warm the comparison cache for the candidates a reviewer is likely to open next.
+
+        Returns:
+            Number of suggestions whose comparison was built or refreshed
+        """
+        refreshed = 0
+        for suggestion_id in suggestion_ids:
+            suggestion = self.session.get(DedupeSuggestion, suggestion_id)
+            if not suggestion or not suggestion.primary_contact_id:
+                continue
+            cached = (suggestion.comparison_json or {}).get("stamps")
+            try:
+                if cached is not None and cached == self._comparison_stamps(suggestion):
+                    continue
+                self.get_candidate_details(suggestion_id)
+            except ValueError:
+                continue
+            refreshed += 1
+        return refreshed
+
+    def _comparison_stamps(self, suggestion: DedupeSuggestion) -> dict[str, str | None]:
+        """
+        Last-change stamps of every row a cached comparison was built from.
+
+        Covers each contact and its emails and phones, the staging row, the
+        clean row promoted from it, the DQ violations whose edits become manual
+        overrides, and the survivorship profile. Child rows are stamped with
+        their latest updated_at and their count, so deletions register too.
+        """
+        contact_ids = [cid for cid in (suggestion.primary_contact_id, suggestion.candidate_contact_id) if cid]
+        updated: dict[int, list[Any]] = {}
+        for model, id_column in (
+            (Contact, Contact.id),
+            (ContactEmail, ContactEmail.contact_id),
+            (ContactPhone, ContactPhone.contact_id),
+        ):
+            rows = self.session.execute(
+                select(id_column, func.max(model.updated_at), func.count())
+                .where(id_column.in_(contact_ids))
+                .group_by(id_column)
+            )
+            for contact_id, value, count in rows:
+                if model is Contact:
+                    updated[contact_id] = [value, 0]
+                elif contact_id in updated:
+                    updated[contact_id] = [max(updated[contact_id][0], value), updated[contact_id][1] + count]
+        if suggestion.primary_contact_id not in updated:
+            raise ValueError(f"Primary contact {suggestion.primary_contact_id} not found")
+
+        # IN lists rather than equality so a missing id matches nothing instead of every NULL row.
+        staging_ids = [suggestion.staging_volunteer_id] if suggestion.staging_volunteer_id else []
+        remediation_id = _remediation_violation_id(suggestion.import_run)
+        remediation_ids = [remediation_id] if remediation_id is not None else []
+        staging_row = StagingVolunteer.id.in_(staging_ids)
+        clean_rows = CleanVolunteer.staging_volunteer_id.in_(staging_ids)
+        violations = or_(
+            DataQualityViolation.staging_volunteer_id.in_(staging_ids),
+            DataQualityViolation.id.in_(remediation_ids),
+        )
+        staged = self.session.execute(
+            select(
+                select(func.max(StagingVolunteer.updated_at)).where(staging_row).scalar_subquery(),
+                select(func.max(CleanVolunteer.updated_at)).where(clean_rows).scalar_subquery(),
+                select(func.count()).select_from(CleanVolunteer).where(clean_rows).scalar_subquery(),
+                select(func.max(DataQualityViolation.updated_at)).where(violations).scalar_subquery(),
+                select(func.count()).select_from(DataQualityViolation).where(violations).scalar_subquery(),
+            )
+        ).one()
+
+        def _stamp(value: datetime | None, count: int | None = None) -> str | None:
+            if value is None:
+                return None
+            return value.isoformat() if count is None else f"{value.isoformat()}#{count}"
+
+        def _contact_stamp(contact_id: int | None) -> str | None:
+            value, count = updated.get(contact_id, (None, 0))
+            return _stamp(value, count)
+
+        return {
+            "primary": _contact_stamp(suggestion.primary_contact_id),
+            "candidate": _contact_stamp(suggestion.candidate_contact_id),
+            "staging": _stamp(staged[0]),
+            "clean": _stamp(staged[1], staged[2]),
+            "overrides": _stamp(staged[3], staged[4]),
+            "profile": load_profile().key,
+        }
+
+    def _build_candidate_comparison(self, suggestion: DedupeSuggestion) -> dict[str, Any]:
+        """Build the side-by-side comparison and survivorship preview shown in the review modal."""
         primary_volunteer = self.session.get(Volunteer, suggestion.primary_contact_id)
         if not primary_volunteer:
             raise ValueError(f"Primary contact {suggestion.primary_contact_id} not found")
@@ -290,18 +667,12 @@ class MergeService:
         else:
             survivorship_preview = {}
 
-        return CandidateDetails(
-            suggestion_id=suggestion.id,
-            score=float(suggestion.score) if suggestion.score else None,
-            match_type=suggestion.match_type,
-            features_json=suggestion.features_json or {},
-            primary_contact=primary_data,
-            candidate_contact=candidate_data,
-            staging_data=staging_data,
-            survivorship_preview=survivorship_preview,
-            run_id=suggestion.run_id,
-            created_at=suggestion.import_run.created_at if suggestion.import_run else datetime.now(timezone.utc),
-        )
+        return {
+            "primary_contact": primary_data,
+            "candidate_contact": candidate_data,
+            "staging_data": staging_data,
+            "survivorship_preview": survivorship_preview,
+        }
 
     def execute_merge(
         self,
@@ -654,74 +1025,40 @@ class MergeService:
         """
         Automatically merge high-confidence fuzzy dedupe candidates.
 
+        Claims one batch of pending ``fuzzy_high`` suggestions and merges it in
+        grouped transactions (see ``AutoMergeWorker``); other workers running
+        at the same time claim disjoint batches. Use ``AutoMergeWorker.drain``
+        to keep claiming until the backlog is empty.
+
         Args:
             run_id: Optional import run ID to limit to specific run
             dry_run: If True, don't actually perform merges
             batch_size: Maximum number of candidates to process (uses config default if None)
 
         Returns:
-            Dict with counts: processed, merged, skipped, errors
+            Dict with counts: processed, merged, skipped, errors, conflicts, plus merges_per_second
         """
         from flask import current_app
 
         enabled = current_app.config.get("FUZZY_AUTO_MERGE_ENABLED", True)
         if not enabled:
-            return {"processed": 0, "merged": 0, "skipped": 0, "errors": 0}
+            return AutoMergeStats().to_dict()
 
         if batch_size is None:
             batch_size = current_app.config.get("FUZZY_AUTO_MERGE_BATCH_SIZE", 50)
 
-        # Query for high-confidence pending suggestions
-        query = (
-            self.session.query(DedupeSuggestion)
-            .options(
-                joinedload(DedupeSuggestion.primary_contact),
-                joinedload(DedupeSuggestion.staging_row),
-                joinedload(DedupeSuggestion.import_run),
-            )
-            .filter(
+        if dry_run:
+            query = self.session.query(func.count(DedupeSuggestion.id)).filter(
                 DedupeSuggestion.decision == DedupeDecision.PENDING,
-                DedupeSuggestion.match_type == "fuzzy_high",
+                DedupeSuggestion.match_type == AUTO_MERGE_MATCH_TYPE,
                 DedupeSuggestion.primary_contact_id.isnot(None),
             )
-        )
-
-        if run_id:
-            query = query.filter(DedupeSuggestion.run_id == run_id)
-
-        query = query.order_by(DedupeSuggestion.score.desc().nulls_last(), DedupeSuggestion.id.asc()).limit(batch_size)
-
-        candidates = query.all()
-
-        stats = {"processed": 0, "merged": 0, "skipped": 0, "errors": 0}
-
-        for suggestion in candidates:
-            stats["processed"] += 1
-
-            if dry_run:
-                stats["skipped"] += 1
-                continue
+            if run_id:
+                query = query.filter(DedupeSuggestion.run_id == run_id)
+            pending = min(query.scalar() or 0, batch_size)
+            return AutoMergeStats(processed=pending, skipped=pending).to_dict()
 
-            try:
-                # Execute merge with decision_type="auto"
-                self.execute_merge(
-                    suggestion.id,
-                    user_id=None,
-                    decision_type="auto",
-                    notes="Auto-merged due to high confidence score",
-                )
-                self.session.commit()
-                stats["merged"] += 1
-            except Exception as e:
-                self.session.rollback()
-                stats["errors"] += 1
-                current_app.logger.warning(
-                    f"Failed to auto-merge suggestion {suggestion.id}: {e}",
-                    exc_info=True,
-                )
-                # Continue processing other candidates
-
-        return stats
+        return AutoMergeWorker(self, run_id=run_id, claim_size=batch_size).run_batch().to_dict()
 
     def undo_merge(self, merge_log_id: int, user_id: int) -> MergeLog:
         """
@@ -742,22 +1079,12 @@ class MergeService:
         if not merge_log:
             raise ValueError(f"Merge log {merge_log_id} not found")
 
-        # Check if already undone - look for undo MergeLog entries
-        # We check by matching the same contacts and looking for undo decision_type
-        # with metadata referencing this merge_log_id
-        undo_candidates = (
-            self.session.query(MergeLog)
-            .filter(
-                MergeLog.primary_contact_id == merge_log.primary_contact_id,
-                MergeLog.merged_contact_id == merge_log.merged_contact_id,
-                MergeLog.decision_type == "undo",
-            )
-            .all()
+        # Undo entries point back at the merge they undid (unique, indexed)
+        already_undone = self.session.scalar(
+            select(MergeLog.id).where(MergeLog.original_merge_log_id == merge_log_id).limit(1)
         )
-        # Check metadata_json for original_merge_log_id match
-        for undo_log in undo_candidates:
-            if undo_log.metadata_json and undo_log.metadata_json.get("original_merge_log_id") == merge_log_id:
-                raise ValueError(f"Merge log {merge_log_id} has already been undone")
+        if already_undone:
+            raise ValueError(f"Merge log {merge_log_id} has already been undone")
 
         if not merge_log.undo_payload:
             raise ValueError(f"Merge log {merge_log_id} has no undo payload")
@@ -858,6 +1185,7 @@ class MergeService:
             snapshot_before=snapshot_before_undo,
             snapshot_after=snapshot_after_undo,
             undo_payload=None,  # Undo of undo not supported
+            original_merge_log_id=merge_log_id,
         )
         undo_merge_log.metadata_json = {
             "original_merge_log_id": merge_log_id,
@@ -969,96 +1297,36 @@ class MergeService:
         """
         Get statistics about the review queue.
 
+        Reads the ``dedupe_queue_counters`` rollup in a single aggregate, so the
+        cost does not grow with the number of suggestions. Aging is based on
+        when each suggestion was created, to the hour.
+
         Returns:
             QueueStats with counts and aging information
         """
         now = datetime.now(timezone.utc)
-
-        # Total pending
-        total_pending = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .filter(DedupeSuggestion.decision == DedupeDecision.PENDING)
-            .filter(DedupeSuggestion.primary_contact_id.isnot(None))
-            .scalar()
-            or 0
-        )
-
-        # Review band (0.80-0.95)
-        total_review_band = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .filter(
-                DedupeSuggestion.decision == DedupeDecision.PENDING,
-                DedupeSuggestion.match_type == "fuzzy_review",
-                DedupeSuggestion.primary_contact_id.isnot(None),
-            )
-            .scalar()
-            or 0
-        )
-
-        # High confidence (≥0.95) - pending only
-        total_high_confidence = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .filter(
-                DedupeSuggestion.decision == DedupeDecision.PENDING,
-                DedupeSuggestion.match_type == "fuzzy_high",
-                DedupeSuggestion.primary_contact_id.isnot(None),
-            )
-            .scalar()
-            or 0
-        )
-
-        # Auto-merged count
-        total_auto_merged = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .filter(
-                DedupeSuggestion.decision == DedupeDecision.AUTO_MERGED,
-                DedupeSuggestion.primary_contact_id.isnot(None),
-            )
-            .scalar()
-            or 0
-        )
-
-        # Aging buckets (based on import run created_at)
-        # Use timedelta for database-agnostic date arithmetic
         day_ago = now - timedelta(days=1)
         two_days_ago = now - timedelta(days=2)
 
-        aging_24h = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .join(ImportRun)
-            .filter(
-                DedupeSuggestion.decision == DedupeDecision.PENDING,
-                DedupeSuggestion.primary_contact_id.isnot(None),
-                ImportRun.created_at >= day_ago,
-            )
-            .scalar()
-            or 0
-        )
-
-        aging_48h = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .join(ImportRun)
-            .filter(
-                DedupeSuggestion.decision == DedupeDecision.PENDING,
-                DedupeSuggestion.primary_contact_id.isnot(None),
-                ImportRun.created_at < day_ago,
-                ImportRun.created_at >= two_days_ago,
+        counter = DedupeQueueCounter
+        pending = counter.decision == DedupeDecision.PENDING
+
+        def _total(*conditions):
+            return func.coalesce(func.sum(case((and_(*conditions), counter.suggestion_count), else_=0)), 0)
+
+        row = self.session.execute(
+            select(
+                _total(pending),
+                _total(pending, counter.match_type == "fuzzy_review"),
+                _total(pending, counter.match_type == AUTO_MERGE_MATCH_TYPE),
+                _total(counter.decision == DedupeDecision.AUTO_MERGED),
+                _total(pending, counter.created_hour >= day_ago),
+                _total(pending, counter.created_hour < day_ago, counter.created_hour >= two_days_ago),
+                _total(pending, counter.created_hour < two_days_ago),
             )
-            .scalar()
-            or 0
-        )
-
-        aging_older = (
-            self.session.query(func.count(DedupeSuggestion.id))
-            .join(ImportRun)
-            .filter(
-                DedupeSuggestion.decision == DedupeDecision.PENDING,
-                DedupeSuggestion.primary_contact_id.isnot(None),
-                ImportRun.created_at < two_days_ago,
-            )
-            .scalar()
-            or 0
-        )
+        ).one()
+        total_pending, total_review_band, total_high_confidence, total_auto_merged, *aging = (int(v) for v in row)
+        aging_24h, aging_48h, aging_older = aging
 
         return QueueStats(
             total_pending=total_pending,
@@ -1073,4 +1341,4 @@ class MergeService:
         )
 
 
-__all__ = ["MergeService", "CandidateDetails", "QueueStats"]
+__all__ = ["MergeService", "CandidateDetails", "QueueStats", "ReviewQueuePage", "ReviewQueueRow"]
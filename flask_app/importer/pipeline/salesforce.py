@@ -6,8 +6,8 @@ from __future__ import annotations
 
 import logging
 import time
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Mapping
 
@@ -30,11 +30,11 @@ from flask_app.importer.metrics import record_salesforce_batch, record_salesforc
 from flask_app.importer.pipeline.staging import (
     StagingSummary,
     _commit_staging_batch,
-    compute_checksum,
+    mark_unchanged_staging_rows,
     resolve_source_record_id,
     update_staging_counts,
 )
-from flask_app.models.base import db
+from flask_app.importer.pipeline.staging_writer import StagingWriter, build_staging_row
 from flask_app.models.importer.schema import (
     ImporterWatermark,
     ImportRun,
@@ -58,6 +58,10 @@ class SalesforceIngestSummary:
     max_modstamp: datetime | None
     unmapped_counts: Mapping[str, int]
     errors: list[str]
+    # Peak distinct values per transformed source field within a single batch
+    transform_cardinality: Mapping[str, int] = field(default_factory=dict)
+    # Staged rows whose checksum matched the last loaded payload (skipped downstream)
+    records_unchanged: int = 0
 
 
 def ingest_salesforce_contacts(
@@ -85,23 +89,20 @@ def ingest_salesforce_contacts(
     header: tuple[str, ...] = ()
     max_modstamp: datetime | None = last_modstamp
     sequence_number = 0
-    staging_buffer: list[StagingVolunteer] = []
+    staging_buffer: list[dict[str, object]] = []
+    staging_writer = StagingWriter(StagingVolunteer) if not dry_run else None
     unmapped_counter: Counter[str] = Counter()
     transform_errors: list[str] = []
 
     mapping_spec = get_active_salesforce_mapping()
     transformer = SalesforceMappingTransformer(mapping_spec)
 
-    # Aggregate field statistics across all records
-    aggregated_field_stats: dict[str, FieldImportStats] = {}
-    target_field_contributors: dict[str, set[str]] = defaultdict(set)
-
     def flush_buffer():
         nonlocal records_staged
         if dry_run or not staging_buffer:
             staging_buffer.clear()
             return
-        db.session.add_all(staging_buffer)
+        staging_writer.write(staging_buffer)
         _commit_staging_batch()
         records_staged += len(staging_buffer)
         staging_buffer.clear()
@@ -111,7 +112,8 @@ def ingest_salesforce_contacts(
         if not header and batch.records:
             header = tuple(batch.records[0].keys())
         batch_start = time.perf_counter()
-        for record in batch.records:
+        batch_transform = transformer.transform_batch(batch.records)
+        for record, transform_result in zip(batch.records, batch_transform.results):
             records_received += 1
             modstamp = _parse_salesforce_datetime(record.get("SystemModstamp"))
             if modstamp:
@@ -122,27 +124,6 @@ def ingest_salesforce_contacts(
                     modstamp = modstamp.replace(tzinfo=timezone.utc)
                 if max_modstamp is None or modstamp > max_modstamp:
                     max_modstamp = modstamp
-            transform_result = transformer.transform(record)
-
-            # Aggregate field statistics
-            for source_field, stats in transform_result.field_stats.items():
-                if source_field not in aggregated_field_stats:
-                    aggregated_field_stats[source_field] = FieldImportStats(
-                        source_field=stats.source_field,
-                        target_field=stats.target_field,
-                    )
-                agg_stats = aggregated_field_stats[source_field]
-                agg_stats.records_with_value += stats.records_with_value
-                agg_stats.records_mapped += stats.records_mapped
-                agg_stats.records_transformed += stats.records_transformed
-                agg_stats.records_failed_transform += stats.records_failed_transform
-                agg_stats.records_used_default += stats.records_used_default
-                agg_stats.total_records_processed += stats.total_records_processed
-
-                # Track target field contributors
-                if stats.target_field:
-                    target_field_contributors[stats.target_field].add(source_field)
-
             for field_name in transform_result.unmapped_fields:
                 unmapped_counter[field_name] += 1
             if transform_result.errors:
@@ -179,15 +160,14 @@ def ingest_salesforce_contacts(
                 metadata = normalized.setdefault("metadata", {})
                 metadata["missing_contact_info"] = True
             staging_buffer.append(
-                StagingVolunteer(
+                build_staging_row(
                     run_id=import_run.id,
                     sequence_number=sequence_number,
                     source_record_id=resolve_source_record_id(record.get("Id"), sequence_number),
                     external_system="salesforce",
                     external_id=record.get("Id") or None,
-                    payload_json=dict(record),
-                    normalized_json=normalized,
-                    checksum=compute_checksum(normalized),
+                    payload=record,
+                    normalized=normalized,
                 )
             )
             if len(staging_buffer) >= staging_batch_size:
@@ -204,9 +184,14 @@ def ingest_salesforce_contacts(
                 "salesforce_batch_records": len(batch.records),
                 "salesforce_batch_locator": batch.locator,
                 "salesforce_batch_duration_seconds": round(duration, 3),
+                "salesforce_batch_transform_cardinality": batch_transform.cardinality,
             },
         )
 
+    records_unchanged = 0
+    if not dry_run:
+        records_unchanged = mark_unchanged_staging_rows(import_run, StagingVolunteer, entity_type="salesforce_contact")
+
     summary = SalesforceIngestSummary(
         job_id=batch.job_id if batches_processed else "n/a",
         batches_processed=batches_processed,
@@ -217,12 +202,15 @@ def ingest_salesforce_contacts(
         max_modstamp=max_modstamp,
         unmapped_counts=dict(unmapped_counter),
         errors=transform_errors,
+        transform_cardinality=dict(transformer.peak_cardinality),
+        records_unchanged=records_unchanged,
     )
     if unmapped_counter:
         for field_name, count in unmapped_counter.items():
             record_salesforce_unmapped(field_name, count)
+    field_stats = transformer.field_stats()
     _update_import_run(
-        import_run, summary, field_stats=aggregated_field_stats, target_contributors=target_field_contributors
+        import_run, summary, field_stats=field_stats, target_contributors=_target_contributors(field_stats)
     )
     if not dry_run and max_modstamp:
         watermark.last_successful_modstamp = max_modstamp.astimezone(timezone.utc)
@@ -236,6 +224,15 @@ def ingest_salesforce_contacts(
     return summary
 
 
+def _target_contributors(field_stats: Mapping[str, FieldImportStats]) -> dict[str, set[str]]:
+    """Group source fields by the canonical target they populate."""
+    contributors: dict[str, set[str]] = {}
+    for source_field, stats in field_stats.items():
+        if stats.target_field:
+            contributors.setdefault(stats.target_field, set()).add(source_field)
+    return contributors
+
+
 def _update_import_run(
     import_run: ImportRun,
     summary: SalesforceIngestSummary,
@@ -249,7 +246,7 @@ def _update_import_run(
         rows_skipped_blank=0,
         header=summary.header,
         dry_run=summary.dry_run,
-        dry_run_rows=(),
+        rows_unchanged=summary.records_unchanged,
     )
     update_staging_counts(import_run, staging_summary)
     metrics = dict(import_run.metrics_json or {})
@@ -260,10 +257,12 @@ def _update_import_run(
             "batches_processed": summary.batches_processed,
             "records_received": summary.records_received,
             "records_staged": summary.records_staged,
+            "records_unchanged": summary.records_unchanged,
             "dry_run": summary.dry_run,
             "max_system_modstamp": summary.max_modstamp.isoformat() if summary.max_modstamp else None,
             "unmapped_fields": dict(summary.unmapped_counts),
             "transform_errors": list(summary.errors),
+            "transform_cardinality": dict(summary.transform_cardinality),
         }
     )
 
@@ -339,23 +338,20 @@ def ingest_salesforce_accounts(
     header: tuple[str, ...] = ()
     max_modstamp: datetime | None = last_modstamp
     sequence_number = 0
-    staging_buffer: list[StagingOrganization] = []
+    staging_buffer: list[dict[str, object]] = []
+    staging_writer = StagingWriter(StagingOrganization) if not dry_run else None
     unmapped_counter: Counter[str] = Counter()
     transform_errors: list[str] = []
 
     mapping_spec = get_active_salesforce_account_mapping()
     transformer = SalesforceMappingTransformer(mapping_spec)
 
-    # Aggregate field statistics across all records
-    aggregated_field_stats: dict[str, FieldImportStats] = {}
-    target_field_contributors: dict[str, set[str]] = defaultdict(set)
-
     def flush_buffer():
         nonlocal records_staged
         if dry_run or not staging_buffer:
             staging_buffer.clear()
             return
-        db.session.add_all(staging_buffer)
+        staging_writer.write(staging_buffer)
         _commit_staging_batch()
         records_staged += len(staging_buffer)
         staging_buffer.clear()
@@ -365,7 +361,8 @@ def ingest_salesforce_accounts(
         if not header and batch.records:
             header = tuple(batch.records[0].keys())
         batch_start = time.perf_counter()
-        for record in batch.records:
+        batch_transform = transformer.transform_batch(batch.records)
+        for record, transform_result in zip(batch.records, batch_transform.results):
             records_received += 1
             modstamp = _parse_salesforce_datetime(record.get("SystemModstamp"))
             if modstamp:
@@ -376,27 +373,6 @@ def ingest_salesforce_accounts(
                     modstamp = modstamp.replace(tzinfo=timezone.utc)
                 if max_modstamp is None or modstamp > max_modstamp:
                     max_modstamp = modstamp
-            transform_result = transformer.transform(record)
-
-            # Aggregate field statistics
-            for source_field, stats in transform_result.field_stats.items():
-                if source_field not in aggregated_field_stats:
-                    aggregated_field_stats[source_field] = FieldImportStats(
-                        source_field=stats.source_field,
-                        target_field=stats.target_field,
-                    )
-                agg_stats = aggregated_field_stats[source_field]
-                agg_stats.records_with_value += stats.records_with_value
-                agg_stats.records_mapped += stats.records_mapped
-                agg_stats.records_transformed += stats.records_transformed
-                agg_stats.records_failed_transform += stats.records_failed_transform
-                agg_stats.records_used_default += stats.records_used_default
-                agg_stats.total_records_processed += stats.total_records_processed
-
-                # Track target field contributors
-                if stats.target_field:
-                    target_field_contributors[stats.target_field].add(source_field)
-
             for field_name in transform_result.unmapped_fields:
                 unmapped_counter[field_name] += 1
             if transform_result.errors:
@@ -406,15 +382,14 @@ def ingest_salesforce_accounts(
             sequence_number += 1
             normalized = transform_result.canonical or {}
             staging_buffer.append(
-                StagingOrganization(
+                build_staging_row(
                     run_id=import_run.id,
                     sequence_number=sequence_number,
                     source_record_id=resolve_source_record_id(record.get("Id"), sequence_number),
                     external_system="salesforce",
                     external_id=record.get("Id") or None,
-                    payload_json=dict(record),
-                    normalized_json=normalized,
-                    checksum=compute_checksum(normalized),
+                    payload=record,
+                    normalized=normalized,
                 )
             )
             if len(staging_buffer) >= staging_batch_size:
@@ -431,9 +406,16 @@ def ingest_salesforce_accounts(
                 "salesforce_batch_records": len(batch.records),
                 "salesforce_batch_locator": batch.locator,
                 "salesforce_batch_duration_seconds": round(duration, 3),
+                "salesforce_batch_transform_cardinality": batch_transform.cardinality,
             },
         )
 
+    records_unchanged = 0
+    if not dry_run:
+        records_unchanged = mark_unchanged_staging_rows(
+            import_run, StagingOrganization, entity_type="salesforce_organization"
+        )
+
     summary = SalesforceIngestSummary(
         job_id=batch.job_id if batches_processed else "n/a",
         batches_processed=batches_processed,
@@ -444,12 +426,15 @@ def ingest_salesforce_accounts(
         max_modstamp=max_modstamp,
         unmapped_counts=dict(unmapped_counter),
         errors=transform_errors,
+        transform_cardinality=dict(transformer.peak_cardinality),
+        records_unchanged=records_unchanged,
     )
     if unmapped_counter:
         for field_name, count in unmapped_counter.items():
             record_salesforce_unmapped(field_name, count)
+    field_stats = transformer.field_stats()
     _update_import_run_accounts(
-        import_run, summary, field_stats=aggregated_field_stats, target_contributors=target_field_contributors
+        import_run, summary, field_stats=field_stats, target_contributors=_target_contributors(field_stats)
     )
     if not dry_run and max_modstamp:
         watermark.last_successful_modstamp = max_modstamp.astimezone(timezone.utc)
@@ -476,7 +461,7 @@ def _update_import_run_accounts(
         rows_skipped_blank=0,
         header=summary.header,
         dry_run=summary.dry_run,
-        dry_run_rows=(),
+        rows_unchanged=summary.records_unchanged,
     )
     update_staging_counts(import_run, staging_summary, entity_type="organizations")
     metrics = dict(import_run.metrics_json or {})
@@ -487,10 +472,12 @@ def _update_import_run_accounts(
             "batches_processed": summary.batches_processed,
             "records_received": summary.records_received,
             "records_staged": summary.records_staged,
+            "records_unchanged": summary.records_unchanged,
             "dry_run": summary.dry_run,
             "max_system_modstamp": summary.max_modstamp.isoformat() if summary.max_modstamp else None,
             "unmapped_fields": dict(summary.unmapped_counts),
             "transform_errors": list(summary.errors),
+            "transform_cardinality": dict(summary.transform_cardinality),
         }
     )
 
@@ -566,23 +553,20 @@ def ingest_salesforce_sessions(
     header: tuple[str, ...] = ()
     max_modstamp: datetime | None = last_modstamp
     sequence_number = 0
-    staging_buffer: list[StagingEvent] = []
+    staging_buffer: list[dict[str, object]] = []
+    staging_writer = StagingWriter(StagingEvent) if not dry_run else None
     unmapped_counter: Counter[str] = Counter()
     transform_errors: list[str] = []
 
     mapping_spec = get_active_salesforce_session_mapping()
     transformer = SalesforceMappingTransformer(mapping_spec)
 
-    # Aggregate field statistics across all records
-    aggregated_field_stats: dict[str, FieldImportStats] = {}
-    target_field_contributors: dict[str, set[str]] = defaultdict(set)
-
     def flush_buffer():
         nonlocal records_staged
         if dry_run or not staging_buffer:
             staging_buffer.clear()
             return
-        db.session.add_all(staging_buffer)
+        staging_writer.write(staging_buffer)
         _commit_staging_batch()
         records_staged += len(staging_buffer)
         staging_buffer.clear()
@@ -592,7 +576,8 @@ def ingest_salesforce_sessions(
         if not header and batch.records:
             header = tuple(batch.records[0].keys())
         batch_start = time.perf_counter()
-        for record in batch.records:
+        batch_transform = transformer.transform_batch(batch.records)
+        for record, transform_result in zip(batch.records, batch_transform.results):
             records_received += 1
             modstamp = _parse_salesforce_datetime(record.get("SystemModstamp"))
             if modstamp:
@@ -603,8 +588,6 @@ def ingest_salesforce_sessions(
                     modstamp = modstamp.replace(tzinfo=timezone.utc)
                 if max_modstamp is None or modstamp > max_modstamp:
                     max_modstamp = modstamp
-            transform_result = transformer.transform(record)
-
             # Calculate duration from start_date and end_date if both are present
             canonical = transform_result.canonical or {}
             start_date_str = canonical.get("start_date")
@@ -618,25 +601,6 @@ def ingest_salesforce_sessions(
                 except Exception:
                     pass  # Duration calculation failed, leave it unset
 
-            # Aggregate field statistics
-            for source_field, stats in transform_result.field_stats.items():
-                if source_field not in aggregated_field_stats:
-                    aggregated_field_stats[source_field] = FieldImportStats(
-                        source_field=stats.source_field,
-                        target_field=stats.target_field,
-                    )
-                agg_stats = aggregated_field_stats[source_field]
-                agg_stats.records_with_value += stats.records_with_value
-                agg_stats.records_mapped += stats.records_mapped
-                agg_stats.records_transformed += stats.records_transformed
-                agg_stats.records_failed_transform += stats.records_failed_transform
-                agg_stats.records_used_default += stats.records_used_default
-                agg_stats.total_records_processed += stats.total_records_processed
-
-                # Track target field contributors
-                if stats.target_field:
-                    target_field_contributors[stats.target_field].add(source_field)
-
             for field_name in transform_result.unmapped_fields:
                 unmapped_counter[field_name] += 1
             if transform_result.errors:
@@ -646,15 +610,14 @@ def ingest_salesforce_sessions(
             sequence_number += 1
             normalized = canonical
             staging_buffer.append(
-                StagingEvent(
+                build_staging_row(
                     run_id=import_run.id,
                     sequence_number=sequence_number,
                     source_record_id=resolve_source_record_id(record.get("Id"), sequence_number),
                     external_system="salesforce",
                     external_id=record.get("Id") or None,
-                    payload_json=dict(record),
-                    normalized_json=normalized,
-                    checksum=compute_checksum(normalized),
+                    payload=record,
+                    normalized=normalized,
                 )
             )
             if len(staging_buffer) >= staging_batch_size:
@@ -671,9 +634,14 @@ def ingest_salesforce_sessions(
                 "salesforce_batch_records": len(batch.records),
                 "salesforce_batch_locator": batch.locator,
                 "salesforce_batch_duration_seconds": round(duration, 3),
+                "salesforce_batch_transform_cardinality": batch_transform.cardinality,
             },
         )
 
+    records_unchanged = 0
+    if not dry_run:
+        records_unchanged = mark_unchanged_staging_rows(import_run, StagingEvent, entity_type="salesforce_event")
+
     summary = SalesforceIngestSummary(
         job_id=batch.job_id if batches_processed else "n/a",
         batches_processed=batches_processed,
@@ -684,12 +652,15 @@ def ingest_salesforce_sessions(
         max_modstamp=max_modstamp,
         unmapped_counts=dict(unmapped_counter),
         errors=transform_errors,
+        transform_cardinality=dict(transformer.peak_cardinality),
+        records_unchanged=records_unchanged,
     )
     if unmapped_counter:
         for field_name, count in unmapped_counter.items():
             record_salesforce_unmapped(field_name, count)
+    field_stats = transformer.field_stats()
     _update_import_run_events(
-        import_run, summary, field_stats=aggregated_field_stats, target_contributors=target_field_contributors
+        import_run, summary, field_stats=field_stats, target_contributors=_target_contributors(field_stats)
     )
     if not dry_run and max_modstamp:
         watermark.last_successful_modstamp = max_modstamp.astimezone(timezone.utc)
@@ -716,7 +687,7 @@ def _update_import_run_events(
         rows_skipped_blank=0,
         header=summary.header,
         dry_run=summary.dry_run,
-        dry_run_rows=(),
+        rows_unchanged=summary.records_unchanged,
     )
     update_staging_counts(import_run, staging_summary, entity_type="events")
     metrics = dict(import_run.metrics_json or {})
@@ -727,10 +698,12 @@ def _update_import_run_events(
             "batches_processed": summary.batches_processed,
             "records_received": summary.records_received,
             "records_staged": summary.records_staged,
+            "records_unchanged": summary.records_unchanged,
             "dry_run": summary.dry_run,
             "max_system_modstamp": summary.max_modstamp.isoformat() if summary.max_modstamp else None,
             "unmapped_fields": dict(summary.unmapped_counts),
             "transform_errors": list(summary.errors),
+            "transform_cardinality": dict(summary.transform_cardinality),
         }
     )
 
@@ -823,23 +796,20 @@ def ingest_salesforce_affiliations(
     header: tuple[str, ...] = ()
     max_modstamp: datetime | None = last_modstamp
     sequence_number = 0
-    staging_buffer: list[StagingAffiliation] = []
+    staging_buffer: list[dict[str, object]] = []
+    staging_writer = StagingWriter(StagingAffiliation) if not dry_run else None
     unmapped_counter: Counter[str] = Counter()
     transform_errors: list[str] = []
 
     mapping_spec = get_active_salesforce_affiliation_mapping()
     transformer = SalesforceMappingTransformer(mapping_spec)
 
-    # Aggregate field statistics across all records
-    aggregated_field_stats: dict[str, FieldImportStats] = {}
-    target_field_contributors: dict[str, set[str]] = defaultdict(set)
-
     def flush_buffer():
         nonlocal records_staged
         if dry_run or not staging_buffer:
             staging_buffer.clear()
             return
-        db.session.add_all(staging_buffer)
+        staging_writer.write(staging_buffer)
         _commit_staging_batch()
         records_staged += len(staging_buffer)
         staging_buffer.clear()
@@ -849,7 +819,8 @@ def ingest_salesforce_affiliations(
         if not header and batch.records:
             header = tuple(batch.records[0].keys())
         batch_start = time.perf_counter()
-        for record in batch.records:
+        batch_transform = transformer.transform_batch(batch.records)
+        for record, transform_result in zip(batch.records, batch_transform.results):
             records_received += 1
             modstamp = _parse_salesforce_datetime(record.get("SystemModstamp"))
             if modstamp:
@@ -860,27 +831,6 @@ def ingest_salesforce_affiliations(
                     modstamp = modstamp.replace(tzinfo=timezone.utc)
                 if max_modstamp is None or modstamp > max_modstamp:
                     max_modstamp = modstamp
-            transform_result = transformer.transform(record)
-
-            # Aggregate field statistics
-            for source_field, stats in transform_result.field_stats.items():
-                if source_field not in aggregated_field_stats:
-                    aggregated_field_stats[source_field] = FieldImportStats(
-                        source_field=stats.source_field,
-                        target_field=stats.target_field,
-                    )
-                agg_stats = aggregated_field_stats[source_field]
-                agg_stats.records_with_value += stats.records_with_value
-                agg_stats.records_mapped += stats.records_mapped
-                agg_stats.records_transformed += stats.records_transformed
-                agg_stats.records_failed_transform += stats.records_failed_transform
-                agg_stats.records_used_default += stats.records_used_default
-                agg_stats.total_records_processed += stats.total_records_processed
-
-                # Track target field contributors
-                if stats.target_field:
-                    target_field_contributors[stats.target_field].add(source_field)
-
             for field_name in transform_result.unmapped_fields:
                 unmapped_counter[field_name] += 1
             if transform_result.errors:
@@ -890,15 +840,14 @@ def ingest_salesforce_affiliations(
             sequence_number += 1
             normalized = transform_result.canonical or {}
             staging_buffer.append(
-                StagingAffiliation(
+                build_staging_row(
                     run_id=import_run.id,
                     sequence_number=sequence_number,
                     source_record_id=resolve_source_record_id(record.get("Id"), sequence_number),
                     external_system="salesforce",
                     external_id=record.get("Id") or None,
-                    payload_json=dict(record),
-                    normalized_json=normalized,
-                    checksum=compute_checksum(normalized),
+                    payload=record,
+                    normalized=normalized,
                 )
             )
             if len(staging_buffer) >= staging_batch_size:
@@ -915,9 +864,16 @@ def ingest_salesforce_affiliations(
                 "salesforce_batch_records": len(batch.records),
                 "salesforce_batch_locator": batch.locator,
                 "salesforce_batch_duration_seconds": round(duration, 3),
+                "salesforce_batch_transform_cardinality": batch_transform.cardinality,
             },
         )
 
+    records_unchanged = 0
+    if not dry_run:
+        records_unchanged = mark_unchanged_staging_rows(
+            import_run, StagingAffiliation, entity_type="salesforce_affiliation"
+        )
+
     summary = SalesforceIngestSummary(
         job_id=batch.job_id if batches_processed else "n/a",
         batches_processed=batches_processed,
@@ -928,12 +884,15 @@ def ingest_salesforce_affiliations(
         max_modstamp=max_modstamp,
         unmapped_counts=dict(unmapped_counter),
         errors=transform_errors,
+        transform_cardinality=dict(transformer.peak_cardinality),
+        records_unchanged=records_unchanged,
     )
     if unmapped_counter:
         for field_name, count in unmapped_counter.items():
             record_salesforce_unmapped(field_name, count)
+    field_stats = transformer.field_stats()
     _update_import_run_affiliations(
-        import_run, summary, field_stats=aggregated_field_stats, target_contributors=target_field_contributors
+        import_run, summary, field_stats=field_stats, target_contributors=_target_contributors(field_stats)
     )
     if not dry_run and max_modstamp:
         watermark.last_successful_modstamp = max_modstamp.astimezone(timezone.utc)
@@ -960,7 +919,7 @@ def _update_import_run_affiliations(
         rows_skipped_blank=0,
         header=summary.header,
         dry_run=summary.dry_run,
-        dry_run_rows=(),
+        rows_unchanged=summary.records_unchanged,
     )
     update_staging_counts(import_run, staging_summary, entity_type="affiliations")
     metrics = dict(import_run.metrics_json or {})
@@ -971,10 +930,12 @@ def _update_import_run_affiliations(
             "batches_processed": summary.batches_processed,
             "records_received": summary.records_received,
             "records_staged": summary.records_staged,
+            "records_unchanged": summary.records_unchanged,
             "dry_run": summary.dry_run,
             "max_system_modstamp": summary.max_modstamp.isoformat() if summary.max_modstamp else None,
             "unmapped_fields": dict(summary.unmapped_counts),
             "transform_errors": list(summary.errors),
+            "transform_cardinality": dict(summary.transform_cardinality),
         }
     )
 
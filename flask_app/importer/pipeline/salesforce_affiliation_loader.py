@@ -5,20 +5,23 @@ Salesforce Affiliation (npe5__Affiliation__c) loader with two-phase commit to co
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from hashlib import sha256
 from types import SimpleNamespace
-from typing import Mapping
+from typing import Iterable, Iterator, Mapping
 
 from flask import current_app
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from flask_app.importer.metrics import record_salesforce_rows, record_salesforce_watermark
+from flask_app.importer.pipeline.external_id_cache import ExternalIdMapCache, iter_chunks
 from flask_app.importer.pipeline.load_core import _record_import_skip
+from flask_app.importer.pipeline.staging import count_unchanged_staging_rows, max_staging_source_timestamps
 from flask_app.models import ExternalIdMap, db
 from flask_app.models.contact.relationships import ContactOrganization
 from flask_app.models.importer.schema import (
@@ -59,30 +62,42 @@ class SalesforceAffiliationLoader:
     def __init__(self, run: ImportRun, session: Session | None = None):
         self.run = run
         self.session = session or db.session
+        self.external_ids = {
+            entity_type: ExternalIdMapCache(self.session, entity_type=entity_type)
+            for entity_type in (ENTITY_TYPE, "salesforce_contact", "salesforce_organization")
+        }
+        # ContactOrganization rows of the chunk's contacts, and new rows whose ids are assigned on flush.
+        self._links: dict[tuple[int, int], ContactOrganization] = {}
+        self._links_by_contact: dict[int, list[ContactOrganization]] = defaultdict(list)
+        self._unbound_links: list[tuple[ContactOrganization, CleanAffiliation, ExternalIdMap | None]] = []
 
     def execute(self) -> LoaderCounters:
         # Read from clean_affiliations (validated rows) instead of staging
         clean_rows = self._snapshot_clean_rows()
-        counters = LoaderCounters()
+        counters = LoaderCounters(unchanged=count_unchanged_staging_rows(self.run.id, StagingAffiliation))
 
         with self._transaction():
-            for clean_row in clean_rows:
-                action = self._apply_row(clean_row)
-                if action == "created":
-                    counters.created += 1
-                elif action == "updated":
-                    counters.updated += 1
-                elif action == "deleted":
-                    counters.deleted += 1
-                elif action == "skipped":
-                    counters.skipped += 1
-                else:
-                    counters.unchanged += 1
-
-            # Advance watermark using ALL staging rows (not just validated ones)
+            for chunk in iter_chunks(clean_rows):
+                self._prefetch_external_maps(chunk)
+                for clean_row in chunk:
+                    action = self._apply_row(clean_row)
+                    if action == "created":
+                        counters.created += 1
+                    elif action == "updated":
+                        counters.updated += 1
+                    elif action == "deleted":
+                        counters.deleted += 1
+                    elif action == "skipped":
+                        counters.skipped += 1
+                    else:
+                        counters.unchanged += 1
+                self._flush_links()
+                for cache in self.external_ids.values():
+                    cache.flush()
+
+            # Advance watermark over ALL staging rows (not just validated ones)
             # This ensures we don't re-process records that failed DQ validation
-            all_staging_rows = self._snapshot_staging_rows()
-            self._advance_watermark(all_staging_rows)
+            self._advance_watermark()
             self.run.status = ImportRunStatus.SUCCEEDED
             self.run.finished_at = datetime.now(timezone.utc)
             self._persist_counters(counters)
@@ -91,7 +106,7 @@ class SalesforceAffiliationLoader:
             record_salesforce_rows(action=action, count=count)
         return counters
 
-    def _snapshot_clean_rows(self) -> list[CleanAffiliation | SimpleNamespace]:
+    def _snapshot_clean_rows(self) -> Iterable[CleanAffiliation | SimpleNamespace]:
         """Read validated rows from clean_affiliations (only rows that passed DQ validation)."""
         stmt = (
             select(CleanAffiliation)
@@ -104,37 +119,30 @@ class SalesforceAffiliationLoader:
             return clean_rows
 
         # Fallback for unit tests that invoke the loader without running the clean promotion step.
-        staging_rows = self._snapshot_staging_rows()
-        validated_staging = [r for r in staging_rows if r.status == StagingRecordStatus.VALIDATED]
-        if not validated_staging:
-            return []
-
-        fallback_rows: list[SimpleNamespace] = []
-        for row in validated_staging:
-            payload = dict(row.normalized_json or row.payload_json or {})
-            fallback_rows.append(
-                SimpleNamespace(
-                    payload_json=payload,
-                    staging_row=row,
-                    external_id=payload.get("external_id"),
-                    contact_external_id=payload.get("contact_external_id"),
-                    organization_external_id=payload.get("organization_external_id"),
-                    load_action=None,
-                    core_contact_organization_id=None,
-                    external_system=row.external_system,
-                    staging_affiliation_id=row.id,
-                )
-            )
-        return fallback_rows
+        return self._iter_staging_fallback_rows()
 
-    def _snapshot_staging_rows(self) -> list[StagingAffiliation]:
-        """Legacy method - kept for watermark advancement."""
+    def _iter_staging_fallback_rows(self) -> Iterator[SimpleNamespace]:
+        """Yield clean-row stand-ins for this run's validated staging rows, built as the loader consumes them."""
         stmt = (
             select(StagingAffiliation)
             .where(StagingAffiliation.run_id == self.run.id)
+            .where(StagingAffiliation.status == StagingRecordStatus.VALIDATED)
             .order_by(StagingAffiliation.sequence_number.asc())
         )
-        return list(self.session.scalars(stmt))
+        for row in self.session.scalars(stmt).all():
+            payload = dict(row.normalized_json or row.payload_json or {})
+            yield SimpleNamespace(
+                payload_json=payload,
+                staging_row=row,
+                checksum=row.checksum,
+                external_id=payload.get("external_id"),
+                contact_external_id=payload.get("contact_external_id"),
+                organization_external_id=payload.get("organization_external_id"),
+                load_action=None,
+                core_contact_organization_id=None,
+                external_system=row.external_system,
+                staging_affiliation_id=row.id,
+            )
 
     def _apply_row(self, clean_row: CleanAffiliation) -> str:
         # Get normalized payload from clean_affiliation payload_json
@@ -233,17 +241,56 @@ class SalesforceAffiliationLoader:
         else:
             return self._handle_update(map_entry, payload, payload_hash, clean_row, contact_id, organization_id)
 
-    def _get_external_map(self, entity_type: str, external_id: str) -> ExternalIdMap | None:
-        stmt = (
-            select(ExternalIdMap)
-            .where(
-                ExternalIdMap.external_system == "salesforce",
-                ExternalIdMap.external_id == external_id,
-                ExternalIdMap.entity_type == entity_type,
+    def _prefetch_external_maps(self, clean_rows: list[CleanAffiliation | SimpleNamespace]) -> None:
+        """Load the affiliation, contact, and organization map entries a chunk of rows refers to."""
+        keys = {ENTITY_TYPE: [], "salesforce_contact": [], "salesforce_organization": []}
+        for clean_row in clean_rows:
+            payload = clean_row.payload_json or {}
+            keys[ENTITY_TYPE].append(clean_row.external_id or payload.get("external_id"))
+            keys["salesforce_contact"].append(clean_row.contact_external_id or payload.get("contact_external_id"))
+            keys["salesforce_organization"].append(
+                clean_row.organization_external_id or payload.get("organization_external_id")
             )
-            .with_for_update(of=ExternalIdMap)
-        )
-        return self.session.scalars(stmt).first()
+        for entity_type, external_ids in keys.items():
+            self.external_ids[entity_type].prefetch(external_ids)
+
+        contact_maps = (self._get_external_map("salesforce_contact", key) for key in keys["salesforce_contact"] if key)
+        self._preload_links({entry.entity_id for entry in contact_maps if entry is not None and entry.is_active})
+
+    def _preload_links(self, contact_ids: set[int]) -> None:
+        """Load every ContactOrganization of the chunk's contacts in one query."""
+        self._links.clear()
+        self._links_by_contact.clear()
+        if not contact_ids:
+            return
+        stmt = select(ContactOrganization).where(ContactOrganization.contact_id.in_(contact_ids))
+        for contact_org in self.session.scalars(stmt):
+            self._register_link(contact_org)
+
+    def _register_link(self, contact_org: ContactOrganization) -> None:
+        self._links[(contact_org.contact_id, contact_org.organization_id)] = contact_org
+        self._links_by_contact[contact_org.contact_id].append(contact_org)
+
+    def _bind_link(
+        self, contact_org: ContactOrganization, clean_row: CleanAffiliation, entry: ExternalIdMap | None = None
+    ) -> None:
+        """Point the clean row (and a new map entry) at contact_org, once it has an id."""
+        if contact_org.id is None:
+            self._unbound_links.append((contact_org, clean_row, entry))
+            return
+        clean_row.core_contact_organization_id = contact_org.id
+        if entry is not None:
+            entry.entity_id = contact_org.id
+
+    def _flush_links(self) -> None:
+        """Write the chunk's affiliation inserts and primary-flag changes in one flush."""
+        self.session.flush()
+        for contact_org, clean_row, entry in self._unbound_links:
+            self._bind_link(contact_org, clean_row, entry)
+        self._unbound_links.clear()
+
+    def _get_external_map(self, entity_type: str, external_id: str) -> ExternalIdMap | None:
+        return self.external_ids[entity_type].get(external_id)
 
     def _handle_create(
         self,
@@ -255,11 +302,7 @@ class SalesforceAffiliationLoader:
         organization_id: int,
     ) -> str:
         # Check if ContactOrganization already exists (unique constraint on contact_id, organization_id)
-        existing = (
-            self.session.query(ContactOrganization)
-            .filter_by(contact_id=contact_id, organization_id=organization_id)
-            .first()
-        )
+        existing = self._links.get((contact_id, organization_id))
 
         if existing:
             # Update existing record instead of creating duplicate
@@ -292,11 +335,11 @@ class SalesforceAffiliationLoader:
             end_date=end_date,
         )
         self.session.add(contact_org)
-        self.session.flush()
+        self._register_link(contact_org)
 
         # If this is primary, deactivate other primary affiliations for this contact
         if is_primary:
-            self._deactivate_other_primary_affiliations(contact_id, contact_org.id)
+            self._deactivate_other_primary_affiliations(contact_id, contact_org)
 
         # Create ExternalIdMap entry
         metadata_dict = {
@@ -315,17 +358,16 @@ class SalesforceAffiliationLoader:
 
         entry = ExternalIdMap(
             entity_type=ENTITY_TYPE,
-            entity_id=contact_org.id,
             external_system="salesforce",
             external_id=external_id,
             metadata_json=metadata_dict,
         )
-        entry.mark_seen(run_id=self.run.id)
-        self.session.add(entry)
+        entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+        self.external_ids[ENTITY_TYPE].add(entry)
 
         # Update clean_row
         clean_row.load_action = "inserted"
-        clean_row.core_contact_organization_id = contact_org.id
+        self._bind_link(contact_org, clean_row, entry)
 
         return "created"
 
@@ -341,6 +383,10 @@ class SalesforceAffiliationLoader:
         current = entry.metadata_json or {}
         previous_hash = current.get("payload_hash")
 
+        if entry.entity_id is None:
+            # Created earlier in this chunk; flush so the new ContactOrganization has an id.
+            self._flush_links()
+
         # Get the ContactOrganization record
         contact_org = self.session.get(ContactOrganization, entry.entity_id)
         if contact_org is None:
@@ -351,7 +397,7 @@ class SalesforceAffiliationLoader:
 
         # Check if payload changed
         if previous_hash == payload_hash:
-            entry.mark_seen(run_id=self.run.id)
+            entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
             clean_row.load_action = "unchanged"
             clean_row.core_contact_organization_id = contact_org.id
             return "unchanged"
@@ -382,13 +428,13 @@ class SalesforceAffiliationLoader:
 
         # If this became primary, deactivate other primary affiliations
         if is_primary and not was_primary:
-            self._deactivate_other_primary_affiliations(contact_id, contact_org.id)
+            self._deactivate_other_primary_affiliations(contact_id, contact_org)
 
         # Update ExternalIdMap
         entry.is_active = True
         entry.deactivated_at = None
         entry.upstream_deleted_reason = None
-        entry.mark_seen(run_id=self.run.id)
+        entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
 
         # Update metadata
         metadata_dict = {
@@ -440,9 +486,10 @@ class SalesforceAffiliationLoader:
             contact_org.end_date = end_date
 
         if is_primary and not was_primary:
-            self._deactivate_other_primary_affiliations(contact_id, contact_org.id)
+            self._deactivate_other_primary_affiliations(contact_id, contact_org)
 
         # Create or update ExternalIdMap
+        entry = None
         if is_new_external_map:
             metadata_dict = {
                 "payload_hash": payload_hash,
@@ -460,18 +507,17 @@ class SalesforceAffiliationLoader:
 
             entry = ExternalIdMap(
                 entity_type=ENTITY_TYPE,
-                entity_id=contact_org.id,
                 external_system="salesforce",
                 external_id=external_id,
                 metadata_json=metadata_dict,
             )
-            entry.mark_seen(run_id=self.run.id)
-            self.session.add(entry)
+            entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+            self.external_ids[ENTITY_TYPE].add(entry)
         else:
             # Update existing ExternalIdMap
             map_entry = self._get_external_map(ENTITY_TYPE, external_id)
             if map_entry:
-                map_entry.mark_seen(run_id=self.run.id)
+                map_entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
                 metadata_dict = {
                     "payload_hash": payload_hash,
                     "last_payload": payload,
@@ -488,23 +534,15 @@ class SalesforceAffiliationLoader:
                 map_entry.metadata_json = metadata_dict
 
         clean_row.load_action = "updated"
-        clean_row.core_contact_organization_id = contact_org.id
+        self._bind_link(contact_org, clean_row, entry)
 
         return "updated"
 
-    def _deactivate_other_primary_affiliations(self, contact_id: int, exclude_id: int) -> None:
-        """Deactivate other primary affiliations for this contact."""
-        other_primaries = (
-            self.session.query(ContactOrganization)
-            .filter(
-                ContactOrganization.contact_id == contact_id,
-                ContactOrganization.is_primary.is_(True),
-                ContactOrganization.id != exclude_id,
-            )
-            .all()
-        )
-        for primary in other_primaries:
-            primary.is_primary = False
+    def _deactivate_other_primary_affiliations(self, contact_id: int, primary: ContactOrganization) -> None:
+        """Deactivate other primary affiliations for this contact among the chunk's preloaded rows."""
+        for contact_org in self._links_by_contact[contact_id]:
+            if contact_org is not primary and contact_org.is_primary:
+                contact_org.is_primary = False
 
     def _handle_delete(self, external_id: str) -> str:
         """Handle deletion of an affiliation."""
@@ -551,26 +589,9 @@ class SalesforceAffiliationLoader:
         normalized_json = json.dumps(normalized, sort_keys=True, default=str)
         return sha256(normalized_json.encode("utf-8")).hexdigest()
 
-    def _advance_watermark(self, staging_rows: list[StagingAffiliation]) -> None:
-        """Advance watermark to max SystemModstamp from staging rows."""
-        if not staging_rows:
-            return
-
-        max_modstamp = None
-        for row in staging_rows:
-            payload = row.payload_json or {}
-            modstamp_str = payload.get("SystemModstamp")
-            if modstamp_str:
-                try:
-                    if modstamp_str.endswith("Z"):
-                        modstamp_str = modstamp_str[:-1] + "+00:00"
-                    modstamp = datetime.fromisoformat(modstamp_str)
-                    if modstamp.tzinfo is None:
-                        modstamp = modstamp.replace(tzinfo=timezone.utc)
-                    if max_modstamp is None or modstamp > max_modstamp:
-                        max_modstamp = modstamp
-                except (ValueError, AttributeError):
-                    continue
+    def _advance_watermark(self) -> None:
+        """Advance watermark to the max SystemModstamp staged for this run."""
+        max_modstamp, _ = max_staging_source_timestamps(self.run.id, StagingAffiliation)
 
         if max_modstamp:
             watermark = (
@@ -579,11 +600,10 @@ class SalesforceAffiliationLoader:
                 .first()
             )
             if watermark:
-                parsed_modstamp = max_modstamp.astimezone(timezone.utc)
-                watermark.last_successful_modstamp = parsed_modstamp
+                watermark.last_successful_modstamp = max_modstamp
                 watermark.last_run_id = self.run.id
                 self.session.add(watermark)
-                record_salesforce_watermark(parsed_modstamp)
+                record_salesforce_watermark(max_modstamp)
 
     def _persist_counters(self, counters: LoaderCounters) -> None:
         """Persist loader counters to ImportRun metrics."""
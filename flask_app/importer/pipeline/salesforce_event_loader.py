@@ -5,20 +5,22 @@ Salesforce Session (Event) loader with two-phase commit to core tracking tables.
 from __future__ import annotations
 
 import json
-import re
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
 from types import SimpleNamespace
-from typing import Iterable, Mapping
+from typing import Iterable, Iterator, Mapping
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from flask_app.importer.metrics import record_salesforce_rows, record_salesforce_watermark
+from flask_app.importer.pipeline.external_id_cache import ExternalIdMapCache, iter_chunks
 from flask_app.importer.pipeline.load_core import _record_import_skip
+from flask_app.importer.pipeline.slug_registry import SlugRegistry
+from flask_app.importer.pipeline.staging import count_unchanged_staging_rows, max_staging_source_timestamps
 from flask_app.models import ExternalIdMap, db
 from flask_app.models.event.enums import CancellationReason, EventFormat, EventStatus, EventType
 from flask_app.models.event.models import Event, EventOrganization
@@ -35,6 +37,8 @@ from flask_app.models.organization import Organization
 
 ENTITY_TYPE = "salesforce_event"
 DELETE_REASON = "salesforce_is_deleted"
+# Payload metadata keys holding the Salesforce account IDs an event is linked to, in priority order.
+ORGANIZATION_LINK_KEYS = ("district_id", "school_id", "parent_account_id")
 
 
 @dataclass
@@ -59,28 +63,40 @@ class SalesforceEventLoader:
     def __init__(self, run: ImportRun, session: Session | None = None):
         self.run = run
         self.session = session or db.session
+        self.external_ids = ExternalIdMapCache(self.session, entity_type=ENTITY_TYPE)
+        self.slugs = SlugRegistry(self.session, Event, fallback="event")
+        # Per chunk: Salesforce account ID -> organization ID, and event ID -> {organization ID: [link ID, is_primary]}.
+        self._organization_ids: dict[str, int] = {}
+        self._event_links: dict[int, dict[int, list]] = {}
+        self._link_inserts: dict[tuple[int, int], bool] = {}
+        self._link_updates: dict[int, bool] = {}
+        self._link_deletes: set[int] = set()
 
     def execute(self) -> LoaderCounters:
         # Read from clean_events (validated rows) instead of staging
         clean_rows = self._snapshot_clean_rows()
-        counters = LoaderCounters()
+        counters = LoaderCounters(unchanged=count_unchanged_staging_rows(self.run.id, StagingEvent))
 
         with self._transaction():
-            for clean_row in clean_rows:
-                action = self._apply_row(clean_row)
-                if action == "created":
-                    counters.created += 1
-                elif action == "updated":
-                    counters.updated += 1
-                elif action == "deleted":
-                    counters.deleted += 1
-                else:
-                    counters.unchanged += 1
-
-            # Advance watermark using ALL staging rows (not just validated ones)
+            for chunk in iter_chunks(clean_rows):
+                self.external_ids.prefetch(_row_external_id(clean_row) for clean_row in chunk)
+                self._prefetch_organization_links(chunk)
+                for clean_row in chunk:
+                    action = self._apply_row(clean_row)
+                    if action == "created":
+                        counters.created += 1
+                    elif action == "updated":
+                        counters.updated += 1
+                    elif action == "deleted":
+                        counters.deleted += 1
+                    else:
+                        counters.unchanged += 1
+                self._flush_organization_links()
+                self.external_ids.flush()
+
+            # Advance watermark over ALL staging rows (not just validated ones)
             # This ensures we don't re-process records that failed DQ validation
-            all_staging_rows = self._snapshot_staging_rows()
-            self._advance_watermark(all_staging_rows)
+            self._advance_watermark()
             self.run.status = ImportRunStatus.SUCCEEDED
             self.run.finished_at = datetime.now(timezone.utc)
             self._persist_counters(counters)
@@ -89,7 +105,7 @@ class SalesforceEventLoader:
             record_salesforce_rows(action=action, count=count)
         return counters
 
-    def _snapshot_clean_rows(self) -> list[CleanEvent | SimpleNamespace]:
+    def _snapshot_clean_rows(self) -> Iterable[CleanEvent | SimpleNamespace]:
         """Read validated rows from clean_events (only rows that passed DQ validation)."""
         stmt = (
             select(CleanEvent)
@@ -102,48 +118,35 @@ class SalesforceEventLoader:
             return clean_rows
 
         # Fallback for unit tests that invoke the loader without running the clean promotion step.
-        # Only use fallback if there are validated staging rows but no clean rows (clean promotion wasn't run)
-        staging_rows = self._snapshot_staging_rows()
-        validated_staging = [r for r in staging_rows if r.status == StagingRecordStatus.VALIDATED]
-        if not validated_staging:
-            # No validated staging rows, return empty list
-            return []
-
-        fallback_rows: list[SimpleNamespace] = []
-        for row in validated_staging:
+        # Only validated staging rows are used (clean promotion wasn't run)
+        return self._iter_staging_fallback_rows()
+
+    def _iter_staging_fallback_rows(self) -> Iterator[SimpleNamespace]:
+        """Yield clean-row stand-ins for this run's validated staging rows, built as the loader consumes them."""
+        stmt = (
+            select(StagingEvent)
+            .where(StagingEvent.run_id == self.run.id)
+            .where(StagingEvent.status == StagingRecordStatus.VALIDATED)
+            .order_by(StagingEvent.sequence_number.asc())
+        )
+        for row in self.session.scalars(stmt).all():
             payload = dict(row.normalized_json or row.payload_json or {})
             # Use actual title from payload, don't default (clean promotion would have skipped if title was required)
             title = payload.get("title") or payload.get("Name") or ""
-            fallback_rows.append(
-                SimpleNamespace(
-                    payload_json=payload,
-                    staging_row=row,
-                    external_id=payload.get("external_id"),
-                    title=title,
-                    load_action=None,
-                    core_event_id=None,
-                    external_system=row.external_system,
-                    staging_event_id=row.id,
-                )
+            yield SimpleNamespace(
+                payload_json=payload,
+                staging_row=row,
+                checksum=row.checksum,
+                external_id=payload.get("external_id"),
+                title=title,
+                load_action=None,
+                core_event_id=None,
+                external_system=row.external_system,
+                staging_event_id=row.id,
             )
-        return fallback_rows
-
-    def _snapshot_staging_rows(self) -> list[StagingEvent]:
-        """Legacy method - kept for watermark advancement."""
-        stmt = (
-            select(StagingEvent).where(StagingEvent.run_id == self.run.id).order_by(StagingEvent.sequence_number.asc())
-        )
-        return list(self.session.scalars(stmt))
 
     def _apply_row(self, clean_row: CleanEvent) -> str:
-        # Get normalized payload from clean_event payload_json
-        payload = clean_row.payload_json or {}
-        # Try to get metadata from staging row if available, otherwise from payload
-        if clean_row.staging_row and clean_row.staging_row.normalized_json:
-            staging_metadata = clean_row.staging_row.normalized_json.get("metadata", {})
-            if staging_metadata:
-                # Merge staging metadata into payload for watermark advancement
-                payload = {**payload, "metadata": {**payload.get("metadata", {}), **staging_metadata}}
+        payload = _row_payload(clean_row)
         metadata = payload.get("metadata", {})
         external_id = clean_row.external_id or payload.get("external_id")
         if not external_id:
@@ -161,16 +164,7 @@ class SalesforceEventLoader:
         return self._handle_update(map_entry, payload, payload_hash, clean_row)
 
     def _get_external_map(self, external_id: str) -> ExternalIdMap | None:
-        stmt = (
-            select(ExternalIdMap)
-            .where(
-                ExternalIdMap.external_system == "salesforce",
-                ExternalIdMap.external_id == external_id,
-                ExternalIdMap.entity_type == ENTITY_TYPE,
-            )
-            .with_for_update(of=ExternalIdMap)
-        )
-        return self.session.scalars(stmt).first()
+        return self.external_ids.get(external_id)
 
     def _handle_create(
         self, external_id: str, payload: Mapping[str, object], payload_hash: str, clean_row: CleanEvent
@@ -192,8 +186,6 @@ class SalesforceEventLoader:
             return "unchanged"
 
         # Create Event record
-        slug = _generate_unique_slug(title, self.session)
-
         # Parse start_date
         start_date = None
         start_date_str = payload.get("start_date")
@@ -247,7 +239,6 @@ class SalesforceEventLoader:
         event = Event(
             title=title,
             description=_coerce_string(payload.get("description")),
-            slug=slug,
             event_type=_map_event_type(payload.get("event_type")),
             event_status=_map_event_status(payload.get("event_status")),
             event_format=_map_event_format(payload.get("event_format")),
@@ -258,8 +249,7 @@ class SalesforceEventLoader:
             location_address=_coerce_string(payload.get("location_address")),
             capacity=_coerce_int(payload.get("capacity")),
         )
-        self.session.add(event)
-        self.session.flush()
+        self.slugs.save(event, title)
 
         # Handle organization relationships
         self._link_organizations(event, payload)
@@ -282,8 +272,8 @@ class SalesforceEventLoader:
             external_id=external_id,
             metadata_json=metadata_dict,
         )
-        entry.mark_seen(run_id=self.run.id)
-        self.session.add(entry)
+        entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+        self.external_ids.add(entry)
 
         # Update clean_row
         clean_row.load_action = "inserted"
@@ -308,7 +298,7 @@ class SalesforceEventLoader:
         if title != event.title:
             event.title = title
             # Regenerate slug if title changed
-            event.slug = _generate_unique_slug(title, self.session, exclude_id=event.id)
+            self.slugs.save(event, title)
 
         if payload.get("description"):
             event.description = _coerce_string(payload.get("description"))
@@ -386,6 +376,7 @@ class SalesforceEventLoader:
 
         entry.metadata_json = metadata_dict
         entry.last_seen_at = datetime.now(timezone.utc)
+        entry.last_loaded_checksum = clean_row.checksum
 
         # Update clean_row
         clean_row.load_action = "updated" if previous_hash != payload_hash else "no_change"
@@ -414,75 +405,102 @@ class SalesforceEventLoader:
 
         return "deleted"
 
+    def _prefetch_organization_links(self, clean_rows: list[CleanEvent | SimpleNamespace]) -> None:
+        """Load the organizations and existing event links a chunk of rows refers to, one query each."""
+        account_ids: set[str] = set()
+        for clean_row in clean_rows:
+            metadata = _row_payload(clean_row).get("metadata", {})
+            for key in ORGANIZATION_LINK_KEYS:
+                if metadata.get(key):
+                    account_ids.add(str(metadata[key]))
+        self._organization_ids = {}
+        if account_ids:
+            stmt = (
+                select(ExternalIdMap.external_id, Organization.id)
+                .join(Organization, Organization.id == ExternalIdMap.entity_id)
+                .where(
+                    ExternalIdMap.external_system == "salesforce",
+                    ExternalIdMap.entity_type == "salesforce_organization",
+                    ExternalIdMap.is_active.is_(True),
+                    ExternalIdMap.external_id.in_(account_ids),
+                )
+            )
+            for external_id, organization_id in self.session.execute(stmt):
+                self._organization_ids.setdefault(external_id, organization_id)
+
+        event_ids = set()
+        for clean_row in clean_rows:
+            external_id = _row_external_id(clean_row)
+            entry = self._get_external_map(external_id) if external_id else None
+            if entry is not None and entry.entity_id:
+                event_ids.add(entry.entity_id)
+        self._event_links = {}
+        if event_ids:
+            links = EventOrganization.__table__
+            stmt = select(links.c.id, links.c.event_id, links.c.organization_id, links.c.is_primary).where(
+                links.c.event_id.in_(event_ids)
+            )
+            for link_id, event_id, organization_id, is_primary in self.session.execute(stmt):
+                self._event_links.setdefault(event_id, {})[organization_id] = [link_id, is_primary]
+
     def _link_organizations(self, event: Event, payload: Mapping[str, object]) -> None:
-        """Link event to organizations based on metadata fields."""
+        """Link event to organizations based on metadata fields; changes are written at the end of the chunk."""
         metadata = payload.get("metadata", {})
-        district_id = metadata.get("district_id")
-        school_id = metadata.get("school_id")
-        parent_account_id = metadata.get("parent_account_id")
-
-        # Look up organizations by external ID
-        org_ids_to_link = []
-
-        if district_id:
-            org = self._find_organization_by_external_id(str(district_id))
-            if org:
-                org_ids_to_link.append((org.id, True))  # Mark as primary
-
-        if school_id:
-            org = self._find_organization_by_external_id(str(school_id))
-            if org:
-                org_ids_to_link.append((org.id, False))
-
-        if parent_account_id:
-            org = self._find_organization_by_external_id(str(parent_account_id))
-            if org:
-                org_ids_to_link.append((org.id, False))
-
-        # Remove existing organization links for this event
-        existing_links = self.session.query(EventOrganization).filter_by(event_id=event.id).all()
-        for link in existing_links:
-            self.session.delete(link)
-
-        # Add new organization links
-        primary_set = False
-        for org_id, is_primary in org_ids_to_link:
-            # Only set first one as primary if none set yet
-            if is_primary and not primary_set:
-                link = EventOrganization(event_id=event.id, organization_id=org_id, is_primary=True)
-                primary_set = True
-            else:
-                link = EventOrganization(event_id=event.id, organization_id=org_id, is_primary=False)
-            self.session.add(link)
-
-    def _find_organization_by_external_id(self, external_id: str) -> Organization | None:
-        """Find organization by Salesforce external ID."""
-        map_entry = (
-            self.session.query(ExternalIdMap)
-            .filter_by(
-                external_system="salesforce",
-                external_id=external_id,
-                entity_type="salesforce_organization",
-                is_active=True,
-            )
-            .first()
-        )
-        if map_entry and map_entry.entity_id:
-            return self.session.get(Organization, map_entry.entity_id)
-        return None
 
-    def _advance_watermark(self, rows: Iterable[StagingEvent]) -> None:
-        latest_modstamp: str | None = None
-        latest_updated_at: str | None = None
+        # District is the primary organization; school and parent account are secondary links.
+        desired: dict[int, bool] = {}
+        for key in ORGANIZATION_LINK_KEYS:
+            account_id = metadata.get(key)
+            organization_id = self._organization_ids.get(str(account_id)) if account_id else None
+            if organization_id is not None and organization_id not in desired:
+                desired[organization_id] = key == "district_id"
+
+        current = self._event_links.setdefault(event.id, {})
+        for organization_id in list(current):
+            if organization_id not in desired:
+                link_id, _ = current.pop(organization_id)
+                if link_id is None:
+                    self._link_inserts.pop((event.id, organization_id), None)
+                else:
+                    self._link_updates.pop(link_id, None)
+                    self._link_deletes.add(link_id)
+        for organization_id, is_primary in desired.items():
+            link = current.get(organization_id)
+            if link is None:
+                current[organization_id] = [None, is_primary]
+                self._link_inserts[(event.id, organization_id)] = is_primary
+            elif link[1] != is_primary:
+                link[1] = is_primary
+                if link[0] is None:
+                    self._link_inserts[(event.id, organization_id)] = is_primary
+                else:
+                    self._link_updates[link[0]] = is_primary
 
-        for row in rows:
-            metadata = (row.normalized_json or {}).get("metadata", {})
-            modstamp = metadata.get("source_modstamp")
-            updated_at = metadata.get("source_last_modified")
-            if modstamp:
-                latest_modstamp = max(latest_modstamp or modstamp, modstamp)
-            if updated_at:
-                latest_updated_at = max(latest_updated_at or updated_at, updated_at)
+    def _flush_organization_links(self) -> None:
+        """Apply the chunk's link differences with one DELETE, one UPDATE batch, and one INSERT batch."""
+        if self._link_deletes:
+            self.session.execute(
+                delete(EventOrganization.__table__).where(EventOrganization.__table__.c.id.in_(self._link_deletes))
+            )
+        if self._link_updates:
+            self.session.execute(
+                update(EventOrganization),
+                [{"id": link_id, "is_primary": is_primary} for link_id, is_primary in self._link_updates.items()],
+            )
+        if self._link_inserts:
+            self.session.execute(
+                insert(EventOrganization),
+                [
+                    {"event_id": event_id, "organization_id": organization_id, "is_primary": is_primary}
+                    for (event_id, organization_id), is_primary in self._link_inserts.items()
+                ],
+            )
+        self._link_deletes.clear()
+        self._link_updates.clear()
+        self._link_inserts.clear()
+
+    def _advance_watermark(self) -> None:
+        latest_modstamp, latest_updated_at = max_staging_source_timestamps(self.run.id, StagingEvent)
 
         if latest_modstamp:
             watermark = (
@@ -492,18 +510,16 @@ class SalesforceEventLoader:
                 .first()
             )
             if watermark:
-                parsed_modstamp = _safe_parse_datetime(latest_modstamp)
-                watermark.last_successful_modstamp = parsed_modstamp
+                watermark.last_successful_modstamp = latest_modstamp
                 watermark.last_run_id = self.run.id
                 self.session.add(watermark)
-                record_salesforce_watermark(parsed_modstamp)
+                record_salesforce_watermark(latest_modstamp)
 
         target_updated = latest_updated_at or latest_modstamp
         if target_updated:
-            parsed = _safe_parse_datetime(target_updated)
-            self.run.max_source_updated_at = parsed
+            self.run.max_source_updated_at = target_updated
             metrics = deepcopy(self.run.metrics_json) if self.run.metrics_json else {}
-            metrics.setdefault("salesforce", {})["max_source_updated_at"] = parsed.isoformat()
+            metrics.setdefault("salesforce", {})["max_source_updated_at"] = target_updated.isoformat()
             self.run.metrics_json = metrics
 
     def _persist_counters(self, counters: LoaderCounters) -> None:
@@ -525,43 +541,28 @@ class SalesforceEventLoader:
             raise
 
 
+def _row_payload(clean_row: CleanEvent) -> dict:
+    # Get normalized payload from clean_event payload_json
+    payload = clean_row.payload_json or {}
+    # Try to get metadata from staging row if available, otherwise from payload
+    if clean_row.staging_row and clean_row.staging_row.normalized_json:
+        staging_metadata = clean_row.staging_row.normalized_json.get("metadata", {})
+        if staging_metadata:
+            # Merge staging metadata into payload for watermark advancement
+            payload = {**payload, "metadata": {**payload.get("metadata", {}), **staging_metadata}}
+    return payload
+
+
+def _row_external_id(clean_row: CleanEvent) -> str | None:
+    external_id = clean_row.external_id or (clean_row.payload_json or {}).get("external_id")
+    return str(external_id) if external_id else None
+
+
 def _payload_hash(payload: Mapping[str, object]) -> str:
     serialized = json.dumps(payload, sort_keys=True, default=str)
     return sha256(serialized.encode("utf-8")).hexdigest()
 
 
-def _generate_unique_slug(title: str, session: Session, exclude_id: int | None = None) -> str:
-    """Generate a unique slug from event title."""
-    # Convert to lowercase
-    slug = title.lower()
-    # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[_\s]+", "-", slug)
-    # Remove all non-alphanumeric characters except hyphens
-    slug = re.sub(r"[^a-z0-9\-]", "", slug)
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
-    # Remove leading/trailing hyphens
-    slug = slug.strip("-")
-
-    if not slug:
-        slug = "event"
-
-    # Ensure uniqueness
-    base_slug = slug
-    counter = 1
-    while True:
-        query = session.query(Event).filter_by(slug=slug)
-        if exclude_id:
-            query = query.filter(Event.id != exclude_id)
-        existing = query.first()
-        if not existing:
-            break
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
-    return slug
-
-
 def _map_event_type(value: object | None) -> EventType | None:
     """Map normalized event type string to EventType enum."""
     if not value:
@@ -657,14 +658,3 @@ def _coerce_int(value: object | None) -> int | None:
         return int(value)
     except (ValueError, TypeError):
         return None
-
-
-def _safe_parse_datetime(value: str) -> datetime:
-    candidate = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(candidate)
-    except ValueError:
-        return datetime.now(timezone.utc)
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
@@ -9,25 +9,37 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
-from typing import Iterable, Mapping
+from typing import Iterable, Iterator, Mapping
 from copy import deepcopy
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from flask import current_app
 
 from types import SimpleNamespace
 
 from flask_app.importer.metrics import record_salesforce_rows, record_salesforce_watermark
+from flask_app.importer.pipeline.contact_info import ContactInfoReconciler, WantedEmail, WantedPhone
+from flask_app.importer.pipeline.external_id_cache import EXTERNAL_ID_CHUNK_SIZE, ExternalIdMapCache, iter_chunks
 from flask_app.importer.pipeline.load_core import (
     _merge_email_to_volunteer,
     _name_exists_exact,
     _name_exists_fuzzy,
     _record_import_skip,
 )
+from flask_app.importer.pipeline.staging import count_unchanged_staging_rows, max_staging_source_timestamps
 from flask_app.models import ExternalIdMap, db
-from flask_app.models.importer.schema import CleanVolunteer, ImportRun, ImportRunStatus, ImportSkip, ImportSkipType, ImporterWatermark, StagingVolunteer
-from flask_app.models import Volunteer, ContactEmail, ContactPhone, EmailType, PhoneType
+from flask_app.models.importer.schema import (
+    CleanVolunteer,
+    ImportRun,
+    ImportRunStatus,
+    ImportSkip,
+    ImportSkipType,
+    ImporterWatermark,
+    StagingRecordStatus,
+    StagingVolunteer,
+)
+from flask_app.models import Volunteer, ContactEmail, EmailType, PhoneType
 from flask_app.models.contact.info import ContactAddress
 from flask_app.models.contact.enums import AddressType
 
@@ -57,28 +69,34 @@ class SalesforceContactLoader:
     def __init__(self, run: ImportRun, session: Session | None = None):
         self.run = run
         self.session = session or db.session
+        self.external_ids = ExternalIdMapCache(self.session, entity_type=ENTITY_TYPE)
+        self._volunteer_ids: set[int] = set()
+        self.contact_info = ContactInfoReconciler(self.session)
 
     def execute(self) -> LoaderCounters:
         # Read from clean_volunteers (validated rows) instead of staging
         clean_rows = self._snapshot_clean_rows()
-        counters = LoaderCounters()
+        counters = LoaderCounters(unchanged=count_unchanged_staging_rows(self.run.id, StagingVolunteer))
 
         with self._transaction():
-            for clean_row in clean_rows:
-                action = self._apply_row(clean_row)
-                if action == "created":
-                    counters.created += 1
-                elif action == "updated":
-                    counters.updated += 1
-                elif action == "deleted":
-                    counters.deleted += 1
-                else:
-                    counters.unchanged += 1
+            for chunk in iter_chunks(clean_rows):
+                self._prefetch_chunk(chunk)
+                for clean_row in chunk:
+                    action = self._apply_row(clean_row)
+                    if action == "created":
+                        counters.created += 1
+                    elif action == "updated":
+                        counters.updated += 1
+                    elif action == "deleted":
+                        counters.deleted += 1
+                    else:
+                        counters.unchanged += 1
+                self.contact_info.flush()
+                self.external_ids.flush()
 
-            # Advance watermark using ALL staging rows (not just validated ones)
+            # Advance watermark over ALL staging rows (not just validated ones)
             # This ensures we don't re-process records that failed DQ validation
-            all_staging_rows = self._snapshot_staging_rows()
-            self._advance_watermark(all_staging_rows)
+            self._advance_watermark()
             self.run.status = ImportRunStatus.SUCCEEDED
             self.run.finished_at = datetime.now(timezone.utc)
             self._persist_counters(counters)
@@ -87,7 +105,7 @@ class SalesforceContactLoader:
             record_salesforce_rows(action=action, count=count)
         return counters
 
-    def _snapshot_clean_rows(self) -> list[CleanVolunteer | SimpleNamespace]:
+    def _snapshot_clean_rows(self) -> Iterable[CleanVolunteer | SimpleNamespace]:
         """Read validated rows from clean_volunteers (only rows that passed DQ validation)."""
         stmt = (
             select(CleanVolunteer)
@@ -100,37 +118,39 @@ class SalesforceContactLoader:
             return clean_rows
 
         # Fallback for unit tests that invoke the loader without running the clean promotion step.
-        staging_rows = self._snapshot_staging_rows()
-        fallback_rows: list[SimpleNamespace] = []
-        for row in staging_rows:
-            payload = dict(row.normalized_json or row.payload_json or {})
-            first_name = payload.get("first_name")
-            last_name = payload.get("last_name") or first_name or payload.get("external_id") or "Salesforce"
-            fallback_rows.append(
-                SimpleNamespace(
-                    payload_json=payload,
-                    staging_row=row,
-                    external_id=payload.get("external_id"),
-                    first_name=first_name or "Salesforce",
-                    last_name=last_name,
-                    email=payload.get("email"),
-                    phone_e164=payload.get("phone"),
-                    load_action=None,
-                    core_contact_id=None,
-                    core_volunteer_id=None,
-                    external_system=row.external_system,
-                )
-            )
-        return fallback_rows
+        return self._iter_staging_fallback_rows()
+
+    def _iter_staging_fallback_rows(self) -> Iterator[SimpleNamespace]:
+        """
+        Yield clean-row stand-ins for this run's staging rows, built as the loader consumes them.
 
-    def _snapshot_staging_rows(self) -> list[StagingVolunteer]:
-        """Legacy method - kept for watermark advancement."""
+        Staging rows are streamed a chunk at a time rather than loaded for the whole run.
+        """
         stmt = (
             select(StagingVolunteer)
             .where(StagingVolunteer.run_id == self.run.id)
+            .where(StagingVolunteer.status != StagingRecordStatus.UNCHANGED)
             .order_by(StagingVolunteer.sequence_number.asc())
+            .execution_options(yield_per=EXTERNAL_ID_CHUNK_SIZE)
         )
-        return list(self.session.scalars(stmt))
+        for row in self.session.scalars(stmt):
+            payload = dict(row.normalized_json or row.payload_json or {})
+            first_name = payload.get("first_name")
+            last_name = payload.get("last_name") or first_name or payload.get("external_id") or "Salesforce"
+            yield SimpleNamespace(
+                payload_json=payload,
+                staging_row=row,
+                checksum=row.checksum,
+                external_id=payload.get("external_id"),
+                first_name=first_name or "Salesforce",
+                last_name=last_name,
+                email=payload.get("email"),
+                phone_e164=payload.get("phone"),
+                load_action=None,
+                core_contact_id=None,
+                core_volunteer_id=None,
+                external_system=row.external_system,
+            )
 
     def _apply_row(self, clean_row: CleanVolunteer) -> str:
         # Get normalized payload from clean_volunteer payload_json
@@ -158,17 +178,25 @@ class SalesforceContactLoader:
 
         return self._handle_update(map_entry, payload, payload_hash, clean_row)
 
-    def _get_external_map(self, external_id: str) -> ExternalIdMap | None:
-        stmt = (
-            select(ExternalIdMap)
-            .where(
-                ExternalIdMap.external_system == "salesforce",
-                ExternalIdMap.external_id == external_id,
-                ExternalIdMap.entity_type == ENTITY_TYPE,
-            )
-            .with_for_update(of=ExternalIdMap)
+    def _prefetch_chunk(self, clean_rows: list[CleanVolunteer | SimpleNamespace]) -> None:
+        """Load the chunk's map entries and which of their volunteers still exist."""
+        external_ids = [external_id for external_id in map(_row_external_id, clean_rows) if external_id]
+        self.external_ids.prefetch(external_ids)
+        entity_ids = {
+            entry.entity_id
+            for entry in map(self.external_ids.get, external_ids)
+            if entry is not None and entry.entity_id
+        }
+        self._volunteer_ids = (
+            set(self.session.scalars(select(Volunteer.id).where(Volunteer.id.in_(entity_ids)))) if entity_ids else set()
         )
-        return self.session.scalars(stmt).first()
+
+    def _queue_contact_info(self, volunteer: Volunteer, payload: Mapping[str, object]) -> None:
+        current_app.logger.debug(f"Processing emails for volunteer {volunteer.id}: {payload.get('email', {})}")
+        self.contact_info.queue(volunteer, emails=_wanted_emails(payload), phones=_wanted_phones(payload))
+
+    def _get_external_map(self, external_id: str) -> ExternalIdMap | None:
+        return self.external_ids.get(external_id)
 
     def _handle_create(self, external_id: str, payload: Mapping[str, object], payload_hash: str, clean_row: CleanVolunteer) -> str:
         # Extract email from clean_row (handle dict structures)
@@ -184,7 +212,9 @@ class SalesforceContactLoader:
             name_dedupe_or_logic = config.get("IMPORTER_NAME_DEDUPE_OR_LOGIC", True)
         
         # Check for duplicate email
-        email_exists = email_value and _email_exists(email_value)
+        email_exists = email_value and (
+            self.contact_info.has_pending_email(email_value) or _email_exists(email_value)
+        )
         
         # Check for name duplicate if enabled
         name_match_volunteer = None
@@ -240,18 +270,12 @@ class SalesforceContactLoader:
             elif skip_reason == "name":
                 # Merge email if provided and different
                 if email_value and name_match_volunteer:
+                    if self.contact_info.has_pending(name_match_volunteer.id):
+                        self.contact_info.flush()
                     _merge_email_to_volunteer(name_match_volunteer.id, email_value, self.run.id)
                 # Update ExternalIdMap if external_id exists
                 if external_id and name_match_volunteer:
-                    existing_map = (
-                        self.session.query(ExternalIdMap)
-                        .filter(
-                            ExternalIdMap.entity_type == "salesforce_contact",
-                            ExternalIdMap.external_system == "salesforce",
-                            ExternalIdMap.external_id == external_id,
-                        )
-                        .first()
-                    )
+                    existing_map = self._get_external_map(external_id)
                     if not existing_map:
                         entry = ExternalIdMap(
                             entity_type="salesforce_contact",
@@ -260,8 +284,8 @@ class SalesforceContactLoader:
                             external_id=external_id,
                             metadata_json={"payload_hash": payload_hash, "last_payload": payload},
                         )
-                        entry.mark_seen(run_id=self.run.id)
-                        self.session.add(entry)
+                        entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+                        self.external_ids.add(entry)
                 clean_row.load_action = "skipped_duplicate"
                 clean_row.core_contact_id = name_match_volunteer.id
                 clean_row.core_volunteer_id = name_match_volunteer.id
@@ -302,11 +326,8 @@ class SalesforceContactLoader:
         self.session.add(volunteer)
         self.session.flush()
         
-        # Apply all emails from payload
-        _apply_emails_to_volunteer(volunteer, payload, self.session)
-        
-        # Apply all phones from payload
-        _apply_phones_to_volunteer(volunteer, payload, self.session)
+        # Queue all emails and phones from payload; they are written at the end of the chunk
+        self._queue_contact_info(volunteer, payload)
         
         # Apply contact preferences from payload
         contact_prefs = payload.get("contact_preferences", {})
@@ -619,8 +640,8 @@ class SalesforceContactLoader:
             external_id=external_id,
             metadata_json=metadata,
         )
-        entry.mark_seen(run_id=self.run.id)
-        self.session.add(entry)
+        entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+        self.external_ids.add(entry)
         
         # Update clean_row
         clean_row.load_action = "inserted"
@@ -632,9 +653,24 @@ class SalesforceContactLoader:
     def _handle_update(self, entry: ExternalIdMap, payload: Mapping[str, object], payload_hash: str, clean_row: CleanVolunteer) -> str:
         current = entry.metadata_json or {}
         previous_hash = current.get("payload_hash")
-        
+
+        # Unchanged payload: record the sighting without loading the volunteer or its contact info.
+        # The map entry is written with the rest of the chunk by ExternalIdMapCache.flush().
+        if previous_hash == payload_hash and entry.is_active and entry.entity_id in self._volunteer_ids:
+            entry.last_seen_at = datetime.now(timezone.utc)
+            entry.last_loaded_checksum = clean_row.checksum
+            clean_row.load_action = "no_change"
+            clean_row.core_contact_id = entry.entity_id
+            clean_row.core_volunteer_id = entry.entity_id
+            return "unchanged"
+
         # Get the volunteer record
-        volunteer = self.session.get(Volunteer, entry.entity_id)
+        volunteer = self.session.get(
+            Volunteer,
+            entry.entity_id,
+            # Emails and phones are loaded per chunk by ContactInfoReconciler.
+            options=[selectinload(Volunteer.addresses)],
+        )
         if volunteer is None:
             # ExternalIdMap exists but volunteer doesn't - treat as create
             return self._handle_create(clean_row.external_id or "", payload, payload_hash, clean_row)
@@ -650,11 +686,8 @@ class SalesforceContactLoader:
             volunteer.type = _coerce_string(payload.get("type"))
         volunteer.source = "salesforce"
         
-        # Apply all emails from payload (updates existing, adds new)
-        _apply_emails_to_volunteer(volunteer, payload, self.session)
-        
-        # Apply all phones from payload (updates existing, adds new)
-        _apply_phones_to_volunteer(volunteer, payload, self.session)
+        # Queue all emails and phones from payload (updates existing, adds new at the end of the chunk)
+        self._queue_contact_info(volunteer, payload)
         
         # Apply contact preferences from payload
         contact_prefs = payload.get("contact_preferences", {})
@@ -977,6 +1010,7 @@ class SalesforceContactLoader:
         
         entry.metadata_json = metadata
         entry.last_seen_at = datetime.now(timezone.utc)
+        entry.last_loaded_checksum = clean_row.checksum
         
         # Update clean_row
         clean_row.load_action = "updated" if previous_hash != payload_hash else "no_change"
@@ -1008,18 +1042,8 @@ class SalesforceContactLoader:
         
         return "deleted"
 
-    def _advance_watermark(self, rows: Iterable[StagingVolunteer]) -> None:
-        latest_modstamp: str | None = None
-        latest_updated_at: str | None = None
-
-        for row in rows:
-            metadata = (row.normalized_json or {}).get("metadata", {})
-            modstamp = metadata.get("source_modstamp")
-            updated_at = metadata.get("source_last_modified")
-            if modstamp:
-                latest_modstamp = max(latest_modstamp or modstamp, modstamp)
-            if updated_at:
-                latest_updated_at = max(latest_updated_at or updated_at, updated_at)
+    def _advance_watermark(self) -> None:
+        latest_modstamp, latest_updated_at = max_staging_source_timestamps(self.run.id, StagingVolunteer)
 
         if latest_modstamp:
             watermark = (
@@ -1029,18 +1053,16 @@ class SalesforceContactLoader:
                 .first()
             )
             if watermark:
-                parsed_modstamp = _safe_parse_datetime(latest_modstamp)
-                watermark.last_successful_modstamp = parsed_modstamp
+                watermark.last_successful_modstamp = latest_modstamp
                 watermark.last_run_id = self.run.id
                 self.session.add(watermark)
-                record_salesforce_watermark(parsed_modstamp)
+                record_salesforce_watermark(latest_modstamp)
 
         target_updated = latest_updated_at or latest_modstamp
         if target_updated:
-            parsed = _safe_parse_datetime(target_updated)
-            self.run.max_source_updated_at = parsed
+            self.run.max_source_updated_at = target_updated
             metrics = deepcopy(self.run.metrics_json) if self.run.metrics_json else {}
-            metrics.setdefault("salesforce", {})["max_source_updated_at"] = parsed.isoformat()
+            metrics.setdefault("salesforce", {})["max_source_updated_at"] = target_updated.isoformat()
             self.run.metrics_json = metrics
 
     def _persist_counters(self, counters: LoaderCounters) -> None:
@@ -1062,6 +1084,11 @@ class SalesforceContactLoader:
             raise
 
 
+def _row_external_id(clean_row: CleanVolunteer) -> str | None:
+    external_id = clean_row.external_id or (clean_row.payload_json or {}).get("external_id")
+    return str(external_id) if external_id else None
+
+
 def _payload_hash(payload: Mapping[str, object]) -> str:
     serialized = json.dumps(payload, sort_keys=True, default=str)
     return sha256(serialized.encode("utf-8")).hexdigest()
@@ -1108,8 +1135,8 @@ def _validate_email(email: str | None) -> str | None:
         return None
 
 
-def _apply_emails_to_volunteer(volunteer: Volunteer, payload: Mapping[str, object], session: Session) -> None:
-    """Apply all email addresses from payload to volunteer, creating ContactEmail records for each."""
+def _wanted_emails(payload: Mapping[str, object]) -> list[WantedEmail]:
+    """Return the email addresses in payload in application order, exactly one of them primary."""
     email_data = payload.get("email", {})
     if not isinstance(email_data, dict):
         # Fallback: if email is a string, treat it as primary
@@ -1117,10 +1144,7 @@ def _apply_emails_to_volunteer(volunteer: Volunteer, payload: Mapping[str, objec
         if email_str:
             email_data = {"primary": email_str}
         else:
-            return
-    
-    # Log what email data we're processing
-    current_app.logger.debug(f"Processing emails for volunteer {volunteer.id}: {email_data}")
+            return []
     
     # Get preferred email type to determine which should be primary
     # preferred_type is stored at email.preferred_type in the payload
@@ -1178,48 +1202,7 @@ def _apply_emails_to_volunteer(volunteer: Volunteer, payload: Mapping[str, objec
             # Make the first email primary
             emails_to_add[0] = (emails_to_add[0][0], emails_to_add[0][1], True)
     
-    # Add emails to volunteer
-    for email_address, email_type, is_primary in emails_to_add:
-        # Check if email already exists for this volunteer (query database, not just in-memory)
-        existing_email = session.query(ContactEmail).filter_by(
-            contact_id=volunteer.id,
-            email=email_address
-        ).first()
-        
-        if existing_email:
-            # Update existing email if needed
-            if existing_email.email_type != email_type:
-                existing_email.email_type = email_type
-            if is_primary and not existing_email.is_primary:
-                # Mark this as primary and unmark others
-                # Update all other emails for this volunteer to non-primary
-                session.query(ContactEmail).filter_by(
-                    contact_id=volunteer.id,
-                    is_primary=True
-                ).update({"is_primary": False})
-                existing_email.is_primary = True
-            continue
-        
-        # If this is primary, ensure no other emails are primary
-        if is_primary:
-            session.query(ContactEmail).filter_by(
-                contact_id=volunteer.id,
-                is_primary=True
-            ).update({"is_primary": False})
-        
-        try:
-            email = ContactEmail(
-                contact_id=volunteer.id,
-                email=email_address,
-                email_type=email_type,
-                is_primary=is_primary,
-                is_verified=False,
-            )
-            volunteer.emails.append(email)
-            session.add(email)
-            current_app.logger.info(f"Added email {email_address} ({email_type.value}) to volunteer {volunteer.id}, primary={is_primary}")
-        except ValueError as e:
-            current_app.logger.warning(f"Model validator rejected email for volunteer {volunteer.id}: {email_address} - {e}")
+    return [WantedEmail(*wanted) for wanted in emails_to_add]
 
 
 def _extract_phone(value: object | None) -> str | None:
@@ -1244,8 +1227,8 @@ def _extract_phone(value: object | None) -> str | None:
     return _coerce_string(value)
 
 
-def _apply_phones_to_volunteer(volunteer: Volunteer, payload: Mapping[str, object], session: Session) -> None:
-    """Apply all phone numbers from payload to volunteer, creating ContactPhone records for each."""
+def _wanted_phones(payload: Mapping[str, object]) -> list[WantedPhone]:
+    """Return the phone numbers in payload in application order, exactly one of them primary."""
     phone_data = payload.get("phone", {})
     if not isinstance(phone_data, dict):
         # Fallback: if phone is a string, treat it as primary
@@ -1253,7 +1236,7 @@ def _apply_phones_to_volunteer(volunteer: Volunteer, payload: Mapping[str, objec
         if phone_str:
             phone_data = {"primary": phone_str}
         else:
-            return
+            return []
     
     # Get preferred phone type to determine which should be primary
     preferred_type = _coerce_string(phone_data.get("preferred_type"))
@@ -1313,47 +1296,7 @@ def _apply_phones_to_volunteer(volunteer: Volunteer, payload: Mapping[str, objec
             # Make the first phone primary
             phones_to_add[0] = (phones_to_add[0][0], phones_to_add[0][1], True)
     
-    # Add phones to volunteer
-    for phone_number, phone_type, is_primary in phones_to_add:
-        # Check if phone already exists for this volunteer (query database, not just in-memory)
-        existing_phone = session.query(ContactPhone).filter_by(
-            contact_id=volunteer.id,
-            phone_number=phone_number
-        ).first()
-        
-        if existing_phone:
-            # Update existing phone if needed
-            if existing_phone.phone_type != phone_type:
-                existing_phone.phone_type = phone_type
-            if is_primary and not existing_phone.is_primary:
-                # Mark this as primary and unmark others
-                # Update all other phones for this volunteer to non-primary
-                session.query(ContactPhone).filter_by(
-                    contact_id=volunteer.id,
-                    is_primary=True
-                ).update({"is_primary": False})
-                existing_phone.is_primary = True
-            continue
-        
-        # If this is primary, ensure no other phones are primary
-        if is_primary:
-            session.query(ContactPhone).filter_by(
-                contact_id=volunteer.id,
-                is_primary=True
-            ).update({"is_primary": False})
-        
-        try:
-            phone = ContactPhone(
-                contact_id=volunteer.id,
-                phone_number=phone_number,
-                phone_type=phone_type,
-                is_primary=is_primary,
-                can_text=(phone_type == PhoneType.MOBILE),  # Default can_text for mobile
-            )
-            volunteer.phones.append(phone)
-            session.add(phone)
-        except ValueError as e:
-            current_app.logger.warning(f"Model validator rejected phone for volunteer {volunteer.id}: {phone_number} - {e}")
+    return [WantedPhone(*wanted) for wanted in phones_to_add]
 
 
 def _email_exists(email: str | None) -> bool:
@@ -1375,15 +1318,3 @@ def _coerce_string(value: object | None) -> str | None:
         return None
     token = str(value).strip()
     return token or None
-
-
-def _safe_parse_datetime(value: str) -> datetime:
-    candidate = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(candidate)
-    except ValueError:
-        return datetime.now(timezone.utc)
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
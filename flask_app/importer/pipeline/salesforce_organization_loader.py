@@ -5,12 +5,11 @@ Salesforce Account (Organization) loader with two-phase commit to core tracking
 from __future__ import annotations
 
 import json
-import re
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
-from typing import Iterable, Mapping
+from typing import Iterable, Iterator, Mapping
 from copy import deepcopy
 
 from sqlalchemy import select, func
@@ -20,7 +19,10 @@ from flask import current_app
 from types import SimpleNamespace
 
 from flask_app.importer.metrics import record_salesforce_rows, record_salesforce_watermark
+from flask_app.importer.pipeline.external_id_cache import ExternalIdMapCache, iter_chunks
 from flask_app.importer.pipeline.load_core import _record_import_skip
+from flask_app.importer.pipeline.slug_registry import SlugRegistry
+from flask_app.importer.pipeline.staging import count_unchanged_staging_rows, max_staging_source_timestamps
 from flask_app.models import ExternalIdMap, db
 from flask_app.models.importer.schema import (
     CleanOrganization,
@@ -61,28 +63,32 @@ class SalesforceOrganizationLoader:
     def __init__(self, run: ImportRun, session: Session | None = None):
         self.run = run
         self.session = session or db.session
+        self.external_ids = ExternalIdMapCache(self.session, entity_type=ENTITY_TYPE)
+        self.slugs = SlugRegistry(self.session, Organization, fallback="organization")
 
     def execute(self) -> LoaderCounters:
         # Read from clean_organizations (validated rows) instead of staging
         clean_rows = self._snapshot_clean_rows()
-        counters = LoaderCounters()
+        counters = LoaderCounters(unchanged=count_unchanged_staging_rows(self.run.id, StagingOrganization))
 
         with self._transaction():
-            for clean_row in clean_rows:
-                action = self._apply_row(clean_row)
-                if action == "created":
-                    counters.created += 1
-                elif action == "updated":
-                    counters.updated += 1
-                elif action == "deleted":
-                    counters.deleted += 1
-                else:
-                    counters.unchanged += 1
-
-            # Advance watermark using ALL staging rows (not just validated ones)
+            for chunk in iter_chunks(clean_rows):
+                self.external_ids.prefetch(_row_external_id(clean_row) for clean_row in chunk)
+                for clean_row in chunk:
+                    action = self._apply_row(clean_row)
+                    if action == "created":
+                        counters.created += 1
+                    elif action == "updated":
+                        counters.updated += 1
+                    elif action == "deleted":
+                        counters.deleted += 1
+                    else:
+                        counters.unchanged += 1
+                self.external_ids.flush()
+
+            # Advance watermark over ALL staging rows (not just validated ones)
             # This ensures we don't re-process records that failed DQ validation
-            all_staging_rows = self._snapshot_staging_rows()
-            self._advance_watermark(all_staging_rows)
+            self._advance_watermark()
             self.run.status = ImportRunStatus.SUCCEEDED
             self.run.finished_at = datetime.now(timezone.utc)
             self._persist_counters(counters)
@@ -91,7 +97,7 @@ class SalesforceOrganizationLoader:
             record_salesforce_rows(action=action, count=count)
         return counters
 
-    def _snapshot_clean_rows(self) -> list[CleanOrganization | SimpleNamespace]:
+    def _snapshot_clean_rows(self) -> Iterable[CleanOrganization | SimpleNamespace]:
         """Read validated rows from clean_organizations (only rows that passed DQ validation)."""
         stmt = (
             select(CleanOrganization)
@@ -104,40 +110,32 @@ class SalesforceOrganizationLoader:
             return clean_rows
 
         # Fallback for unit tests that invoke the loader without running the clean promotion step.
-        # Only use fallback if there are validated staging rows but no clean rows (clean promotion wasn't run)
-        staging_rows = self._snapshot_staging_rows()
-        validated_staging = [r for r in staging_rows if r.status == StagingRecordStatus.VALIDATED]
-        if not validated_staging:
-            # No validated staging rows, return empty list
-            return []
-        
-        fallback_rows: list[SimpleNamespace] = []
-        for row in validated_staging:
-            payload = dict(row.normalized_json or row.payload_json or {})
-            # Use actual name from payload, don't default (clean promotion would have skipped if name was required)
-            name = payload.get("name") or payload.get("Name") or ""
-            fallback_rows.append(
-                SimpleNamespace(
-                    payload_json=payload,
-                    staging_row=row,
-                    external_id=payload.get("external_id"),
-                    name=name,
-                    load_action=None,
-                    core_organization_id=None,
-                    external_system=row.external_system,
-                    staging_organization_id=row.id,
-                )
-            )
-        return fallback_rows
+        # Only validated staging rows are used (clean promotion wasn't run)
+        return self._iter_staging_fallback_rows()
 
-    def _snapshot_staging_rows(self) -> list[StagingOrganization]:
-        """Legacy method - kept for watermark advancement."""
+    def _iter_staging_fallback_rows(self) -> Iterator[SimpleNamespace]:
+        """Yield clean-row stand-ins for this run's validated staging rows, built as the loader consumes them."""
         stmt = (
             select(StagingOrganization)
             .where(StagingOrganization.run_id == self.run.id)
+            .where(StagingOrganization.status == StagingRecordStatus.VALIDATED)
             .order_by(StagingOrganization.sequence_number.asc())
         )
-        return list(self.session.scalars(stmt))
+        for row in self.session.scalars(stmt).all():
+            payload = dict(row.normalized_json or row.payload_json or {})
+            # Use actual name from payload, don't default (clean promotion would have skipped if name was required)
+            name = payload.get("name") or payload.get("Name") or ""
+            yield SimpleNamespace(
+                payload_json=payload,
+                staging_row=row,
+                checksum=row.checksum,
+                external_id=payload.get("external_id"),
+                name=name,
+                load_action=None,
+                core_organization_id=None,
+                external_system=row.external_system,
+                staging_organization_id=row.id,
+            )
 
     def _apply_row(self, clean_row: CleanOrganization) -> str:
         # Get normalized payload from clean_organization payload_json
@@ -165,16 +163,7 @@ class SalesforceOrganizationLoader:
         return self._handle_update(map_entry, payload, payload_hash, clean_row)
 
     def _get_external_map(self, external_id: str) -> ExternalIdMap | None:
-        stmt = (
-            select(ExternalIdMap)
-            .where(
-                ExternalIdMap.external_system == "salesforce",
-                ExternalIdMap.external_id == external_id,
-                ExternalIdMap.entity_type == ENTITY_TYPE,
-            )
-            .with_for_update(of=ExternalIdMap)
-        )
-        return self.session.scalars(stmt).first()
+        return self.external_ids.get(external_id)
 
     def _handle_create(self, external_id: str, payload: Mapping[str, object], payload_hash: str, clean_row: CleanOrganization) -> str:
         name = clean_row.name or payload.get("name") or ""
@@ -207,15 +196,7 @@ class SalesforceOrganizationLoader:
         
         if name_match_org:
             # Merge: link external_id to existing organization and add note
-            existing_map = (
-                self.session.query(ExternalIdMap)
-                .filter(
-                    ExternalIdMap.entity_type == ENTITY_TYPE,
-                    ExternalIdMap.external_system == "salesforce",
-                    ExternalIdMap.external_id == external_id,
-                )
-                .first()
-            )
+            existing_map = self._get_external_map(external_id)
             if not existing_map:
                 entry = ExternalIdMap(
                     entity_type=ENTITY_TYPE,
@@ -224,8 +205,8 @@ class SalesforceOrganizationLoader:
                     external_id=external_id,
                     metadata_json={"payload_hash": payload_hash, "last_payload": payload},
                 )
-                entry.mark_seen(run_id=self.run.id)
-                self.session.add(entry)
+                entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+                self.external_ids.add(entry)
             
             # Add note about Salesforce import
             note_text = f"Linked from Salesforce import (run {self.run.id}, external_id: {external_id})"
@@ -270,16 +251,13 @@ class SalesforceOrganizationLoader:
             return "unchanged"
         
         # Create Organization record
-        slug = _generate_unique_slug(name, self.session)
         organization = Organization(
             name=name,
             description=_coerce_string(payload.get("description")),
-            slug=slug,
             is_active=True,
             organization_type=_map_organization_type(payload.get("organization_type")),
         )
-        self.session.add(organization)
-        self.session.flush()
+        self.slugs.save(organization, name)
         
         # Create ExternalIdMap entry
         metadata_dict = {
@@ -301,8 +279,8 @@ class SalesforceOrganizationLoader:
             external_id=external_id,
             metadata_json=metadata_dict,
         )
-        entry.mark_seen(run_id=self.run.id)
-        self.session.add(entry)
+        entry.mark_seen(run_id=self.run.id, checksum=clean_row.checksum)
+        self.external_ids.add(entry)
         
         # Update clean_row
         clean_row.load_action = "inserted"
@@ -325,7 +303,7 @@ class SalesforceOrganizationLoader:
         if name != organization.name:
             organization.name = name
             # Regenerate slug if name changed
-            organization.slug = _generate_unique_slug(name, self.session, exclude_id=organization.id)
+            self.slugs.save(organization, name)
         
         if payload.get("description"):
             organization.description = _coerce_string(payload.get("description"))
@@ -350,6 +328,7 @@ class SalesforceOrganizationLoader:
         
         entry.metadata_json = metadata_dict
         entry.last_seen_at = datetime.now(timezone.utc)
+        entry.last_loaded_checksum = clean_row.checksum
         
         # Update clean_row
         clean_row.load_action = "updated" if previous_hash != payload_hash else "no_change"
@@ -378,18 +357,8 @@ class SalesforceOrganizationLoader:
         
         return "deleted"
 
-    def _advance_watermark(self, rows: Iterable[StagingOrganization]) -> None:
-        latest_modstamp: str | None = None
-        latest_updated_at: str | None = None
-
-        for row in rows:
-            metadata = (row.normalized_json or {}).get("metadata", {})
-            modstamp = metadata.get("source_modstamp")
-            updated_at = metadata.get("source_last_modified")
-            if modstamp:
-                latest_modstamp = max(latest_modstamp or modstamp, modstamp)
-            if updated_at:
-                latest_updated_at = max(latest_updated_at or updated_at, updated_at)
+    def _advance_watermark(self) -> None:
+        latest_modstamp, latest_updated_at = max_staging_source_timestamps(self.run.id, StagingOrganization)
 
         if latest_modstamp:
             watermark = (
@@ -399,18 +368,16 @@ class SalesforceOrganizationLoader:
                 .first()
             )
             if watermark:
-                parsed_modstamp = _safe_parse_datetime(latest_modstamp)
-                watermark.last_successful_modstamp = parsed_modstamp
+                watermark.last_successful_modstamp = latest_modstamp
                 watermark.last_run_id = self.run.id
                 self.session.add(watermark)
-                record_salesforce_watermark(parsed_modstamp)
+                record_salesforce_watermark(latest_modstamp)
 
         target_updated = latest_updated_at or latest_modstamp
         if target_updated:
-            parsed = _safe_parse_datetime(target_updated)
-            self.run.max_source_updated_at = parsed
+            self.run.max_source_updated_at = target_updated
             metrics = deepcopy(self.run.metrics_json) if self.run.metrics_json else {}
-            metrics.setdefault("salesforce", {})["max_source_updated_at"] = parsed.isoformat()
+            metrics.setdefault("salesforce", {})["max_source_updated_at"] = target_updated.isoformat()
             self.run.metrics_json = metrics
 
     def _persist_counters(self, counters: LoaderCounters) -> None:
@@ -432,6 +399,11 @@ class SalesforceOrganizationLoader:
             raise
 
 
+def _row_external_id(clean_row: CleanOrganization) -> str | None:
+    external_id = clean_row.external_id or (clean_row.payload_json or {}).get("external_id")
+    return str(external_id) if external_id else None
+
+
 def _payload_hash(payload: Mapping[str, object]) -> str:
     serialized = json.dumps(payload, sort_keys=True, default=str)
     return sha256(serialized.encode("utf-8")).hexdigest()
@@ -448,38 +420,6 @@ def _name_exists_exact_org(name: str) -> Organization | None:
     )
 
 
-def _generate_unique_slug(name: str, session: Session, exclude_id: int | None = None) -> str:
-    """Generate a unique slug from organization name."""
-    # Convert to lowercase
-    slug = name.lower()
-    # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[_\s]+", "-", slug)
-    # Remove all non-alphanumeric characters except hyphens
-    slug = re.sub(r"[^a-z0-9\-]", "", slug)
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
-    # Remove leading/trailing hyphens
-    slug = slug.strip("-")
-    
-    if not slug:
-        slug = "organization"
-    
-    # Ensure uniqueness
-    base_slug = slug
-    counter = 1
-    while True:
-        query = session.query(Organization).filter_by(slug=slug)
-        if exclude_id:
-            query = query.filter(Organization.id != exclude_id)
-        existing = query.first()
-        if not existing:
-            break
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-    
-    return slug
-
-
 def _map_organization_type(value: object | None) -> OrganizationType | None:
     """Map normalized organization type string to OrganizationType enum."""
     if not value:
@@ -506,15 +446,3 @@ def _coerce_string(value: object | None) -> str | None:
         return None
     token = str(value).strip()
     return token or None
-
-
-def _safe_parse_datetime(value: str) -> datetime:
-    candidate = value.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(candidate)
-    except ValueError:
-        return datetime.now(timezone.utc)
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
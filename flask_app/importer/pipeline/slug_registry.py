@@ -0,0 +1,119 @@
+"""
+Run-scoped slug allocation for the Salesforce event and organization loaders.
+
+Finding a free slug by probing ``slug``, ``slug-1``, ``slug-2``, ... costs one
+query per probe, and Salesforce titles repeat heavily ("Career Day", "Mock
+Interviews"), so creating the n-th event with a popular title took n queries.
+``SlugRegistry`` loads every existing slug for a base in one query the first
+time the base is seen, then hands out the lowest free suffix from memory.
+
+Allocation is only as fresh as that snapshot, so ``save`` flushes each new or
+renamed row in a savepoint and, if the unique constraint still fires (for
+example, a concurrent run took the slug), reloads the base and tries again.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+SLUG_CONFLICT_RETRIES = 3
+
+
+def slugify(text: str, fallback: str) -> str:
+    """Lowercase ``text`` and reduce it to hyphen-separated ``[a-z0-9]`` words."""
+
+    slug = text.lower()
+    slug = re.sub(r"[_\s]+", "-", slug)
+    slug = re.sub(r"[^a-z0-9\-]", "", slug)
+    slug = re.sub(r"-+", "-", slug)
+    slug = slug.strip("-")
+    return slug or fallback
+
+
+class SlugRegistry:
+    """Allocate unique ``slug`` values for one model, loading each base's existing slugs once."""
+
+    def __init__(self, session: Session, model: Any, *, fallback: str) -> None:
+        self.session = session
+        self.model = model
+        self.fallback = fallback
+        # base -> {suffix: owning row id (None when allocated in this run)}; suffix 0 is the bare base.
+        self._taken: dict[str, dict[int, int | None]] = {}
+        self._next_suffix: dict[str, int] = {}
+
+    def allocate(self, text: str, *, exclude_id: int | None = None) -> str:
+        """
+        Return a free slug for ``text``.
+
+        ``exclude_id`` is the row being renamed; if it already holds a slug for
+        this base it keeps it.
+        """
+
+        base = slugify(text, self.fallback)
+        taken = self._load(base)
+        if exclude_id is not None:
+            for suffix, owner_id in taken.items():
+                if owner_id == exclude_id:
+                    return _with_suffix(base, suffix)
+        suffix = self._next_suffix.get(base, 0)
+        while suffix in taken:
+            suffix += 1
+        taken[suffix] = exclude_id
+        self._next_suffix[base] = suffix + 1
+        return _with_suffix(base, suffix)
+
+    def save(self, instance: Any, text: str) -> None:
+        """Give ``instance`` a slug for ``text`` and flush it, reallocating on a unique-constraint conflict."""
+
+        for attempt in range(SLUG_CONFLICT_RETRIES + 1):
+            try:
+                with self.session.begin_nested():
+                    instance.slug = self.allocate(text, exclude_id=instance.id)
+                    self.session.add(instance)
+                    self.session.flush()
+                return
+            except IntegrityError:
+                if attempt == SLUG_CONFLICT_RETRIES:
+                    raise
+                self.forget(text)
+
+    def forget(self, text: str) -> None:
+        """Drop the cached slugs for ``text``'s base so the next allocation reloads them."""
+
+        base = slugify(text, self.fallback)
+        self._taken.pop(base, None)
+        self._next_suffix.pop(base, None)
+
+    def _load(self, base: str) -> dict[int, int | None]:
+        taken = self._taken.get(base)
+        if taken is not None:
+            return taken
+        slug_column = self.model.slug
+        rows = self.session.execute(
+            select(self.model.id, slug_column).where(or_(slug_column == base, slug_column.like(f"{base}-%")))
+        )
+        taken = {}
+        for row_id, slug in rows:
+            suffix = _suffix(base, slug)
+            if suffix is not None:
+                taken[suffix] = row_id
+        self._taken[base] = taken
+        return taken
+
+
+def _with_suffix(base: str, suffix: int) -> str:
+    return base if suffix == 0 else f"{base}-{suffix}"
+
+
+def _suffix(base: str, slug: str) -> int | None:
+    if slug == base:
+        return 0
+    rest = slug[len(base) + 1 :]
+    if rest.isdigit() and not rest.startswith("0"):
+        return int(rest)
+    return None
@@ -5,15 +5,20 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import IO
 
 from flask import current_app, has_app_context
+from sqlalchemy import and_, exists, func, select, update
 
-from flask_app.importer.adapters import VolunteerCSVAdapter, VolunteerCSVRow
+from flask_app.importer.adapters import VolunteerCSVAdapter
 from flask_app.models.base import db
-from flask_app.models.importer.schema import ImportRun, StagingVolunteer
+from flask_app.models.importer.schema import ExternalIdMap, ImportRun, StagingRecordStatus, StagingVolunteer
 
-BATCH_SIZE = 500
+from .clean import CleanPromotionSummary, DryRunCleanEvaluator
+from .dq import DQProcessingSummary, DryRunDQEvaluator
+from .fused_ingest import FusedVolunteerWriter
+from .staging_writer import StagingWriter, build_staging_row
 
 BATCH_SIZE = 500
 
@@ -25,6 +30,19 @@ def _commit_staging_batch() -> None:
         db.session.commit()
 
 
+def _csv_parallel_options() -> dict[str, int | None]:
+    """Adapter options for parallel CSV parsing, from ``IMPORTER_CSV_PARALLEL_*`` settings."""
+
+    if not has_app_context():
+        return {}
+    config = current_app.config
+    threshold_mb = config.get("IMPORTER_CSV_PARALLEL_THRESHOLD_MB") or 0
+    return {
+        "parallel_threshold_bytes": int(threshold_mb * 1024 * 1024) if threshold_mb > 0 else None,
+        "parallel_workers": config.get("IMPORTER_CSV_PARALLEL_WORKERS") or None,
+    }
+
+
 @dataclass
 class StagingSummary:
     """Outcome statistics for a staging operation."""
@@ -34,7 +52,9 @@ class StagingSummary:
     rows_skipped_blank: int
     header: tuple[str, ...]
     dry_run: bool = False
-    dry_run_rows: tuple[VolunteerCSVRow, ...] = ()
+    rows_unchanged: int = 0
+    streamed_dq: DQProcessingSummary | None = None
+    streamed_clean: CleanPromotionSummary | None = None
 
 
 def stage_volunteers_from_csv(
@@ -44,12 +64,26 @@ def stage_volunteers_from_csv(
     source_system: str = "csv",
     dry_run: bool = False,
     batch_size: int = BATCH_SIZE,
+    fused: bool = False,
 ) -> StagingSummary:
-    """Stage volunteer rows from a CSV into ``staging_volunteers``."""
+    """
+    Stage volunteer rows from a CSV into ``staging_volunteers``.
+
+    A dry run writes nothing: each row is DQ-evaluated and clean-checked as it
+    streams past and then discarded. With ``fused`` (see ``fused_ingest``),
+    each batch is staged with its DQ status, violations, and clean rows in the
+    same pass. Either way the results are returned as
+    ``streamed_dq``/``streamed_clean`` for ``run_minimal_dq`` and
+    ``promote_clean_volunteers`` to record.
+    """
 
-    adapter = VolunteerCSVAdapter(file_obj, source_system=source_system)
-    rows_to_flush: list[StagingVolunteer] = []
-    dry_run_rows: list[VolunteerCSVRow] = []
+    adapter = VolunteerCSVAdapter(file_obj, source_system=source_system, **_csv_parallel_options())
+    fused_writer = FusedVolunteerWriter(import_run) if fused and not dry_run else None
+    writer = StagingWriter(StagingVolunteer) if not dry_run and fused_writer is None else None
+    dq_evaluator = DryRunDQEvaluator() if dry_run else None
+    clean_evaluator = DryRunCleanEvaluator() if dry_run else None
+    rows_to_flush: list[dict[str, object]] = []
+    normalized_to_flush: list[dict[str, object | None]] = []
     rows_staged = 0
     
     # Track field-level statistics for CSV
@@ -73,34 +107,37 @@ def stage_volunteers_from_csv(
                 csv_field_stats[column_name]["records_with_value"] += 1
         
         external_system = resolve_external_system(normalized_json.get("external_system"), source_system)
-        external_id = normalized_json.get("external_id")
-        checksum = compute_checksum(normalized_json)
-
         if dry_run:
-            dry_run_rows.append(row)
+            if not dq_evaluator.evaluate(row):
+                clean_evaluator.check(payload_json, normalized_json, external_system=external_system)
             continue
 
-        staging_row = StagingVolunteer(
-            run_id=import_run.id,
-            sequence_number=row.sequence_number,
-            source_record_id=resolve_source_record_id(external_id, row.sequence_number),
-            external_system=external_system,
-            external_id=str(external_id) if external_id not in (None, "") else None,
-            payload_json=payload_json,
-            normalized_json=normalized_json,
-            checksum=checksum,
+        external_id = normalized_json.get("external_id")
+        rows_to_flush.append(
+            build_staging_row(
+                run_id=import_run.id,
+                sequence_number=row.sequence_number,
+                source_record_id=resolve_source_record_id(external_id, row.sequence_number),
+                external_system=external_system,
+                external_id=str(external_id) if external_id not in (None, "") else None,
+                payload=payload_json,
+                normalized=normalized_json,
+            )
         )
-        rows_to_flush.append(staging_row)
+        normalized_to_flush.append(normalized_json)
         rows_staged += 1
 
         if len(rows_to_flush) >= batch_size:
-            db.session.add_all(rows_to_flush)
-            _commit_staging_batch()
-            rows_to_flush.clear()
+            _flush_staging_batch(writer, fused_writer, rows_to_flush, normalized_to_flush)
+
+    if rows_to_flush:
+        _flush_staging_batch(writer, fused_writer, rows_to_flush, normalized_to_flush)
 
-    if not dry_run and rows_to_flush:
-        db.session.add_all(rows_to_flush)
-        _commit_staging_batch()
+    rows_unchanged = 0
+    if fused_writer is not None:
+        rows_unchanged = fused_writer.rows_unchanged
+    elif not dry_run:
+        rows_unchanged = mark_unchanged_staging_rows(import_run, StagingVolunteer, entity_type="volunteer")
 
     summary = StagingSummary(
         rows_processed=adapter.statistics.rows_processed,
@@ -108,13 +145,34 @@ def stage_volunteers_from_csv(
         rows_skipped_blank=adapter.statistics.rows_skipped_blank,
         header=adapter.header.canonical_headers if adapter.header else (),
         dry_run=dry_run,
-        dry_run_rows=tuple(dry_run_rows),
+        rows_unchanged=rows_unchanged,
     )
+    if fused_writer is not None:
+        summary.streamed_dq = fused_writer.dq_summary()
+        summary.streamed_clean = fused_writer.clean_summary()
+    elif dry_run:
+        summary.streamed_dq = dq_evaluator.summary()
+        summary.streamed_clean = clean_evaluator.summary()
     update_staging_counts(import_run, summary, csv_field_stats=csv_field_stats if csv_field_stats else None)
     _commit_staging_batch()
     return summary
 
 
+def _flush_staging_batch(
+    writer: StagingWriter | None,
+    fused_writer: FusedVolunteerWriter | None,
+    rows: list[dict[str, object]],
+    normalized: list[dict[str, object | None]],
+) -> None:
+    if fused_writer is not None:
+        fused_writer.write(list(zip(rows, normalized)))
+    else:
+        writer.write(rows)
+    _commit_staging_batch()
+    rows.clear()
+    normalized.clear()
+
+
 def resolve_external_system(candidate: object | None, fallback: str) -> str:
     if isinstance(candidate, str):
         candidate_clean = candidate.strip()
@@ -138,6 +196,79 @@ def resolve_source_record_id(external_id: object | None, sequence_number: int) -
     return str(external_id)
 
 
+def mark_unchanged_staging_rows(import_run: ImportRun, model: type, *, entity_type: str) -> int:
+    """
+    Mark landed rows whose checksum matches the last loaded payload as ``unchanged``.
+
+    Rows are compared against ``ExternalIdMap.last_loaded_checksum`` for
+    ``entity_type`` in bulk. Matching rows keep their identifier map current
+    (``last_seen_at``/``run_id``) but are skipped by DQ, clean promotion, and
+    core load. Disabled when ``IMPORTER_SKIP_UNCHANGED`` is false.
+    """
+
+    if has_app_context() and not current_app.config.get("IMPORTER_SKIP_UNCHANGED", True):
+        return 0
+
+    staging = model.__table__
+    id_map = ExternalIdMap.__table__
+    matches_loaded_checksum = and_(
+        id_map.c.entity_type == entity_type,
+        id_map.c.external_system == staging.c.external_system,
+        id_map.c.external_id == staging.c.external_id,
+        id_map.c.is_active.is_(True),
+        id_map.c.last_loaded_checksum == staging.c.checksum,
+    )
+    landed_in_run = and_(
+        staging.c.run_id == import_run.id,
+        staging.c.status == StagingRecordStatus.LANDED,
+        staging.c.external_id.is_not(None),
+    )
+
+    db.session.execute(
+        update(id_map)
+        .where(exists(select(staging.c.id).where(landed_in_run, matches_loaded_checksum)))
+        .values(last_seen_at=datetime.now(timezone.utc), run_id=import_run.id)
+    )
+    result = db.session.execute(
+        update(staging)
+        .where(landed_in_run, exists(select(id_map.c.id).where(matches_loaded_checksum)))
+        .values(status=StagingRecordStatus.UNCHANGED)
+    )
+    _commit_staging_batch()
+    return max(result.rowcount or 0, 0)
+
+
+def count_unchanged_staging_rows(run_id: int, model: type) -> int:
+    """Return how many rows of ``model`` were marked ``unchanged`` at staging for a run."""
+
+    return db.session.execute(
+        select(func.count())
+        .select_from(model)
+        .where(model.run_id == run_id, model.status == StagingRecordStatus.UNCHANGED)
+    ).scalar_one()
+
+
+def max_staging_source_timestamps(run_id: int, model: type) -> tuple[datetime | None, datetime | None]:
+    """
+    Return the latest ``source_modstamp`` and ``source_last_modified`` staged for a run.
+
+    Both come from one aggregate over the extracted timestamp columns (indexed
+    on ``run_id, source_modstamp``), so watermark advancement never loads the
+    staging rows themselves. Naive values read back from SQLite are treated as UTC.
+    """
+
+    latest_modstamp, latest_updated_at = db.session.execute(
+        select(func.max(model.source_modstamp), func.max(model.source_last_modified)).where(model.run_id == run_id)
+    ).one()
+    return _as_utc(latest_modstamp), _as_utc(latest_updated_at)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
 def update_staging_counts(import_run: ImportRun, summary: StagingSummary, *, csv_field_stats: dict[str, dict[str, int]] | None = None, entity_type: str = "volunteers") -> None:
     counts = dict(import_run.counts_json or {})
     staging_counts = counts.setdefault("staging", {}).setdefault(entity_type, {})
@@ -146,6 +277,7 @@ def update_staging_counts(import_run: ImportRun, summary: StagingSummary, *, csv
             "rows_processed": summary.rows_processed,
             "rows_staged": summary.rows_staged,
             "rows_skipped_blank": summary.rows_skipped_blank,
+            "rows_unchanged": summary.rows_unchanged,
             "headers": list(summary.header),
             "dry_run": summary.dry_run,
         }
@@ -159,6 +291,7 @@ def update_staging_counts(import_run: ImportRun, summary: StagingSummary, *, csv
             "rows_processed": summary.rows_processed,
             "rows_staged": summary.rows_staged,
             "rows_skipped_blank": summary.rows_skipped_blank,
+            "rows_unchanged": summary.rows_unchanged,
             "dry_run": summary.dry_run,
         }
     )
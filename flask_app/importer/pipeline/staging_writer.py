@@ -0,0 +1,303 @@
+"""
+Bulk writers for the importer staging tables.
+
+Staging rows are emitted as plain dictionaries and written without building ORM
+objects. Three write modes are supported, selected by
+``IMPORTER_STAGING_WRITER``:
+
+* ``orm`` – legacy path, ``session.add_all`` of model instances.
+* ``core`` – one ``INSERT ... VALUES`` executemany per batch.
+* ``copy`` – PostgreSQL ``COPY ... FROM STDIN`` streamed through psycopg2.
+
+``auto`` (the default) uses ``copy`` on PostgreSQL/psycopg2 and ``core``
+everywhere else. Requesting ``copy`` on another backend falls back to ``core``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Iterable, Mapping, Sequence
+
+from flask import current_app, has_app_context
+from sqlalchemy import JSON, Text, bindparam, insert
+
+from flask_app.models.base import db
+from flask_app.models.importer.schema import StagingAffiliation, StagingEvent, StagingOrganization, StagingVolunteer
+
+logger = logging.getLogger(__name__)
+
+STAGING_WRITER_MODES = ("auto", "orm", "core", "copy")
+STAGING_MODELS = (StagingVolunteer, StagingOrganization, StagingAffiliation, StagingEvent)
+
+
+class SerializedJSON(str):
+    """JSON text serialized ahead of time (e.g. while computing a checksum)."""
+
+
+def serialize_with_checksum(payload: Mapping[str, object | None]) -> tuple[SerializedJSON, str]:
+    """
+    Serialize ``payload`` once and derive its checksum from the same text.
+
+    The serialization matches ``compute_checksum`` (sorted keys, compact
+    separators), so the stored JSON hashes to the stored checksum.
+    """
+
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return SerializedJSON(serialized), hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def build_staging_row(
+    *,
+    run_id: int,
+    sequence_number: int,
+    source_record_id: str,
+    external_system: str,
+    external_id: str | None,
+    payload: Mapping[str, object | None],
+    normalized: Mapping[str, object | None],
+) -> dict[str, Any]:
+    """Return a staging row dictionary accepted by ``StagingWriter.write`` for any staging table."""
+
+    normalized_json, checksum = serialize_with_checksum(normalized)
+    metadata = normalized.get("metadata")
+    if not isinstance(metadata, Mapping):
+        metadata = {}
+    return {
+        "run_id": run_id,
+        "sequence_number": sequence_number,
+        "source_record_id": source_record_id,
+        "external_system": external_system,
+        "external_id": external_id,
+        "payload_json": payload,
+        "normalized_json": normalized_json,
+        "checksum": checksum,
+        "source_modstamp": parse_source_timestamp(metadata.get("source_modstamp")),
+        "source_last_modified": parse_source_timestamp(metadata.get("source_last_modified")),
+    }
+
+
+def parse_source_timestamp(value: object | None) -> datetime | None:
+    """
+    Parse a source-system timestamp (ISO 8601, ``Z`` suffix allowed) as UTC.
+
+    Staging rows carry ``metadata.source_modstamp``/``source_last_modified`` in
+    their columns so loaders can take the run's watermark with one ``MAX()``.
+    Unparseable values are stored as ``NULL``.
+    """
+
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        candidate = str(value or "").strip()
+        if not candidate:
+            return None
+        if candidate.endswith("Z"):
+            candidate = candidate[:-1] + "+00:00"
+        try:
+            parsed = datetime.fromisoformat(candidate)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def resolve_staging_writer_mode(requested: str | None = None) -> str:
+    """Resolve the configured writer mode to the one usable on the bound database."""
+
+    mode = (requested or "").strip().lower()
+    if not mode and has_app_context():
+        mode = str(current_app.config.get("IMPORTER_STAGING_WRITER", "auto")).strip().lower()
+    if mode not in STAGING_WRITER_MODES:
+        logger.warning("Unknown IMPORTER_STAGING_WRITER %r; using 'auto'.", mode)
+        mode = "auto"
+    if mode in ("auto", "copy"):
+        dialect = db.engine.dialect
+        if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+            return "copy"
+        if mode == "copy":
+            logger.info("COPY staging requires PostgreSQL with psycopg2 (found %s); using core inserts.", dialect.name)
+        return "core"
+    return mode
+
+
+class StagingWriter:
+    """Write batches of staging row dictionaries into one staging table."""
+
+    def __init__(self, model: type, *, mode: str | None = None) -> None:
+        if model not in STAGING_MODELS:
+            raise ValueError(f"{model!r} is not a staging model.")
+        self.model = model
+        self.table = model.__table__
+        self.mode = resolve_staging_writer_mode(mode)
+        self.rows_written = 0
+        self._json_columns = frozenset(column.name for column in self.table.columns if isinstance(column.type, JSON))
+        self._insert_statement = None
+
+    def write(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Write ``rows`` within the current session transaction and return the count written."""
+
+        if not rows:
+            return 0
+        if self.mode == "copy":
+            self._write_copy(rows)
+        elif self.mode == "core":
+            self._write_core(rows)
+        else:
+            self._write_orm(rows)
+        self.rows_written += len(rows)
+        return len(rows)
+
+    def write_returning_ids(self, rows: Sequence[Mapping[str, Any]]) -> list[int] | None:
+        """
+        Write ``rows`` like ``write`` and return their primary keys in row order.
+
+        Returns ``None`` when the rows were written but their keys cannot be
+        reported: always for ``copy``, and for ``core`` on a dialect without
+        ordered executemany ``RETURNING``.
+        """
+
+        if not rows:
+            return []
+        ids: list[int] | None = None
+        dialect = db.engine.dialect
+        if self.mode == "orm":
+            instances = [self.model(**self._decode_json(row)) for row in rows]
+            db.session.add_all(instances)
+            db.session.flush(instances)
+            ids = [instance.id for instance in instances]
+        elif self.mode == "core" and dialect.insert_executemany_returning_sort_by_parameter_order:
+            statement = self._core_insert().returning(self.table.c.id, sort_by_parameter_order=True)
+            ids = list(db.session.execute(statement, [self._encode_json(row) for row in rows]).scalars())
+        else:
+            self.write(rows)
+            return None
+        self.rows_written += len(rows)
+        return ids
+
+    def _write_orm(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        db.session.add_all(self.model(**self._decode_json(row)) for row in rows)
+
+    def _core_insert(self):
+        if self._insert_statement is None:
+            # JSON columns are bound as text so pre-serialized values are not encoded twice
+            self._insert_statement = insert(self.table).values(
+                {name: bindparam(name, type_=Text()) for name in self._json_columns}
+            )
+        return self._insert_statement
+
+    def _write_core(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        db.session.execute(self._core_insert(), [self._encode_json(row) for row in rows])
+
+    def _write_copy(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        columns = [column for column in self.table.columns if not (column.primary_key and column.autoincrement)]
+        dialect = db.engine.dialect
+        processors = []
+        for column in columns:
+            processor = None if column.name in self._json_columns else column.type.bind_processor(dialect)
+            processors.append(processor)
+        defaults, context_defaults = _column_defaults(columns)
+
+        buffer = io.StringIO()
+        for row in rows:
+            row = self._encode_json(row)
+            context = _CopyDefaultContext(row) if context_defaults else None
+            fields = []
+            for column, processor in zip(columns, processors):
+                if column.name in row:
+                    value = row[column.name]
+                elif column.name in context_defaults:
+                    value = context_defaults[column.name](context)
+                else:
+                    value = defaults.get(column.name)
+                if processor is not None and value is not None:
+                    value = processor(value)
+                fields.append(_copy_text(value))
+            buffer.write("\t".join(fields))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        column_list = ", ".join(column.name for column in columns)
+        cursor = db.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {self.table.name} ({column_list}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+    def _encode_json(self, row: Mapping[str, Any]) -> dict[str, Any]:
+        encoded = dict(row)
+        for name in self._json_columns:
+            value = encoded.get(name)
+            if value is not None and not isinstance(value, SerializedJSON):
+                encoded[name] = json.dumps(value, default=str)
+        return encoded
+
+    def _decode_json(self, row: Mapping[str, Any]) -> dict[str, Any]:
+        decoded = dict(row)
+        for name in self._json_columns:
+            value = decoded.get(name)
+            if isinstance(value, SerializedJSON):
+                decoded[name] = json.loads(value)
+        return decoded
+
+
+class _CopyDefaultContext:
+    """
+    Stand-in for the execution context SQLAlchemy passes to column default callables.
+
+    COPY bypasses statement execution, so defaults that read the row being
+    inserted get it from here, as they would from ``get_current_parameters()``.
+    """
+
+    def __init__(self, row: Mapping[str, Any]) -> None:
+        self.current_parameters = row
+
+    def get_current_parameters(self, isolate_multiinsert_groups: bool = True) -> Mapping[str, Any]:
+        return self.current_parameters
+
+
+def _column_defaults(columns: Iterable[Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Resolve Python-side column defaults for COPY rows.
+
+    Returns ``(values, context_callables)``. Scalars and zero-argument callables
+    (which SQLAlchemy wraps, keeping the original as ``__wrapped__``) are
+    evaluated once per batch. Callables that take the execution context are
+    returned for per-row evaluation with a ``_CopyDefaultContext``.
+    """
+
+    values: dict[str, Any] = {}
+    context_callables: dict[str, Any] = {}
+    for column in columns:
+        default = column.default
+        if default is None:
+            continue
+        if default.is_scalar:
+            values[column.name] = default.arg
+        elif default.is_callable:
+            if hasattr(default.arg, "__wrapped__"):
+                values[column.name] = default.arg.__wrapped__()
+            else:
+                context_callables[column.name] = default.arg
+    return values, context_callables
+
+
+def _copy_text(value: Any) -> str:
+    """Render a value in PostgreSQL COPY text format."""
+
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    text = str(value)
+    if "\\" in text or "\t" in text or "\n" in text or "\r" in text:
+        text = text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    return text
@@ -1,25 +1,43 @@
 """
 Importer Celery tasks.
 
-These tasks are intentionally lightweight placeholders; future IMP tickets will
-extend them with real pipeline orchestration. They provide the scaffolding
-needed for worker health checks and integration tests today.
+``ingest_csv`` and ``ingest_salesforce_contacts`` run the volunteer pipeline:
+staging, DQ, clean promotion, fuzzy matching, and core load, each checkpointed
+on the run so a retry resumes at the first incomplete stage. The other
+Salesforce tasks load accounts, affiliations, and sessions incrementally from
+their watermarks.
+
+With ``IMPORTER_STAGE_CHAIN_ENABLED``, ``ingest_csv`` queues a non-dry run as
+a Celery chain of per-stage tasks (``importer.pipeline.csv_stage.<stage>``)
+instead of running every stage itself. ``celery_app`` routes the DB-bound
+stages (staging, clean, core) to the ``imports.io`` queue and the CPU-bound
+ones (DQ, fuzzy) to ``imports.cpu``, each with its own time limit and retry
+budget; every other task stays on the default ``imports`` queue. The health
+check, no-op ingest, and auto-merge tasks support worker monitoring and the
+merge review queue.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from celery import shared_task
+from celery import chain, shared_task
 from flask import current_app
+from sqlalchemy.exc import OperationalError
 
 from flask_app.importer.adapters.salesforce.extractor import SalesforceExtractor, create_salesforce_client
+from flask_app.importer.celery_app import stage_task_name
 from flask_app.importer.idempotency_summary import persist_idempotency_summary
 from flask_app.importer.pipeline import (
+    CleanPromotionSummary,
     CoreLoadSummary,
+    DQProcessingSummary,
+    PIPELINE_STAGES,
+    StageCheckpoints,
     StagingSummary,
+    csv_fused_ingest_enabled,
     load_core_volunteers,
     promote_clean_affiliations,
     promote_clean_events,
@@ -28,7 +46,13 @@ from flask_app.importer.pipeline import (
     run_minimal_dq,
     stage_volunteers_from_csv,
 )
-from flask_app.importer.pipeline.fuzzy_candidates import generate_fuzzy_candidates
+from flask_app.importer.pipeline.checkpoints import _summary_from_json, _summary_to_json
+from flask_app.importer.pipeline.fuzzy_candidates import (
+    FuzzyCandidateSummary,
+    _update_dedupe_counts,
+    generate_fuzzy_candidates,
+)
+from flask_app.importer.pipeline.salesforce import SalesforceIngestSummary
 from flask_app.importer.pipeline.salesforce import ingest_salesforce_accounts as run_salesforce_accounts_ingest
 from flask_app.importer.pipeline.salesforce import ingest_salesforce_affiliations as run_salesforce_affiliations_ingest
 from flask_app.importer.pipeline.salesforce import ingest_salesforce_contacts as run_salesforce_ingest
@@ -74,12 +98,36 @@ def noop_ingest(self, *, payload: dict[str, Any] | None = None) -> dict[str, Any
     }
 
 
+# Exceptions a chained stage task retries (per its ``max_retries``); anything else fails the run.
+STAGE_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (OperationalError,)
+
+_CSV_STAGE_SUMMARIES: dict[str, type] = {
+    "staging": StagingSummary,
+    "dq": DQProcessingSummary,
+    "clean": CleanPromotionSummary,
+    "fuzzy": FuzzyCandidateSummary,
+    "core": CoreLoadSummary,
+}
+
+
 @shared_task(name="importer.pipeline.ingest_csv", bind=True)
 def ingest_csv(
-    self, *, run_id: int, file_path: str, dry_run: bool = False, source_system: str = "csv", keep_file: bool = False
+    self,
+    *,
+    run_id: int,
+    file_path: str,
+    dry_run: bool = False,
+    source_system: str = "csv",
+    keep_file: bool = False,
+    from_stage: str | None = None,
 ) -> dict[str, Any]:
     """
     Execute the CSV ingest pipeline asynchronously via the importer worker.
+
+    Stages already checkpointed on the run are skipped (see ``StageCheckpoints``);
+    ``from_stage`` re-runs that stage and every later one. With
+    ``IMPORTER_STAGE_CHAIN_ENABLED`` the stages of a non-dry run are queued as
+    a chain of per-stage tasks instead, and this task returns once it is queued.
     """
 
     run = db.session.get(ImportRun, run_id)
@@ -102,149 +150,362 @@ def ingest_csv(
     cleanup_target: Path | None = None if keep_file else path
 
     try:
+        checkpoints = StageCheckpoints(run, from_stage=from_stage, dry_run=dry_run)
+        if not dry_run and current_app.config.get("IMPORTER_STAGE_CHAIN_ENABLED", False):
+            if checkpoints.should_run("staging"):
+                # The staging task removes the upload once it has been read.
+                cleanup_target = None
+            return _dispatch_csv_stage_chain(
+                run,
+                checkpoints.start_stage,
+                file_path=file_path,
+                source_system=source_system,
+                keep_file=keep_file,
+            )
+
+        summaries: dict[str, Any] = {}
+        for stage in PIPELINE_STAGES:
+            _run_csv_stage(stage, run, checkpoints, summaries, path=path, source_system=source_system, dry_run=dry_run)
+        return _complete_csv_run(run, summaries)
+    except Exception as exc:  # pragma: no cover - defensive logging path
+        _fail_csv_run(run_id, exc)
+        raise
+    finally:
+        if cleanup_target is not None:
+            cleanup_upload(cleanup_target)
+
+
+def _run_csv_stage(
+    stage: str,
+    run: ImportRun,
+    checkpoints: StageCheckpoints,
+    summaries: dict[str, Any],
+    *,
+    path: Path,
+    source_system: str,
+    dry_run: bool,
+) -> None:
+    """Run one CSV pipeline stage (or restore its checkpoint) and add its summary to ``summaries``."""
+
+    def _stage_csv() -> StagingSummary:
         with path.open("r", encoding="utf-8", newline="") as handle:
-            staging_summary = stage_volunteers_from_csv(
+            return stage_volunteers_from_csv(
                 run,
                 handle,
                 source_system=source_system,
                 dry_run=dry_run,
+                fused=csv_fused_ingest_enabled(),
             )
-        dq_summary = run_minimal_dq(run, dry_run=dry_run, csv_rows=staging_summary.dry_run_rows)
-        clean_summary = promote_clean_volunteers(run, dry_run=dry_run)
-        fuzzy_summary = generate_fuzzy_candidates(run, dry_run=dry_run)
-
-        # Auto-merge high-confidence candidates if enabled and not dry_run
-        if not dry_run:
-            from flask_app.importer.pipeline.merge_service import MergeService
-
-            merge_service = MergeService()
-            auto_merge_stats = merge_service.auto_merge_high_confidence_candidates(
-                run_id=run.id,
-                dry_run=False,
-            )
-            fuzzy_summary.auto_merged_count = auto_merge_stats.get("merged", 0)
 
-        # Update dedupe counts in counts_json/metrics_json
-        from flask_app.importer.pipeline.fuzzy_candidates import _update_dedupe_counts
+    executors = {
+        "staging": _stage_csv,
+        "dq": lambda: run_minimal_dq(run, dry_run=dry_run, streamed_summary=summaries["staging"].streamed_dq),
+        "clean": lambda: promote_clean_volunteers(
+            run, dry_run=dry_run, streamed_summary=summaries["staging"].streamed_clean
+        ),
+        "fuzzy": lambda: _generate_and_auto_merge_candidates(run, dry_run=dry_run),
+        "core": lambda: load_core_volunteers(run, dry_run=dry_run, clean_candidates=summaries["clean"].candidates),
+    }
+    summaries[stage] = checkpoints.run(stage, _CSV_STAGE_SUMMARIES[stage], executors[stage])
+
+
+def _complete_csv_run(run: ImportRun, summaries: dict[str, Any]) -> dict[str, Any]:
+    """Mark a CSV run succeeded, record its idempotency summary, and build the task result."""
+
+    staging_summary: StagingSummary = summaries["staging"]
+    dq_summary: DQProcessingSummary = summaries["dq"]
+    clean_summary: CleanPromotionSummary = summaries["clean"]
+    fuzzy_summary: FuzzyCandidateSummary = summaries["fuzzy"]
+    core_summary: CoreLoadSummary = summaries["core"]
+
+    run.status = ImportRunStatus.SUCCEEDED
+    run.finished_at = datetime.now(timezone.utc)
+    persist_idempotency_summary(
+        run,
+        staging_summary=staging_summary,
+        dq_summary=dq_summary,
+        clean_summary=clean_summary,
+        core_summary=core_summary,
+        fuzzy_summary=fuzzy_summary,
+    )
+    db.session.commit()
+    current_app.logger.info(
+        "Importer run completed",
+        extra={
+            "importer_run_id": run.id,
+            "importer_status": run.status.value,
+            "importer_rows_processed": staging_summary.rows_processed,
+            "importer_rows_created": core_summary.rows_created,
+            "importer_rows_updated": core_summary.rows_updated,
+            "importer_rows_skipped_no_change": core_summary.rows_skipped_no_change,
+            "importer_rows_reactivated": core_summary.rows_reactivated,
+            "importer_rows_quarantined": dq_summary.rows_quarantined,
+            "importer_dry_run": staging_summary.dry_run,
+            "importer_fuzzy_suggestions_created": fuzzy_summary.suggestions_created,
+            "importer_fuzzy_high_confidence": fuzzy_summary.high_confidence,
+            "importer_fuzzy_review": fuzzy_summary.review_band,
+            "importer_fuzzy_auto_merged": fuzzy_summary.auto_merged_count,
+        },
+    )
+    return {
+        "run_id": run.id,
+        "rows_processed": staging_summary.rows_processed,
+        "rows_staged": staging_summary.rows_staged,
+        "rows_skipped_blank": staging_summary.rows_skipped_blank,
+        "dry_run": staging_summary.dry_run,
+        "dq_rows_evaluated": dq_summary.rows_evaluated,
+        "dq_rows_validated": dq_summary.rows_validated,
+        "dq_rows_quarantined": dq_summary.rows_quarantined,
+        "dq_rule_counts": dict(dq_summary.rule_counts),
+        "clean_rows_promoted": clean_summary.rows_promoted,
+        "core_rows_created": core_summary.rows_created,
+        "core_rows_updated": core_summary.rows_updated,
+        "core_rows_reactivated": core_summary.rows_reactivated,
+        "core_rows_skipped_no_change": core_summary.rows_skipped_no_change,
+        "core_rows_duplicates": core_summary.rows_skipped_duplicates,
+        "core_rows_missing_external_id": core_summary.rows_missing_external_id,
+        "fuzzy_rows_considered": fuzzy_summary.rows_considered,
+        "fuzzy_suggestions_created": fuzzy_summary.suggestions_created,
+        "fuzzy_high_confidence": fuzzy_summary.high_confidence,
+        "fuzzy_review": fuzzy_summary.review_band,
+        "fuzzy_auto_merged": fuzzy_summary.auto_merged_count,
+    }
 
-        _update_dedupe_counts(run, fuzzy_summary)
 
-        core_summary = load_core_volunteers(
-            run,
-            dry_run=dry_run,
-            clean_candidates=clean_summary.candidates,
-        )
-        run.status = ImportRunStatus.SUCCEEDED
-        run.finished_at = datetime.now(timezone.utc)
-        persist_idempotency_summary(
-            run,
-            staging_summary=staging_summary,
-            dq_summary=dq_summary,
-            clean_summary=clean_summary,
-            core_summary=core_summary,
-            fuzzy_summary=fuzzy_summary,
-        )
-        db.session.commit()
-        current_app.logger.info(
-            "Importer run completed",
-            extra={
-                "importer_run_id": run_id,
-                "importer_status": run.status.value,
-                "importer_rows_processed": staging_summary.rows_processed,
-                "importer_rows_created": core_summary.rows_created,
-                "importer_rows_updated": core_summary.rows_updated,
-                "importer_rows_skipped_no_change": core_summary.rows_skipped_no_change,
-                "importer_rows_reactivated": core_summary.rows_reactivated,
-                "importer_rows_quarantined": dq_summary.rows_quarantined,
-                "importer_dry_run": staging_summary.dry_run,
-                "importer_fuzzy_suggestions_created": fuzzy_summary.suggestions_created,
-                "importer_fuzzy_high_confidence": fuzzy_summary.high_confidence,
-                "importer_fuzzy_review": fuzzy_summary.review_band,
-                "importer_fuzzy_auto_merged": fuzzy_summary.auto_merged_count,
-            },
-        )
-        return {
-            "run_id": run_id,
-            "rows_processed": staging_summary.rows_processed,
-            "rows_staged": staging_summary.rows_staged,
-            "rows_skipped_blank": staging_summary.rows_skipped_blank,
-            "dry_run": staging_summary.dry_run,
-            "dq_rows_evaluated": dq_summary.rows_evaluated,
-            "dq_rows_validated": dq_summary.rows_validated,
-            "dq_rows_quarantined": dq_summary.rows_quarantined,
-            "dq_rule_counts": dict(dq_summary.rule_counts),
-            "clean_rows_promoted": clean_summary.rows_promoted,
-            "core_rows_created": core_summary.rows_created,
-            "core_rows_updated": core_summary.rows_updated,
-            "core_rows_reactivated": core_summary.rows_reactivated,
-            "core_rows_skipped_no_change": core_summary.rows_skipped_no_change,
-            "core_rows_duplicates": core_summary.rows_skipped_duplicates,
-            "core_rows_missing_external_id": core_summary.rows_missing_external_id,
-            "fuzzy_rows_considered": fuzzy_summary.rows_considered,
-            "fuzzy_suggestions_created": fuzzy_summary.suggestions_created,
-            "fuzzy_high_confidence": fuzzy_summary.high_confidence,
-            "fuzzy_review": fuzzy_summary.review_band,
-            "fuzzy_auto_merged": fuzzy_summary.auto_merged_count,
+def _fail_csv_run(run_id: int, exc: Exception) -> None:
+    db.session.rollback()
+    recovery_run = db.session.get(ImportRun, run_id)
+    if recovery_run is None:
+        return
+    recovery_run.status = ImportRunStatus.FAILED
+    recovery_run.error_summary = str(exc)
+    recovery_run.finished_at = datetime.now(timezone.utc)
+    db.session.commit()
+    current_app.logger.exception(
+        "Importer run failed",
+        extra={
+            "importer_run_id": run_id,
+            "importer_error": str(exc),
+        },
+    )
+
+
+def _dispatch_csv_stage_chain(
+    run: ImportRun,
+    start_stage: str,
+    *,
+    file_path: str,
+    source_system: str,
+    keep_file: bool,
+) -> dict[str, Any]:
+    """Queue the stage tasks from ``start_stage`` on as a chain; each passes the run payload to the next."""
+
+    stages = PIPELINE_STAGES[PIPELINE_STAGES.index(start_stage) :]
+    payload = {"run_id": run.id, "file_path": file_path, "source_system": source_system, "keep_file": keep_file}
+    signatures = [CSV_STAGE_TASKS[stages[0]].si(payload)]
+    signatures.extend(CSV_STAGE_TASKS[stage].s() for stage in stages[1:])
+    result = chain(*signatures).apply_async()
+    current_app.logger.info(
+        "Importer run queued as stage chain",
+        extra={"importer_run_id": run.id, "importer_stages": list(stages), "importer_final_task_id": result.id},
+    )
+    return {"run_id": run.id, "chained_stages": list(stages), "final_task_id": result.id}
+
+
+def _run_chained_csv_stage(task, stage: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Run one stage of a chained CSV ingest and return the payload for the next stage.
+
+    The DQ and clean results that fused staging computes travel in the payload
+    (``streamed``), as they would in memory in ``ingest_csv``. A retried stage
+    discards what its failed attempt wrote and starts over from the checkpoints
+    of the stages before it, like a resumed run, so it drops them.
+    """
+
+    run_id = payload["run_id"]
+    keep_file = payload.get("keep_file", False)
+    path = Path(payload["file_path"])
+    retrying = task.request.retries > 0
+    next_payload = dict(payload)
+    try:
+        run = db.session.get(ImportRun, run_id)
+        if run is None:
+            raise ValueError(f"Import run {run_id} not found.")
+        checkpoints = StageCheckpoints(run, discard=retrying)
+        index = PIPELINE_STAGES.index(stage)
+        if PIPELINE_STAGES.index(checkpoints.start_stage) < index:
+            raise ValueError(
+                f"Import run {run_id} cannot run stage '{stage}': "
+                f"stage '{checkpoints.start_stage}' has not completed."
+            )
+
+        summaries: dict[str, Any] = {
+            earlier: checkpoints.summary(earlier, _CSV_STAGE_SUMMARIES[earlier]) for earlier in PIPELINE_STAGES[:index]
         }
-    except Exception as exc:  # pragma: no cover - defensive logging path
-        db.session.rollback()
-        recovery_run = db.session.get(ImportRun, run_id)
-        if recovery_run is None:
-            raise
-        recovery_run.status = ImportRunStatus.FAILED
-        recovery_run.error_summary = str(exc)
-        recovery_run.finished_at = datetime.now(timezone.utc)
-        db.session.commit()
-        current_app.logger.exception(
-            "Importer run failed",
-            extra={
-                "importer_run_id": run_id,
-                "importer_error": str(exc),
-            },
+        streamed = None if retrying else payload.get("streamed")
+        if streamed:
+            summaries["staging"].streamed_dq = _summary_from_json(DQProcessingSummary, streamed["dq"])
+            summaries["staging"].streamed_clean = _summary_from_json(CleanPromotionSummary, streamed["clean"])
+        else:
+            next_payload.pop("streamed", None)
+
+        _run_csv_stage(
+            stage, run, checkpoints, summaries, path=path, source_system=payload["source_system"], dry_run=False
         )
+    except STAGE_RETRY_EXCEPTIONS as exc:
+        db.session.rollback()
+        if task.request.retries < task.max_retries:
+            raise task.retry(exc=exc, countdown=task.default_retry_delay * 2**task.request.retries)
+        _fail_chained_csv_stage(run_id, exc, path=path, keep_file=keep_file)
         raise
-    finally:
-        if cleanup_target is not None:
-            cleanup_upload(cleanup_target)
+    except Exception as exc:
+        _fail_chained_csv_stage(run_id, exc, path=path, keep_file=keep_file)
+        raise
+
+    if stage == "staging":
+        staging_summary: StagingSummary = summaries["staging"]
+        if staging_summary.streamed_dq is not None and staging_summary.streamed_clean is not None:
+            next_payload["streamed"] = {
+                "dq": _summary_to_json(staging_summary.streamed_dq),
+                "clean": _summary_to_json(staging_summary.streamed_clean),
+            }
+        if not keep_file:
+            cleanup_upload(path)
+    if stage == PIPELINE_STAGES[-1]:
+        return _complete_csv_run(run, summaries)
+    return next_payload
+
+
+def _fail_chained_csv_stage(run_id: int, exc: Exception, *, path: Path, keep_file: bool) -> None:
+    _fail_csv_run(run_id, exc)
+    if not keep_file:
+        cleanup_upload(path)
+
+
+@shared_task(name=stage_task_name("staging"), bind=True)
+def csv_stage_staging(self, payload: dict[str, Any]) -> dict[str, Any]:
+    """Chained CSV ingest: parse the uploaded file into ``staging_volunteers``."""
+    return _run_chained_csv_stage(self, "staging", payload)
+
+
+@shared_task(name=stage_task_name("dq"), bind=True)
+def csv_stage_dq(self, payload: dict[str, Any]) -> dict[str, Any]:
+    """Chained CSV ingest: evaluate the DQ rules on the staged rows."""
+    return _run_chained_csv_stage(self, "dq", payload)
+
+
+@shared_task(name=stage_task_name("clean"), bind=True)
+def csv_stage_clean(self, payload: dict[str, Any]) -> dict[str, Any]:
+    """Chained CSV ingest: promote validated rows to ``clean_volunteers``."""
+    return _run_chained_csv_stage(self, "clean", payload)
+
+
+@shared_task(name=stage_task_name("fuzzy"), bind=True)
+def csv_stage_fuzzy(self, payload: dict[str, Any]) -> dict[str, Any]:
+    """Chained CSV ingest: generate fuzzy dedupe suggestions and auto-merge the high-confidence ones."""
+    return _run_chained_csv_stage(self, "fuzzy", payload)
+
+
+@shared_task(name=stage_task_name("core"), bind=True)
+def csv_stage_core(self, payload: dict[str, Any]) -> dict[str, Any]:
+    """Chained CSV ingest: load clean rows into the core tables and finish the run."""
+    return _run_chained_csv_stage(self, "core", payload)
+
+
+CSV_STAGE_TASKS = {
+    "staging": csv_stage_staging,
+    "dq": csv_stage_dq,
+    "clean": csv_stage_clean,
+    "fuzzy": csv_stage_fuzzy,
+    "core": csv_stage_core,
+}
+
+
+def _generate_and_auto_merge_candidates(run: ImportRun, *, dry_run: bool) -> FuzzyCandidateSummary:
+    """Generate fuzzy dedupe suggestions, auto-merge the high-confidence ones, and record dedupe counts."""
+
+    fuzzy_summary = generate_fuzzy_candidates(run, dry_run=dry_run)
+
+    # Auto-merge high-confidence candidates if enabled and not dry_run
+    if not dry_run:
+        from flask_app.importer.pipeline.merge_service import MergeService
+
+        merge_service = MergeService()
+        auto_merge_stats = merge_service.auto_merge_high_confidence_candidates(
+            run_id=run.id,
+            dry_run=False,
+        )
+        fuzzy_summary.auto_merged_count = auto_merge_stats.get("merged", 0)
+
+    # Update dedupe counts in counts_json/metrics_json
+    _update_dedupe_counts(run, fuzzy_summary)
+    return fuzzy_summary
 
 
 @shared_task(name="importer.pipeline.process_auto_merge_candidates", bind=True)
-def process_auto_merge_candidates(self, *, max_age_minutes: int = 5, batch_size: int | None = None) -> dict[str, Any]:
+def process_auto_merge_candidates(
+    self,
+    *,
+    max_age_minutes: int = 5,
+    batch_size: int | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
     """
     Background task to process missed high-confidence fuzzy dedupe candidates.
 
     Processes candidates that are older than max_age_minutes to avoid race conditions
-    with in-progress imports.
+    with in-progress imports. ``workers - 1`` additional ``auto_merge_worker`` tasks are
+    queued and this task drains alongside them; workers claim disjoint batches.
 
     Args:
         max_age_minutes: Minimum age in minutes for candidates to be processed (default: 5)
-        batch_size: Maximum number of candidates to process (uses config default if None)
+        batch_size: Candidates claimed per batch (uses config default if None)
+        workers: Parallel workers to run (uses ``FUZZY_AUTO_MERGE_WORKERS`` if None)
 
     Returns:
-        Dict with counts: processed, merged, skipped, errors
+        Dict with counts: processed, merged, skipped, errors, conflicts, plus merges_per_second
     """
-    from flask_app.importer.pipeline.merge_service import MergeService
+    if workers is None:
+        workers = current_app.config.get("FUZZY_AUTO_MERGE_WORKERS", 1)
+    dispatched = [
+        auto_merge_worker.apply_async(kwargs={"max_age_minutes": max_age_minutes, "batch_size": batch_size}).id
+        for _ in range(max(0, workers - 1))
+    ]
+    stats = _drain_auto_merge_candidates(max_age_minutes=max_age_minutes, batch_size=batch_size)
+    stats["workers_dispatched"] = dispatched
+    return stats
+
 
-    merge_service = MergeService()
+@shared_task(name="importer.pipeline.auto_merge_worker", bind=True)
+def auto_merge_worker(self, *, max_age_minutes: int = 5, batch_size: int | None = None) -> dict[str, Any]:
+    """Claim and merge high-confidence candidates until none are left or the time budget is spent."""
 
-    # Process candidates older than threshold
-    # This is handled by auto_merge_high_confidence_candidates which queries for pending
-    # We could add age filtering here if needed, but for now the batch processing
-    # handles rate limiting
+    return _drain_auto_merge_candidates(max_age_minutes=max_age_minutes, batch_size=batch_size)
 
-    stats = merge_service.auto_merge_high_confidence_candidates(
-        run_id=None,  # Process all runs
-        dry_run=False,
-        batch_size=batch_size,
+
+def _drain_auto_merge_candidates(*, max_age_minutes: int, batch_size: int | None) -> dict[str, Any]:
+    from flask_app.importer.pipeline.auto_merge import AutoMergeStats, AutoMergeWorker
+    from flask_app.importer.pipeline.merge_service import MergeService
+
+    if not current_app.config.get("FUZZY_AUTO_MERGE_ENABLED", True):
+        return AutoMergeStats().to_dict()
+
+    worker = AutoMergeWorker(
+        MergeService(),
+        claim_size=batch_size,
+        created_before=datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes),
     )
+    stats = worker.drain(max_seconds=current_app.config.get("FUZZY_AUTO_MERGE_WORKER_SECONDS", 600)).to_dict()
 
     current_app.logger.info(
-        "Auto-merge background task completed",
+        "Auto-merge worker completed",
         extra={
-            "processed": stats.get("processed", 0),
-            "merged": stats.get("merged", 0),
-            "skipped": stats.get("skipped", 0),
-            "errors": stats.get("errors", 0),
+            "processed": stats["processed"],
+            "merged": stats["merged"],
+            "skipped": stats["skipped"],
+            "errors": stats["errors"],
+            "conflicts": stats["conflicts"],
+            "merges_per_second": stats["merges_per_second"],
         },
     )
 
@@ -258,9 +519,13 @@ def ingest_salesforce_contacts(
     run_id: int,
     dry_run: bool = False,
     record_limit: int | None = None,
+    from_stage: str | None = None,
 ) -> dict[str, object]:
     """
     Execute the Salesforce contact ingest pipeline via the importer worker.
+
+    Like ``ingest_csv``, checkpointed stages are skipped on a retry, so a run
+    that failed after staging does not extract from Salesforce again.
     """
 
     run = db.session.get(ImportRun, run_id)
@@ -286,28 +551,39 @@ def ingest_salesforce_contacts(
         db.session.flush()
 
     try:
-        client = create_salesforce_client()
-        extractor = SalesforceExtractor(
-            client=client,
-            batch_size=batch_size,
-            poll_interval=5.0,
-            poll_timeout=900.0,
-            logger=current_app.logger,
-        )
-        summary = run_salesforce_ingest(
-            import_run=run,
-            extractor=extractor,
-            watermark=watermark,
-            staging_batch_size=500,
-            dry_run=dry_run,
-            logger=current_app.logger,
-            record_limit=record_limit,
-        )
+        checkpoints = StageCheckpoints(run, from_stage=from_stage, dry_run=dry_run)
+
+        def _stage_contacts() -> SalesforceIngestSummary:
+            client = create_salesforce_client()
+            extractor = SalesforceExtractor(
+                client=client,
+                batch_size=batch_size,
+                poll_interval=5.0,
+                poll_timeout=900.0,
+                logger=current_app.logger,
+            )
+            return run_salesforce_ingest(
+                import_run=run,
+                extractor=extractor,
+                watermark=watermark,
+                staging_batch_size=500,
+                dry_run=dry_run,
+                logger=current_app.logger,
+                record_limit=record_limit,
+            )
+
+        summary = checkpoints.run("staging", SalesforceIngestSummary, _stage_contacts)
 
         # Run DQ validation and clean promotion (same as CSV pipeline)
-        dq_summary = run_minimal_dq(run, dry_run=dry_run, csv_rows=None)
-        clean_summary = promote_clean_volunteers(run, dry_run=dry_run)
-        fuzzy_summary = generate_fuzzy_candidates(run, dry_run=dry_run)
+        dq_summary = checkpoints.run(
+            "dq", DQProcessingSummary, lambda: run_minimal_dq(run, dry_run=dry_run, csv_rows=None)
+        )
+        clean_summary = checkpoints.run(
+            "clean", CleanPromotionSummary, lambda: promote_clean_volunteers(run, dry_run=dry_run)
+        )
+        fuzzy_summary = checkpoints.run(
+            "fuzzy", FuzzyCandidateSummary, lambda: generate_fuzzy_candidates(run, dry_run=dry_run)
+        )
 
         if dry_run:
             counters = LoaderCounters()
@@ -337,6 +613,7 @@ def ingest_salesforce_contacts(
             duplicate_emails=(),  # Salesforce loader doesn't track duplicate emails
             dry_run=dry_run,
         )
+        checkpoints.complete("core", core_summary)
 
         # Persist idempotency summary (includes DQ and clean summaries)
         persist_idempotency_summary(
@@ -347,7 +624,6 @@ def ingest_salesforce_contacts(
                 rows_skipped_blank=0,
                 header=summary.header,
                 dry_run=summary.dry_run,
-                dry_run_rows=(),
             ),
             dq_summary=dq_summary,
             clean_summary=clean_summary,
@@ -503,7 +779,6 @@ def ingest_salesforce_affiliations(
                 rows_skipped_blank=0,
                 header=summary.header,
                 dry_run=summary.dry_run,
-                dry_run_rows=(),
             ),
             dq_summary=dq_summary,
             clean_summary=clean_summary,
@@ -649,7 +924,6 @@ def ingest_salesforce_accounts(
                 rows_skipped_blank=0,
                 header=summary.header,
                 dry_run=summary.dry_run,
-                dry_run_rows=(),
             ),
             dq_summary=dq_summary,
             clean_summary=clean_summary,
@@ -794,7 +1068,6 @@ def ingest_salesforce_sessions(
                 rows_skipped_blank=0,
                 header=summary.header,
                 dry_run=summary.dry_run,
-                dry_run_rows=(),
             ),
             dq_summary=dq_summary,
             clean_summary=clean_summary,
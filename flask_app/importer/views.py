@@ -13,6 +13,7 @@ from flask_login import current_user
 from sqlalchemy.exc import NoResultFound
 
 from config.monitoring import ImporterMonitoring
+from flask_app.importer.pipeline.checkpoints import completed_stages
 from flask_app.importer.pipeline.dq_service import DataQualityViolationService, ViolationFilters
 from flask_app.importer.pipeline.run_service import ImportRunService, RunFilters
 from flask_app.importer.pipeline.skip_service import ImportSkipService, SkipSummary
@@ -216,12 +217,21 @@ def _serialize_detail(run, *, summary):
         "notes": run.notes,
         "anomaly_flags": run.anomaly_flags or {},
         "ingest_params": run.ingest_params_json or {},
+        "completed_stages": completed_stages(run),
         "triggered_by": summary.triggered_by,
         "retry_available": summary.can_retry,
         "download_available": summary.can_retry,
+        "dq_rule_profile": _serialize_dq_rule_profile(run.metrics_json or {}),
     }
 
 
+def _serialize_dq_rule_profile(metrics_json: dict) -> list[dict]:
+    """Per-rule DQ timings from ``metrics_json['dq']['rule_profile']``, slowest rule first."""
+    profile = (metrics_json.get("dq") or {}).get("rule_profile") or {}
+    rows = [{"rule_code": rule_code, **stats} for rule_code, stats in profile.items()]
+    return sorted(rows, key=lambda row: row.get("total_ms", 0), reverse=True)
+
+
 def _split_csv(value: str | None):
     if value in (None, "", ()):
         return ()
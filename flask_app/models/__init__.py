@@ -60,6 +60,7 @@ from .importer import (
     DataQualityStatus,
     DataQualityViolation,
     DedupeDecision,
+    DedupeQueueCounter,
     DedupeSuggestion,
     ExternalIdMap,
     ImporterWatermark,
@@ -147,6 +148,7 @@ __all__ = [
     "DataQualityViolation",
     "DataQualitySeverity",
     "DataQualityStatus",
+    "DedupeQueueCounter",
     "DedupeSuggestion",
     "DedupeDecision",
     "ExternalIdMap",
@@ -5,6 +5,7 @@ These models back the IMP-2 base schema: runs, staging, violations, dedupe,
 external ID mapping, merge history, and change history.
 """
 
+from . import dedupe_counters  # noqa: F401  (registers the counter flush hooks)
 from .schema import (
     ChangeLogEntry,
     CleanEvent,
@@ -14,6 +15,7 @@ from .schema import (
     DataQualityStatus,
     DataQualityViolation,
     DedupeDecision,
+    DedupeQueueCounter,
     DedupeSuggestion,
     ExternalIdMap,
     ImporterWatermark,
@@ -36,6 +38,7 @@ __all__ = [
     "DataQualitySeverity",
     "DataQualityStatus",
     "DedupeDecision",
+    "DedupeQueueCounter",
     "DedupeSuggestion",
     "ExternalIdMap",
     "ImportRun",
@@ -0,0 +1,213 @@
+"""
+Incrementally maintained ``dedupe_queue_counters`` rollup.
+
+The dedupe review dashboard used to count ``dedupe_suggestions`` on every load.
+Instead, every ORM flush that creates, re-decides or deletes a suggestion folds
+its effect into ``dedupe_queue_counters`` (one row per decision, match type and
+creation hour) inside the same transaction, so the rollup commits or rolls back
+together with the suggestions it describes.
+
+Only suggestions with a ``primary_contact_id`` are counted, matching the review
+queue. Core ``UPDATE``/``DELETE`` statements and database cascades bypass the
+ORM and are not tracked; ``rebuild_dedupe_queue_counters`` recomputes the
+rollup from the suggestions and reports the drift it repaired.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import delete, event, inspect, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .schema import DedupeDecision, DedupeQueueCounter, DedupeSuggestion
+
+CounterKey = tuple[DedupeDecision, str, datetime]
+
+_PENDING_DELTAS_KEY = "dedupe_queue_counter_deltas"
+REBUILD_BATCH_SIZE = 5000
+
+
+@dataclass
+class CounterRepairSummary:
+    """Result of recomputing ``dedupe_queue_counters`` from the suggestions."""
+
+    rows_before: int = 0
+    rows_after: int = 0
+    drift: dict[CounterKey, tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def drifted(self) -> bool:
+        return bool(self.drift)
+
+
+def counter_hour(value: datetime | None) -> datetime:
+    """Truncate ``value`` to its UTC hour; naive values are treated as UTC and ``None`` as now."""
+
+    if value is None:
+        value = datetime.now(timezone.utc)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def counter_key(
+    decision: DedupeDecision | str | None,
+    match_type: str | None,
+    created_at: datetime | None,
+    primary_contact_id: int | None,
+) -> CounterKey | None:
+    if primary_contact_id is None or decision is None:
+        return None
+    return DedupeDecision(decision), match_type or "", counter_hour(created_at)
+
+
+def apply_counter_deltas(connection: Any, deltas: dict[CounterKey, int]) -> None:
+    """Add ``deltas`` to the counter rows, creating missing rows, in one statement where the dialect allows."""
+
+    params = [
+        {"decision": decision, "match_type": match_type, "created_hour": hour, "suggestion_count": delta}
+        for (decision, match_type, hour), delta in deltas.items()
+        if delta
+    ]
+    if not params:
+        return
+    table = DedupeQueueCounter.__table__
+    now = datetime.now(timezone.utc)
+    dialect = connection.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        stmt = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.decision, table.c.match_type, table.c.created_hour],
+            set_={
+                "suggestion_count": table.c.suggestion_count + stmt.excluded.suggestion_count,
+                "updated_at": now,
+            },
+        )
+        connection.execute(stmt, params)
+        return
+    for row in params:
+        result = connection.execute(
+            update(table)
+            .where(
+                table.c.decision == row["decision"],
+                table.c.match_type == row["match_type"],
+                table.c.created_hour == row["created_hour"],
+            )
+            .values(suggestion_count=table.c.suggestion_count + row["suggestion_count"], updated_at=now)
+        )
+        if not result.rowcount:
+            connection.execute(insert(table), row)
+
+
+def rebuild_dedupe_queue_counters(session: Session, *, dry_run: bool = False) -> CounterRepairSummary:
+    """Recompute the rollup from ``dedupe_suggestions``, replacing the stored rows unless ``dry_run``."""
+
+    expected: Counter[CounterKey] = Counter()
+    rows = session.execute(
+        select(DedupeSuggestion.decision, DedupeSuggestion.match_type, DedupeSuggestion.created_at)
+        .where(DedupeSuggestion.primary_contact_id.isnot(None))
+        .execution_options(yield_per=REBUILD_BATCH_SIZE)
+    )
+    for decision, match_type, created_at in rows:
+        expected[(DedupeDecision(decision), match_type or "", counter_hour(created_at))] += 1
+
+    stored: dict[CounterKey, int] = {}
+    for decision, match_type, hour, count in session.execute(
+        select(
+            DedupeQueueCounter.decision,
+            DedupeQueueCounter.match_type,
+            DedupeQueueCounter.created_hour,
+            DedupeQueueCounter.suggestion_count,
+        )
+    ):
+        key = (DedupeDecision(decision), match_type, counter_hour(hour))
+        stored[key] = stored.get(key, 0) + count
+
+    summary = CounterRepairSummary(rows_before=len(stored), rows_after=len(expected))
+    for key in stored.keys() | expected.keys():
+        if stored.get(key, 0) != expected.get(key, 0):
+            summary.drift[key] = (stored.get(key, 0), expected.get(key, 0))
+
+    if summary.drifted and not dry_run:
+        session.execute(delete(DedupeQueueCounter))
+        session.flush()
+        apply_counter_deltas(session.connection(), dict(expected))
+    return summary
+
+
+_KEY_ATTRIBUTES = ("decision", "match_type", "created_at", "primary_contact_id")
+
+
+def _suggestion_key(obj: DedupeSuggestion) -> CounterKey | None:
+    return counter_key(obj.decision, obj.match_type, obj.created_at, obj.primary_contact_id)
+
+
+def _previous_key(session: Session, obj: DedupeSuggestion) -> CounterKey | None:
+    state = inspect(obj)
+    values = {}
+    for name in _KEY_ATTRIBUTES:
+        history = state.attrs[name].history
+        previous = history.deleted or history.unchanged
+        if not previous and history.added:
+            # Assigned while expired, so the old value was never loaded; the row still holds it.
+            row = session.execute(
+                select(*(getattr(DedupeSuggestion, key) for key in _KEY_ATTRIBUTES)).where(
+                    DedupeSuggestion.id == obj.id
+                )
+            ).one()
+            return counter_key(*row)
+        values[name] = previous[0] if previous else getattr(obj, name)
+    return counter_key(**values)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_counter_changes(session: Session, flush_context: Any, instances: Any) -> None:
+    # Deleted and re-decided rows still hold their previous values until the flush writes.
+    deltas: Counter[CounterKey] = Counter()
+    for obj in session.deleted:
+        if isinstance(obj, DedupeSuggestion):
+            key = _suggestion_key(obj)
+            if key is not None:
+                deltas[key] -= 1
+    for obj in session.dirty:
+        if not isinstance(obj, DedupeSuggestion):
+            continue
+        state = inspect(obj)
+        if not any(state.attrs[name].history.has_changes() for name in _KEY_ATTRIBUTES):
+            continue
+        old_key = _previous_key(session, obj)
+        new_key = _suggestion_key(obj)
+        if old_key == new_key:
+            continue
+        if old_key is not None:
+            deltas[old_key] -= 1
+        if new_key is not None:
+            deltas[new_key] += 1
+    session.info[_PENDING_DELTAS_KEY] = deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _update_dedupe_queue_counters(session: Session, flush_context: Any) -> None:
+    # New rows are counted after the flush so column defaults (decision, created_at) are populated.
+    deltas: Counter[CounterKey] = session.info.pop(_PENDING_DELTAS_KEY, None) or Counter()
+    for obj in session.new:
+        if isinstance(obj, DedupeSuggestion):
+            key = _suggestion_key(obj)
+            if key is not None:
+                deltas[key] += 1
+    if deltas:
+        apply_counter_deltas(session.connection(), dict(deltas))
+
+
+__all__ = [
+    "CounterRepairSummary",
+    "apply_counter_deltas",
+    "counter_hour",
+    "counter_key",
+    "rebuild_dedupe_queue_counters",
+]
@@ -0,0 +1,84 @@
+"""
+Compact storage for ``MergeLog`` before/after snapshots.
+
+A merge snapshot pairs the surviving record after the merge with the state
+before it: the primary record and the candidate (or staging payload) that was
+folded in. Most fields are identical across those documents, so only the
+surviving record is stored in full. Every other document is stored as a
+field-level diff against it, and the whole payload is zlib-compressed into
+``merge_log.snapshot_data``.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any
+
+SNAPSHOT_FORMAT_VERSION = 1
+_SURVIVOR_KEY = "primary"
+
+
+def diff_fields(base: dict[str, Any], target: dict[str, Any]) -> dict[str, Any]:
+    """Return the changes that turn ``base`` into ``target``."""
+
+    changed = {key: value for key, value in target.items() if key not in base or base[key] != value}
+    diff: dict[str, Any] = {"set": changed}
+    unset = [key for key in base if key not in target]
+    if unset:
+        diff["unset"] = unset
+    return diff
+
+
+def apply_fields(base: dict[str, Any], diff: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild the ``target`` that ``diff_fields(base, target)`` described."""
+
+    unset = set(diff.get("unset", ()))
+    document = {key: value for key, value in base.items() if key not in unset}
+    document.update(diff.get("set", {}))
+    return document
+
+
+def pack_merge_snapshots(before: dict[str, Any] | None, after: dict[str, Any] | None) -> bytes | None:
+    """Encode the before/after snapshots as diffs against the surviving record, compressed."""
+
+    if before is None and after is None:
+        return None
+    survivor = dict((after or {}).get(_SURVIVOR_KEY) or {})
+    payload = {
+        "v": SNAPSHOT_FORMAT_VERSION,
+        "survivor": survivor,
+        "after": None if after is None else _diff_sections(after, survivor),
+        "before": None if before is None else _diff_sections(before, survivor),
+    }
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+
+def unpack_merge_snapshots(data: bytes) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Decode ``pack_merge_snapshots`` output back into ``(before, after)``."""
+
+    payload = json.loads(zlib.decompress(data).decode("utf-8"))
+    if payload.get("v") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported merge snapshot format: {payload.get('v')!r}")
+    survivor = payload["survivor"]
+    before = None if payload["before"] is None else _apply_sections(payload["before"], survivor)
+    after = None if payload["after"] is None else _apply_sections(payload["after"], survivor)
+    return before, after
+
+
+def _diff_sections(snapshot: dict[str, Any], survivor: dict[str, Any]) -> dict[str, Any]:
+    # Non-dict sections are not field maps, so they are kept as-is.
+    return {
+        name: {"diff": diff_fields(survivor, section)} if isinstance(section, dict) else {"value": section}
+        for name, section in snapshot.items()
+    }
+
+
+def _apply_sections(sections: dict[str, Any], survivor: dict[str, Any]) -> dict[str, Any]:
+    return {
+        name: apply_fields(survivor, section["diff"]) if "diff" in section else section["value"]
+        for name, section in sections.items()
+    }
+
+
+__all__ = ["apply_fields", "diff_fields", "pack_merge_snapshots", "unpack_merge_snapshots"]
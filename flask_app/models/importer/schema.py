@@ -11,10 +11,11 @@ from __future__ import annotations
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import CheckConstraint, Enum, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import CheckConstraint, Enum, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..base import BaseModel, db
+from .merge_snapshots import pack_merge_snapshots, unpack_merge_snapshots
 
 
 class ImportRunStatus(str, enum.Enum):
@@ -66,6 +67,11 @@ class ImportRun(BaseModel):
         nullable=True,
         comment="Latest source updated-at observed during the run for freshness tracking.",
     )
+    stage_checkpoints_json: Mapped[dict | None] = mapped_column(
+        db.JSON,
+        nullable=True,
+        comment="Completed pipeline stages with their summaries, used to resume retries.",
+    )
 
     triggered_by_user = relationship("User", foreign_keys=[triggered_by_user_id])
     staging_rows = relationship(
@@ -163,6 +169,7 @@ class StagingRecordStatus(str, enum.Enum):
     VALIDATED = "validated"
     QUARANTINED = "quarantined"
     LOADED = "loaded"
+    UNCHANGED = "unchanged"
 
 
 class StagingVolunteer(BaseModel):
@@ -188,6 +195,8 @@ class StagingVolunteer(BaseModel):
     payload_json: Mapped[dict] = mapped_column(db.JSON, nullable=False)
     normalized_json: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
     checksum: Mapped[str | None] = mapped_column(db.String(64), nullable=True, index=True)
+    source_modstamp: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    source_last_modified: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
     status: Mapped[StagingRecordStatus] = mapped_column(
         Enum(StagingRecordStatus, name="staging_volunteer_status_enum"),
         default=StagingRecordStatus.LANDED,
@@ -235,6 +244,11 @@ class StagingVolunteer(BaseModel):
             "external_system",
             "external_id",
         ),
+        Index(
+            "idx_staging_volunteers_run_modstamp",
+            "run_id",
+            "source_modstamp",
+        ),
         UniqueConstraint(
             "run_id",
             "sequence_number",
@@ -266,6 +280,8 @@ class StagingOrganization(BaseModel):
     payload_json: Mapped[dict] = mapped_column(db.JSON, nullable=False)
     normalized_json: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
     checksum: Mapped[str | None] = mapped_column(db.String(64), nullable=True, index=True)
+    source_modstamp: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    source_last_modified: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
     status: Mapped[StagingRecordStatus] = mapped_column(
         Enum(StagingRecordStatus, name="staging_organization_status_enum"),
         default=StagingRecordStatus.LANDED,
@@ -308,6 +324,11 @@ class StagingOrganization(BaseModel):
             "external_system",
             "external_id",
         ),
+        Index(
+            "idx_staging_organizations_run_modstamp",
+            "run_id",
+            "source_modstamp",
+        ),
         UniqueConstraint(
             "run_id",
             "sequence_number",
@@ -339,6 +360,8 @@ class StagingAffiliation(BaseModel):
     payload_json: Mapped[dict] = mapped_column(db.JSON, nullable=False)
     normalized_json: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
     checksum: Mapped[str | None] = mapped_column(db.String(64), nullable=True, index=True)
+    source_modstamp: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    source_last_modified: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
     status: Mapped[StagingRecordStatus] = mapped_column(
         Enum(StagingRecordStatus, name="staging_affiliation_status_enum"),
         default=StagingRecordStatus.LANDED,
@@ -381,6 +404,11 @@ class StagingAffiliation(BaseModel):
             "external_system",
             "external_id",
         ),
+        Index(
+            "idx_staging_affiliations_run_modstamp",
+            "run_id",
+            "source_modstamp",
+        ),
         UniqueConstraint(
             "run_id",
             "sequence_number",
@@ -412,6 +440,8 @@ class StagingEvent(BaseModel):
     payload_json: Mapped[dict] = mapped_column(db.JSON, nullable=False)
     normalized_json: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
     checksum: Mapped[str | None] = mapped_column(db.String(64), nullable=True, index=True)
+    source_modstamp: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    source_last_modified: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
     status: Mapped[StagingRecordStatus] = mapped_column(
         Enum(StagingRecordStatus, name="staging_event_status_enum"),
         default=StagingRecordStatus.LANDED,
@@ -454,6 +484,11 @@ class StagingEvent(BaseModel):
             "external_system",
             "external_id",
         ),
+        Index(
+            "idx_staging_events_run_modstamp",
+            "run_id",
+            "source_modstamp",
+        ),
         UniqueConstraint(
             "run_id",
             "sequence_number",
@@ -854,6 +889,10 @@ class DedupeDecision(str, enum.Enum):
     DEFERRED = "deferred"
 
 
+def _not_postgresql(ddl, target, bind, dialect=None, **kwargs) -> bool:
+    return dialect is None or dialect.name != "postgresql"
+
+
 class DedupeSuggestion(BaseModel):
     """Candidate duplicate matches surfaced during imports."""
 
@@ -901,6 +940,14 @@ class DedupeSuggestion(BaseModel):
         ForeignKey("users.id"),
         nullable=True,
     )
+    # Set while an auto-merge worker holds the suggestion; see importer.pipeline.auto_merge.
+    claim_token: Mapped[str | None] = mapped_column(db.String(32), nullable=True, index=True)
+    claimed_at: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    comparison_json: Mapped[dict | None] = mapped_column(
+        db.JSON,
+        nullable=True,
+        comment="Cached side-by-side comparison for the review UI, stamped with both contacts' updated_at.",
+    )
 
     import_run = relationship("ImportRun", back_populates="dedupe_suggestions")
     staging_row = relationship("StagingVolunteer", back_populates="dedupe_suggestions")
@@ -910,6 +957,22 @@ class DedupeSuggestion(BaseModel):
 
     __table_args__ = (
         Index("idx_dedupe_suggestions_run_decision", "run_id", "decision"),
+        # Backs the review queue's keyset pages (ORDER BY score DESC NULLS LAST, id). SQLite
+        # already sorts NULLs last under DESC and rejects NULLS LAST in index definitions.
+        Index(
+            "idx_dedupe_suggestions_review_keyset",
+            "decision",
+            "match_type",
+            text("score DESC NULLS LAST"),
+            "id",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_dedupe_suggestions_review_keyset",
+            "decision",
+            "match_type",
+            text("score DESC"),
+            "id",
+        ).ddl_if(callable_=_not_postgresql),
         UniqueConstraint(
             "run_id",
             "primary_contact_id",
@@ -919,6 +982,35 @@ class DedupeSuggestion(BaseModel):
     )
 
 
+class DedupeQueueCounter(BaseModel):
+    """Rollup of dedupe suggestion counts by decision, match type and creation hour."""
+
+    __tablename__ = "dedupe_queue_counters"
+
+    id: Mapped[int] = mapped_column(db.Integer, primary_key=True, autoincrement=True)
+    decision: Mapped[DedupeDecision] = mapped_column(
+        Enum(DedupeDecision, name="dedupe_decision_enum"),
+        nullable=False,
+    )
+    # Empty string stands in for suggestions without a match type so the key stays unique.
+    match_type: Mapped[str] = mapped_column(db.String(32), nullable=False, default="")
+    created_hour: Mapped[datetime] = mapped_column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        comment="Suggestion created_at truncated to the hour (UTC).",
+    )
+    suggestion_count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "decision",
+            "match_type",
+            "created_hour",
+            name="uq_dedupe_queue_counters_key",
+        ),
+    )
+
+
 class ExternalIdMap(BaseModel):
     """Maps external IDs to internal entities to support idempotency."""
 
@@ -944,6 +1036,7 @@ class ExternalIdMap(BaseModel):
     deactivated_at: Mapped[datetime | None] = mapped_column(db.DateTime(timezone=True), nullable=True)
     upstream_deleted_reason: Mapped[str | None] = mapped_column(db.String(255), nullable=True)
     metadata_json: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
+    last_loaded_checksum: Mapped[str | None] = mapped_column(db.String(64), nullable=True)
 
     import_run = relationship("ImportRun", back_populates="external_ids")
 
@@ -972,18 +1065,23 @@ class ExternalIdMap(BaseModel):
         *,
         run_id: int | None = None,
         seen_at: datetime | None = None,
+        checksum: str | None = None,
     ) -> None:
         """
         Update bookkeeping for an external identifier that was observed again.
 
         If the identifier had been soft-deleted previously, it is automatically
         reactivated so downstream consumers do not treat the record as removed.
+        ``checksum`` records the staging checksum of the payload that was loaded,
+        letting later runs skip rows whose normalized payload is unchanged.
         """
 
         now = seen_at or datetime.now(timezone.utc)
         self.last_seen_at = now
         if run_id is not None:
             self.run_id = run_id
+        if checksum is not None:
+            self.last_loaded_checksum = checksum
         if not self.is_active:
             self.is_active = True
             self.deactivated_at = None
@@ -1034,9 +1132,20 @@ class MergeLog(BaseModel):
     )
     decision_type: Mapped[str] = mapped_column(db.String(50), nullable=False, default="manual")
     reason: Mapped[str | None] = mapped_column(db.Text, nullable=True)
-    snapshot_before: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
-    snapshot_after: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
+    # Uncompressed snapshots written before snapshot_data existed; read through snapshot_before/after.
+    legacy_snapshot_before: Mapped[dict | None] = mapped_column("snapshot_before", db.JSON, nullable=True)
+    legacy_snapshot_after: Mapped[dict | None] = mapped_column("snapshot_after", db.JSON, nullable=True)
+    snapshot_data: Mapped[bytes | None] = mapped_column(
+        db.LargeBinary,
+        nullable=True,
+        comment="zlib-compressed before/after snapshots stored as field diffs against the surviving record.",
+    )
     undo_payload: Mapped[dict | None] = mapped_column(db.JSON, nullable=True)
+    original_merge_log_id: Mapped[int | None] = mapped_column(
+        ForeignKey("merge_log.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="For undo entries, the merge log entry that was undone.",
+    )
     metadata_json: Mapped[dict | None] = mapped_column(
         db.JSON,
         nullable=True,
@@ -1051,8 +1160,36 @@ class MergeLog(BaseModel):
     __table_args__ = (
         Index("idx_merge_log_primary_contact", "primary_contact_id"),
         Index("idx_merge_log_run", "run_id"),
+        # A merge can be undone once; this also makes the already-undone check one index probe.
+        Index("uq_merge_log_original_merge_log", "original_merge_log_id", unique=True),
     )
 
+    @property
+    def snapshot_before(self) -> dict | None:
+        return self._snapshots()[0]
+
+    @snapshot_before.setter
+    def snapshot_before(self, value: dict | None) -> None:
+        self._store_snapshots(value, self.snapshot_after)
+
+    @property
+    def snapshot_after(self) -> dict | None:
+        return self._snapshots()[1]
+
+    @snapshot_after.setter
+    def snapshot_after(self, value: dict | None) -> None:
+        self._store_snapshots(self.snapshot_before, value)
+
+    def _snapshots(self) -> tuple[dict | None, dict | None]:
+        if self.snapshot_data is not None:
+            return unpack_merge_snapshots(self.snapshot_data)
+        return self.legacy_snapshot_before, self.legacy_snapshot_after
+
+    def _store_snapshots(self, before: dict | None, after: dict | None) -> None:
+        self.snapshot_data = pack_merge_snapshots(before, after)
+        self.legacy_snapshot_before = None
+        self.legacy_snapshot_after = None
+
 
 class ChangeLogEntry(BaseModel):
     """Field-level change history for importer-driven updates."""
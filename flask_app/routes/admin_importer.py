@@ -31,6 +31,7 @@ from config.survivorship import load_profile
 from flask_app.importer import get_adapter_readiness
 from flask_app.importer.celery_app import DEFAULT_QUEUE_NAME, get_celery_app
 from flask_app.importer.mapping import MappingLoadError, get_active_salesforce_mapping
+from flask_app.importer.pipeline.checkpoints import prepare_run_retry
 from flask_app.importer.pipeline.dq_service import (
     DataQualityViolationService,
     RemediationConflict,
@@ -945,13 +946,8 @@ def _retry_import_run_admin(run: ImportRun) -> tuple[str, str]:
     dry_run = params.get("dry_run", False)
     keep_file = params.get("keep_file", True)
 
-    # Reset run state for retry
-    run.status = ImportRunStatus.PENDING
-    run.started_at = None
-    run.finished_at = None
-    run.error_summary = None
-    run.counts_json = {}
-    run.metrics_json = {}
+    # Reset run state for retry; the task resumes from the first incomplete pipeline stage
+    prepare_run_retry(run)
     run.dry_run = bool(dry_run)
     db.session.commit()
 
@@ -1132,6 +1128,31 @@ def importer_dedupe_review_queue():
     if offset < 0:
         return jsonify({"error": "offset must be non-negative."}), HTTPStatus.BAD_REQUEST
 
+    # Keyset mode: pass `cursor` (empty for the first page) and follow `next_cursor`.
+    cursor = request.args.get("cursor")
+    if cursor is not None:
+        try:
+            page = _merge_service.get_review_queue_page(
+                status=status,
+                match_type=match_type,
+                run_id=run_id,
+                limit=limit,
+                cursor=cursor or None,
+            )
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), HTTPStatus.BAD_REQUEST
+        except Exception as exc:
+            current_app.logger.exception("Failed to fetch dedupe review queue", exc_info=exc)
+            return jsonify({"error": "Failed to fetch review queue."}), HTTPStatus.INTERNAL_SERVER_ERROR
+        result = {
+            "candidates": [row.to_dict() for row in page.rows],
+            "total": page.total,
+            "limit": limit,
+            "cursor": cursor,
+            "next_cursor": page.next_cursor,
+        }
+        return jsonify(result), HTTPStatus.OK
+
     try:
         candidates, total = _merge_service.get_review_queue(
             status=status,
@@ -1239,6 +1260,8 @@ def importer_dedupe_candidate_details(candidate_id: int):
 
     try:
         details = _merge_service.get_candidate_details(candidate_id)
+        # Persist the comparison cache built on first view.
+        db.session.commit()
         result = {
             "suggestion_id": details.suggestion_id,
             "score": details.score,
@@ -1253,12 +1276,39 @@ def importer_dedupe_candidate_details(candidate_id: int):
         }
         return jsonify(result), HTTPStatus.OK
     except ValueError as exc:
+        db.session.rollback()
         return jsonify({"error": str(exc)}), HTTPStatus.NOT_FOUND
     except Exception as exc:
+        db.session.rollback()
         current_app.logger.exception("Failed to fetch candidate details", exc_info=exc)
         return jsonify({"error": "Failed to fetch candidate details."}), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@admin_importer_blueprint.post("/dedupe/candidates/prefetch")
+@login_required
+@permission_required("manage_imports", org_context=False)
+def importer_dedupe_prefetch_candidates():
+    """Warm the comparison cache for the candidates a reviewer will open next."""
+    if not _ensure_importer_enabled():
+        return jsonify({"error": "Importer is disabled."}), HTTPStatus.NOT_FOUND
+
+    payload = request.get_json(silent=True) or {}
+    candidate_ids = payload.get("candidate_ids") if isinstance(payload, dict) else None
+    if not isinstance(candidate_ids, list) or not all(isinstance(cid, int) for cid in candidate_ids):
+        return jsonify({"error": "candidate_ids must be a list of integers."}), HTTPStatus.BAD_REQUEST
+    if len(candidate_ids) > 20:
+        return jsonify({"error": "At most 20 candidates can be prefetched at once."}), HTTPStatus.BAD_REQUEST
+
+    try:
+        prefetched = _merge_service.prefetch_candidate_details(candidate_ids)
+        db.session.commit()
+        return jsonify({"prefetched": prefetched, "requested": len(candidate_ids)}), HTTPStatus.OK
+    except Exception as exc:
+        db.session.rollback()
+        current_app.logger.exception("Failed to prefetch candidate details", exc_info=exc)
+        return jsonify({"error": "Failed to prefetch candidate details."}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 @admin_importer_blueprint.post("/dedupe/candidates/<int:candidate_id>/merge")
 @login_required
 @permission_required("manage_imports", org_context=False)
@@ -0,0 +1,44 @@
+"""
+Migration script to add claim_token and claimed_at columns to dedupe_suggestions table.
+
+Auto-merge workers stamp the suggestions they are merging with these columns so
+several workers can drain the fuzzy_high backlog in parallel without taking the
+same suggestion.
+
+Run this script after deploying the code changes that add claim-based auto-merge.
+"""
+
+from flask_app import create_app
+from flask_app.models.base import db
+from sqlalchemy import text
+
+
+def add_dedupe_claim_columns():
+    """Add claim_token/claimed_at columns and the claim_token index to dedupe_suggestions if missing."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        columns = [col["name"] for col in inspector.get_columns("dedupe_suggestions")]
+        indexes = [index["name"] for index in inspector.get_indexes("dedupe_suggestions")]
+        timestamp_type = "TIMESTAMP WITH TIME ZONE" if db.engine.dialect.name == "postgresql" else "DATETIME"
+
+        if "claim_token" in columns and "claimed_at" in columns:
+            print("Columns claim_token and claimed_at already exist. Skipping migration.")
+            return
+
+        with db.engine.connect() as conn:
+            if "claim_token" not in columns:
+                conn.execute(text("ALTER TABLE dedupe_suggestions ADD COLUMN claim_token VARCHAR(32)"))
+            if "claimed_at" not in columns:
+                conn.execute(text(f"ALTER TABLE dedupe_suggestions ADD COLUMN claimed_at {timestamp_type}"))
+            if "ix_dedupe_suggestions_claim_token" not in indexes:
+                conn.execute(
+                    text("CREATE INDEX ix_dedupe_suggestions_claim_token ON dedupe_suggestions (claim_token)")
+                )
+            conn.commit()
+
+        print("Successfully added claim columns to dedupe_suggestions table.")
+
+
+if __name__ == "__main__":
+    add_dedupe_claim_columns()
@@ -0,0 +1,36 @@
+"""
+Migration script to add the comparison_json column to dedupe_suggestions table.
+
+The review UI's side-by-side comparison is cached in this column the first
+time a candidate is viewed (or prefetched) and rebuilt when either contact's
+updated_at changes. Existing suggestions fill it in lazily.
+
+Run this script after deploying the code changes that add the comparison cache.
+"""
+
+from flask_app import create_app
+from flask_app.models.base import db
+from sqlalchemy import text
+
+
+def add_dedupe_comparison_column():
+    """Add comparison_json column to dedupe_suggestions if missing."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        columns = [col["name"] for col in inspector.get_columns("dedupe_suggestions")]
+
+        if "comparison_json" in columns:
+            print("Column comparison_json already exists. Skipping migration.")
+            return
+
+        json_type = "JSONB" if db.engine.dialect.name == "postgresql" else "JSON"
+        with db.engine.connect() as conn:
+            conn.execute(text(f"ALTER TABLE dedupe_suggestions ADD COLUMN comparison_json {json_type}"))
+            conn.commit()
+
+        print("Successfully added comparison_json column to dedupe_suggestions table.")
+
+
+if __name__ == "__main__":
+    add_dedupe_comparison_column()
@@ -0,0 +1,36 @@
+"""
+Migration script to create the dedupe_queue_counters table and fill it from dedupe_suggestions.
+
+The dedupe review dashboard reads its queue statistics from this rollup, which
+is kept up to date on every flush that creates or re-decides a suggestion.
+Suggestions created before this change are counted by the initial rebuild.
+
+Run this script after deploying the code changes that add the counters. It is
+safe to re-run; ``flask importer repair-dedupe-counters`` performs the same
+rebuild on demand.
+"""
+
+from flask_app import create_app
+from flask_app.models.base import db
+from flask_app.models.importer.dedupe_counters import rebuild_dedupe_queue_counters
+from flask_app.models.importer.schema import DedupeQueueCounter
+
+
+def add_dedupe_queue_counters_table():
+    """Create dedupe_queue_counters if missing and rebuild it from the existing suggestions."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        if "dedupe_queue_counters" in inspector.get_table_names():
+            print("Table dedupe_queue_counters already exists. Skipping creation.")
+        else:
+            DedupeQueueCounter.__table__.create(db.engine)
+            print("Created dedupe_queue_counters table.")
+
+        summary = rebuild_dedupe_queue_counters(db.session)
+        db.session.commit()
+        print(f"Rebuilt dedupe queue counters: {summary.rows_after} buckets, {len(summary.drift)} corrected.")
+
+
+if __name__ == "__main__":
+    add_dedupe_queue_counters_table()
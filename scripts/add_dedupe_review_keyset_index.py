@@ -0,0 +1,40 @@
+"""
+Migration script to add the review-queue keyset index to dedupe_suggestions.
+
+The dedupe review queue pages with a (score, id) cursor filtered by decision
+and match type; this index lets each page start at the cursor instead of
+scanning and sorting the whole backlog.
+
+Run this script after deploying the code changes that add keyset pagination.
+"""
+
+from flask_app import create_app
+from flask_app.models.base import db
+from sqlalchemy import text
+
+INDEX_NAME = "idx_dedupe_suggestions_review_keyset"
+
+
+def add_dedupe_review_keyset_index():
+    """Create the (decision, match_type, score DESC, id) index on dedupe_suggestions if missing."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        indexes = [index["name"] for index in inspector.get_indexes("dedupe_suggestions")]
+        if INDEX_NAME in indexes:
+            print(f"Index {INDEX_NAME} already exists. Skipping migration.")
+            return
+
+        # PostgreSQL sorts NULLs first under DESC; SQLite sorts them last and rejects NULLS LAST here.
+        score_order = "score DESC NULLS LAST" if db.engine.dialect.name == "postgresql" else "score DESC"
+        with db.engine.connect() as conn:
+            conn.execute(
+                text(f"CREATE INDEX {INDEX_NAME} ON dedupe_suggestions (decision, match_type, {score_order}, id)")
+            )
+            conn.commit()
+
+        print(f"Successfully added {INDEX_NAME} to dedupe_suggestions table.")
+
+
+if __name__ == "__main__":
+    add_dedupe_review_keyset_index()
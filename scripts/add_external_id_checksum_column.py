@@ -0,0 +1,52 @@
+"""
+Migration script for checksum-based change detection.
+
+- Adds ``last_loaded_checksum`` to ``external_id_map`` (checksum of the staged
+  payload most recently loaded for each external identifier).
+- On PostgreSQL, adds the ``UNCHANGED`` value to the staging status enums.
+
+Run this script after deploying the code changes that add change detection.
+"""
+
+from flask_app import create_app
+from flask_app.models.base import db
+from sqlalchemy import text
+
+STAGING_STATUS_ENUMS = (
+    "staging_volunteer_status_enum",
+    "staging_organization_status_enum",
+    "staging_affiliation_status_enum",
+    "staging_event_status_enum",
+)
+
+
+def add_external_id_checksum_column():
+    """Add last_loaded_checksum to external_id_map and extend staging status enums."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        columns = [col["name"] for col in inspector.get_columns("external_id_map")]
+
+        with db.engine.connect() as conn:
+            if "last_loaded_checksum" in columns:
+                print("Column last_loaded_checksum already exists. Skipping column migration.")
+            else:
+                conn.execute(
+                    text(
+                        """
+                        ALTER TABLE external_id_map
+                        ADD COLUMN last_loaded_checksum VARCHAR(64)
+                        """
+                    )
+                )
+                print("Successfully added last_loaded_checksum column to external_id_map table.")
+
+            if db.engine.dialect.name == "postgresql":
+                for enum_name in STAGING_STATUS_ENUMS:
+                    conn.execute(text(f"ALTER TYPE {enum_name} ADD VALUE IF NOT EXISTS 'UNCHANGED'"))
+                print("Ensured UNCHANGED value on staging status enums.")
+            conn.commit()
+
+
+if __name__ == "__main__":
+    add_external_id_checksum_column()
@@ -0,0 +1,41 @@
+"""
+Migration script to add stage_checkpoints_json column to import_runs table.
+
+This column records each completed pipeline stage (staging, dq, clean, fuzzy,
+core) with its summary so retries can resume from the first incomplete stage.
+
+Run this script after deploying the code changes that add stage checkpoints.
+"""
+
+from flask_app import create_app
+from flask_app.models.base import db
+from sqlalchemy import text
+
+
+def add_stage_checkpoints_json_column():
+    """Add stage_checkpoints_json column to import_runs table if it doesn't exist."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        columns = [col["name"] for col in inspector.get_columns("import_runs")]
+
+        if "stage_checkpoints_json" in columns:
+            print("Column stage_checkpoints_json already exists. Skipping migration.")
+            return
+
+        with db.engine.connect() as conn:
+            conn.execute(
+                text(
+                    """
+                    ALTER TABLE import_runs
+                    ADD COLUMN stage_checkpoints_json JSON
+                    """
+                )
+            )
+            conn.commit()
+
+        print("Successfully added stage_checkpoints_json column to import_runs table.")
+
+
+if __name__ == "__main__":
+    add_stage_checkpoints_json_column()
@@ -0,0 +1,92 @@
+"""
+Migration script to add source_modstamp and source_last_modified columns to the staging tables.
+
+The Salesforce loaders advance their watermark with one MAX() over these
+columns instead of reading every staging row's normalized_json. Rows staged
+before this change are backfilled from normalized_json metadata.
+
+Run this script after deploying the code changes that add the columns.
+"""
+
+import json
+
+from flask_app import create_app
+from flask_app.importer.pipeline.staging_writer import parse_source_timestamp
+from flask_app.models.base import db
+from sqlalchemy import DateTime, bindparam, text
+
+STAGING_TABLES = ("staging_volunteers", "staging_organizations", "staging_affiliations", "staging_events")
+TIMESTAMP_COLUMNS = ("source_modstamp", "source_last_modified")
+BACKFILL_BATCH_SIZE = 5000
+
+
+def add_staging_source_modstamp_columns():
+    """Add the extracted timestamp columns and run/modstamp index to each staging table, then backfill them."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        timestamp_type = "TIMESTAMP WITH TIME ZONE" if db.engine.dialect.name == "postgresql" else "DATETIME"
+        for table in STAGING_TABLES:
+            columns = [col["name"] for col in inspector.get_columns(table)]
+            indexes = [index["name"] for index in inspector.get_indexes(table)]
+            with db.engine.connect() as conn:
+                for column in TIMESTAMP_COLUMNS:
+                    if column in columns:
+                        print(f"Column {table}.{column} already exists. Skipping.")
+                        continue
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {timestamp_type}"))
+                index_name = f"idx_{table}_run_modstamp"
+                if index_name not in indexes:
+                    conn.execute(text(f"CREATE INDEX {index_name} ON {table} (run_id, source_modstamp)"))
+                conn.commit()
+
+            backfilled = _backfill(table)
+            print(f"Added source timestamp columns to {table}; backfilled {backfilled} rows.")
+
+
+def _backfill(table: str) -> int:
+    """Populate the timestamp columns from normalized_json metadata for rows staged before the migration."""
+    backfilled = 0
+    last_id = 0
+    with db.engine.connect() as conn:
+        while True:
+            rows = conn.execute(
+                text(
+                    f"""
+                    SELECT id, normalized_json FROM {table}
+                    WHERE id > :last_id AND source_modstamp IS NULL AND source_last_modified IS NULL
+                    ORDER BY id LIMIT :limit
+                    """
+                ),
+                {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            updates = []
+            for row in rows:
+                normalized = row.normalized_json
+                if isinstance(normalized, str):
+                    normalized = json.loads(normalized)
+                metadata = (normalized or {}).get("metadata") or {}
+                values = {column: parse_source_timestamp(metadata.get(column)) for column in TIMESTAMP_COLUMNS}
+                if any(values.values()):
+                    updates.append({"id": row.id, **values})
+            if updates:
+                conn.execute(
+                    text(
+                        f"""
+                        UPDATE {table}
+                        SET source_modstamp = :source_modstamp, source_last_modified = :source_last_modified
+                        WHERE id = :id
+                        """
+                    ).bindparams(*(bindparam(column, type_=DateTime(timezone=True)) for column in TIMESTAMP_COLUMNS)),
+                    updates,
+                )
+                conn.commit()
+                backfilled += len(updates)
+    return backfilled
+
+
+if __name__ == "__main__":
+    add_staging_source_modstamp_columns()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Measure VolunteerCSVAdapter parsing throughput, serial versus parallel.
+
+Scales the golden volunteer dataset (``ops/testdata/importer_golden_dataset_v0``)
+to the requested row count with unique external IDs, writes it to a temporary
+file, and reports rows/sec for ``iter_rows`` in serial mode and with the
+parallel byte-range parser.
+
+Usage:
+    python scripts/benchmark_csv_ingest.py
+    python scripts/benchmark_csv_ingest.py --rows 200000 --workers 4 --chunk-mb 4 --verify
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from flask_app.importer.adapters import VolunteerCSVAdapter  # noqa: E402
+
+DEFAULT_DATASET = project_root / "ops" / "testdata" / "importer_golden_dataset_v0" / "volunteers_valid.csv"
+
+
+def build_dataset(source: Path, rows: int, destination: Path) -> int:
+    """Repeat ``source`` rows until ``rows`` are written; return the file size in bytes."""
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.DictReader(handle)
+        fieldnames = list(reader.fieldnames or ())
+        template = list(reader)
+    with destination.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        for index in range(rows):
+            row = dict(template[index % len(template)])
+            if "external_id" in row:
+                row["external_id"] = f"bench-{index:08d}"
+            writer.writerow(row)
+    return destination.stat().st_size
+
+
+def run_pass(path: Path, *, parallel: bool, workers: int, chunk_bytes: int) -> tuple[float, int, bool]:
+    started = time.perf_counter()
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        adapter = VolunteerCSVAdapter(
+            handle,
+            parallel_threshold_bytes=1 if parallel else None,
+            parallel_workers=workers,
+            parallel_chunk_bytes=chunk_bytes,
+        )
+        count = 0
+        for _ in adapter.iter_rows():
+            count += 1
+    elapsed = time.perf_counter() - started
+    return count / elapsed if elapsed else float("inf"), count, adapter.parallel_used
+
+
+def fingerprint(path: Path, *, parallel: bool, workers: int, chunk_bytes: int) -> list[tuple]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        adapter = VolunteerCSVAdapter(
+            handle,
+            parallel_threshold_bytes=1 if parallel else None,
+            parallel_workers=workers,
+            parallel_chunk_bytes=chunk_bytes,
+        )
+        return [(row.sequence_number, row.source_line, row.normalized) for row in adapter.iter_rows()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows to generate (default: 1000000).")
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET, help="Seed CSV to scale up.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parallel worker processes.")
+    parser.add_argument("--chunk-mb", type=float, default=4.0, help="Byte range size per worker task in MB.")
+    parser.add_argument("--verify", action="store_true", help="Also check serial and parallel rows are identical.")
+    args = parser.parse_args(argv)
+    chunk_bytes = max(1, int(args.chunk_mb * 1024 * 1024))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "volunteers_bench.csv"
+        size = build_dataset(args.dataset, args.rows, path)
+        print(f"dataset: {args.rows:,} rows, {size / 1024 / 1024:,.1f} MB")
+
+        serial_rate, serial_count, _ = run_pass(path, parallel=False, workers=1, chunk_bytes=chunk_bytes)
+        print(f"serial: {serial_rate:,.0f} rows/sec ({serial_count:,} rows)")
+        parallel_rate, parallel_count, used = run_pass(
+            path, parallel=True, workers=args.workers, chunk_bytes=chunk_bytes
+        )
+        mode = f"{args.workers} workers" if used else "fell back to serial"
+        print(f"parallel ({mode}): {parallel_rate:,.0f} rows/sec ({parallel_count:,} rows)")
+
+        if args.verify:
+            identical = fingerprint(path, parallel=False, workers=1, chunk_bytes=chunk_bytes) == fingerprint(
+                path, parallel=True, workers=args.workers, chunk_bytes=chunk_bytes
+            )
+            print(f"identical output: {identical}")
+            if not identical:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Measure DQ rule throughput, row-by-row evaluate versus evaluate_batch.
+
+Builds synthetic volunteer, organization, and event payloads (roughly 10% of
+them invalid), then reports rows/sec per rule for ``DQRule.evaluate`` called
+once per payload and for ``DQRule.evaluate_batch`` over batches of the size
+used by ``run_minimal_dq``. Rules that need the database (such as
+``AffiliationReferenceValidationRule``) are not included.
+
+Usage:
+    python scripts/benchmark_dq_rules.py
+    python scripts/benchmark_dq_rules.py --rows 500000 --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from flask_app.importer.pipeline.dq import (  # noqa: E402
+    DQ_BATCH_SIZE,
+    DQRule,
+    EmailFormatRule,
+    EmailOrPhoneRule,
+    EventDateValidationRule,
+    EventStartDateRequiredRule,
+    EventTitleRequiredRule,
+    OrganizationNameRequiredRule,
+    PhoneFormatRule,
+)
+
+
+def build_payloads(rows: int) -> list[dict[str, object | None]]:
+    payloads: list[dict[str, object | None]] = []
+    for index in range(rows):
+        invalid = index % 10 == 0
+        payloads.append(
+            {
+                "email": "broken-address" if invalid else f"volunteer{index}@example.org",
+                "phone": "555-0100" if invalid else f"+1415555{index % 10000:04d}",
+                "name": "" if invalid else f"Organization {index}",
+                "title": None if invalid else f"Event {index}",
+                "start_date": "2024-05-02T10:00:00Z",
+                "end_date": "2024-05-01T10:00:00Z" if invalid else "2024-05-02T12:00:00Z",
+            }
+        )
+    return payloads
+
+
+def run_row_by_row(rule: DQRule, payloads: list[dict[str, object | None]]) -> tuple[float, int]:
+    started = time.perf_counter()
+    violations = 0
+    for payload in payloads:
+        violations += len(list(rule.evaluate(payload)))
+    elapsed = time.perf_counter() - started
+    return len(payloads) / elapsed if elapsed else float("inf"), violations
+
+
+def run_batched(rule: DQRule, payloads: list[dict[str, object | None]], batch_size: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    violations = 0
+    for start in range(0, len(payloads), batch_size):
+        violations += len(rule.evaluate_batch(payloads[start : start + batch_size]))
+    elapsed = time.perf_counter() - started
+    return len(payloads) / elapsed if elapsed else float("inf"), violations
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000, help="Payloads to evaluate per rule (default: 200000).")
+    parser.add_argument("--batch-size", type=int, default=DQ_BATCH_SIZE, help="Payloads per evaluate_batch call.")
+    args = parser.parse_args(argv)
+
+    payloads = build_payloads(args.rows)
+    rules: list[DQRule] = [
+        EmailFormatRule(),
+        PhoneFormatRule(),
+        EmailOrPhoneRule(),
+        OrganizationNameRequiredRule(),
+        EventTitleRequiredRule(),
+        EventStartDateRequiredRule(),
+        EventDateValidationRule(),
+    ]
+    print(f"payloads: {args.rows:,}, batch size: {args.batch_size:,}")
+    print(f"{'rule':<28} {'row-by-row':>14} {'batched':>14} {'speedup':>8}")
+    for rule in rules:
+        row_rate, row_violations = run_row_by_row(rule, payloads)
+        batch_rate, batch_violations = run_batched(rule, payloads, args.batch_size)
+        if row_violations != batch_violations:
+            print(f"{rule.code}: violation counts differ ({row_violations} vs {batch_violations})")
+            return 1
+        print(f"{rule.code:<28} {row_rate:>10,.0f} r/s {batch_rate:>10,.0f} r/s {batch_rate / row_rate:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
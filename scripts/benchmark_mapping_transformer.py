@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Measure SalesforceMappingTransformer throughput on the bundled contact mapping.
+
+Generates synthetic Salesforce Contact payloads shaped like a Bulk API export
+(picklists, phones, dates, booleans, unmapped extras) and reports records/sec
+for the transformer with the mapping in ``config/mappings/salesforce_contact_v1.yaml``,
+both per record (``transform``) and per Bulk API sized batch (``transform_batch``).
+
+Usage:
+    python scripts/benchmark_mapping_transformer.py
+    python scripts/benchmark_mapping_transformer.py --records 200000 --repeat 5 --batch-size 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from flask_app.importer.mapping import SalesforceMappingTransformer, load_mapping  # noqa: E402
+
+DEFAULT_MAPPING = project_root / "config" / "mappings" / "salesforce_contact_v1.yaml"
+
+# Picklist values as exported from Salesforce: some hit the normalizers' direct
+# lookups, others fall through to the substring/regex matching paths.
+RACE_VALUES = (
+    "Black/African American",
+    "White/Caucasian/European American",
+    "Hispanic/Latino",
+    "Asian American/Pacific Islander",
+    "Bi-racial/Multi-racial/Multicultural",
+    "",
+    None,
+)
+EDUCATION_VALUES = (
+    "Bachelor's Degree",
+    "Master's",
+    "Associate Degree (AA/AS)",
+    "Doctorate (PhD, EdD)",
+    "Some College, No Degree",
+    "",
+    None,
+)
+AGE_VALUES = ("18-64", "25-34", "35-44", "55-64 years old", "65+", "", None)
+SKILL_VALUES = ("Mentoring;Public Speaking", "Coding;Data Analysis;Mentoring", "", None)
+
+
+def build_records(count: int, *, seed: int = 7) -> list[dict[str, object]]:
+    """Build ``count`` synthetic Contact payloads with a stable random seed."""
+    rng = random.Random(seed)
+    records: list[dict[str, object]] = []
+    for index in range(count):
+        records.append(
+            {
+                "Id": f"003{index:015d}",
+                "FirstName": rng.choice(("Ada", "Grace", "Alan", "Katherine", "Linus")),
+                "LastName": rng.choice(("Lovelace", "Hopper", "Turing", "Johnson", "Torvalds")),
+                "MiddleName": rng.choice(("", None, "Q")),
+                "Email": f"user{index}@example.org",
+                "npe01__HomeEmail__c": rng.choice(("", None, f"home{index}@example.org")),
+                "npe01__WorkEmail__c": None,
+                "npe01__Preferred_Email__c": rng.choice(("Personal", "Work", None)),
+                "MobilePhone": rng.choice(("(555) 010-1234", "555.010.9876", "", None)),
+                "HomePhone": None,
+                "Phone": "+1 555 010 4321",
+                "Title": rng.choice(("Engineer", "Teacher", "")),
+                "Gender__c": rng.choice(("Female", "Male", "Prefer not to say", None)),
+                "Birthdate": rng.choice(("1980-04-12", "1992-11-03", None)),
+                "Racial_Ethnic_Background__c": rng.choice(RACE_VALUES),
+                "Age_Group__c": rng.choice(AGE_VALUES),
+                "Highest_Level_of_Educational__c": rng.choice(EDUCATION_VALUES),
+                "Contact_Type__c": "Volunteer",
+                "AccountId": f"001{index % 500:015d}",
+                "Last_Mailchimp_Email_Date__c": "2024-03-01T10:00:00.000+0000",
+                "Last_Volunteer_Date__c": "2024-02-15",
+                "Number_of_Attended_Volunteer_Sessions__c": rng.randint(0, 40),
+                "Volunteer_Skills__c": rng.choice(SKILL_VALUES),
+                "MailingStreet": "1 Main St",
+                "MailingCity": "Kansas City",
+                "MailingState": "MO",
+                "MailingPostalCode": "64105",
+                "DoNotCall": rng.choice(("true", "false", None)),
+                "HasOptedOutOfEmail": rng.choice((True, False)),
+                "SystemModstamp": "2024-03-05T12:00:00.000Z",
+                "LastModifiedDate": "2024-03-05T12:00:00.000Z",
+                "IsDeleted": "false",
+                "attributes": {"type": "Contact"},
+                "Unmapped_Custom__c": rng.choice(("x", "", None)),
+            }
+        )
+    return records
+
+
+def run_benchmark(
+    mapping_path: Path, records: list[dict[str, object]], repeat: int, *, batch_size: int | None = None
+) -> float:
+    """Return the best observed records/sec across ``repeat`` passes."""
+    spec = load_mapping(mapping_path)
+    best = 0.0
+    for _ in range(repeat):
+        transformer = SalesforceMappingTransformer(spec)
+        started = time.perf_counter()
+        if batch_size:
+            for offset in range(0, len(records), batch_size):
+                for _ in transformer.transform_batch(records[offset : offset + batch_size]).results:
+                    pass
+        else:
+            for record in records:
+                transformer.transform(record)
+        elapsed = time.perf_counter() - started
+        best = max(best, len(records) / elapsed if elapsed else float("inf"))
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50000, help="Synthetic records per pass (default: 50000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes to run; the best is reported (default: 3).")
+    parser.add_argument("--mapping", type=Path, default=DEFAULT_MAPPING, help="Mapping YAML to benchmark.")
+    parser.add_argument(
+        "--batch-size", type=int, default=10000, help="Records per transform_batch call (default: 10000)."
+    )
+    args = parser.parse_args(argv)
+
+    records = build_records(args.records)
+    per_record = run_benchmark(args.mapping, records, args.repeat)
+    batched = run_benchmark(args.mapping, records, args.repeat, batch_size=args.batch_size)
+    print(f"mapping: {args.mapping.name}")
+    print(f"records per pass: {args.records}")
+    print(f"transform: {per_record:,.0f} records/sec")
+    print(f"transform_batch (batch size {args.batch_size}): {batched:,.0f} records/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
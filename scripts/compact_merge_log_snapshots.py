@@ -0,0 +1,131 @@
+"""
+Migration script to add snapshot_data and original_merge_log_id to merge_log and backfill them.
+
+MergeLog snapshots are now stored zlib-compressed as field diffs against the
+surviving record (snapshot_data), and undo entries link to the merge they
+undid through the indexed original_merge_log_id column. Existing undo entries
+are linked from their metadata_json, and existing snapshots are repacked in
+batches so their JSON columns can be cleared.
+
+Run this script after deploying the code changes that add the columns.
+"""
+
+import json
+
+from flask_app import create_app
+from flask_app.models.base import db
+from flask_app.models.importer.merge_snapshots import pack_merge_snapshots
+from sqlalchemy import LargeBinary, bindparam, text
+
+BATCH_SIZE = 1000
+
+
+def compact_merge_log_snapshots():
+    """Add the new merge_log columns and unique index if missing, then backfill both."""
+    app = create_app()
+    with app.app_context():
+        inspector = db.inspect(db.engine)
+        columns = [col["name"] for col in inspector.get_columns("merge_log")]
+        indexes = [index["name"] for index in inspector.get_indexes("merge_log")]
+        binary_type = "BYTEA" if db.engine.dialect.name == "postgresql" else "BLOB"
+
+        with db.engine.connect() as conn:
+            if "snapshot_data" not in columns:
+                conn.execute(text(f"ALTER TABLE merge_log ADD COLUMN snapshot_data {binary_type}"))
+            if "original_merge_log_id" not in columns:
+                conn.execute(
+                    text(
+                        "ALTER TABLE merge_log ADD COLUMN original_merge_log_id INTEGER "
+                        "REFERENCES merge_log(id) ON DELETE SET NULL"
+                    )
+                )
+            conn.commit()
+
+        linked = _link_undo_entries()
+        with db.engine.connect() as conn:
+            if "uq_merge_log_original_merge_log" not in indexes:
+                conn.execute(
+                    text("CREATE UNIQUE INDEX uq_merge_log_original_merge_log ON merge_log (original_merge_log_id)")
+                )
+                conn.commit()
+
+        compacted = _compact_snapshots()
+        print(f"Linked {linked} undo entries; compacted snapshots on {compacted} merge_log rows.")
+
+
+def _load_json(value):
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _link_undo_entries() -> int:
+    """Set original_merge_log_id on undo entries from metadata_json; only the first undo of a merge is linked."""
+    linked_originals: set[int] = set()
+    updates = []
+    with db.engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                """
+                SELECT id, metadata_json FROM merge_log
+                WHERE decision_type = 'undo' AND original_merge_log_id IS NULL
+                ORDER BY id
+                """
+            )
+        ).all()
+        for row in rows:
+            original_id = (_load_json(row.metadata_json) or {}).get("original_merge_log_id")
+            if original_id is None or original_id in linked_originals:
+                continue
+            linked_originals.add(original_id)
+            updates.append({"id": row.id, "original_id": original_id})
+        if updates:
+            conn.execute(text("UPDATE merge_log SET original_merge_log_id = :original_id WHERE id = :id"), updates)
+            conn.commit()
+    return len(updates)
+
+
+def _compact_snapshots() -> int:
+    """Repack snapshot_before/snapshot_after into snapshot_data and clear the JSON columns, in batches."""
+    compacted = 0
+    last_id = 0
+    with db.engine.connect() as conn:
+        while True:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT id, snapshot_before, snapshot_after FROM merge_log
+                    WHERE id > :last_id AND snapshot_data IS NULL
+                      AND (snapshot_before IS NOT NULL OR snapshot_after IS NOT NULL)
+                    ORDER BY id LIMIT :limit
+                    """
+                ),
+                {"last_id": last_id, "limit": BATCH_SIZE},
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            updates = [
+                {
+                    "id": row.id,
+                    "snapshot_data": pack_merge_snapshots(
+                        _load_json(row.snapshot_before), _load_json(row.snapshot_after)
+                    ),
+                }
+                for row in rows
+            ]
+            conn.execute(
+                text(
+                    """
+                    UPDATE merge_log
+                    SET snapshot_data = :snapshot_data, snapshot_before = NULL, snapshot_after = NULL
+                    WHERE id = :id
+                    """
+                ).bindparams(bindparam("snapshot_data", type_=LargeBinary)),
+                updates,
+            )
+            conn.commit()
+            compacted += len(updates)
+    return compacted
+
+
+if __name__ == "__main__":
+    compact_merge_log_snapshots()
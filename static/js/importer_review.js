@@ -49,7 +49,9 @@
     };
 
     const state = {
-      offset: 0,
+      cursor: "",
+      previousCursors: [],
+      candidateIds: [],
       limit: 100,
       autoRefresh: false,
       autoRefreshTimer: null,
@@ -73,7 +75,7 @@
     function buildQueryParams() {
       const params = new URLSearchParams();
       params.set("limit", String(state.limit));
-      params.set("offset", String(state.offset));
+      params.set("cursor", state.cursor);
 
       if (!elements.filterForm) return params;
       const formData = new FormData(elements.filterForm);
@@ -168,6 +170,7 @@
     function renderCandidates(candidates) {
       if (!elements.candidatesList) return;
       elements.candidatesList.innerHTML = "";
+      state.candidateIds = (candidates || []).map((candidate) => candidate.id);
 
       if (!candidates || candidates.length === 0) {
         elements.candidatesList.innerHTML = `
@@ -233,34 +236,32 @@
       });
     }
 
-    function renderPagination(total, limit, offset) {
+    function renderPagination(total, limit, nextCursor, rowCount) {
       if (!elements.pagination || !elements.paginationSummary) return;
       elements.pagination.innerHTML = "";
-      const totalPages = Math.ceil(total / limit);
-      const currentPage = Math.floor(offset / limit) + 1;
+      const offset = state.previousCursors.length * limit;
 
-      if (totalPages <= 1) {
-        elements.paginationSummary.textContent = `Showing ${total} candidate${total !== 1 ? "s" : ""}`;
+      if (!nextCursor && !state.previousCursors.length) {
+        elements.paginationSummary.textContent = `Showing ${rowCount} of ${total} candidate${total !== 1 ? "s" : ""}`;
         return;
       }
 
-      elements.paginationSummary.textContent = `Showing ${offset + 1}–${Math.min(offset + limit, total)} of ${total} candidates`;
+      elements.paginationSummary.textContent = `Showing ${offset + 1}–${offset + rowCount} of ${total} candidates`;
 
       const list = document.createElement("ul");
       list.className = "pagination pagination-sm mb-0 justify-content-end";
 
-      function appendPage(page, label = null, disabled = false, active = false) {
+      function appendPage(label, disabled, onClick) {
         const li = document.createElement("li");
-        li.className = `page-item ${disabled ? "disabled" : ""} ${active ? "active" : ""}`;
+        li.className = `page-item ${disabled ? "disabled" : ""}`;
         const a = document.createElement("a");
         a.className = "page-link";
         a.href = "#";
-        a.textContent = label || String(page);
+        a.textContent = label;
         if (!disabled) {
           a.addEventListener("click", (event) => {
             event.preventDefault();
-            if (page === currentPage) return;
-            state.offset = (page - 1) * limit;
+            onClick();
             loadCandidates();
           });
         }
@@ -268,18 +269,14 @@
         list.appendChild(li);
       }
 
-      appendPage(Math.max(1, currentPage - 1), "«", currentPage === 1);
-      for (let page = 1; page <= totalPages; page += 1) {
-        if (page === 1 || page === totalPages || Math.abs(page - currentPage) <= 2) {
-          appendPage(page, null, false, page === currentPage);
-        } else if (Math.abs(page - currentPage) === 3) {
-          const ellipsis = document.createElement("li");
-          ellipsis.className = "page-item disabled";
-          ellipsis.innerHTML = `<span class="page-link">…</span>`;
-          list.appendChild(ellipsis);
-        }
-      }
-      appendPage(Math.min(totalPages, currentPage + 1), "»", currentPage === totalPages);
+      // Pages are keyset cursors, so navigation is previous/next rather than by page number.
+      appendPage("« Previous", !state.previousCursors.length, () => {
+        state.cursor = state.previousCursors.pop();
+      });
+      appendPage("Next »", !nextCursor, () => {
+        state.previousCursors.push(state.cursor);
+        state.cursor = nextCursor;
+      });
       elements.pagination.appendChild(list);
     }
 
@@ -317,7 +314,7 @@
         return fetchJSON(config.apiBase, params)
           .then((data) => {
             renderCandidates(data.candidates || []);
-            renderPagination(data.total || 0, data.limit || 100, data.offset || 0);
+            renderPagination(data.total || 0, data.limit || 100, data.next_cursor || null, (data.candidates || []).length);
           })
           .catch((err) => {
             console.error("Failed to load candidates:", err);
@@ -412,8 +409,27 @@
       return html;
     }
 
+    const PREFETCH_AHEAD = 3;
+
+    function prefetchNextCandidates(candidateId) {
+      // Warm the server-side comparison cache for the next few candidates on this page.
+      if (!config.prefetchUrl) return;
+      const index = state.candidateIds.indexOf(candidateId);
+      if (index === -1) return;
+      const nextIds = state.candidateIds.slice(index + 1, index + 1 + PREFETCH_AHEAD);
+      if (!nextIds.length) return;
+      fetchJSON(config.prefetchUrl, null, {
+        method: "POST",
+        headers: { "Content-Type": "application/json", Accept: "application/json" },
+        body: JSON.stringify({ candidate_ids: nextIds }),
+      }).catch((err) => {
+        console.warn("Failed to prefetch candidates:", err);
+      });
+    }
+
     function loadCandidateDetails(candidateId) {
       if (!elements.modalLoader || !elements.modalContent) return;
+      prefetchNextCandidates(candidateId);
 
       elements.modalLoader.classList.remove("d-none");
       elements.modalContent.classList.add("d-none");
@@ -621,7 +637,8 @@
     if (elements.filterForm) {
       elements.filterForm.addEventListener("submit", (event) => {
         event.preventDefault();
-        state.offset = 0;
+        state.cursor = "";
+        state.previousCursors = [];
         loadCandidates();
       });
     }
@@ -775,6 +775,35 @@
       });
     }
 
+    function renderDqRuleProfile(profile) {
+      const section = document.getElementById("dq-rule-profile-section");
+      const tableBody = document.getElementById("dq-rule-profile-table-body");
+      if (!section || !tableBody) return;
+
+      if (!profile.length) {
+        section.classList.add("d-none");
+        tableBody.innerHTML = "";
+        return;
+      }
+
+      const formatNumber = (value) => Number(value ?? 0).toLocaleString();
+      const formatMs = (value, digits = 2) => Number(value ?? 0).toFixed(digits);
+      tableBody.innerHTML = profile
+        .map(
+          (rule) => `
+            <tr>
+              <td><code>${escapeHtml(rule.rule_code)}</code></td>
+              <td class="text-end">${formatNumber(rule.rows_evaluated)}</td>
+              <td class="text-end">${formatNumber(rule.violations)}</td>
+              <td class="text-end">${formatMs(rule.total_ms)}</td>
+              <td class="text-end">${formatMs(rule.p95_ms, 4)}</td>
+            </tr>
+          `
+        )
+        .join("");
+      section.classList.remove("d-none");
+    }
+
     function escapeHtml(text) {
       if (!text) return "";
       const div = document.createElement("div");
@@ -835,6 +864,8 @@
         }
       }
       
+      renderDqRuleProfile(detail.dq_rule_profile || []);
+
       // Render field statistics if available
       if (detail.field_stats) {
         renderFieldStatistics(detail.field_stats, detail.run_id);
@@ -0,0 +1,95 @@
+"""
+Tests for claim-based auto-merge of high-confidence fuzzy suggestions.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from flask_app.importer.pipeline.auto_merge import AutoMergeWorker, claim_auto_merge_candidates
+from flask_app.importer.pipeline.merge_service import MergeService
+from flask_app.models import DedupeDecision, DedupeSuggestion, ImportRun, MergeLog, Volunteer, db
+
+CLAIM_TTL = timedelta(minutes=15)
+
+
+def _suggestions(pairs: list[tuple[str, str]], *, score: float = 0.97) -> list[DedupeSuggestion]:
+    """Create one pending fuzzy_high suggestion per (primary, candidate) name pair; names are reused as contacts."""
+    run = ImportRun(source="csv", notes="auto-merge")
+    db.session.add(run)
+    volunteers: dict[str, Volunteer] = {}
+    for name in {name for pair in pairs for name in pair}:
+        volunteers[name] = Volunteer(first_name=name, last_name="Doe")
+        db.session.add(volunteers[name])
+    db.session.flush()
+    suggestions = [
+        DedupeSuggestion(
+            run_id=run.id,
+            primary_contact_id=volunteers[primary].id,
+            candidate_contact_id=volunteers[candidate].id,
+            score=score,
+            match_type="fuzzy_high",
+            decision=DedupeDecision.PENDING,
+        )
+        for primary, candidate in pairs
+    ]
+    db.session.add_all(suggestions)
+    db.session.commit()
+    return suggestions
+
+
+def test_auto_merge_merges_claimed_batch_and_clears_claims(app):
+    suggestions = _suggestions([("Ann", "Anne"), ("Bob", "Rob"), ("Cy", "Cyrus")])
+
+    stats = MergeService().auto_merge_high_confidence_candidates(batch_size=10)
+
+    assert stats["processed"] == 3
+    assert stats["merged"] == 3
+    assert stats["conflicts"] == 0
+    assert stats["merges_per_second"] > 0
+    db.session.expire_all()
+    for suggestion in suggestions:
+        row = db.session.get(DedupeSuggestion, suggestion.id)
+        assert row.decision == DedupeDecision.AUTO_MERGED
+        assert row.claim_token is None
+    assert MergeLog.query.filter_by(decision_type="auto").count() == 3
+
+
+def test_workers_claim_disjoint_suggestions_and_skip_shared_contacts(app):
+    first, shares_contact, other = _suggestions([("Ann", "Anne"), ("Anne", "Annie"), ("Bob", "Rob")])
+
+    claimed_a = claim_auto_merge_candidates(db.session, token="worker-a", limit=1, claim_ttl=CLAIM_TTL)
+    claimed_b = claim_auto_merge_candidates(db.session, token="worker-b", limit=10, claim_ttl=CLAIM_TTL)
+
+    assert claimed_a == [first.id]
+    # "Anne" is held by worker-a's claim, so only the unrelated suggestion is available.
+    assert claimed_b == [other.id]
+    assert claim_auto_merge_candidates(db.session, token="worker-c", limit=10, claim_ttl=CLAIM_TTL) == []
+
+    stale = datetime.now(timezone.utc) - 2 * CLAIM_TTL
+    db.session.query(DedupeSuggestion).update({"claimed_at": stale}, synchronize_session=False)
+    reclaimed = claim_auto_merge_candidates(db.session, token="worker-c", limit=10, claim_ttl=CLAIM_TTL)
+    assert sorted(reclaimed) == sorted([first.id, shares_contact.id, other.id])
+
+
+def test_failed_merge_keeps_claim_so_drain_does_not_retry_it(app):
+    failing, ok = _suggestions([("Ann", "Anne"), ("Bob", "Rob")])
+    service = MergeService()
+    real_execute = service.execute_merge
+
+    def _execute(suggestion_id, **kwargs):
+        if suggestion_id == failing.id:
+            raise RuntimeError("merge blew up")
+        return real_execute(suggestion_id, **kwargs)
+
+    with patch.object(service, "execute_merge", side_effect=_execute) as execute:
+        stats = AutoMergeWorker(service, claim_size=1).drain(max_batches=5)
+
+    assert stats.processed == 2
+    assert stats.merged == 1
+    assert stats.errors == 1
+    assert execute.call_count == 2
+    db.session.expire_all()
+    assert db.session.get(DedupeSuggestion, ok.id).decision == DedupeDecision.AUTO_MERGED
+    failed = db.session.get(DedupeSuggestion, failing.id)
+    assert failed.decision == DedupeDecision.PENDING
+    assert failed.claim_token is not None
@@ -0,0 +1,123 @@
+"""
+Tests for the incrementally maintained dedupe queue counters.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from flask_app.importer import init_importer
+from flask_app.importer.pipeline.merge_service import MergeService
+from flask_app.models import DedupeDecision, DedupeQueueCounter, DedupeSuggestion, ImportRun, Volunteer, db
+from flask_app.models.importer.dedupe_counters import counter_hour, rebuild_dedupe_queue_counters
+
+
+def _suggestions(*match_types: str, created_at: datetime | None = None) -> list[DedupeSuggestion]:
+    run = ImportRun(source="csv", notes="counters")
+    db.session.add(run)
+    suggestions = []
+    for index, match_type in enumerate(match_types):
+        primary = Volunteer(first_name=f"Primary{index}", last_name="Doe")
+        candidate = Volunteer(first_name=f"Candidate{index}", last_name="Doe")
+        db.session.add_all([primary, candidate])
+        db.session.flush()
+        suggestion = DedupeSuggestion(
+            run_id=run.id,
+            primary_contact_id=primary.id,
+            candidate_contact_id=candidate.id,
+            score=0.9,
+            match_type=match_type,
+        )
+        if created_at is not None:
+            suggestion.created_at = created_at
+        suggestions.append(suggestion)
+    db.session.add_all(suggestions)
+    db.session.commit()
+    return suggestions
+
+
+def _counts() -> dict[tuple[DedupeDecision, str], int]:
+    totals: dict[tuple[DedupeDecision, str], int] = {}
+    for row in db.session.query(DedupeQueueCounter):
+        key = (row.decision, row.match_type)
+        totals[key] = totals.get(key, 0) + row.suggestion_count
+    return {key: count for key, count in totals.items() if count}
+
+
+def test_counters_follow_create_and_each_decision(app):
+    merged, rejected, deferred = _suggestions("fuzzy_high", "fuzzy_review", "fuzzy_review")
+    assert _counts() == {(DedupeDecision.PENDING, "fuzzy_high"): 1, (DedupeDecision.PENDING, "fuzzy_review"): 2}
+
+    service = MergeService()
+    merge_log = service.execute_merge(merged.id, user_id=None, decision_type="auto")
+    service.reject_candidate(rejected.id, user_id=None)
+    service.defer_candidate(deferred.id, user_id=None)
+    db.session.commit()
+    assert _counts() == {
+        (DedupeDecision.AUTO_MERGED, "fuzzy_high"): 1,
+        (DedupeDecision.REJECTED, "fuzzy_review"): 1,
+        (DedupeDecision.DEFERRED, "fuzzy_review"): 1,
+    }
+
+    service.undo_merge(merge_log.id, user_id=None)
+    db.session.commit()
+    assert _counts()[(DedupeDecision.PENDING, "fuzzy_high")] == 1
+    assert (DedupeDecision.AUTO_MERGED, "fuzzy_high") not in _counts()
+
+    db.session.delete(db.session.get(DedupeSuggestion, merged.id))
+    db.session.commit()
+    assert (DedupeDecision.PENDING, "fuzzy_high") not in _counts()
+
+
+def test_rolled_back_changes_leave_counters_untouched(app):
+    (suggestion,) = _suggestions("fuzzy_review")
+    suggestion.decision = DedupeDecision.REJECTED
+    db.session.flush()
+    db.session.rollback()
+
+    assert _counts() == {(DedupeDecision.PENDING, "fuzzy_review"): 1}
+
+
+def test_queue_stats_read_counters_with_aging(app):
+    now = datetime.now(timezone.utc)
+    _suggestions("fuzzy_high", "fuzzy_review")
+    _suggestions("fuzzy_review", created_at=now - timedelta(hours=30))
+    _suggestions("fuzzy_review", created_at=now - timedelta(days=5))
+    (merged,) = _suggestions("fuzzy_high")
+    MergeService().execute_merge(merged.id, user_id=None, decision_type="auto")
+    db.session.commit()
+
+    stats = MergeService().get_queue_stats()
+
+    assert stats.total_pending == 4
+    assert stats.total_review_band == 3
+    assert stats.total_high_confidence == 1
+    assert stats.total_auto_merged == 1
+    assert stats.aging_buckets == {"<24h": 2, "24-48h": 1, ">48h": 1}
+
+
+def test_rebuild_repairs_drift_from_core_updates(app, runner):
+    suggestions = _suggestions("fuzzy_review", "fuzzy_review")
+    db.session.execute(
+        update(DedupeSuggestion)
+        .where(DedupeSuggestion.id == suggestions[0].id)
+        .values(decision=DedupeDecision.REJECTED)
+    )
+    db.session.commit()
+
+    summary = rebuild_dedupe_queue_counters(db.session, dry_run=True)
+    hour = counter_hour(suggestions[0].created_at)
+    assert summary.drift == {
+        (DedupeDecision.PENDING, "fuzzy_review", hour): (2, 1),
+        (DedupeDecision.REJECTED, "fuzzy_review", hour): (0, 1),
+    }
+
+    app.config["IMPORTER_ENABLED"] = True
+    init_importer(app)
+    result = runner.invoke(args=["importer", "repair-dedupe-counters"])
+
+    assert result.exit_code == 0, result.output
+    assert "Repaired 2 drifted buckets" in result.output
+    db.session.expire_all()
+    assert _counts() == {(DedupeDecision.PENDING, "fuzzy_review"): 1, (DedupeDecision.REJECTED, "fuzzy_review"): 1}
+    assert not rebuild_dedupe_queue_counters(db.session).drifted
@@ -15,7 +15,16 @@ from flask_app.importer.pipeline import (
     stage_volunteers_from_csv,
 )
 from flask_app.models import ContactEmail, ContactPhone, Volunteer, db
-from flask_app.models.importer.schema import DedupeDecision, DedupeSuggestion, ExternalIdMap, ImportRun, ImportRunStatus
+from flask_app.models.importer.schema import (
+    CleanVolunteer,
+    DedupeDecision,
+    DedupeSuggestion,
+    ExternalIdMap,
+    ImportRun,
+    ImportRunStatus,
+    StagingRecordStatus,
+    StagingVolunteer,
+)
 
 DATASET_ROOT = Path("ops/testdata/importer_golden_dataset_v0")
 
@@ -52,9 +61,9 @@ def _execute_ingest_handle(
     dq_summary = run_minimal_dq(
         run,
         dry_run=dry_run,
-        csv_rows=staging_summary.dry_run_rows,
+        streamed_summary=staging_summary.streamed_dq,
     )
-    clean_summary = promote_clean_volunteers(run, dry_run=dry_run)
+    clean_summary = promote_clean_volunteers(run, dry_run=dry_run, streamed_summary=staging_summary.streamed_clean)
     core_summary = load_core_volunteers(
         run,
         dry_run=dry_run,
@@ -208,3 +217,42 @@ def test_partial_replay_subset_is_idempotent(seeded_importer):
 
     id_map = ExternalIdMap.query.filter_by(external_id="vol-001").one()
     assert id_map.run_id == result["run"].id
+
+
+def test_unchanged_rows_skip_dq_clean_and_load(seeded_importer):
+    baseline_volunteer_count = Volunteer.query.count()
+    assert all(id_map.last_loaded_checksum for id_map in ExternalIdMap.query)
+
+    result = _execute_ingest("volunteers_idempotent_replay.csv", dry_run=False)
+    run = result["run"]
+
+    statuses = {row.status for row in StagingVolunteer.query.filter_by(run_id=run.id)}
+    assert statuses == {StagingRecordStatus.UNCHANGED}
+    assert result["staging"].rows_unchanged == baseline_volunteer_count
+    assert run.counts_json["staging"]["volunteers"]["rows_unchanged"] == baseline_volunteer_count
+    assert result["dq"].rows_evaluated == 0
+    assert CleanVolunteer.query.filter_by(run_id=run.id).count() == 0
+    assert result["core"].rows_skipped_no_change == baseline_volunteer_count
+
+
+def test_changed_rows_are_not_marked_unchanged(seeded_importer):
+    result = _execute_ingest("volunteers_changed_payload.csv", dry_run=False)
+    run = result["run"]
+
+    landed_or_loaded = StagingVolunteer.query.filter(
+        StagingVolunteer.run_id == run.id,
+        StagingVolunteer.status != StagingRecordStatus.UNCHANGED,
+    ).count()
+    assert landed_or_loaded == 3
+    assert result["core"].rows_updated == 3
+
+
+def test_skip_unchanged_can_be_disabled(seeded_importer, app):
+    app.config["IMPORTER_SKIP_UNCHANGED"] = False
+    baseline_volunteer_count = Volunteer.query.count()
+
+    result = _execute_ingest("volunteers_idempotent_replay.csv", dry_run=False)
+
+    assert result["staging"].rows_unchanged == 0
+    assert result["dq"].rows_evaluated == baseline_volunteer_count
+    assert result["core"].rows_skipped_no_change == baseline_volunteer_count
@@ -5,7 +5,8 @@ Covers merge transaction, survivorship application, external_id_map updates,
 change_log creation, and error handling.
 """
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -15,6 +16,8 @@ from flask_app.models import (
     CleanVolunteer,
     ContactEmail,
     ContactPhone,
+    DataQualitySeverity,
+    DataQualityViolation,
     DedupeDecision,
     DedupeSuggestion,
     EmailType,
@@ -157,6 +160,48 @@ def test_get_review_queue_filter_by_status(merge_service, app, sample_import_run
         assert candidates[0].decision == DedupeDecision.PENDING
 
 
+def test_get_review_queue_page_walks_keyset_cursor(merge_service, app, sample_import_run, sample_volunteers):
+    """Keyset pages follow score DESC NULLS LAST, id and project only displayed columns."""
+    with app.app_context():
+        candidates = [Volunteer(first_name=f"Cand{index}", last_name="Smith") for index in range(5)]
+        db.session.add_all(candidates)
+        db.session.flush()
+        scores = [0.90, None, 0.97, 0.90, 0.0]
+        suggestions = [
+            DedupeSuggestion(
+                run_id=sample_import_run.id,
+                primary_contact_id=sample_volunteers["primary"].id,
+                candidate_contact_id=candidate.id,
+                score=score,
+                match_type="fuzzy_review",
+                decision=DedupeDecision.PENDING,
+            )
+            for candidate, score in zip(candidates, scores)
+        ]
+        db.session.add_all(suggestions)
+        db.session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            page = merge_service.get_review_queue_page(status="pending", limit=2, cursor=cursor)
+            assert page.total == 5
+            seen.extend(page.rows)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = [suggestions[index].id for index in (2, 0, 3, 4, 1)]
+        assert [row.id for row in seen] == expected
+        assert [row.score for row in seen[3:]] == [0.0, None]
+        assert seen[0].primary_name == "John Doe"
+        assert seen[0].candidate_name == "Cand2 Smith"
+        assert seen[0].created_at is not None
+
+        with pytest.raises(ValueError, match="Invalid review queue cursor"):
+            merge_service.get_review_queue_page(cursor="not-a-cursor")
+
+
 def test_get_candidate_details(merge_service, app, sample_dedupe_suggestion):
     """Test getting candidate details."""
     with app.app_context():
@@ -169,6 +214,136 @@ def test_get_candidate_details(merge_service, app, sample_dedupe_suggestion):
         assert details.candidate_contact is not None
 
 
+def test_get_candidate_details_caches_comparison_until_contact_changes(
+    merge_service, app, sample_import_run, sample_volunteers
+):
+    """The comparison is built once, reused, and rebuilt after either contact's updated_at moves."""
+    with app.app_context():
+        session = merge_service.session
+        candidates = [Volunteer(first_name=f"Jon{index}", last_name="Doe") for index in range(2)]
+        session.add_all(candidates)
+        session.flush()
+        first, second = (
+            DedupeSuggestion(
+                run_id=sample_import_run.id,
+                primary_contact_id=sample_volunteers["primary"].id,
+                candidate_contact_id=candidate.id,
+                score=0.9,
+                match_type="fuzzy_review",
+            )
+            for candidate in candidates
+        )
+        session.add_all([first, second])
+        session.commit()
+
+        build = merge_service._build_candidate_comparison
+        with patch.object(merge_service, "_build_candidate_comparison", side_effect=build) as builder:
+            assert merge_service.prefetch_candidate_details([first.id, second.id, 99999]) == 2
+            session.commit()
+            details = merge_service.get_candidate_details(first.id)
+            assert builder.call_count == 2
+            assert details.candidate_contact["first_name"] == "Jon0"
+            assert session.get(DedupeSuggestion, first.id).comparison_json["stamps"]["primary"] is not None
+
+            candidate = session.get(Volunteer, candidates[0].id)
+            candidate.first_name = "Jonathan"
+            candidate.updated_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+            session.commit()
+            details = merge_service.get_candidate_details(first.id)
+            assert builder.call_count == 3
+            assert details.candidate_contact["first_name"] == "Jonathan"
+            assert merge_service.prefetch_candidate_details([first.id, second.id]) == 0
+
+
+def test_get_candidate_details_caches_date_valued_profile_fields(merge_service, app, sample_dedupe_suggestion):
+    """Non-JSON-native snapshot values are stored as strings instead of failing the cache write."""
+    with app.app_context():
+        primary = db.session.get(Volunteer, sample_dedupe_suggestion.primary_contact_id)
+        primary.birthdate = date(1990, 4, 2)
+        db.session.commit()
+
+        field_names = {"first_name", "last_name", "email", "phone_e164", "birthdate"}
+        with patch("flask_app.importer.pipeline.merge_service._profile_field_names", return_value=field_names):
+            details = merge_service.get_candidate_details(sample_dedupe_suggestion.id)
+            merge_service.session.commit()
+
+        assert details.primary_contact["snapshot"]["birthdate"] == "1990-04-02"
+        cached = db.session.get(DedupeSuggestion, sample_dedupe_suggestion.id).comparison_json
+        assert cached["primary_contact"]["snapshot"]["birthdate"] == "1990-04-02"
+
+
+def test_get_candidate_details_rebuilds_after_clean_row_override_or_contact_detail_change(
+    merge_service, app, sample_import_run, sample_volunteers
+):
+    """Rows other than the contacts feed the comparison, so changing them invalidates the cache too."""
+    with app.app_context():
+        session = merge_service.session
+        staging_row = StagingVolunteer(
+            run_id=sample_import_run.id,
+            sequence_number=1,
+            external_system="csv",
+            payload_json={},
+            normalized_json={"first_name": "Johnny", "last_name": "Doe"},
+        )
+        session.add(staging_row)
+        session.flush()
+        suggestion = DedupeSuggestion(
+            run_id=sample_import_run.id,
+            primary_contact_id=sample_volunteers["primary"].id,
+            staging_volunteer_id=staging_row.id,
+            score=0.9,
+            match_type="fuzzy_review",
+        )
+        session.add(suggestion)
+        session.commit()
+
+        build = merge_service._build_candidate_comparison
+        with patch.object(merge_service, "_build_candidate_comparison", side_effect=build) as builder:
+            assert merge_service.get_candidate_details(suggestion.id).candidate_contact is None
+            session.commit()
+
+            session.add(
+                CleanVolunteer(
+                    run_id=sample_import_run.id,
+                    staging_volunteer_id=staging_row.id,
+                    external_system="csv",
+                    first_name="Johnny",
+                    last_name="Doe",
+                    payload_json={},
+                )
+            )
+            session.commit()
+            details = merge_service.get_candidate_details(suggestion.id)
+            assert builder.call_count == 2
+            assert details.candidate_contact["first_name"] == "Johnny"
+            session.commit()
+
+            session.add(
+                DataQualityViolation(
+                    run_id=sample_import_run.id,
+                    staging_volunteer_id=staging_row.id,
+                    rule_code="VOL_NAME",
+                    severity=DataQualitySeverity.ERROR,
+                    edited_fields_json={"first_name": {"before": "Johnny", "after": "Jonathan"}},
+                )
+            )
+            session.commit()
+            details = merge_service.get_candidate_details(suggestion.id)
+            assert builder.call_count == 3
+            assert details.survivorship_preview["resolved_values"]["first_name"] == "Jonathan"
+            session.commit()
+
+            phone = ContactPhone.query.filter_by(contact_id=sample_volunteers["primary"].id).one()
+            session.delete(phone)
+            session.commit()
+            merge_service.get_candidate_details(suggestion.id)
+            assert builder.call_count == 4
+            session.commit()
+
+            merge_service.get_candidate_details(suggestion.id)
+            assert builder.call_count == 4
+
+
 def test_get_candidate_details_not_found(merge_service, app):
     """Test getting details for non-existent candidate."""
     with app.app_context():
@@ -397,3 +572,40 @@ def test_execute_merge_creates_snapshots(merge_service, app, sample_dedupe_sugge
         assert merge_log.snapshot_after is not None
         assert "primary" in merge_log.snapshot_before
         assert "primary" in merge_log.snapshot_after
+
+
+def test_merge_snapshots_are_stored_as_compressed_diffs(merge_service, app, sample_dedupe_suggestion):
+    """Snapshots round-trip through the compressed diff column and legacy rows still read."""
+    with app.app_context():
+        merge_log = merge_service.execute_merge(sample_dedupe_suggestion.id, user_id=1)
+        db.session.commit()
+        before, after = merge_log.snapshot_before, merge_log.snapshot_after
+        merge_log_id = merge_log.id
+        db.session.expire_all()
+
+        stored = db.session.get(MergeLog, merge_log_id)
+        assert stored.legacy_snapshot_before is None
+        assert stored.snapshot_data is not None
+        assert stored.snapshot_before == before
+        assert stored.snapshot_after == after
+
+        legacy = MergeLog(
+            primary_contact_id=stored.primary_contact_id,
+            merged_contact_id=stored.merged_contact_id,
+            legacy_snapshot_before={"primary": {"first_name": "Old"}},
+        )
+        assert legacy.snapshot_before == {"primary": {"first_name": "Old"}}
+        assert legacy.snapshot_after is None
+
+
+def test_undo_merge_twice_is_rejected(merge_service, app, sample_dedupe_suggestion):
+    """The already-undone check uses the indexed original_merge_log_id link."""
+    with app.app_context():
+        merge_log = merge_service.execute_merge(sample_dedupe_suggestion.id, user_id=1)
+        undo_log = merge_service.undo_merge(merge_log.id, user_id=1)
+        db.session.commit()
+
+        assert undo_log.original_merge_log_id == merge_log.id
+        assert undo_log.metadata_json["original_merge_log_id"] == merge_log.id
+        with pytest.raises(ValueError, match="already been undone"):
+            merge_service.undo_merge(merge_log.id, user_id=1)
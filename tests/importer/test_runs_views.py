@@ -57,6 +57,25 @@ def test_run_detail(importer_app, client, run_factory):
     assert detail["rows_deduped_auto"] == 4
 
 
+def test_run_detail_includes_dq_rule_profile(importer_app, client, run_factory):
+    run = run_factory(source="csv", status=ImportRunStatus.SUCCEEDED)
+    run.metrics_json = {
+        "dq": {
+            "rule_profile": {
+                "VOL_EMAIL_FORMAT": {"rows_evaluated": 50, "violations": 2, "total_ms": 1.5, "p95_ms": 0.2},
+                "VOL_PHONE_E164": {"rows_evaluated": 50, "violations": 0, "total_ms": 4.0, "p95_ms": 0.5},
+            }
+        }
+    }
+    db.session.commit()
+    _login_super_admin(importer_app, client)
+    response = client.get(f"/importer/runs/{run.id}")
+    assert response.status_code == 200
+    profile = response.get_json()["dq_rule_profile"]
+    assert [entry["rule_code"] for entry in profile] == ["VOL_PHONE_E164", "VOL_EMAIL_FORMAT"]
+    assert profile[1]["violations"] == 2
+
+
 def test_run_stats(importer_app, client, run_factory):
     run_factory(source="csv", status=ImportRunStatus.SUCCEEDED, dry_run=True)
     run_factory(source="crm", status=ImportRunStatus.FAILED, dry_run=False)
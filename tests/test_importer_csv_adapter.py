@@ -1,4 +1,5 @@
 import io
+import multiprocessing
 
 import pytest
 
@@ -52,3 +53,77 @@ def test_adapter_skips_blank_rows_and_tracks_statistics():
     assert rows[1].sequence_number == 3  # Blank row still increments the sequence counter.
     assert adapter.statistics.rows_processed == 2
     assert adapter.statistics.rows_skipped_blank == 1
+
+
+def _write_tricky_csv(path, *, stray_quote: bool = False) -> None:
+    lines = ["first_name,last_name,email,phone\r\n"]
+    for index in range(60):
+        if index % 11 == 0:
+            lines.append("\r\n")
+        elif index % 7 == 0:
+            lines.append(f'"Multi\nline {index}, with ""quotes""",Doe,user{index}@example.org,\r\n')
+        elif index % 13 == 0:
+            lines.append(",,,\r\n")
+        else:
+            lines.append(f" Name{index} ,Smith,user{index}@example.org,+1415555{index:04d},extra\r\n")
+        if stray_quote and index == 30:
+            lines.append('ab"c,Quote,stray@example.org,\r\n')
+    path.write_text("".join(lines), encoding="utf-8", newline="")
+
+
+def _read_rows(path, **options):
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        adapter = VolunteerCSVAdapter(handle, **options)
+        rows = [(row.sequence_number, row.source_line, row.raw, row.normalized) for row in adapter.iter_rows()]
+        return rows, adapter
+
+
+@pytest.mark.parametrize("stray_quote", [False, True])
+def test_parallel_parsing_matches_serial_rows(tmp_path, stray_quote):
+    path = tmp_path / "volunteers.csv"
+    _write_tricky_csv(path, stray_quote=stray_quote)
+
+    serial_rows, serial_adapter = _read_rows(path)
+    parallel_rows, parallel_adapter = _read_rows(
+        path, parallel_threshold_bytes=1, parallel_workers=2, parallel_chunk_bytes=64
+    )
+
+    assert parallel_adapter.parallel_used is True
+    assert serial_adapter.parallel_used is False
+    assert parallel_rows == serial_rows
+    assert parallel_adapter.statistics == serial_adapter.statistics
+
+
+def _read_rows_in_child(path, results) -> None:
+    rows, adapter = _read_rows(path, parallel_threshold_bytes=1, parallel_workers=2, parallel_chunk_bytes=64)
+    results.put((multiprocessing.current_process().daemon, adapter.parallel_used, rows))
+
+
+def test_parallel_parsing_runs_inside_daemonic_worker_process(tmp_path):
+    # Celery prefork children are daemonic; the byte-range pool must still start there.
+    path = tmp_path / "volunteers.csv"
+    _write_tricky_csv(path)
+    serial_rows, _ = _read_rows(path)
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    child = context.Process(target=_read_rows_in_child, args=(path, results), daemon=True)
+    child.start()
+    daemon, parallel_used, rows = results.get(timeout=60)
+    child.join(timeout=10)
+
+    assert daemon is True
+    assert parallel_used is True
+    assert rows == serial_rows
+
+
+def test_parallel_parsing_requires_file_above_threshold(tmp_path):
+    path = tmp_path / "volunteers.csv"
+    _write_tricky_csv(path)
+
+    _, adapter = _read_rows(path, parallel_threshold_bytes=path.stat().st_size + 1, parallel_workers=2)
+    assert adapter.parallel_used is False
+
+    stream_adapter = VolunteerCSVAdapter(_make_csv("first_name,last_name\nAda,Lovelace\n"), parallel_threshold_bytes=1)
+    assert len(list(stream_adapter.iter_rows())) == 1
+    assert stream_adapter.parallel_used is False
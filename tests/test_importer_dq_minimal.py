@@ -1,11 +1,30 @@
 from flask_app.importer.pipeline import run_minimal_dq
-from flask_app.importer.pipeline.dq import evaluate_event_rules
+import pytest
+from sqlalchemy import event
+
+from flask_app.importer.pipeline.dq import (
+    AffiliationReferenceSet,
+    AffiliationReferenceValidationRule,
+    DQResult,
+    DQRule,
+    DQRuleStats,
+    EmailFormatRule,
+    EmailOrPhoneRule,
+    EventDateValidationRule,
+    PhoneFormatRule,
+    evaluate_event_rules,
+    evaluate_rules,
+    evaluate_rules_batch,
+)
 from flask_app.models.base import db
 from flask_app.models.importer.schema import (
+    DataQualitySeverity,
     DataQualityStatus,
     DataQualityViolation,
+    ExternalIdMap,
     ImportRun,
     ImportRunStatus,
+    StagingAffiliation,
     StagingEvent,
     StagingRecordStatus,
     StagingVolunteer,
@@ -71,6 +90,39 @@ def test_run_minimal_dq_validates_clean_rows(app):
     assert dq_metrics["rows_validated"] == 1
 
 
+def test_run_minimal_dq_records_rule_profile(app):
+    run = _create_import_run()
+    _create_staging_row(
+        run,
+        payload={"first_name": "Ada", "email": "not-an-email"},
+        normalized={"first_name": "Ada", "email": "not-an-email"},
+    )
+
+    run_minimal_dq(run, dry_run=False)
+    db.session.commit()
+
+    refreshed_run = db.session.get(ImportRun, run.id)
+    profile = refreshed_run.metrics_json["dq"]["rule_profile"]
+    email_stats = profile["VOL_EMAIL_FORMAT"]
+    assert email_stats["rows_evaluated"] == 1
+    assert email_stats["violations"] == 1
+    assert email_stats["invocations"] == 1
+    assert email_stats["total_ms"] >= 0
+    assert email_stats["p95_ms"] >= 0
+
+
+def test_dq_rule_stats_p95_is_per_row_across_batch_sizes():
+    batched, per_row = DQRuleStats(), DQRuleStats()
+    batched.observe(0.5, rows=1000, violations=0)
+    batched.observe(0.002, rows=1, violations=0)
+    for _ in range(20):
+        per_row.observe(0.0005, rows=1, violations=0)
+
+    assert batched.p95_seconds == pytest.approx(0.0005)
+    assert per_row.p95_seconds == pytest.approx(0.0005)
+    assert batched.to_dict()["p95_ms"] == per_row.to_dict()["p95_ms"] == 0.5
+
+
 def test_run_minimal_dq_quarantines_and_logs_violations(app):
     from flask_app.importer.pipeline.dq import EmailOrPhoneRule, evaluate_rules
     from flask_app.models.importer.schema import DataQualitySeverity
@@ -290,3 +342,137 @@ def test_run_minimal_dq_quarantines_events_with_violations(app):
     )
     assert len(violations) >= 1
     assert any(v.rule_code == "EVENT_TITLE_REQUIRED" for v in violations)
+
+
+def test_evaluate_rules_batch_matches_row_by_row_evaluation():
+    payloads = [
+        {"email": "ada@example.org", "phone": "+14155550101"},
+        {"email": "not-an-email", "phone": "555"},
+        {"email_normalized": " spaced@example.org "},
+        {},
+        {"start_date": "2024-05-02T10:00:00Z", "end_date": "2024-05-01T10:00:00Z"},
+        {"start_date": "bogus", "end_date": "2024-05-01"},
+    ]
+    rules = (EmailOrPhoneRule(), EmailFormatRule(), PhoneFormatRule(), EventDateValidationRule())
+
+    assert evaluate_rules_batch(payloads, rules) == [evaluate_rules(payload, rules) for payload in payloads]
+
+
+def test_evaluate_rules_batch_adapts_row_level_rules():
+    class OddIdRule(DQRule):
+        def __init__(self) -> None:
+            super().__init__(code="TEST_ODD_ID", description="Odd ids fail.", severity=DataQualitySeverity.WARNING)
+
+        def evaluate(self, payload):
+            if payload["id"] % 2:
+                return [DQResult(self.code, self.severity, "odd", {"id": payload["id"]})]
+            return []
+
+    results = evaluate_rules_batch([{"id": index} for index in range(4)], (OddIdRule(),))
+
+    assert [[violation.details["id"] for violation in row] for row in results] == [[], [1], [], [3]]
+
+
+def test_run_minimal_dq_bulk_updates_rows_loaded_in_session(app):
+    run = _create_import_run()
+    rows = []
+    for index, email in enumerate(["ok@example.org", "broken", "also-broken"], start=1):
+        row = StagingVolunteer(
+            run_id=run.id,
+            sequence_number=index,
+            source_record_id=f"row-{index}",
+            external_system="csv",
+            payload_json={"email": email},
+            normalized_json={"email": email},
+            status=StagingRecordStatus.LANDED,
+        )
+        db.session.add(row)
+        rows.append(row)
+    db.session.flush()
+
+    summary = run_minimal_dq(run, dry_run=False)
+
+    assert (summary.rows_validated, summary.rows_quarantined) == (1, 2)
+    assert [row.status for row in rows] == [
+        StagingRecordStatus.VALIDATED,
+        StagingRecordStatus.QUARANTINED,
+        StagingRecordStatus.QUARANTINED,
+    ]
+    assert rows[1].last_error == "Email is not in a valid format."
+    assert rows[0].processed_at is not None
+    violations = DataQualityViolation.query.filter_by(run_id=run.id).order_by(DataQualityViolation.id).all()
+    assert [(v.staging_volunteer_id, v.record_key, v.rule_code) for v in violations] == [
+        (rows[1].id, "row-2", "VOL_EMAIL_FORMAT"),
+        (rows[2].id, "row-3", "VOL_EMAIL_FORMAT"),
+    ]
+    assert rows[1].dq_violations[0].status == DataQualityStatus.OPEN
+
+
+def test_affiliation_reference_rule_uses_preloaded_sets(app):
+    for entity_type, external_id, is_active in [
+        ("salesforce_contact", "003-known", True),
+        ("salesforce_contact", "003-retired", False),
+        ("salesforce_organization", "001-known", True),
+    ]:
+        db.session.add(
+            ExternalIdMap(
+                entity_type=entity_type,
+                entity_id=1,
+                external_system="salesforce",
+                external_id=external_id,
+                is_active=is_active,
+            )
+        )
+    run = _create_import_run()
+    references = [
+        ("003-known", "001-known"),
+        ("003-retired", "001-known"),
+        ("003-known", "001-missing"),
+        ("003-missing", "001-missing"),
+        ("", "001-missing"),
+    ]
+    for index, (contact_id, organization_id) in enumerate(references, start=1):
+        db.session.add(
+            StagingAffiliation(
+                run_id=run.id,
+                sequence_number=index,
+                source_record_id=f"aff-{index}",
+                external_system="salesforce",
+                external_id=f"a0B-{index}",
+                payload_json={"npe5__Contact__c": contact_id, "npe5__Organization__c": organization_id},
+                status=StagingRecordStatus.LANDED,
+            )
+        )
+    db.session.commit()
+
+    payloads = [
+        {"contact_external_id": contact_id, "organization_external_id": organization_id}
+        for contact_id, organization_id in references
+    ]
+    row_rule = AffiliationReferenceValidationRule()
+    preloaded_rule = AffiliationReferenceValidationRule(references=AffiliationReferenceSet.load())
+    assert preloaded_rule.evaluate_batch(payloads) == row_rule.evaluate_batch(payloads)
+
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        run_minimal_dq(run, dry_run=False)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+
+    assert sum("FROM external_id_map" in statement for statement in statements) == 2
+    violations = (
+        DataQualityViolation.query.filter_by(run_id=run.id, rule_code="AFF_REFERENCE_VALIDATION")
+        .order_by(DataQualityViolation.id)
+        .all()
+    )
+    assert [(v.record_key, v.details_json["missing_reference"]) for v in violations] == [
+        ("a0B-2", "contact"),
+        ("a0B-3", "organization"),
+        ("a0B-4", "contact"),
+        ("a0B-4", "organization"),
+    ]
@@ -0,0 +1,254 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from flask_app.importer import init_importer
+from flask_app.importer.pipeline import PIPELINE_STAGES, resolve_start_stage
+from flask_app.importer.pipeline.fuzzy_candidates import generate_fuzzy_candidates
+from flask_app.importer.tasks import CSV_STAGE_TASKS, ingest_csv
+from flask_app.models import Volunteer
+from flask_app.models.base import db
+from flask_app.models.importer.dedupe_counters import rebuild_dedupe_queue_counters
+from flask_app.models.importer.schema import (
+    CleanVolunteer,
+    DedupeDecision,
+    DedupeQueueCounter,
+    DedupeSuggestion,
+    ImportRun,
+    ImportRunStatus,
+    StagingRecordStatus,
+    StagingVolunteer,
+)
+
+
+@pytest.fixture
+def committing_app(app, monkeypatch):
+    # Stage checkpoints are committed; with TESTING they would only be flushed and
+    # rolled back together with the failed stage.
+    monkeypatch.setitem(app.config, "TESTING", False)
+    return app
+
+
+def _write_csv(tmp_path):
+    csv_path = tmp_path / "volunteers.csv"
+    csv_path.write_text(
+        "external_id,first_name,last_name,email,phone\n"
+        "ada-1,Ada,Lovelace,ada@example.org,+14155550101\n"
+        "grace-2,Grace,Hopper,grace@example.org,\n",
+        encoding="utf-8",
+    )
+    return csv_path
+
+
+def _create_run(csv_path) -> ImportRun:
+    run = ImportRun(
+        source="csv",
+        adapter="csv",
+        status=ImportRunStatus.PENDING,
+        dry_run=False,
+        ingest_params_json={"file_path": str(csv_path), "source_system": "csv", "dry_run": False, "keep_file": True},
+    )
+    db.session.add(run)
+    db.session.commit()
+    return run
+
+
+def _ingest(run_id: int, csv_path, **kwargs):
+    return ingest_csv.run(run_id=run_id, file_path=str(csv_path), keep_file=True, **kwargs)
+
+
+def test_ingest_csv_resumes_from_first_incomplete_stage(committing_app, tmp_path):
+    csv_path = _write_csv(tmp_path)
+    run_id = _create_run(csv_path).id
+
+    with patch("flask_app.importer.tasks.load_core_volunteers", side_effect=RuntimeError("core load failed")):
+        with pytest.raises(RuntimeError):
+            _ingest(run_id, csv_path)
+
+    run = db.session.get(ImportRun, run_id)
+    assert run.status == ImportRunStatus.FAILED
+    assert list(run.stage_checkpoints_json) == ["staging", "dq", "clean", "fuzzy"]
+    assert run.stage_checkpoints_json["staging"]["summary"]["rows_staged"] == 2
+    assert resolve_start_stage(run) == "core"
+
+    with patch("flask_app.importer.tasks.stage_volunteers_from_csv") as stage, patch(
+        "flask_app.importer.tasks.run_minimal_dq"
+    ) as dq, patch("flask_app.importer.tasks.promote_clean_volunteers") as clean:
+        result = _ingest(run_id, csv_path)
+
+    stage.assert_not_called()
+    dq.assert_not_called()
+    clean.assert_not_called()
+    assert result["rows_staged"] == 2
+    assert result["dq_rows_validated"] == 2
+    assert result["clean_rows_promoted"] == 2
+    assert result["core_rows_created"] == 2
+
+    run = db.session.get(ImportRun, run_id)
+    assert run.status == ImportRunStatus.SUCCEEDED
+    assert list(run.stage_checkpoints_json) == list(PIPELINE_STAGES)
+    assert StagingVolunteer.query.filter_by(run_id=run_id).count() == 2
+    assert Volunteer.query.count() == 2
+
+
+def test_ingest_csv_from_stage_reruns_only_the_tail(committing_app, tmp_path):
+    csv_path = _write_csv(tmp_path)
+    run_id = _create_run(csv_path).id
+    _ingest(run_id, csv_path)
+    staged_at = db.session.get(ImportRun, run_id).stage_checkpoints_json["staging"]["completed_at"]
+
+    with patch("flask_app.importer.tasks.stage_volunteers_from_csv") as stage, patch(
+        "flask_app.importer.tasks.generate_fuzzy_candidates", wraps=generate_fuzzy_candidates
+    ) as fuzzy:
+        result = _ingest(run_id, csv_path, from_stage="fuzzy")
+
+    stage.assert_not_called()
+    fuzzy.assert_called_once()
+    assert result["core_rows_created"] == 0
+    run = db.session.get(ImportRun, run_id)
+    assert run.status == ImportRunStatus.SUCCEEDED
+    assert run.stage_checkpoints_json["staging"]["completed_at"] == staged_at
+    assert CleanVolunteer.query.filter_by(run_id=run_id).count() == 2
+
+
+def test_ingest_csv_from_fuzzy_keeps_dedupe_counters_in_step(committing_app, tmp_path):
+    csv_path = _write_csv(tmp_path)
+    run_id = _create_run(csv_path).id
+    _ingest(run_id, csv_path)
+    primary, candidate = Volunteer.query.order_by(Volunteer.id).all()
+    db.session.add_all(
+        [
+            DedupeSuggestion(
+                run_id=run_id,
+                primary_contact_id=primary.id,
+                candidate_contact_id=candidate.id,
+                score=0.8,
+                match_type="fuzzy_review",
+            ),
+            DedupeSuggestion(
+                run_id=run_id,
+                primary_contact_id=candidate.id,
+                candidate_contact_id=primary.id,
+                score=0.9,
+                match_type="fuzzy_high",
+                decision=DedupeDecision.REJECTED,
+            ),
+        ]
+    )
+    db.session.commit()
+
+    _ingest(run_id, csv_path, from_stage="fuzzy")
+
+    assert DedupeSuggestion.query.filter_by(run_id=run_id, decision=DedupeDecision.PENDING).count() == 0
+    counts = {
+        (row.decision, row.match_type): row.suggestion_count
+        for row in DedupeQueueCounter.query
+        if row.suggestion_count
+    }
+    assert counts == {(DedupeDecision.REJECTED, "fuzzy_high"): 1}
+    assert not rebuild_dedupe_queue_counters(db.session, dry_run=True).drifted
+
+
+def test_ingest_csv_rerun_from_dq_resets_downstream_rows(committing_app, tmp_path):
+    csv_path = _write_csv(tmp_path)
+    run_id = _create_run(csv_path).id
+    _ingest(run_id, csv_path)
+
+    result = _ingest(run_id, csv_path, from_stage="dq")
+
+    assert result["dq_rows_evaluated"] == 2
+    assert result["clean_rows_promoted"] == 2
+    assert CleanVolunteer.query.filter_by(run_id=run_id).count() == 2
+    statuses = {row.status for row in StagingVolunteer.query.filter_by(run_id=run_id)}
+    assert statuses <= {StagingRecordStatus.VALIDATED, StagingRecordStatus.LOADED}
+
+
+def test_ingest_csv_stage_chain_runs_each_stage_as_its_own_task(committing_app, tmp_path):
+    committing_app.config["IMPORTER_STAGE_CHAIN_ENABLED"] = True
+    csv_path = _write_csv(tmp_path)
+    run_id = _create_run(csv_path).id
+
+    with patch("flask_app.importer.tasks.chain") as chain:
+        chain.return_value.apply_async.return_value.id = "chain-final"
+        queued = _ingest(run_id, csv_path)
+
+    assert queued == {"run_id": run_id, "chained_stages": list(PIPELINE_STAGES), "final_task_id": "chain-final"}
+    signatures = chain.call_args.args
+    assert [signature.task for signature in signatures] == [CSV_STAGE_TASKS[stage].name for stage in PIPELINE_STAGES]
+    assert db.session.get(ImportRun, run_id).status == ImportRunStatus.RUNNING
+
+    # Run the chain in order: each stage task hands its payload to the next.
+    payload = signatures[0].args[0]
+    for stage in PIPELINE_STAGES:
+        payload = CSV_STAGE_TASKS[stage].run(payload)
+
+    assert payload["rows_staged"] == 2
+    assert payload["dq_rows_validated"] == 2
+    assert payload["clean_rows_promoted"] == 2
+    assert payload["core_rows_created"] == 2
+    run = db.session.get(ImportRun, run_id)
+    assert run.status == ImportRunStatus.SUCCEEDED
+    assert list(run.stage_checkpoints_json) == list(PIPELINE_STAGES)
+    assert Volunteer.query.count() == 2
+
+
+def test_chained_stage_failure_marks_run_failed(committing_app, tmp_path):
+    csv_path = _write_csv(tmp_path)
+    run_id = _create_run(csv_path).id
+    payload = {"run_id": run_id, "file_path": str(csv_path), "source_system": "csv", "keep_file": True}
+    for stage in ("staging", "dq", "clean"):
+        payload = CSV_STAGE_TASKS[stage].run(payload)
+
+    with patch(
+        "flask_app.importer.tasks.generate_fuzzy_candidates", side_effect=RuntimeError("fuzzy failed")
+    ), pytest.raises(RuntimeError):
+        CSV_STAGE_TASKS["fuzzy"].run(payload)
+
+    run = db.session.get(ImportRun, run_id)
+    assert run.status == ImportRunStatus.FAILED
+    assert run.error_summary == "fuzzy failed"
+    assert resolve_start_stage(run) == "fuzzy"
+
+
+def test_resolve_start_stage_rejects_skipping_incomplete_stage(app, tmp_path):
+    run = _create_run(_write_csv(tmp_path))
+    run.stage_checkpoints_json = {"staging": {"completed_at": "2026-01-01T00:00:00+00:00", "summary": {}}}
+
+    assert resolve_start_stage(run) == "dq"
+    assert resolve_start_stage(run, "staging") == "staging"
+    with pytest.raises(ValueError, match="stage 'dq' has not completed"):
+        resolve_start_stage(run, "fuzzy")
+
+
+def test_importer_retry_cli_from_stage_keeps_checkpointed_counts(app, runner, tmp_path):
+    app.config.update({"IMPORTER_ENABLED": True, "IMPORTER_ADAPTERS": ("csv",), "IMPORTER_WORKER_ENABLED": True})
+    if "importer" not in app.blueprints:
+        init_importer(app)
+    run = _create_run(_write_csv(tmp_path))
+    run.status = ImportRunStatus.FAILED
+    run.counts_json = {"staging": {"volunteers": {"rows_staged": 2}}}
+    run.stage_checkpoints_json = {
+        stage: {"completed_at": "2026-01-01T00:00:00+00:00", "summary": {}} for stage in ("staging", "dq", "clean")
+    }
+    db.session.commit()
+
+    async_result = Mock()
+    async_result.id = "celery-task-resume"
+    celery_app = Mock()
+    celery_app.send_task.return_value = async_result
+    with patch("flask_app.importer.cli.get_celery_app", return_value=celery_app):
+        result = runner.invoke(args=["importer", "retry", "--run-id", str(run.id), "--from-stage", "clean"])
+
+    assert result.exit_code == 0, result.output
+    json_line = next(line for line in result.output.splitlines() if line.strip().startswith("{"))
+    assert json.loads(json_line)["status"] == "queued"
+    assert celery_app.send_task.call_args.kwargs["kwargs"]["from_stage"] == "clean"
+    run = db.session.get(ImportRun, run.id)
+    assert run.status == ImportRunStatus.PENDING
+    assert run.counts_json == {"staging": {"volunteers": {"rows_staged": 2}}}
+
+    with patch("flask_app.importer.cli.get_celery_app", return_value=celery_app):
+        result = runner.invoke(args=["importer", "retry", "--run-id", str(run.id), "--from-stage", "core"])
+    assert result.exit_code != 0
+    assert "stage 'fuzzy' has not completed" in result.output
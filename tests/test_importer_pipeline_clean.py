@@ -1,4 +1,6 @@
 from flask_app.importer.pipeline.clean import promote_clean_events, promote_clean_volunteers
+from sqlalchemy import event
+
 from flask_app.models import (
     CleanEvent,
     CleanVolunteer,
@@ -185,3 +187,103 @@ def test_promote_clean_events_dry_run(app):
     assert counts["dry_run"] is True
     metrics = run.metrics_json["clean"]["events"]
     assert metrics["rows_promoted"] == 0
+
+
+_PARITY_ROWS = (
+    # (payload_json, normalized_json, external_id)
+    ({"first_name": "Ada"}, {"first_name": " Ada ", "last_name": "Lovelace", "email": "ADA@Example.org "}, "ext-1"),
+    (
+        {"first_name": "Grace", "last_name": "Hopper"},
+        {"email": {"primary": "", "work": "Grace@Navy.mil"}, "phone": {"mobile": " +14155550102 "}},
+        "003A",
+    ),
+    ({"first_name": "Alan", "last_name": "Turing", "email": "alan@example.org"}, {"email": {}}, None),
+    ({}, {"first_name": "Katherine", "last_name": "Johnson", "email": "KÁTHERINE@example.org"}, "ext-4"),
+    ({}, {"first_name": "Edsger", "last_name": 7, "external_id": 42}, "ext-5"),
+    ({"first_name": "Barbara"}, {"first_name": "Barbara", "last_name": "  "}, "ext-6"),
+    ({}, {"first_name": "Margaret", "last_name": "Hamilton", "external_system": " sheets "}, ""),
+)
+
+
+def _promote_parity_rows(app, mode: str) -> tuple[object, list[tuple]]:
+    app.config["IMPORTER_CLEAN_PROMOTION"] = mode
+    run = _make_import_run()
+    for sequence_number, (payload, normalized, external_id) in enumerate(_PARITY_ROWS, start=1):
+        db.session.add(
+            StagingVolunteer(
+                run_id=run.id,
+                sequence_number=sequence_number,
+                source_record_id=f"row-{sequence_number}",
+                external_system="csv",
+                external_id=external_id,
+                payload_json=payload,
+                normalized_json=normalized,
+                checksum=f"hash-{sequence_number}",
+                status=StagingRecordStatus.VALIDATED,
+            )
+        )
+    db.session.commit()
+
+    summary = promote_clean_volunteers(run, dry_run=False)
+    db.session.commit()
+    clean_rows = CleanVolunteer.query.filter_by(run_id=run.id).order_by(CleanVolunteer.checksum).all()
+    return summary, [
+        (
+            row.checksum,
+            row.external_system,
+            row.external_id,
+            row.first_name,
+            row.last_name,
+            row.email,
+            row.phone_e164,
+            row.payload_json,
+        )
+        for row in clean_rows
+    ]
+
+
+def test_set_based_promotion_matches_python_path(app):
+    python_summary, python_rows = _promote_parity_rows(app, "python")
+    set_summary, set_rows = _promote_parity_rows(app, "set")
+
+    assert set_rows == python_rows
+    assert (set_summary.rows_considered, set_summary.rows_promoted, set_summary.rows_skipped) == (
+        python_summary.rows_considered,
+        python_summary.rows_promoted,
+        python_summary.rows_skipped,
+    )
+    assert set_summary.rows_promoted == 6
+    assert set_summary.rows_skipped == 1
+
+
+def test_set_based_promotion_inserts_in_one_statement(app):
+    app.config["IMPORTER_CLEAN_PROMOTION"] = "set"
+    run = _make_import_run()
+    for sequence_number in range(1, 6):
+        _make_staging_row(
+            run,
+            status=StagingRecordStatus.VALIDATED,
+            email=f"ada{sequence_number}@example.org",
+            sequence_number=sequence_number,
+        )
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _capture)
+    try:
+        summary = promote_clean_volunteers(run, dry_run=False)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _capture)
+    db.session.commit()
+
+    assert summary.rows_promoted == 5
+    assert summary.rows_skipped == 0
+    assert [statement for statement in statements if statement.lstrip().upper().startswith("INSERT")] == [
+        statement for statement in statements if "INSERT INTO clean_volunteers" in statement
+    ]
+    assert len([statement for statement in statements if "INSERT INTO clean_volunteers" in statement]) == 1
+    rerun = promote_clean_volunteers(run, dry_run=False)
+    assert (rerun.rows_considered, rerun.rows_promoted, rerun.rows_skipped) == (5, 0, 5)
@@ -1,14 +1,27 @@
 import io
 from pathlib import Path
 
+import pytest
+
 from flask_app.importer.pipeline import (
+    FusedVolunteerWriter,
+    StagingWriter,
+    build_staging_row,
     load_core_volunteers,
     promote_clean_volunteers,
     run_minimal_dq,
     stage_volunteers_from_csv,
 )
 from flask_app.models.base import db
-from flask_app.models.importer.schema import CleanVolunteer, ImportRun, ImportRunStatus, StagingVolunteer
+from flask_app.models.importer.schema import (
+    CleanVolunteer,
+    DataQualityViolation,
+    ExternalIdMap,
+    ImportRun,
+    ImportRunStatus,
+    StagingRecordStatus,
+    StagingVolunteer,
+)
 
 
 def _make_csv_stream() -> io.StringIO:
@@ -95,3 +108,187 @@ def test_full_pipeline_dry_run_with_golden_dataset(app):
     assert CleanVolunteer.query.count() == 0
     metrics_core = run.metrics_json["core"]["volunteers"]
     assert metrics_core["rows_created"] == 0
+
+
+def test_csv_dry_run_streams_dq_and_clean_checks(app):
+    app.config["IMPORTER_DRY_RUN_VIOLATION_SAMPLE_SIZE"] = 1
+    run = _create_import_run(dry_run=True)
+    stream = io.StringIO(
+        "first_name,last_name,email,phone\n"
+        "Jane,Doe,jane@example.org,+14155550101\n"
+        "Bad,Email,not-an-email,\n"
+        "Worse,Email,also-bad,\n"
+        ",NoFirst,nofirst@example.org,\n"
+    )
+    staging_summary = stage_volunteers_from_csv(run, stream, source_system="csv", dry_run=True)
+    dq_summary = run_minimal_dq(run, dry_run=True, streamed_summary=staging_summary.streamed_dq)
+    clean_summary = promote_clean_volunteers(run, dry_run=True, streamed_summary=staging_summary.streamed_clean)
+    db.session.commit()
+
+    assert StagingVolunteer.query.count() == 0
+    assert dq_summary.rows_evaluated == 4
+    assert dq_summary.rows_quarantined == 2
+    assert dq_summary.rule_counts == {"VOL_EMAIL_FORMAT": 2}
+    assert len(dq_summary.violations) == 1
+    assert clean_summary.rows_considered == 2
+    assert clean_summary.rows_skipped == 1
+    assert run.counts_json["dq"]["volunteers"]["rule_counts"] == {"VOL_EMAIL_FORMAT": 2}
+    assert run.counts_json["clean"]["volunteers"]["rows_considered"] == 2
+
+
+def test_csv_dry_run_quarantines_rows_with_warning_violations(app):
+    # Dry runs keep the baseline rule: any violation quarantines, whatever its severity.
+    app.config["IMPORTER_WARN_ON_MISSING_CONTACT"] = True
+    run = _create_import_run(dry_run=True)
+    stream = io.StringIO("first_name,last_name,email,phone\nJane,Doe,jane@example.org,\nNo,Contact,,\n")
+
+    staging_summary = stage_volunteers_from_csv(run, stream, source_system="csv", dry_run=True)
+    dq_summary = run_minimal_dq(run, dry_run=True, streamed_summary=staging_summary.streamed_dq)
+
+    assert dq_summary.rows_validated == 1
+    assert dq_summary.rows_quarantined == 1
+    assert dq_summary.rule_counts == {"VOL_CONTACT_REQUIRED": 1}
+    assert staging_summary.streamed_clean.rows_considered == 1
+
+
+_FUSED_CSV = (
+    "external_id,first_name,last_name,email,phone\n"
+    "vol-1,Jane,Doe,jane@example.org,+14155550101\n"
+    "vol-2,Bad,Email,not-an-email,\n"
+    ",NoPhone,Person,nophone@example.org,\n"
+    "vol-4,,NoFirst,nofirst@example.org,\n"
+    "vol-5,Unchanged,Row,same@example.org,\n"
+)
+
+
+def _run_csv_stages(*, fused: bool) -> tuple[ImportRun, object, object, object]:
+    run = _create_import_run()
+    staging_summary = stage_volunteers_from_csv(
+        run, io.StringIO(_FUSED_CSV), source_system="csv", batch_size=2, fused=fused
+    )
+    dq_summary = run_minimal_dq(run, streamed_summary=staging_summary.streamed_dq)
+    clean_summary = promote_clean_volunteers(run, streamed_summary=staging_summary.streamed_clean)
+    db.session.commit()
+    return run, staging_summary, dq_summary, clean_summary
+
+
+def _audit_trail(run: ImportRun) -> tuple[list, list, list]:
+    staging_rows = StagingVolunteer.query.filter_by(run_id=run.id).order_by(StagingVolunteer.sequence_number).all()
+    sequence_by_id = {row.id: row.sequence_number for row in staging_rows}
+    violations = DataQualityViolation.query.filter_by(run_id=run.id).all()
+    clean_rows = CleanVolunteer.query.filter_by(run_id=run.id).all()
+    return (
+        [
+            (row.sequence_number, row.status, row.last_error, row.checksum, row.processed_at is None)
+            for row in staging_rows
+        ],
+        sorted(
+            (
+                sequence_by_id[violation.staging_volunteer_id],
+                violation.rule_code,
+                violation.severity,
+                violation.record_key,
+                violation.message,
+                violation.details_json,
+            )
+            for violation in violations
+        ),
+        sorted(
+            (
+                sequence_by_id[row.staging_volunteer_id],
+                row.external_system,
+                row.external_id,
+                row.first_name,
+                row.last_name,
+                row.email,
+                row.phone_e164,
+                row.checksum,
+                row.payload_json,
+            )
+            for row in clean_rows
+        ),
+    )
+
+
+def test_fused_csv_ingest_matches_staged_pipeline(app):
+    # Seed the identifier map so one row is detected as unchanged since its last load.
+    probe_run, _, _, _ = _run_csv_stages(fused=False)
+    unchanged_checksum = StagingVolunteer.query.filter_by(run_id=probe_run.id, external_id="vol-5").one().checksum
+    db.session.add(
+        ExternalIdMap(
+            entity_type="volunteer",
+            entity_id=1,
+            external_system="csv",
+            external_id="vol-5",
+            is_active=True,
+            last_loaded_checksum=unchanged_checksum,
+        )
+    )
+    db.session.commit()
+
+    staged_run, staged_staging, staged_dq, staged_clean = _run_csv_stages(fused=False)
+    fused_run, fused_staging, fused_dq, fused_clean = _run_csv_stages(fused=True)
+
+    assert _audit_trail(fused_run) == _audit_trail(staged_run)
+    statuses = [status for _, status, *_ in _audit_trail(fused_run)[0]]
+    assert statuses.count(StagingRecordStatus.UNCHANGED) == 1
+    assert statuses.count(StagingRecordStatus.QUARANTINED) == 1
+    assert fused_staging.rows_unchanged == staged_staging.rows_unchanged == 1
+    assert (fused_dq.rows_evaluated, fused_dq.rows_validated, fused_dq.rows_quarantined) == (
+        staged_dq.rows_evaluated,
+        staged_dq.rows_validated,
+        staged_dq.rows_quarantined,
+    )
+    assert fused_dq.rule_counts == staged_dq.rule_counts
+    assert (fused_clean.rows_considered, fused_clean.rows_promoted, fused_clean.rows_skipped) == (
+        staged_clean.rows_considered,
+        staged_clean.rows_promoted,
+        staged_clean.rows_skipped,
+    )
+    assert fused_run.counts_json["dq"] == staged_run.counts_json["dq"]
+    assert fused_run.counts_json["clean"] == staged_run.counts_json["clean"]
+    assert ExternalIdMap.query.filter_by(external_id="vol-5").one().run_id == fused_run.id
+
+
+def _fused_batch(run: ImportRun, rows: list[tuple[int, str, str]]) -> list[tuple[dict, dict]]:
+    batch = []
+    for sequence_number, external_id, email in rows:
+        normalized = {"external_id": external_id, "first_name": "Pat", "last_name": external_id, "email": email}
+        staging_row = build_staging_row(
+            run_id=run.id,
+            sequence_number=sequence_number,
+            source_record_id=external_id,
+            external_system="csv",
+            external_id=external_id,
+            payload=dict(normalized),
+            normalized=normalized,
+        )
+        batch.append((staging_row, normalized))
+    return batch
+
+
+@pytest.mark.parametrize("returning_ids", [True, False])
+def test_fused_writer_links_rows_when_batches_share_a_sequence_range(app, monkeypatch, returning_ids):
+    if not returning_ids:
+        # Fall back to looking ids up by sequence number, as the COPY writer must.
+        def write_without_ids(self, rows):
+            self.write(rows)
+            return None
+
+        monkeypatch.setattr(StagingWriter, "write_returning_ids", write_without_ids)
+
+    run = _create_import_run()
+    writer = FusedVolunteerWriter(run)
+    # The second batch's sequence range (1-4) spans both rows the first batch wrote.
+    writer.write(_fused_batch(run, [(2, "vol-2", "not-an-email"), (3, "vol-3", "three@example.org")]))
+    writer.write(_fused_batch(run, [(1, "vol-1", "bad-email"), (4, "vol-4", "four@example.org")]))
+    db.session.commit()
+
+    external_ids = {row.id: row.external_id for row in StagingVolunteer.query.filter_by(run_id=run.id)}
+    violations = DataQualityViolation.query.filter_by(run_id=run.id).all()
+    clean_rows = CleanVolunteer.query.filter_by(run_id=run.id).all()
+    assert sorted(external_ids[violation.staging_volunteer_id] for violation in violations) == ["vol-1", "vol-2"]
+    assert sorted((external_ids[row.staging_volunteer_id], row.external_id) for row in clean_rows) == [
+        ("vol-3", "vol-3"),
+        ("vol-4", "vol-4"),
+    ]
@@ -0,0 +1,59 @@
+from sqlalchemy import event, insert
+
+from flask_app.importer.pipeline.slug_registry import SlugRegistry, slugify
+from flask_app.models import Organization
+from flask_app.models.base import db
+
+
+def _add_organizations(*slugs: str) -> None:
+    for slug in slugs:
+        db.session.add(Organization(name=slug, slug=slug))
+    db.session.commit()
+
+
+def test_slugify_matches_loader_rules():
+    assert slugify("  Career Day: Spring_2025! ", "event") == "career-day-spring-2025"
+    assert slugify("!!!", "event") == "event"
+
+
+def test_allocate_loads_each_base_once_and_fills_lowest_free_suffix(app):
+    _add_organizations("career-day", "career-day-1", "career-day-3", "career-day-fair", "career-day-2024")
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    registry = SlugRegistry(db.session, Organization, fallback="organization")
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        allocated = [registry.allocate("Career Day") for _ in range(3)]
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert allocated == ["career-day-2", "career-day-4", "career-day-5"]
+    assert len(statements) == 1
+
+
+def test_allocate_keeps_slug_of_renamed_row(app):
+    _add_organizations("mock-interviews", "mock-interviews-1")
+    renamed = Organization.query.filter_by(slug="mock-interviews-1").one()
+    registry = SlugRegistry(db.session, Organization, fallback="organization")
+
+    assert registry.allocate("Mock  Interviews", exclude_id=renamed.id) == "mock-interviews-1"
+    assert registry.allocate("Mock Interviews") == "mock-interviews-2"
+
+
+def test_save_reallocates_when_slug_was_taken_concurrently(app):
+    _add_organizations("science-fair")
+    registry = SlugRegistry(db.session, Organization, fallback="organization")
+    first = Organization(name="Science Fair")
+    registry.save(first, "Science Fair")
+    # Another run takes the next suffix after this registry loaded its snapshot.
+    db.session.execute(insert(Organization.__table__).values(name="Taken", slug="science-fair-2", is_active=True))
+
+    second = Organization(name="Science Fair")
+    registry.save(second, "Science Fair")
+
+    assert first.slug == "science-fair-1"
+    assert second.id is not None
+    assert second.slug == "science-fair-3"
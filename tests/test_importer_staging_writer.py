@@ -0,0 +1,168 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.sql.schema import CallableColumnDefault
+
+from flask_app.importer.pipeline.staging import compute_checksum, max_staging_source_timestamps
+from flask_app.importer.pipeline.staging_writer import (
+    StagingWriter,
+    build_staging_row,
+    resolve_staging_writer_mode,
+)
+from flask_app.models.base import db
+from flask_app.models.importer.schema import ImportRun, ImportRunStatus, StagingRecordStatus, StagingVolunteer
+
+
+def _create_import_run() -> ImportRun:
+    run = ImportRun(source="csv", adapter="csv", status=ImportRunStatus.PENDING)
+    db.session.add(run)
+    db.session.commit()
+    return run
+
+
+def _rows(run_id: int, count: int = 3) -> list[dict]:
+    return [
+        build_staging_row(
+            run_id=run_id,
+            sequence_number=index,
+            source_record_id=f"ext-{index}",
+            external_system="csv",
+            external_id=f"ext-{index}",
+            payload={"first_name": f"Vol{index}", "notes": "line\tone\nline two"},
+            normalized={"first_name": f"Vol{index}", "email": f"vol{index}@example.org"},
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def test_build_staging_row_checksum_matches_compute_checksum():
+    normalized = {"last_name": "Doe", "first_name": "Jane", "email": None}
+    row = build_staging_row(
+        run_id=1,
+        sequence_number=1,
+        source_record_id="seq-1",
+        external_system="csv",
+        external_id=None,
+        payload={"First": "Jane"},
+        normalized=normalized,
+    )
+    assert row["checksum"] == compute_checksum(normalized)
+
+
+def test_build_staging_row_extracts_source_timestamps(app):
+    run = _create_import_run()
+    rows = [
+        build_staging_row(
+            run_id=run.id,
+            sequence_number=index,
+            source_record_id=f"sf-{index}",
+            external_system="salesforce",
+            external_id=f"sf-{index}",
+            payload={"Id": f"sf-{index}"},
+            normalized={"metadata": {"source_modstamp": modstamp, "source_last_modified": "2024-02-01T08:00:00+02:00"}},
+        )
+        for index, modstamp in enumerate(["2024-03-01T10:00:00.000Z", "2024-03-02T09:30:00.000+0000", "not a date"], 1)
+    ]
+    assert rows[0]["source_modstamp"] == datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+    assert rows[2]["source_modstamp"] is None
+
+    StagingWriter(StagingVolunteer, mode="core").write(rows)
+    db.session.commit()
+
+    assert max_staging_source_timestamps(run.id, StagingVolunteer) == (
+        datetime(2024, 3, 2, 9, 30, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, 6, tzinfo=timezone.utc),
+    )
+    assert max_staging_source_timestamps(run.id + 1, StagingVolunteer) == (None, None)
+
+
+@pytest.mark.parametrize("mode", ["core", "orm"])
+def test_staging_writer_persists_rows(app, mode):
+    run = _create_import_run()
+    writer = StagingWriter(StagingVolunteer, mode=mode)
+
+    written = writer.write(_rows(run.id))
+    db.session.commit()
+
+    assert written == 3
+    assert writer.rows_written == 3
+    staged = StagingVolunteer.query.order_by(StagingVolunteer.sequence_number).all()
+    assert [row.sequence_number for row in staged] == [1, 2, 3]
+    assert staged[0].status == StagingRecordStatus.LANDED
+    assert staged[0].created_at is not None
+    assert staged[0].payload_json["notes"] == "line\tone\nline two"
+    assert staged[0].normalized_json == {"first_name": "Vol1", "email": "vol1@example.org"}
+    assert staged[0].checksum == compute_checksum(staged[0].normalized_json)
+
+
+def test_resolve_staging_writer_mode_falls_back_to_core_on_sqlite(app):
+    assert resolve_staging_writer_mode("auto") == "core"
+    assert resolve_staging_writer_mode("copy") == "core"
+    assert resolve_staging_writer_mode("orm") == "orm"
+    app.config["IMPORTER_STAGING_WRITER"] = "bogus"
+    assert resolve_staging_writer_mode() == "core"
+
+
+def test_staging_writer_copy_renders_text_format(app, monkeypatch):
+    run = _create_import_run()
+    writer = StagingWriter(StagingVolunteer, mode="core")
+    writer.mode = "copy"
+    captured = {}
+
+    class FakeCursor:
+        def copy_expert(self, sql, buffer):
+            captured["sql"] = sql
+            captured["data"] = buffer.read()
+
+        def close(self):
+            pass
+
+    class FakeConnection:
+        connection = type("RawConnection", (), {"cursor": lambda self: FakeCursor()})()
+
+    monkeypatch.setattr(db.session, "connection", lambda: FakeConnection())
+    writer.write(_rows(run.id, count=2))
+
+    assert captured["sql"].startswith("COPY staging_volunteers (")
+    columns = captured["sql"].split("(", 1)[1].split(")", 1)[0].split(", ")
+    lines = captured["data"].splitlines()
+    assert len(lines) == 2
+    fields = dict(zip(columns, lines[0].split("\t")))
+    assert fields["sequence_number"] == "1"
+    assert fields["status"] == "LANDED"
+    assert fields["last_error"] == "\\N"
+    assert "\\\\t" in fields["payload_json"] and "\\\\n" in fields["payload_json"]
+
+
+def test_staging_writer_copy_resolves_callable_defaults(app, monkeypatch):
+    run = _create_import_run()
+    writer = StagingWriter(StagingVolunteer, mode="core")
+    writer.mode = "copy"
+    captured = {}
+
+    class FakeCursor:
+        def copy_expert(self, sql, buffer):
+            captured["sql"] = sql
+            captured["data"] = buffer.read()
+
+        def close(self):
+            pass
+
+    class FakeConnection:
+        connection = type("RawConnection", (), {"cursor": lambda self: FakeCursor()})()
+
+    # A context-aware default, as SQLAlchemy would call it during an INSERT.
+    last_error = StagingVolunteer.__table__.c.last_error
+    monkeypatch.setattr(
+        last_error,
+        "default",
+        CallableColumnDefault(lambda context: f"default for {context.get_current_parameters()['external_id']}"),
+    )
+    monkeypatch.setattr(db.session, "connection", lambda: FakeConnection())
+    writer.write(_rows(run.id, count=2))
+
+    columns = captured["sql"].split("(", 1)[1].split(")", 1)[0].split(", ")
+    rows = [dict(zip(columns, line.split("\t"))) for line in captured["data"].splitlines()]
+    assert [row["last_error"] for row in rows] == ["default for ext-1", "default for ext-2"]
+    # Zero-argument callable defaults are still evaluated once per batch.
+    assert rows[0]["landed_at"] == rows[1]["landed_at"] != "\\N"
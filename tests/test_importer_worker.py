@@ -5,7 +5,7 @@ import pytest
 from flask import Flask
 
 from flask_app.importer import get_celery_app, init_importer
-from flask_app.importer.celery_app import DEFAULT_QUEUE_NAME
+from flask_app.importer.celery_app import CPU_QUEUE_NAME, DEFAULT_QUEUE_NAME, IO_QUEUE_NAME, stage_task_name
 
 
 def build_importer_app(**overrides) -> Flask:
@@ -49,6 +49,25 @@ def test_celery_defaults_to_sqlite_transport(tmp_path):
     assert celery_app.conf.worker_prefetch_multiplier == 1
 
 
+def test_stage_tasks_route_to_stage_queues_with_own_limits():
+    app = build_importer_app(
+        CELERY_CONFIG={"task_always_eager": True, "task_eager_propagates": True},
+        IMPORTER_STAGE_TIME_LIMITS={"fuzzy": 3600},
+        IMPORTER_STAGE_MAX_RETRIES={"core": 5},
+    )
+    celery_app = get_celery_app(app)
+
+    routes = celery_app.conf.task_routes
+    assert routes[stage_task_name("staging")] == {"queue": IO_QUEUE_NAME}
+    assert routes[stage_task_name("fuzzy")] == {"queue": CPU_QUEUE_NAME}
+    assert {queue.name for queue in celery_app.conf.task_queues} == {DEFAULT_QUEUE_NAME, IO_QUEUE_NAME, CPU_QUEUE_NAME}
+
+    fuzzy_task = celery_app.tasks[stage_task_name("fuzzy")]
+    assert fuzzy_task.time_limit == 3600
+    assert fuzzy_task.soft_time_limit == 2880
+    assert celery_app.tasks[stage_task_name("core")].max_retries == 5
+
+
 def test_worker_ping_cli(monkeypatch):
     app = build_importer_app(
         IMPORTER_WORKER_ENABLED=True,
@@ -446,3 +446,51 @@ def test_loader_handles_status_change(app):
     db.session.refresh(contact_org)
     assert contact_org.end_date is not None
     assert contact_org.end_date == date.today()
+
+
+def test_loader_resolves_primary_once_per_chunk(app):
+    """Several primary affiliations for one contact in a chunk leave only the last one primary."""
+    from sqlalchemy import event
+
+    _ensure_watermark()
+    run = _create_run()
+
+    contact, _ = _create_contact_and_map("0035f00000HYEfOAAX")
+    orgs = [_create_organization_and_map(f"0015f00000JUL8{suffix}AAH")[0] for suffix in ("s", "t", "u")]
+    db.session.add(
+        ContactOrganization(
+            contact_id=contact.id, organization_id=orgs[0].id, is_primary=True, start_date=date(2020, 1, 1)
+        )
+    )
+    db.session.commit()
+
+    for seq, (suffix, org_external_id) in enumerate(
+        (("1", "0015f00000JUL8sAAH"), ("2", "0015f00000JUL8tAAH"), ("3", "0015f00000JUL8uAAH")), start=1
+    ):
+        payload = _make_payload(f"a0H5f000006S0G{suffix}EAK", "0035f00000HYEfOAAX", org_external_id, is_primary=True)
+        staging_row = _add_staging_row(run, seq, payload)
+        staging_row.status = StagingRecordStatus.VALIDATED
+        _add_clean_row(run, staging_row, payload)
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "FROM contact_organizations" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        counters = SalesforceAffiliationLoader(run).execute()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert counters.created == 2
+    assert counters.updated == 1
+    assert len(statements) == 1
+    links = {link.organization_id: link for link in ContactOrganization.query.filter_by(contact_id=contact.id)}
+    assert {org_id for org_id, link in links.items() if link.is_primary} == {orgs[2].id}
+    for clean_row in CleanAffiliation.query.filter_by(run_id=run.id):
+        assert clean_row.core_contact_organization_id in {link.id for link in links.values()}
+    entries = ExternalIdMap.query.filter_by(entity_type="salesforce_affiliation").all()
+    assert len(entries) == 3
+    assert {entry.entity_id for entry in entries} == {link.id for link in links.values()}
@@ -361,3 +361,64 @@ def test_loader_handles_deleted_event(app):
     # Verify clean_row was updated
     db.session.refresh(clean_row)
     assert clean_row.load_action == "deleted"
+
+
+def test_loader_diffs_organization_links(app):
+    """Existing event links are kept, changed, or removed in place; lookups happen once per chunk."""
+    from sqlalchemy import event as sa_event
+
+    from flask_app.models import Organization
+    from flask_app.models.event.models import EventOrganization
+
+    _ensure_watermark()
+    organizations = {}
+    for account_id in ("001DIST", "001SCHA", "001SCHB"):
+        organization = Organization(name=f"Org {account_id}", slug=f"org-{account_id.lower()}")
+        db.session.add(organization)
+        db.session.flush()
+        db.session.add(
+            ExternalIdMap(
+                entity_type="salesforce_organization",
+                entity_id=organization.id,
+                external_system="salesforce",
+                external_id=account_id,
+                is_active=True,
+            )
+        )
+        organizations[account_id] = organization.id
+    db.session.commit()
+
+    def _load(metadata: dict) -> None:
+        run = _create_run()
+        payload = _make_payload("a1hUV0000041IS9YAM", "Career Day")
+        payload["metadata"].update(metadata)
+        staging_row = _add_staging_row(run, 1, payload)
+        staging_row.status = StagingRecordStatus.VALIDATED
+        db.session.commit()
+        _add_clean_row(run, staging_row, payload)
+        SalesforceEventLoader(run).execute()
+
+    _load({"district_id": "001DIST", "school_id": "001SCHA"})
+    event = Event.query.filter_by(title="Career Day").one()
+    district_link_id = EventOrganization.query.filter_by(
+        event_id=event.id, organization_id=organizations["001DIST"]
+    ).one().id
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "event_organizations" in statement:
+            statements.append(statement)
+
+    sa_event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        _load({"district_id": "001DIST", "school_id": "001SCHB", "parent_account_id": "001DIST"})
+    finally:
+        sa_event.remove(db.engine, "before_cursor_execute", _record)
+
+    links = {link.organization_id: link for link in EventOrganization.query.filter_by(event_id=event.id)}
+    assert set(links) == {organizations["001DIST"], organizations["001SCHB"]}
+    assert links[organizations["001DIST"]].id == district_link_id
+    assert links[organizations["001DIST"]].is_primary is True
+    assert links[organizations["001SCHB"]].is_primary is False
+    assert len(statements) == 1
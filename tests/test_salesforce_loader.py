@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+from sqlalchemy import event
+
+from flask_app.importer.pipeline.external_id_cache import EXTERNAL_ID_CHUNK_SIZE, ExternalIdMapCache
 from flask_app.importer.pipeline.salesforce_loader import SalesforceContactLoader
-from flask_app.models import ContactEmail, EmailType, ExternalIdMap, Volunteer
+from flask_app.models import ContactEmail, ContactPhone, EmailType, ExternalIdMap, Volunteer
 from flask_app.models.base import db
 from flask_app.models.importer.schema import (
     CleanVolunteer,
@@ -103,6 +106,109 @@ def test_loader_detects_updates_and_unchanged(app):
     assert entry is not None and entry.is_active
 
 
+def test_loader_fetches_external_id_map_once_per_chunk(app):
+    _ensure_watermark()
+    run = _create_run()
+    for sequence, external_id in enumerate(("010", "011", "012"), start=1):
+        _add_staging_row(run, sequence, _make_payload(external_id))
+    SalesforceContactLoader(run).execute()
+
+    run2 = _create_run()
+    for sequence, external_id in enumerate(("010", "011", "012"), start=1):
+        _add_staging_row(run2, sequence, _make_payload(external_id, first_name="Grace"))
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "external_id_map" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        counters = SalesforceContactLoader(run2).execute()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert counters.updated == 3
+    assert len([statement for statement in statements if statement.lstrip().startswith("SELECT")]) == 1
+    assert len([statement for statement in statements if statement.lstrip().startswith("UPDATE")]) == 1
+    entries = ExternalIdMap.query.filter(ExternalIdMap.external_id.in_(["010", "011", "012"])).all()
+    assert {entry.metadata_json["last_payload"]["first_name"] for entry in entries} == {"Grace"}
+
+
+def test_external_id_cache_forgets_each_chunk_on_flush(app):
+    _ensure_watermark()
+    run = _create_run()
+    _add_staging_row(run, 1, _make_payload("015"))
+    SalesforceContactLoader(run).execute()
+
+    cache = ExternalIdMapCache(db.session, entity_type="salesforce_contact")
+    cache.prefetch(["015"])
+    cache.get("015").last_seen_at = datetime(2030, 1, 1)
+    cache.add(
+        ExternalIdMap(entity_type="salesforce_contact", entity_id=1, external_system="salesforce", external_id="016")
+    )
+    cache.flush()
+    assert cache._entries == {} and not cache._fetched and not cache._detached
+
+    # A later chunk fetches the entry again and sees what the earlier flush wrote.
+    entry = cache.get("015")
+    assert entry.last_seen_at == datetime(2030, 1, 1)
+    assert cache.get("016") is not None
+    cache.flush()
+    assert cache._entries == {}
+
+
+def test_loader_streams_staging_fallback_rows(app):
+    _ensure_watermark()
+    run = _create_run()
+    for sequence, external_id in enumerate(("040", "041"), start=1):
+        _add_staging_row(run, sequence, _make_payload(external_id))
+    streamed: list[object] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "FROM staging_volunteers" in statement:
+            streamed.append(context.execution_options.get("yield_per"))
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        counters = SalesforceContactLoader(run).execute()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert counters.created == 2
+    assert EXTERNAL_ID_CHUNK_SIZE in streamed
+
+
+def test_loader_skips_hydrating_unchanged_contacts(app):
+    _ensure_watermark()
+    run = _create_run()
+    _add_staging_row(run, 1, _make_payload("020"))
+    SalesforceContactLoader(run).execute()
+    entry = ExternalIdMap.query.filter_by(external_system="salesforce", external_id="020").first()
+    first_seen = entry.last_seen_at
+    db.session.expunge_all()
+
+    run2 = _create_run()
+    _add_staging_row(run2, 1, _make_payload("020"))
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        counters = SalesforceContactLoader(run2).execute()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert counters.unchanged == 1
+    assert not [statement for statement in statements if "contact_emails" in statement or "contact_phones" in statement]
+    entry = ExternalIdMap.query.filter_by(external_system="salesforce", external_id="020").first()
+    assert entry.last_seen_at.replace(tzinfo=None) >= first_seen.replace(tzinfo=None)
+    clean_row = CleanVolunteer.query.filter_by(run_id=run2.id).first()
+    assert clean_row is None or clean_row.load_action == "no_change"
+
+
 def test_loader_handles_deletes(app):
     _ensure_watermark()
     run = _create_run()
@@ -512,6 +618,59 @@ def test_loader_records_skip_for_duplicate_email(app):
         assert clean_vol is not None
 
 
+def test_loader_moves_primary_email_and_phone_on_update(app):
+    _ensure_watermark()
+    run = _create_run()
+    payload = _make_payload("030")
+    payload["email"] = {"primary": "ada@example.org", "work": "ada@work.example.org"}
+    payload["phone"] = {"mobile": "+14155550101", "home": "+14155550102"}
+    _add_staging_row(run, 1, payload)
+    SalesforceContactLoader(run).execute()
+
+    run2 = _create_run()
+    payload = _make_payload("030")
+    payload["email"] = {
+        "primary": "ada@example.org",
+        "work": "ada@work.example.org",
+        "alternate": "ada@other.example.org",
+        "preferred_type": "work",
+    }
+    payload["phone"] = {"mobile": "+14155550101", "home": "+14155550102", "preferred_type": "home"}
+    _add_staging_row(run2, 1, payload)
+    counters = SalesforceContactLoader(run2).execute()
+
+    assert counters.updated == 1
+    volunteer = Volunteer.query.filter_by(first_name="Ada").one()
+    emails = {email.email: email for email in ContactEmail.query.filter_by(contact_id=volunteer.id)}
+    assert set(emails) == {"ada@example.org", "ada@work.example.org", "ada@other.example.org"}
+    assert [address for address, email in emails.items() if email.is_primary] == ["ada@work.example.org"]
+    phones = {phone.phone_number: phone for phone in ContactPhone.query.filter_by(contact_id=volunteer.id)}
+    assert [number for number, phone in phones.items() if phone.is_primary] == ["+14155550102"]
+
+
+def test_loader_skips_duplicate_email_queued_in_same_chunk(app):
+    _ensure_watermark()
+    run = _create_run()
+    first = _make_payload("031", first_name="Ada")
+    first["last_name"] = "Lovelace"
+    first["email"] = "shared@example.org"
+    second = _make_payload("032", first_name="Grace")
+    second["last_name"] = "Hopper"
+    second["email"] = "shared@example.org"
+    _add_staging_row(run, 1, first)
+    _add_staging_row(run, 2, second)
+
+    from flask_app.importer.pipeline.clean import promote_clean_volunteers
+
+    promote_clean_volunteers(run, dry_run=False)
+    db.session.commit()
+    counters = SalesforceContactLoader(run).execute()
+
+    assert counters.created == 1
+    assert ContactEmail.query.filter_by(email="shared@example.org").count() == 1
+    assert ImportSkip.query.filter_by(run_id=run.id, skip_type=ImportSkipType.DUPLICATE_EMAIL).count() == 1
+
+
 def test_loader_records_skip_for_duplicate_name(app):
     """Test that loader records ImportSkip when skipping duplicate name."""
     _ensure_watermark()
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from flask_app.importer.mapping import MappingField, MappingSpec, MappingTransform, SalesforceMappingTransformer
+from flask_app.importer.mapping import (
+    MappingField,
+    MappingSpec,
+    MappingTransform,
+    SalesforceMappingTransformer,
+    compile_mapping,
+)
 
 
 def _make_spec():
@@ -429,3 +435,147 @@ def test_transformer_event_type_normalization():
             }
         )
         assert result.canonical["cancellation_reason"] == expected, f"Failed for {reason}"
+
+
+def test_compile_mapping_resolves_plan():
+    spec = MappingSpec(
+        version=1,
+        adapter="salesforce",
+        object_name="Contact",
+        fields=(
+            MappingField(source="Id", target="external_id", required=True),
+            MappingField(source="Phone", target="phone.primary", transform="normalize_phone"),
+            MappingField(source="Phone", target="phone.raw"),
+            MappingField(source="DoNotCall", target="contact_preferences.do_not_call", default=False),
+            MappingField(source="Title", target="employment.title", transform="missing_transform"),
+            MappingField(target="metadata.source_system", default="salesforce"),
+        ),
+        transforms={},
+        checksum="fake",
+        path=None,  # type: ignore[arg-type]
+    )
+    plan = compile_mapping(spec)
+
+    assert plan.source_fields == frozenset({"Id", "Phone", "DoNotCall", "Title"})
+    assert plan.stats_sources == ("Id", "Phone", "DoNotCall", "Title")
+    assert plan.stats_multiplicity == (1, 2, 1, 1)
+    phone_field = plan.fields[1]
+    assert phone_field.parents == ("phone",)
+    assert phone_field.leaf == "primary"
+    assert callable(phone_field.transform_fn)
+    assert plan.fields[3].coerce_bool is True
+    assert plan.fields[4].transform_fn is None
+    assert "Unknown transform 'missing_transform'" in plan.fields[4].unknown_transform_error
+    assert plan.fields[5].stats_slot == -1
+
+
+def test_transformer_accumulates_field_stats():
+    spec = MappingSpec(
+        version=1,
+        adapter="salesforce",
+        object_name="Contact",
+        fields=(
+            MappingField(source="Id", target="external_id", required=True),
+            MappingField(source="Email", target="email.primary"),
+            MappingField(source="Birthdate", target="demographics.birthdate", transform="parse_date"),
+            MappingField(source="DoNotCall", target="contact_preferences.do_not_call", default=False),
+            MappingField(target="metadata.source_system", default="salesforce"),
+        ),
+        transforms={},
+        checksum="fake",
+        path=None,  # type: ignore[arg-type]
+    )
+    transformer = SalesforceMappingTransformer(spec)
+    assert transformer.field_stats() == {}
+
+    transformer.transform({"Id": "001", "Email": "ada@example.org", "Birthdate": "1990-01-01T00:00:00Z"})
+    transformer.transform({"Id": "002", "Email": "", "DoNotCall": "true"})
+    transformer.transform({"Email": "grace@example.org"})
+
+    stats = transformer.field_stats()
+    assert set(stats) == {"Id", "Email", "Birthdate", "DoNotCall"}
+    assert stats["Id"].records_with_value == 2
+    assert stats["Id"].records_mapped == 2
+    assert stats["Email"].target_field == "email.primary"
+    assert stats["Email"].records_with_value == 2
+    assert stats["Email"].total_records_processed == 3
+    assert stats["Birthdate"].records_transformed == 3
+    assert stats["DoNotCall"].records_used_default == 2
+    assert stats["DoNotCall"].records_mapped == 3
+    assert stats["DoNotCall"].population_rate == 1 / 3
+
+    transformer.reset_stats()
+    assert transformer.field_stats() == {}
+
+
+def test_transform_batch_matches_per_record_transform():
+    spec = MappingSpec(
+        version=1,
+        adapter="salesforce",
+        object_name="Contact",
+        fields=(
+            MappingField(source="Id", target="external_id", required=True),
+            MappingField(
+                source="Racial_Ethnic_Background__c",
+                target="demographics.racial_ethnic_background",
+                transform="normalize_race_ethnicity",
+            ),
+            MappingField(source="Volunteer_Skills__c", target="skills.volunteer_skills", transform="split_semicolon"),
+            MappingField(source="Phone", target="phone.primary", transform="normalize_phone"),
+        ),
+        transforms={},
+        checksum="fake",
+        path=None,  # type: ignore[arg-type]
+    )
+    records = [
+        {"Id": "001", "Racial_Ethnic_Background__c": "Hispanic/Latino", "Volunteer_Skills__c": "Coding;Mentoring"},
+        {"Id": "002", "Racial_Ethnic_Background__c": "Asian American/Pacific Islander", "Phone": "555-010-1234"},
+        {"Id": "003", "Racial_Ethnic_Background__c": "Hispanic/Latino", "Volunteer_Skills__c": "Coding;Mentoring"},
+        {"Racial_Ethnic_Background__c": None},
+    ]
+
+    expected_transformer = SalesforceMappingTransformer(spec)
+    expected = [expected_transformer.transform(record) for record in records]
+
+    transformer = SalesforceMappingTransformer(spec)
+    batch = transformer.transform_batch(records)
+    results = list(batch.results)
+
+    assert [result.canonical for result in results] == [result.canonical for result in expected]
+    assert [result.errors for result in results] == [result.errors for result in expected]
+    assert transformer.field_stats() == expected_transformer.field_stats()
+    # Only picklist-style transforms are dictionary-encoded
+    assert batch.cardinality == {"Racial_Ethnic_Background__c": 3, "Volunteer_Skills__c": 2}
+    assert transformer.peak_cardinality == batch.cardinality
+    # Shared encoded outcomes are copied per record
+    results[0].canonical["skills"]["volunteer_skills"].append("Extra")
+    assert results[2].canonical["skills"]["volunteer_skills"] == ["Coding", "Mentoring"]
+
+
+def test_transform_batch_runs_normalizer_once_per_distinct_value():
+    spec = MappingSpec(
+        version=1,
+        adapter="salesforce",
+        object_name="Session__c",
+        fields=(MappingField(source="Session_Type__c", target="event_type", transform="normalize_session_type"),),
+        transforms={},
+        checksum="fake",
+        path=None,  # type: ignore[arg-type]
+    )
+    transformer = SalesforceMappingTransformer(spec)
+    calls: list[object] = []
+    original = transformer.transform_registry["normalize_session_type"]
+
+    def counting_normalizer(value):
+        calls.append(value)
+        return original(value)
+
+    transformer.transform_registry["normalize_session_type"] = counting_normalizer
+    transformer.plan = compile_mapping(spec, transformer.transform_registry)
+
+    records = [{"Session_Type__c": value} for value in ("Career Fair", "Workshop", "Career Fair", "Workshop") * 50]
+    results = list(transformer.transform_batch(records).results)
+
+    assert sorted(calls) == ["Career Fair", "Workshop"]
+    assert [result.canonical["event_type"] for result in results[:2]] == ["community_event", "workshop"]
+    assert transformer.field_stats()["Session_Type__c"].records_transformed == 200
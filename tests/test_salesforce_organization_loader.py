@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from flask_app.importer.pipeline.salesforce_organization_loader import SalesforceOrganizationLoader
+from flask_app.importer.pipeline.staging_writer import parse_source_timestamp
 from flask_app.models import ExternalIdMap, Organization
 from flask_app.models.base import db
 from flask_app.models.importer.schema import (
@@ -63,6 +64,7 @@ def _add_staging_row(run: ImportRun, seq: int, payload: dict) -> StagingOrganiza
         external_id=payload["external_id"],
         payload_json={"Id": payload["external_id"], "Name": payload["name"]},
         normalized_json=payload,
+        source_modstamp=parse_source_timestamp(payload["metadata"]["source_modstamp"]),
         status=StagingRecordStatus.LANDED,
     )
     db.session.add(row)